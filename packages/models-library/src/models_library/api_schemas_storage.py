@@ -229,6 +229,17 @@ class PresignedLink(BaseModel):
     link: AnyUrl
 
 
+# /locations/{location_id}/files:download-links
+
+
+class FileDownloadLinksBody(BaseModel):
+    file_ids: list[StorageFileID] = Field(..., min_items=1)
+
+
+class PresignedLinks(BaseModel):
+    links: dict[StorageFileID, AnyUrl]
+
+
 class FileUploadLinks(BaseModel):
     abort_upload: AnyUrl
     complete_upload: AnyUrl
@@ -40,4 +40,16 @@ file_meta_data = sa.Table(
     sa.Column(
         "upload_expires_at", sa.DateTime(), nullable=True, doc="Timestamp of expiration"
     ),
+    # NOTE: pattern ops indices are needed for prefix matching (i.e. LIKE 'prefix%'),
+    # e.g. to find the soft links of a project/node when it gets deleted
+    sa.Index(
+        "ix_file_meta_data_object_name_pattern",
+        "object_name",
+        postgresql_ops={"object_name": "text_pattern_ops"},
+    ),
+    sa.Index(
+        "ix_file_meta_data_file_id_pattern",
+        "file_id",
+        postgresql_ops={"file_id": "text_pattern_ops"},
+    ),
 )
@@ -2,6 +2,7 @@
 # pylint:disable=unused-argument
 # pylint:disable=redefined-outer-name
 
+import asyncio
 import logging
 from typing import AsyncIterator, Union
 
@@ -34,7 +35,11 @@ async def redis_settings(
     )
     # test runner is running on the host computer
     settings = RedisSettings(REDIS_HOST=get_localhost_ip(), REDIS_PORT=int(port))
-    await wait_till_redis_responsive(settings.dsn_resources)
+    # NOTE: also ensures the redis service has enough databases
+    await asyncio.gather(
+        wait_till_redis_responsive(settings.dsn_resources),
+        wait_till_redis_responsive(settings.dsn_scheduler_data),
+    )
 
     return settings
 
@@ -81,6 +86,21 @@ async def redis_locks_client(
     await client.close(close_connection_pool=True)
 
 
+@pytest.fixture(scope="function")
+async def redis_scheduler_data_client(
+    redis_settings: RedisSettings,
+) -> AsyncIterator[Redis]:
+    """Creates a redis client to communicate with a redis service ready"""
+    client = from_url(
+        redis_settings.dsn_scheduler_data, encoding="utf-8", decode_responses=True
+    )
+
+    yield client
+
+    await client.flushall()
+    await client.close(close_connection_pool=True)
+
+
 @tenacity.retry(
     wait=wait_fixed(5),
     stop=stop_after_delay(60),
@@ -342,6 +342,25 @@ def get_download_link_cb(url: URL, **kwargs) -> CallbackResult:
     )
 
 
+def get_download_links_cb(url: URL, **kwargs) -> CallbackResult:
+    assert "params" in kwargs
+    assert "link_type" in kwargs["params"]
+    assert "json" in kwargs
+    link_type = kwargs["params"]["link_type"]
+    scheme = {LinkType.PRESIGNED: "http", LinkType.S3: "s3"}
+    return CallbackResult(
+        status=web.HTTPOk.status_code,
+        payload={
+            "data": {
+                "links": {
+                    file_id: f"{scheme[link_type]}://{file_id}"
+                    for file_id in kwargs["json"]["file_ids"]
+                }
+            }
+        },
+    )
+
+
 def get_upload_link_cb(url: URL, **kwargs) -> CallbackResult:
     file_id = url.path.rsplit("/files/")[1]
     assert "params" in kwargs
@@ -399,6 +418,10 @@ async def storage_v0_service_mock(
         r"^http://[a-z\-_]*storage:[0-9]+/v0/locations/[0-9]+/files.+$"
     )
 
+    get_download_links_pattern = re.compile(
+        r"^http://[a-z\-_]*storage:[0-9]+/v0/locations/[0-9]+/files:download-links.+$"
+    )
+
     get_locations_link_pattern = re.compile(
         r"^http://[a-z\-_]*storage:[0-9]+/v0/locations.+$"
     )
@@ -424,6 +447,9 @@ async def storage_v0_service_mock(
     aioresponses_mocker.put(
         get_upload_link_pattern, callback=get_upload_link_cb, repeat=True
     )
+    aioresponses_mocker.post(
+        get_download_links_pattern, callback=get_download_links_cb, repeat=True
+    )
     aioresponses_mocker.delete(
         delete_file_pattern, status=web.HTTPNoContent.status_code
     )
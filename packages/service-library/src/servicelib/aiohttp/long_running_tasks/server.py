@@ -14,6 +14,7 @@ from ...long_running_tasks._task import (
     TaskProtocol,
     TasksManager,
     TaskStatus,
+    start_task,
 )
 from ._dependencies import create_task_name_from_request, get_tasks_manager
 from ._routes import TaskGet
@@ -26,6 +27,7 @@ __all__: tuple[str, ...] = (
     "ProgressPercent",
     "setup",
     "start_long_running_task",
+    "start_task",
     "TaskAlreadyRunningError",
     "TaskCancelledError",
     "TaskId",
@@ -1,7 +1,9 @@
 import asyncio.events
 import sys
+import threading
 import time
-from typing import List
+import traceback
+from typing import Dict, List, Optional, Tuple
 
 from pyinstrument import Profiler
 
@@ -44,3 +46,86 @@ def enable(slow_duration_secs: float, incidents: List[SlowCallback]) -> None:
         return retval
 
     asyncio.events.Handle._run = instrumented
+
+
+class SlowCallbacksSampler(threading.Thread):
+    """Samples from a separate thread the stack of the callbacks that block the event loop
+
+    Only runs every ``sampling_interval_secs``, i.e. it does not add any overhead
+    to the callbacks themselves
+    """
+
+    def __init__(self, sampling_interval_secs: float) -> None:
+        super().__init__(name=f"{__name__}.sampler", daemon=True)
+        self.sampling_interval_secs = sampling_interval_secs
+        # thread id -> start time of the callback it is running
+        self.running: Dict[int, float] = {}
+        # (thread id, start time) -> last stack sampled while running that callback
+        self.samples: Dict[Tuple[int, float], List[str]] = {}
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.sampling_interval_secs):
+            now = time.monotonic()
+            frames = sys._current_frames()  # pylint: disable=protected-access
+            for thread_id, started in list(self.running.items()):
+                if now - started < self.sampling_interval_secs:
+                    continue
+                if frame := frames.get(thread_id):
+                    stack = traceback.format_stack(frame)
+                    # the callback might have finished in the meantime
+                    if self.running.get(thread_id) == started:
+                        self.samples[(thread_id, started)] = stack
+            del frames
+            # drops samples taken while their callbacks were finishing
+            for thread_id, started in list(self.samples):
+                if self.running.get(thread_id) != started:
+                    self.samples.pop((thread_id, started), None)
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+def enable_sampling(
+    slow_duration_secs: float,
+    incidents: List[SlowCallback],
+    sampling_interval_secs: Optional[float] = None,
+) -> SlowCallbacksSampler:
+    """Low-overhead alternative to ``enable``, suitable for production
+
+    Every callback is only timed. The stack of the slow ones is the last
+    one captured by a ``SlowCallbacksSampler`` while they were blocking the loop
+    (if they run long enough to be sampled).
+
+    Returns the started sampler, which should be stopped on shutdown
+    """
+    # pylint: disable=protected-access
+    from aiodebug.logging_compat import get_logger
+
+    logger = get_logger(__name__)
+    _run = asyncio.events.Handle._run
+
+    sampler = SlowCallbacksSampler(sampling_interval_secs or slow_duration_secs / 2)
+    running = sampler.running
+    samples = sampler.samples
+
+    def instrumented(self):
+        thread_id = threading.get_ident()
+        t0 = time.monotonic()
+        running[thread_id] = t0
+        try:
+            return _run(self)
+        finally:
+            dt = time.monotonic() - t0
+            stack = samples.pop((thread_id, t0), None)
+            running.pop(thread_id, None)
+            if dt >= slow_duration_secs:
+                msg = f"{self}\n" + (
+                    "".join(stack) if stack else "(callback not sampled)"
+                )
+                incidents.append(SlowCallback(msg=msg, delay_secs=dt))
+                logger.warning("Executing took %.3f seconds\n%s", dt, msg)
+
+    asyncio.events.Handle._run = instrumented
+    sampler.start()
+    return sampler
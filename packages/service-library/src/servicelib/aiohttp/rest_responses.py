@@ -9,7 +9,7 @@ import attr
 from aiohttp import web, web_exceptions
 from aiohttp.web_exceptions import HTTPError, HTTPException
 
-from ..json_serialization import json_dumps
+from ..json_serialization import json_dumps, json_dumps_bytes
 from ..mimetype_constants import MIMETYPE_APPLICATION_JSON
 from .rest_models import ErrorItemType, ErrorType, LogMessageType
 
@@ -78,7 +78,13 @@ def create_data_response(
         else:
             payload = data
 
-        response = web.json_response(payload, dumps=json_dumps, status=status)
+        # NOTE: the body is serialized directly to bytes (i.e. no extra encoding of the text)
+        response = web.Response(
+            body=json_dumps_bytes(payload),
+            status=status,
+            content_type=MIMETYPE_APPLICATION_JSON,
+            charset="utf-8",
+        )
     except (TypeError, ValueError) as err:
         response = create_error_response(
             [
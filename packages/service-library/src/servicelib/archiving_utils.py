@@ -1,15 +1,18 @@
 import asyncio
 import fnmatch
+import heapq
+import io
+import itertools
 import logging
+import tempfile
 import types
 import zipfile
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 from functools import partial
 from pathlib import Path
-from typing import Final, Iterator, Optional
+from typing import IO, AsyncGenerator, Callable, Final, Iterator, Optional, Union
 
 from tqdm import tqdm
-from tqdm.asyncio import tqdm_asyncio
 from tqdm.contrib.logging import logging_redirect_tqdm, tqdm_logging_redirect
 
 from .file_utils import remove_directory
@@ -17,7 +20,20 @@ from .pools import non_blocking_process_pool_executor
 
 _MIN: Final[int] = 60  # secs
 _MAX_UNARCHIVING_WORKER_COUNT: Final[int] = 2
-_CHUNK_SIZE: Final[int] = 1024 * 8
+_MIN_CHUNK_SIZE: Final[int] = 1024 * 64
+_MAX_CHUNK_SIZE: Final[int] = 1024 * 1024 * 8
+# NOTE: more chunks than workers keep the workers busy when entries
+# take unexpectedly long and refine the aggregated progress
+_CHUNKS_PER_WORKER: Final[int] = 4
+# NOTE: creating a file has a cost regardless of its size, it is accounted as
+# this amount of bytes when balancing the chunks
+_ENTRY_OVERHEAD_SIZE: Final[int] = 1024 * 32
+_MAX_IN_MEMORY_PART_SIZE: Final[int] = 1024 * 1024 * 16
+# NOTE: upper bounds including zip64 extensions and data descriptors
+# (local header 30+20, data descriptor 24, central directory 46+28)
+_ZIP_ENTRY_MAX_OVERHEAD_SIZE: Final[int] = 148
+# (end of central directory 22, zip64 end of central directory 56+20)
+_ZIP_END_OF_CENTRAL_DIRECTORY_MAX_SIZE: Final[int] = 98
 
 log = logging.getLogger(__name__)
 
@@ -94,45 +110,59 @@ _TQDM_FILE_OPTIONS = dict(
     colour="yellow",
     miniters=1,
 )
-_TQDM_MULTI_FILES_OPTIONS = _TQDM_FILE_OPTIONS | dict(
-    unit="file",
-    unit_divisor=1000,
-)
 
 
-def _zipfile_single_file_extract_worker(
+def _compute_chunk_size(file_size: int) -> int:
+    """larger files are copied with larger buffers"""
+    return max(_MIN_CHUNK_SIZE, min(file_size, _MAX_CHUNK_SIZE))
+
+
+def _zipfile_files_extract_worker(
     zip_file_path: Path,
-    file_in_archive: zipfile.ZipInfo,
+    files_in_archive: list[zipfile.ZipInfo],
     destination_folder: Path,
-    is_dir: bool,
-) -> Path:
-    """Extracts file_in_archive from the archive zip_file_path -> destination_folder/file_in_archive
+) -> list[Path]:
+    """Extracts files_in_archive from the archive zip_file_path -> destination_folder/file_in_archive
 
+    The archive is opened only once for all the entries.
     Extracts in chunks to avoid memory pressure on zip/unzip
-    returns: a path to extracted file or directory
+    returns: the paths to the extracted files or directories
     """
+    extracted_paths: list[Path] = []
     with _FastZipFileReader(zip_file_path) as zf:
-        # assemble destination and ensure it exits
-        destination_path = destination_folder / file_in_archive.filename
-
-        if is_dir:
-            destination_path.mkdir(parents=True, exist_ok=True)
-            return destination_path
-        desc = f"decompressing {zip_file_path}:{file_in_archive.filename} -> {destination_path}\n"
-        with zf.open(name=file_in_archive) as zip_fp, destination_path.open(
-            "wb"
-        ) as dest_fp, tqdm_logging_redirect(
-            total=file_in_archive.file_size,
-            desc=desc,
-            **(
-                _TQDM_FILE_OPTIONS
-                | dict(miniters=_compute_tqdm_miniters(file_in_archive.file_size))
-            ),
-        ) as pbar:
-            while chunk := zip_fp.read(_CHUNK_SIZE):
-                dest_fp.write(chunk)
-                pbar.update(len(chunk))
-            return destination_path
+        for file_in_archive in files_in_archive:
+            # assemble destination and ensure it exits
+            destination_path = destination_folder / file_in_archive.filename
+
+            if file_in_archive.is_dir():
+                destination_path.mkdir(parents=True, exist_ok=True)
+            else:
+                chunk_size = _compute_chunk_size(file_in_archive.file_size)
+                with zf.open(name=file_in_archive) as zip_fp, destination_path.open(
+                    "wb"
+                ) as dest_fp:
+                    while chunk := zip_fp.read(chunk_size):
+                        dest_fp.write(chunk)
+            extracted_paths.append(destination_path)
+    return extracted_paths
+
+
+def _split_in_balanced_chunks(
+    entries: list[zipfile.ZipInfo], num_chunks: int
+) -> list[list[zipfile.ZipInfo]]:
+    """distributes entries in at most num_chunks chunks with similar amount of
+    bytes to extract (greedy, largest entries first)
+    """
+    chunks: list[list[zipfile.ZipInfo]] = [[] for _ in range(max(num_chunks, 1))]
+    # heap of (chunk_size, chunk_index)
+    chunks_sizes = [(0, index) for index in range(len(chunks))]
+    for entry in sorted(entries, key=lambda e: e.file_size, reverse=True):
+        chunk_size, index = heapq.heappop(chunks_sizes)
+        chunks[index].append(entry)
+        heapq.heappush(
+            chunks_sizes, (chunk_size + entry.file_size + _ENTRY_OVERHEAD_SIZE, index)
+        )
+    return [chunk for chunk in chunks if chunk]
 
 
 def _ensure_destination_subdirectories_exist(
@@ -183,54 +213,67 @@ async def unarchive_dir(
                 destination_folder=destination_folder,
             )
 
-            futures: list[asyncio.Future] = [
-                event_loop.run_in_executor(
-                    process_pool,
-                    # ---------
-                    _zipfile_single_file_extract_worker,
-                    archive_to_extract,
-                    zip_entry,
-                    destination_folder,
-                    zip_entry.is_dir(),
-                )
-                for zip_entry in zip_file_handler.infolist()
-            ]
-
-            try:
-                extracted_paths: list[Path] = await tqdm_asyncio.gather(
-                    *futures,
-                    desc=f"decompressing {archive_to_extract} -> {destination_folder} [{len(futures)} file{'s' if len(futures) > 1 else ''}"
-                    f"/{_human_readable_size(archive_to_extract.stat().st_size)}]\n",
-                    total=len(futures),
-                    **_TQDM_MULTI_FILES_OPTIONS,
-                )
+            zip_entries = zip_file_handler.infolist()
+            total_file_size = sum(entry.file_size for entry in zip_entries)
+            chunks = _split_in_balanced_chunks(
+                zip_entries, num_chunks=max_workers * _CHUNKS_PER_WORKER
+            )
 
-            except Exception as err:
-                for f in futures:
-                    f.cancel()
+            with tqdm_logging_redirect(
+                desc=f"decompressing {archive_to_extract} -> {destination_folder} [{len(zip_entries)} file{'s' if len(zip_entries) > 1 else ''}"
+                f"/{_human_readable_size(archive_to_extract.stat().st_size)}]\n",
+                total=total_file_size,
+                **(
+                    _TQDM_FILE_OPTIONS
+                    | dict(miniters=_compute_tqdm_miniters(total_file_size))
+                ),
+            ) as pbar:
+
+                async def _extract_chunk(chunk: list[zipfile.ZipInfo]) -> list[Path]:
+                    extracted_paths: list[Path] = await event_loop.run_in_executor(
+                        process_pool,
+                        # ---------
+                        _zipfile_files_extract_worker,
+                        archive_to_extract,
+                        chunk,
+                        destination_folder,
+                    )
+                    pbar.update(sum(entry.file_size for entry in chunk))
+                    return extracted_paths
+
+                tasks = [asyncio.create_task(_extract_chunk(chunk)) for chunk in chunks]
+                try:
+                    chunks_extracted_paths: list[list[Path]] = await asyncio.gather(
+                        *tasks
+                    )
 
-                # wait until all tasks are cancelled
-                await asyncio.wait(
-                    futures, timeout=2 * _MIN, return_when=asyncio.ALL_COMPLETED
-                )
+                except Exception as err:
+                    for t in tasks:
+                        t.cancel()
 
-                # now we can cleanup
-                if destination_folder.exists() and destination_folder.is_dir():
-                    await remove_directory(destination_folder, ignore_errors=True)
+                    # wait until all tasks are cancelled
+                    if tasks:
+                        await asyncio.wait(
+                            tasks, timeout=2 * _MIN, return_when=asyncio.ALL_COMPLETED
+                        )
 
-                raise ArchiveError(
-                    f"Failed unarchiving {archive_to_extract} -> {destination_folder} due to {type(err)}."
-                    f"Details: {err}"
-                ) from err
+                    # now we can cleanup
+                    if destination_folder.exists() and destination_folder.is_dir():
+                        await remove_directory(destination_folder, ignore_errors=True)
 
-            else:
+                    raise ArchiveError(
+                        f"Failed unarchiving {archive_to_extract} -> {destination_folder} due to {type(err)}."
+                        f"Details: {err}"
+                    ) from err
 
-                # NOTE: extracted_paths includes all tree leafs, which might include files and empty folders
-                return {
-                    p
-                    for p in extracted_paths
-                    if p.is_file() or (p.is_dir() and not any(p.glob("*")))
-                }
+                else:
+
+                    # NOTE: extracted_paths includes all tree leafs, which might include files and empty folders
+                    return {
+                        p
+                        for p in itertools.chain.from_iterable(chunks_extracted_paths)
+                        if p.is_file() or (p.is_dir() and not any(p.glob("*")))
+                    }
 
 
 @contextmanager
@@ -258,9 +301,23 @@ def _progress_enabled_zip_write_handler(
         zip_file_handler.fp.write = old_write_method
 
 
+def _get_file_name_in_archive(
+    file_to_add: Path, dir_to_compress: Path, store_relative_path: bool
+) -> Path:
+    file_name_in_archive = (
+        _strip_directory_from_path(file_to_add, dir_to_compress)
+        if store_relative_path
+        else file_to_add
+    )
+
+    # because surrogates are not allowed in zip files,
+    # replacing them will ensure errors will not happen.
+    return _strip_undecodable_in_path(file_name_in_archive)
+
+
 def _add_to_archive(
     dir_to_compress: Path,
-    destination: Path,
+    destination: Union[Path, IO[bytes]],
     compress: bool,
     store_relative_path: bool,
     exclude_patterns: Optional[set[str]] = None,
@@ -271,7 +328,9 @@ def _add_to_archive(
         for file in _iter_files_to_compress(dir_to_compress, exclude_patterns)
     )
     desc = f"compressing {dir_to_compress} -> {destination}"
-    with tqdm_logging_redirect(
+    with zipfile.ZipFile(
+        destination, "w", compression=compression
+    ) as zip_file, tqdm_logging_redirect(
         desc=f"{desc}\n",
         total=folder_size_bytes,
         **(
@@ -279,24 +338,17 @@ def _add_to_archive(
             | dict(miniters=_compute_tqdm_miniters(folder_size_bytes))
         ),
     ) as progress_bar, _progress_enabled_zip_write_handler(
-        zipfile.ZipFile(destination, "w", compression=compression), progress_bar
+        zip_file, progress_bar
     ) as zip_file_handler:
         for file_to_add in _iter_files_to_compress(dir_to_compress, exclude_patterns):
             progress_bar.set_description(f"{desc}/{file_to_add.name}\n")
-            file_name_in_archive = (
-                _strip_directory_from_path(file_to_add, dir_to_compress)
-                if store_relative_path
-                else file_to_add
+            zip_file_handler.write(
+                file_to_add,
+                _get_file_name_in_archive(
+                    file_to_add, dir_to_compress, store_relative_path
+                ),
             )
 
-            # because surrogates are not allowed in zip files,
-            # replacing them will ensure errors will not happen.
-            escaped_file_name_in_archive = _strip_undecodable_in_path(
-                file_name_in_archive
-            )
-
-            zip_file_handler.write(file_to_add, escaped_file_name_in_archive)
-
 
 async def archive_dir(
     dir_to_compress: Path,
@@ -347,6 +399,193 @@ async def archive_dir(
             raise
 
 
+class _ArchivePartsWriter:
+    """Write-only and non-seekable stream that splits what is written
+    in parts of part_size bytes (the last part might be smaller)
+
+    If max_num_parts is given, the last allowed part is never split and
+    absorbs whatever exceeds max_num_parts * part_size (e.g. files that grew
+    while being archived)
+
+    Every completed part is handed over to on_part_completed
+    """
+
+    def __init__(
+        self,
+        part_size: int,
+        on_part_completed: Callable[[IO[bytes]], None],
+        max_num_parts: Optional[int] = None,
+    ) -> None:
+        self._part_size = part_size
+        self._on_part_completed = on_part_completed
+        self._max_num_parts = max_num_parts
+        self._num_completed_parts = 0
+        self._part: Optional[IO[bytes]] = None
+        self._part_written_bytes = 0
+        self._written_bytes = 0
+        self._cancelled = False
+
+    def _complete_part(self) -> None:
+        assert self._part  # nosec
+        part, self._part = self._part, None
+        self._num_completed_parts += 1
+        part.seek(0)
+        self._on_part_completed(part)
+
+    def write(self, data) -> int:
+        if self._cancelled:
+            raise ArchiveError("Archiving was cancelled")
+        view = memoryview(data).cast("B")
+        while view:
+            if self._part is None:
+                self._part = tempfile.SpooledTemporaryFile(
+                    max_size=_MAX_IN_MEMORY_PART_SIZE
+                )
+                self._part_written_bytes = 0
+            if self._is_last_part():
+                num_bytes = len(view)
+            else:
+                num_bytes = min(len(view), self._part_size - self._part_written_bytes)
+            self._part.write(view[:num_bytes])
+            self._part_written_bytes += num_bytes
+            self._written_bytes += num_bytes
+            view = view[num_bytes:]
+            if self._part_written_bytes == self._part_size and not self._is_last_part():
+                self._complete_part()
+        return len(data)
+
+    def _is_last_part(self) -> bool:
+        return (
+            self._max_num_parts is not None
+            and self._num_completed_parts >= self._max_num_parts - 1
+        )
+
+    def tell(self) -> int:
+        return self._written_bytes
+
+    def seek(self, *args, **kwargs) -> int:
+        raise io.UnsupportedOperation("seek")
+
+    def flush(self) -> None:
+        """nothing to flush, parts are completed as they are filled"""
+
+    def close(self) -> None:
+        if self._part is not None:
+            self._complete_part()
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+
+def _compute_stored_archive_max_size(
+    dir_to_compress: Path,
+    store_relative_path: bool,
+    exclude_patterns: Optional[set[str]],
+) -> int:
+    archive_max_size = _ZIP_END_OF_CENTRAL_DIRECTORY_MAX_SIZE
+    for file_to_add in _iter_files_to_compress(dir_to_compress, exclude_patterns):
+        file_name_in_archive = _get_file_name_in_archive(
+            file_to_add, dir_to_compress, store_relative_path
+        )
+        archive_max_size += (
+            file_to_add.stat().st_size
+            + _ZIP_ENTRY_MAX_OVERHEAD_SIZE
+            # the name is stored in the local header and in the central directory
+            + 2 * len(f"{file_name_in_archive}".encode())
+        )
+    return archive_max_size
+
+
+async def get_stored_archive_max_size(
+    dir_to_compress: Path,
+    *,
+    store_relative_path: bool,
+    exclude_patterns: Optional[set[str]] = None,
+) -> int:
+    """Returns an upper bound of the size of the uncompressed archive
+    created by archive_dir_in_parts
+    """
+    return await asyncio.get_event_loop().run_in_executor(
+        None,
+        _compute_stored_archive_max_size,
+        dir_to_compress,
+        store_relative_path,
+        exclude_patterns,
+    )
+
+
+async def archive_dir_in_parts(
+    dir_to_compress: Path,
+    *,
+    part_size: int,
+    store_relative_path: bool,
+    exclude_patterns: Optional[set[str]] = None,
+    max_num_parts: Optional[int] = None,
+) -> AsyncGenerator[IO[bytes], None]:
+    """Creates an uncompressed archive of dir_to_compress and yields it in
+    parts of part_size bytes (the last part might be smaller) while it is
+    being produced. The full archive is never written to disk.
+
+    If max_num_parts is given, at most that many parts are yielded: the last
+    one might then be larger than part_size, e.g. when files grew after
+    get_stored_archive_max_size was computed.
+
+    Every part is a file object positioned at its beginning, which is
+    closed (and deleted) once the next part is requested.
+    Archiving continues in a thread while the current part is consumed,
+    so up to 3 parts exist at the same time: the one being consumed, the
+    one waiting in the queue and the one being written. Each is spooled in
+    memory up to _MAX_IN_MEMORY_PART_SIZE and then on disk.
+
+    ::raise ArchiveError
+    """
+    event_loop = asyncio.get_event_loop()
+    # NOTE: maxsize limits the amount of parts waiting to be consumed
+    parts_queue: asyncio.Queue[Optional[IO[bytes]]] = asyncio.Queue(maxsize=1)
+
+    def _on_part_completed(part: IO[bytes]) -> None:
+        asyncio.run_coroutine_threadsafe(parts_queue.put(part), event_loop).result()
+
+    writer = _ArchivePartsWriter(part_size, _on_part_completed, max_num_parts)
+
+    def _archive() -> None:
+        try:
+            _add_to_archive(
+                dir_to_compress,
+                writer,  # type: ignore
+                compress=False,
+                store_relative_path=store_relative_path,
+                exclude_patterns=exclude_patterns,
+            )
+            writer.close()
+        finally:
+            _on_part_completed(None)  # type: ignore
+
+    archiving = event_loop.run_in_executor(None, _archive)
+    all_parts_consumed = False
+    try:
+        while (part := await parts_queue.get()) is not None:
+            with part:
+                yield part
+        all_parts_consumed = True
+    finally:
+        if not all_parts_consumed:
+            # the consumer stopped early, unblock the archiving thread
+            writer.cancel()
+            while (part := await parts_queue.get()) is not None:
+                part.close()
+            with suppress(Exception):
+                await archiving
+
+    try:
+        await archiving
+    except Exception as err:
+        raise ArchiveError(
+            f"Failed archiving {dir_to_compress} in parts due to {type(err)}."
+            f"Details: {err}"
+        ) from err
+
+
 def is_leaf_path(p: Path) -> bool:
     """Tests whether a path corresponds to a file or empty folder, i.e.
     some leaf item in a file-system tree structure
@@ -411,7 +650,9 @@ class PrunableFolder:
 
 __all__ = (
     "archive_dir",
+    "archive_dir_in_parts",
     "ArchiveError",
+    "get_stored_archive_max_size",
     "is_leaf_path",
     "PrunableFolder",
     "unarchive_dir",
@@ -47,3 +47,24 @@ async def test_slow_task_incident(incidents_manager):
 @pytest.mark.skip(reason="TODO: Design under development")
 def test_non_responsive_incident(incidents_manager):
     pass
+
+
+async def test_slow_task_incident_with_sampling(monkeypatch: pytest.MonkeyPatch):
+    # restores the original Handle._run afterwards
+    monkeypatch.setattr(asyncio.events.Handle, "_run", asyncio.events.Handle._run)
+
+    incidents = []
+    sampler = monitor_slow_callbacks.enable_sampling(
+        slow_duration_secs=0.2, incidents=incidents, sampling_interval_secs=0.05
+    )
+    try:
+        await asyncio.gather(slow_task(0.3), slow_task(0.01), slow_task(0.4))
+        await asyncio.sleep(0.1)
+    finally:
+        sampler.stop()
+
+    assert len(incidents) == 2
+    assert all(0.2 <= record.delay_secs < 0.5 for record in incidents)
+    # the stack of the blocking call was sampled
+    assert all("slow_task" in record.msg for record in incidents)
+    assert not sampler.samples
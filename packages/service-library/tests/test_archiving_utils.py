@@ -11,6 +11,7 @@ import random
 import secrets
 import string
 import tempfile
+import zipfile
 from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
@@ -103,16 +104,16 @@ def __raise_error(*arts, **kwargs) -> None:
 
 
 @pytest.fixture
-def zipfile_single_file_extract_worker_raises_error() -> Iterator[None]:
+def zipfile_files_extract_worker_raises_error() -> Iterator[None]:
     # NOTE: cannot MagicMock cannot be serialized via pickle used by
     # multiprocessing, also `__raise_error` cannot be defined in the
     # context fo this function or it cannot be pickled
 
     # pylint: disable=protected-access
-    old_func = archiving_utils._zipfile_single_file_extract_worker
-    archiving_utils._zipfile_single_file_extract_worker = __raise_error
+    old_func = archiving_utils._zipfile_files_extract_worker
+    archiving_utils._zipfile_files_extract_worker = __raise_error
     yield
-    archiving_utils._zipfile_single_file_extract_worker = old_func
+    archiving_utils._zipfile_files_extract_worker = old_func
 
 
 # UTILS
@@ -517,7 +518,7 @@ async def test_archive_unarchive_check_exclude(
 
 
 async def test_unarchive_dir_raises_error(
-    zipfile_single_file_extract_worker_raises_error: None,
+    zipfile_files_extract_worker_raises_error: None,
     dir_with_random_content: Path,
     tmp_path: Path,
 ):
@@ -538,3 +539,131 @@ async def test_unarchive_dir_raises_error(
 
     with pytest.raises(ArchiveError, match=r"^.*raised as requested.*$"):
         await archiving_utils.unarchive_dir(archive_file, temp_dir_two)
+
+
+def test_split_in_balanced_chunks():
+    sizes = [100_000_000, 1] + [1024] * 1000
+    entries = []
+    for index, size in enumerate(sizes):
+        entry = zipfile.ZipInfo(f"file_{index}")
+        entry.file_size = size
+        entries.append(entry)
+
+    # pylint: disable=protected-access
+    chunks = archiving_utils._split_in_balanced_chunks(entries, num_chunks=4)
+    assert len(chunks) == 4
+    assert sorted(itertools.chain.from_iterable(chunks), key=id) == sorted(
+        entries, key=id
+    )
+    # the huge file is alone and the small ones are evenly spread
+    assert [e.file_size for e in chunks[0]] == [100_000_000]
+    chunks_lengths = [len(c) for c in chunks[1:]]
+    assert max(chunks_lengths) - min(chunks_lengths) <= 1
+
+    assert archiving_utils._split_in_balanced_chunks([], num_chunks=4) == []
+    assert len(archiving_utils._split_in_balanced_chunks(entries[:2], 4)) == 2
+
+
+@pytest.mark.parametrize(
+    "file_count, file_size",
+    [
+        pytest.param(5000, 10, id="many_small_files"),
+        pytest.param(3, 10 * 1024 * 1024, id="few_big_files"),
+    ],
+)
+async def test_unarchive_dir_with_many_or_big_files(
+    tmp_path: Path, file_count: int, file_size: int
+):
+    dir_to_compress = tmp_path / "to_compress"
+    for n in range(file_count):
+        file_path = dir_to_compress / f"sub_{n % 50}" / f"file_{n}.bin"
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(os.urandom(file_size))
+    archive_file = tmp_path / "archive.zip"
+    await archive_dir(
+        dir_to_compress=dir_to_compress,
+        destination=archive_file,
+        store_relative_path=True,
+        compress=False,
+    )
+
+    destination = tmp_path / "destination"
+    unarchived_paths = await unarchive_dir(archive_file, destination)
+
+    assert len(unarchived_paths) == file_count
+    await assert_same_directory_content(dir_to_compress, destination)
+
+
+@pytest.mark.parametrize("part_size", [1024, 1024 * 1024])
+async def test_archive_dir_in_parts(
+    dir_with_random_content: Path, tmp_path: Path, part_size: int
+):
+    archive_max_size = await archiving_utils.get_stored_archive_max_size(
+        dir_with_random_content, store_relative_path=True
+    )
+
+    archive_file = tmp_path / "archive.zip"
+    parts_sizes = []
+    with archive_file.open("wb") as fp:
+        async for part in archiving_utils.archive_dir_in_parts(
+            dir_with_random_content, part_size=part_size, store_relative_path=True
+        ):
+            data = part.read()
+            parts_sizes.append(len(data))
+            fp.write(data)
+
+    assert all(size == part_size for size in parts_sizes[:-1])
+    assert 0 < parts_sizes[-1] <= part_size
+    assert archive_file.stat().st_size <= archive_max_size
+
+    destination = tmp_path / "destination"
+    await unarchive_dir(archive_file, destination)
+    await assert_same_directory_content(dir_with_random_content, destination)
+
+
+async def test_archive_dir_in_parts_overflow_goes_into_last_part(
+    dir_with_random_content: Path, tmp_path: Path
+):
+    part_size = 1024
+    archive_max_size = await archiving_utils.get_stored_archive_max_size(
+        dir_with_random_content, store_relative_path=True
+    )
+    # files grow after the archive size was estimated
+    (dir_with_random_content / "grown_file.bin").write_bytes(
+        os.urandom(archive_max_size)
+    )
+    max_num_parts = -(-archive_max_size // part_size)
+
+    archive_file = tmp_path / "archive.zip"
+    parts_sizes = []
+    with archive_file.open("wb") as fp:
+        async for part in archiving_utils.archive_dir_in_parts(
+            dir_with_random_content,
+            part_size=part_size,
+            store_relative_path=True,
+            max_num_parts=max_num_parts,
+        ):
+            data = part.read()
+            parts_sizes.append(len(data))
+            fp.write(data)
+
+    assert len(parts_sizes) == max_num_parts
+    assert all(size == part_size for size in parts_sizes[:-1])
+    assert parts_sizes[-1] > part_size
+
+    destination = tmp_path / "destination"
+    await unarchive_dir(archive_file, destination)
+    await assert_same_directory_content(dir_with_random_content, destination)
+
+
+async def test_archive_dir_in_parts_stopped_early(
+    dir_with_random_content: Path,
+):
+    archive_parts = archiving_utils.archive_dir_in_parts(
+        dir_with_random_content, part_size=1024, store_relative_path=True
+    )
+    async for part in archive_parts:
+        assert part.read()
+        break
+    # the archiving thread is unblocked and stopped
+    await asyncio.wait_for(archive_parts.aclose(), timeout=10)
@@ -4,10 +4,14 @@
 
 
 import json
+from copy import deepcopy
+from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID, uuid4
 
-from servicelib.json_serialization import json_dumps
+import pytest
+import servicelib.json_serialization
+from servicelib.json_serialization import json_dumps, json_dumps_bytes
 
 #
 
@@ -40,3 +44,59 @@ def test_serialization_of_nested_dicts(fake_data_dict: dict[str, Any]):
 
     dump = json_dumps(obj)
     assert json.loads(dump) == export_uuids_to_str(obj)
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "json":
+        monkeypatch.setattr(servicelib.json_serialization, "orjson", None)
+    else:
+        pytest.importorskip("orjson")
+    return request.param
+
+
+def test_serialization_is_independent_of_backend(
+    json_backend: str, fake_data_dict: dict[str, Any]
+):
+    ids = [uuid4(), uuid4()]
+    obj = {
+        "data": fake_data_dict,
+        "created": datetime(2022, 11, 3, 10, 11, 12, tzinfo=timezone.utc),
+        "tags": {1},
+        "ids": (uuid for uuid in ids),
+        3: "non-str key",
+    }
+    expected = {
+        "data": export_uuids_to_str(deepcopy(fake_data_dict)),
+        "created": "2022-11-03T10:11:12+00:00",
+        "tags": [1],
+        "ids": [f"{uuid}" for uuid in ids],
+        "3": "non-str key",
+    }
+
+    assert json.loads(json_dumps(obj)) == expected
+
+    assert json_dumps_bytes({"a": 1}) == json_dumps({"a": 1}).encode()
+
+
+def test_serialization_falls_back_to_json(json_backend: str):
+    # orjson only supports 64-bit integers
+    big_int = 2**70
+    uuid = uuid4()
+    obj = {"big": big_int, "ids": (u for u in [uuid])}
+    assert json.loads(json_dumps_bytes(obj)) == {"big": big_int, "ids": [f"{uuid}"]}
+
+    # json.dumps's kwargs without orjson equivalent
+    assert json_dumps({"a": 1}, separators=(",", ":")) == '{"a":1}'
+    assert json_dumps({"b": 1, "a": 2}, sort_keys=True, indent=2) == json.dumps(
+        {"a": 2, "b": 1}, indent=2
+    )
+
+    with pytest.raises(TypeError):
+        json_dumps({"obj": object()})
+
+
+def test_orjson_output_is_compact_and_encodes_nan_as_null():
+    pytest.importorskip("orjson")
+    obj = {"a": [1, 2], "nan": float("nan"), "inf": float("inf")}
+    assert json_dumps(obj) == '{"a":[1,2],"nan":null,"inf":null}'
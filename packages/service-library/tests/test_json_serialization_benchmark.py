@@ -0,0 +1,42 @@
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=unused-variable
+
+from typing import Any, Callable
+
+import pytest
+import servicelib.json_serialization
+from pytest_simcore.simcore_webserver_projects_rest_api import (
+    LIST_PROJECTS,
+    REPLACE_PROJECT_ON_MODIFIED,
+)
+from servicelib.json_serialization import json_dumps, json_dumps_bytes
+
+
+@pytest.fixture(
+    params=[LIST_PROJECTS, REPLACE_PROJECT_ON_MODIFIED],
+    ids=lambda capture: capture.description,
+)
+def project_payload(request) -> dict[str, Any]:
+    # NOTE: response bodies of real sessions, i.e. projects with their workbench
+    body = request.param.response_body
+    assert body
+    return body
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "json":
+        monkeypatch.setattr(servicelib.json_serialization, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("dumps", [json_dumps, json_dumps_bytes])
+def test_benchmark_json_dumps_project_payloads(
+    benchmark,
+    json_backend: str,
+    project_payload: dict[str, Any],
+    dumps: Callable[[Any], Any],
+):
+    benchmark.group = f"{dumps.__name__}-{len(f'{project_payload}')}"
+    benchmark(dumps, project_payload)
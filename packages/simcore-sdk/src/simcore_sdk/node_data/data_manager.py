@@ -2,16 +2,22 @@ import logging
 from pathlib import Path
 from shutil import move
 from tempfile import TemporaryDirectory
-from typing import Optional, Union
+from typing import IO, AsyncGenerator, Optional, Union
 
 from models_library.projects_nodes_io import StorageFileID
 from pydantic import parse_obj_as
-from servicelib.archiving_utils import archive_dir, unarchive_dir
+from servicelib.archiving_utils import (
+    archive_dir,
+    archive_dir_in_parts,
+    get_stored_archive_max_size,
+    unarchive_dir,
+)
 from servicelib.logging_utils import log_catch, log_context
 from settings_library.r_clone import RCloneSettings
 from simcore_sdk.node_ports_common.constants import SIMCORE_LOCATION
 
 from ..node_ports_common import filemanager
+from ..node_ports_common.file_io_utils import UploadableFileParts
 from ..node_ports_common.filemanager import LogRedirectCB
 
 log = logging.getLogger(__name__)
@@ -51,6 +57,56 @@ async def _push_file(
     log.info("%s successfuly uploaded", file_path)
 
 
+async def _push_folder_while_archiving(
+    user_id: int,
+    project_id: str,
+    node_uuid: str,
+    folder: Path,
+    *,
+    rename_to: Optional[str],
+    io_log_redirect_cb: Optional[LogRedirectCB],
+    archive_exclude_patterns: Optional[set[str]],
+) -> None:
+    archive_name = f"{rename_to or folder.stem}.zip"
+    s3_object = _create_s3_object(project_id, node_uuid, archive_name)
+    if io_log_redirect_cb:
+        await io_log_redirect_cb(
+            f"archiving {folder} into {archive_name} while uploading, please wait..."
+        )
+
+    def _iter_archive_parts(
+        part_size: int, max_num_parts: int
+    ) -> AsyncGenerator[IO, None]:
+        # NOTE: files might grow after the archive size was estimated, the
+        # overflow then goes into the last part instead of failing the upload
+        return archive_dir_in_parts(
+            folder,
+            part_size=part_size,
+            store_relative_path=True,
+            exclude_patterns=archive_exclude_patterns,
+            max_num_parts=max_num_parts,
+        )
+
+    log.info("uploading %s to S3 to %s...", archive_name, s3_object)
+    await filemanager.upload_file(
+        user_id=user_id,
+        store_id=SIMCORE_LOCATION,
+        store_name=None,
+        s3_object=s3_object,
+        file_to_upload=UploadableFileParts(
+            iter_parts=_iter_archive_parts,
+            file_name=archive_name,
+            file_size=await get_stored_archive_max_size(
+                folder,
+                store_relative_path=True,
+                exclude_patterns=archive_exclude_patterns,
+            ),
+        ),
+        io_log_redirect_cb=io_log_redirect_cb,
+    )
+    log.info("%s successfuly uploaded", archive_name)
+
+
 async def push(
     user_id: int,
     project_id: str,
@@ -61,6 +117,10 @@ async def push(
     r_clone_settings: Optional[RCloneSettings] = None,
     archive_exclude_patterns: Optional[set[str]] = None,
 ) -> None:
+    """
+    NOTE: folders are archived. Unless r_clone is used (it needs a file), the archive
+    is uploaded in parts while it is being produced, i.e. no temporary archive on disk
+    """
     if file_or_folder.is_file():
         return await _push_file(
             user_id,
@@ -70,6 +130,20 @@ async def push(
             rename_to=rename_to,
             io_log_redirect_cb=io_log_redirect_cb,
         )
+    if r_clone_settings is None:
+        with log_catch(log), log_context(
+            log, logging.INFO, "pushing %s", file_or_folder
+        ):
+            return await _push_folder_while_archiving(
+                user_id,
+                project_id,
+                node_uuid,
+                file_or_folder,
+                rename_to=rename_to,
+                io_log_redirect_cb=io_log_redirect_cb,
+                archive_exclude_patterns=archive_exclude_patterns,
+            )
+
     # we have a folder, so we create a compressed file
     with log_catch(log), log_context(
         log, logging.INFO, "pushing %s", file_or_folder
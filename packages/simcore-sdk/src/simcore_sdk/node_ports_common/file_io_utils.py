@@ -1,11 +1,13 @@
 import asyncio
 import json
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import (
     IO,
     AsyncGenerator,
+    Callable,
     Optional,
     Protocol,
     Union,
@@ -49,6 +51,21 @@ class UploadableFileObject:
     file_size: int
 
 
+@dataclass(frozen=True)
+class UploadableFileParts:
+    """File that is uploaded while it is produced (e.g. an archive)
+
+    iter_parts is called with the part size and the number of the upload links
+    and shall yield the file in parts of that size (only the last one can be
+    smaller) and in at most that number of parts (the last one can then be larger)
+    """
+
+    iter_parts: Callable[[int, int], AsyncGenerator[IO, None]]
+    file_name: str
+    # NOTE: upper bound of the size of the file, used to get the upload links
+    file_size: int
+
+
 class ExtendedClientResponseError(ClientResponseError):
     def __init__(
         self,
@@ -289,14 +306,81 @@ async def _upload_file_part(
     )
 
 
+async def _upload_file_parts_to_presigned_links(
+    session: ClientSession,
+    file_upload_links: FileUploadSchema,
+    file_to_upload: UploadableFileParts,
+    *,
+    num_retries: int,
+    io_log_redirect_cb: Optional[LogRedirectCB],
+) -> list[UploadedPart]:
+    """each part is uploaded as soon as it is produced, the next part
+    is produced while the current one is uploading
+    """
+    num_urls = len(file_upload_links.urls)
+    uploaded_parts: list[UploadedPart] = []
+    file_parts = file_to_upload.iter_parts(int(file_upload_links.chunk_size), num_urls)
+    with tqdm_logging_redirect(
+        desc=f"uploading {file_to_upload.file_name}\n",
+        total=file_to_upload.file_size,
+        **(
+            _TQDM_FILE_OPTIONS
+            | dict(miniters=_compute_tqdm_miniters(file_to_upload.file_size))
+        ),
+    ) as pbar:
+        try:
+            async for part in file_parts:
+                index = len(uploaded_parts)
+                if index >= num_urls:
+                    raise exceptions.S3TransferError(
+                        f"Could not upload file {file_to_upload.file_name}: larger than "
+                        f"the expected {file_to_upload.file_size} bytes"
+                    )
+                part_size = await asyncio.get_event_loop().run_in_executor(
+                    None, part.seek, 0, os.SEEK_END
+                )
+                _, e_tag = await _upload_file_part(
+                    session,
+                    UploadableFileObject(
+                        file_object=part,
+                        file_name=file_to_upload.file_name,
+                        file_size=part_size,
+                    ),
+                    index,
+                    0,
+                    part_size,
+                    file_upload_links.urls[index],
+                    pbar,
+                    num_retries,
+                    io_log_redirect_cb=io_log_redirect_cb,
+                )
+                uploaded_parts.append(UploadedPart(number=index + 1, e_tag=e_tag))
+            return uploaded_parts
+        except ClientError as exc:
+            raise exceptions.S3TransferError(
+                f"Could not upload file {file_to_upload.file_name}:{exc}"
+            ) from exc
+        finally:
+            await file_parts.aclose()
+
+
 async def upload_file_to_presigned_links(
     session: ClientSession,
     file_upload_links: FileUploadSchema,
-    file_to_upload: Union[Path, UploadableFileObject],
+    file_to_upload: Union[Path, UploadableFileObject, UploadableFileParts],
     *,
     num_retries: int,
     io_log_redirect_cb: Optional[LogRedirectCB],
 ) -> list[UploadedPart]:
+    if isinstance(file_to_upload, UploadableFileParts):
+        return await _upload_file_parts_to_presigned_links(
+            session,
+            file_upload_links,
+            file_to_upload,
+            num_retries=num_retries,
+            io_log_redirect_cb=io_log_redirect_cb,
+        )
+
     file_size = 0
     file_name = ""
     if isinstance(file_to_upload, Path):
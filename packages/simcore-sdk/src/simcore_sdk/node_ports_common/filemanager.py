@@ -20,6 +20,7 @@ from models_library.projects_nodes_io import StorageFileID
 from models_library.users import UserID
 from models_library.utils.fastapi_encoders import jsonable_encoder
 from pydantic import ByteSize, parse_obj_as
+from servicelib.archiving_utils import ArchiveError
 from settings_library.r_clone import RCloneSettings
 from tenacity._asyncio import AsyncRetrying
 from tenacity.before_sleep import before_sleep_log
@@ -34,6 +35,7 @@ from .constants import SIMCORE_LOCATION
 from .file_io_utils import (
     LogRedirectCB,
     UploadableFileObject,
+    UploadableFileParts,
     download_link_to_file,
     upload_file_to_presigned_links,
 )
@@ -148,6 +150,31 @@ async def get_download_link_from_s3(
         )
 
 
+async def get_download_links_from_s3(
+    *,
+    user_id: UserID,
+    store_id: LocationID,
+    s3_objects: list[StorageFileID],
+    link_type: storage_client.LinkType,
+    client_session: Optional[ClientSession] = None,
+) -> dict[StorageFileID, URL]:
+    """returns the download links of all s3_objects using a single call to storage
+
+    :raises exceptions.S3InvalidPathError
+    :raises exceptions.StorageInvalidCall
+    :raises exceptions.StorageServerIssue
+    """
+    async with ClientSessionContextManager(client_session) as session:
+        links = await storage_client.get_download_file_links(
+            session=session,
+            file_ids=s3_objects,
+            location_id=store_id,
+            user_id=user_id,
+            link_type=link_type,
+        )
+        return {file_id: URL(link) for file_id, link in links.items()}
+
+
 async def get_upload_links_from_s3(
     *,
     user_id: UserID,
@@ -277,12 +304,13 @@ async def upload_file(
     store_id: Optional[LocationID],
     store_name: Optional[LocationName],
     s3_object: StorageFileID,
-    file_to_upload: Union[Path, UploadableFileObject],
+    file_to_upload: Union[Path, UploadableFileObject, UploadableFileParts],
     io_log_redirect_cb: Optional[LogRedirectCB],
     client_session: Optional[ClientSession] = None,
     r_clone_settings: Optional[RCloneSettings] = None,
 ) -> tuple[LocationID, ETag]:
-    """Uploads a file (potentially in parallel) or a file object (sequential in any case) to S3
+    """Uploads a file (potentially in parallel), a file object (sequential in any case)
+    or file parts (sequential, uploaded while produced) to S3
 
     :param session: add app[APP_CLIENT_SESSION_KEY] session here otherwise default is opened/closed every call
     :type session: ClientSession, optional
@@ -356,6 +384,12 @@ async def upload_file(
                 await _abort_upload(session, upload_links, reraise_exceptions=False)
                 log.warning("Upload aborted")
             raise exceptions.S3TransferError from exc
+        except ArchiveError:
+            log.error("The upload failed while producing the file:", exc_info=True)
+            if upload_links:
+                await _abort_upload(session, upload_links, reraise_exceptions=False)
+                log.warning("Upload aborted")
+            raise
         if io_log_redirect_cb:
             await io_log_redirect_cb(f"upload of {file_to_upload} complete.")
         return store_id, e_tag
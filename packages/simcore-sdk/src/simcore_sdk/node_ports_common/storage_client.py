@@ -6,12 +6,14 @@ from urllib.parse import quote
 from aiohttp import ClientSession, web
 from aiohttp.client_exceptions import ClientConnectionError, ClientResponseError
 from models_library.api_schemas_storage import (
+    FileDownloadLinksBody,
     FileLocationArray,
     FileMetaDataGet,
     FileUploadSchema,
     LinkType,
     LocationID,
     PresignedLink,
+    PresignedLinks,
     StorageFileID,
 )
 from models_library.generics import Envelope
@@ -104,6 +106,37 @@ async def get_download_file_link(
         return presigned_link_enveloped.data.link
 
 
+@handle_client_exception
+async def get_download_file_links(
+    *,
+    session: ClientSession,
+    file_ids: list[StorageFileID],
+    location_id: LocationID,
+    user_id: UserID,
+    link_type: LinkType,
+) -> dict[StorageFileID, AnyUrl]:
+    """returns the download links of all file_ids in a single call to storage
+
+    :raises exceptions.StorageInvalidCall
+    :raises exceptions.StorageServerIssue
+    """
+    async with session.post(
+        f"{_base_url()}/locations/{location_id}/files:download-links",
+        params={"user_id": f"{user_id}", "link_type": link_type.value},
+        json=FileDownloadLinksBody(file_ids=file_ids).dict(),
+    ) as response:
+        response.raise_for_status()
+
+        presigned_links_enveloped = Envelope[PresignedLinks].parse_obj(
+            await response.json()
+        )
+        if presigned_links_enveloped.data is None:
+            raise exceptions.S3InvalidPathError(
+                f"files {location_id}@{file_ids} not found"
+            )
+        return presigned_links_enveloped.data.links
+
+
 @handle_client_exception
 async def get_upload_file_links(
     *,
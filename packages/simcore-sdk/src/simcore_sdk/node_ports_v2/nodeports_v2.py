@@ -16,7 +16,7 @@ from ..node_ports_common.exceptions import PortNotFound, UnboundPortError
 from ..node_ports_common.file_io_utils import LogRedirectCB
 from ..node_ports_common.storage_client import LinkType
 from ..node_ports_v2.port import SetKWargs
-from .links import ItemConcreteValue, ItemValue
+from .links import DataItemValue, ItemConcreteValue, ItemValue
 from .port_utils import is_file_type
 from .ports_mapping import InputsList, OutputsList
 
@@ -85,6 +85,15 @@ class Nodeports(BaseModel):
             file_link_type=file_link_type
         )
 
+    async def get_data_value(self, item_key: str) -> Optional[DataItemValue]:
+        try:
+            return await (await self.inputs)[item_key].get_data_value()
+        except UnboundPortError:
+            # not available try outputs
+            pass
+        # if this fails it will raise an exception
+        return await (await self.outputs)[item_key].get_data_value()
+
     async def get(self, item_key: str) -> Optional[ItemConcreteValue]:
         try:
             return await (await self.inputs)[item_key].get()
@@ -220,6 +220,20 @@ class Port(BaseServiceIOModel):
             self.value_item = v
         return v
 
+    async def get_data_value(self) -> Optional[DataItemValue]:
+        """Resolves links to other nodes' ports and returns resulted value
+
+        As opposed to get_value, file links are NOT resolved into download links
+        (see port_utils.get_download_links_from_storage to resolve many at once)
+        """
+        if isinstance(self.value, PortLink):
+            return await port_utils.get_data_value_from_port_link(
+                self.value,
+                # pylint: disable=protected-access
+                self._node_ports._node_ports_creator_cb,
+            )
+        return self.value
+
     async def get(self) -> Optional[ItemConcreteValue]:
         """
         Transforms DataItemValue value -> ItemConcreteValue
@@ -7,6 +7,7 @@ from models_library.api_schemas_storage import FileUploadSchema
 from models_library.users import UserID
 from pydantic import AnyUrl, ByteSize
 from pydantic.tools import parse_obj_as
+from servicelib.utils import logged_gather
 from settings_library.r_clone import RCloneSettings
 from yarl import URL
 
@@ -14,7 +15,14 @@ from ..node_ports_common import data_items_utils, filemanager
 from ..node_ports_common.constants import SIMCORE_LOCATION
 from ..node_ports_common.filemanager import LogRedirectCB
 from ..node_ports_common.storage_client import LinkType
-from .links import DownloadLink, FileLink, ItemConcreteValue, ItemValue, PortLink
+from .links import (
+    DataItemValue,
+    DownloadLink,
+    FileLink,
+    ItemConcreteValue,
+    ItemValue,
+    PortLink,
+)
 
 log = logging.getLogger(__name__)
 
@@ -37,6 +45,15 @@ async def get_value_link_from_port_link(
     return other_value
 
 
+async def get_data_value_from_port_link(
+    value: PortLink,
+    node_port_creator: Callable[[str], Coroutine[Any, Any, Any]],
+) -> Optional[DataItemValue]:
+    log.debug("Getting data value %s", value)
+    other_nodeports = await node_port_creator(value.node_uuid)
+    return await other_nodeports.get_data_value(value.output)
+
+
 async def get_value_from_link(
     key: str,
     value: PortLink,
@@ -94,6 +111,34 @@ async def get_download_link_from_storage(
     return parse_obj_as(AnyUrl, f"{link}")
 
 
+async def get_download_links_from_storage(
+    user_id: UserID, values: list[FileLink], link_type: LinkType
+) -> list[AnyUrl]:
+    """returns the download links of values (in the same order) using a single
+    call to storage per store
+
+    :raises exceptions.S3InvalidPathError
+    :raises exceptions.StorageInvalidCall
+    :raises exceptions.StorageServerIssue
+    """
+    log.debug("getting links to %d files from storage", len(values))
+    store_ids = list({v.store for v in values})
+    stores_links = await logged_gather(
+        *(
+            filemanager.get_download_links_from_s3(
+                user_id=user_id,
+                store_id=store_id,
+                s3_objects=list({v.path for v in values if v.store == store_id}),
+                link_type=link_type,
+            )
+            for store_id in store_ids
+        ),
+        log=log,
+    )
+    links = dict(zip(store_ids, stores_links))
+    return [parse_obj_as(AnyUrl, f"{links[v.store][v.path]}") for v in values]
+
+
 async def get_download_link_from_storage_overload(
     user_id: UserID, project_id: str, node_id: str, file_name: str, link_type: LinkType
 ) -> AnyUrl:
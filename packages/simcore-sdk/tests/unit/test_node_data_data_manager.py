@@ -8,8 +8,10 @@ from shutil import copy, make_archive, unpack_archive
 from typing import Callable, Iterator
 
 import pytest
+from settings_library.r_clone import RCloneSettings
 from simcore_sdk.node_data import data_manager
 from simcore_sdk.node_ports_common.constants import SIMCORE_LOCATION
+from simcore_sdk.node_ports_common.file_io_utils import UploadableFileParts
 
 
 @pytest.fixture
@@ -70,14 +72,21 @@ async def test_push_folder(
     for file_path in test_folder.glob("**/*"):
         assert file_path.exists()
 
+    # NOTE: with r_clone the archive is created in a temporary directory
+    r_clone_settings = mocker.MagicMock(spec=RCloneSettings)
     await data_manager.push(
-        user_id, project_id, node_uuid, test_folder, io_log_redirect_cb=None
+        user_id,
+        project_id,
+        node_uuid,
+        test_folder,
+        io_log_redirect_cb=None,
+        r_clone_settings=r_clone_settings,
     )
 
     mock_temporary_directory.assert_called_once()
     mock_filemanager.upload_file.assert_called_once_with(
         file_to_upload=(test_compression_folder / f"{test_folder.stem}.zip"),
-        r_clone_settings=None,
+        r_clone_settings=r_clone_settings,
         io_log_redirect_cb=None,
         s3_object=f"{project_id}/{node_uuid}/{test_folder.stem}.zip",
         store_id=SIMCORE_LOCATION,
@@ -101,6 +110,67 @@ async def test_push_folder(
     assert not errors
 
 
+async def test_push_folder_while_archiving(
+    user_id: int,
+    project_id: str,
+    node_uuid: str,
+    mocker,
+    tmpdir: Path,
+    create_files: Callable,
+):
+    test_folder = Path(tmpdir) / "test_folder"
+    test_folder.mkdir()
+    files_number = 10
+    create_files(files_number, test_folder)
+
+    uploaded_archive = Path(tmpdir) / "uploaded.zip"
+    part_size = 128
+
+    async def _upload_file(*, file_to_upload: UploadableFileParts, **kwargs):
+        assert isinstance(file_to_upload, UploadableFileParts)
+        parts_sizes = []
+        with uploaded_archive.open("wb") as fp:
+            max_num_parts = -(-file_to_upload.file_size // part_size)
+            async for part in file_to_upload.iter_parts(part_size, max_num_parts):
+                data = part.read()
+                parts_sizes.append(len(data))
+                fp.write(data)
+        # only the last part can be smaller
+        assert all(size == part_size for size in parts_sizes[:-1])
+        assert 0 < parts_sizes[-1] <= part_size
+        assert sum(parts_sizes) <= file_to_upload.file_size
+        return SIMCORE_LOCATION, ""
+
+    mock_filemanager = mocker.patch(
+        "simcore_sdk.node_data.data_manager.filemanager", spec=True
+    )
+    mock_filemanager.upload_file.side_effect = _upload_file
+    mock_temporary_directory = mocker.patch(
+        "simcore_sdk.node_data.data_manager.TemporaryDirectory"
+    )
+
+    await data_manager.push(
+        user_id, project_id, node_uuid, test_folder, io_log_redirect_cb=None
+    )
+
+    # no temporary archive is created
+    mock_temporary_directory.assert_not_called()
+    mock_filemanager.upload_file.assert_called_once()
+    assert (
+        mock_filemanager.upload_file.call_args.kwargs["s3_object"]
+        == f"{project_id}/{node_uuid}/{test_folder.stem}.zip"
+    )
+
+    control_folder = Path(tmpdir) / "control_folder"
+    unpack_archive(f"{uploaded_archive}", extract_dir=control_folder, format="zip")
+    matchs, mismatchs, errors = cmpfiles(
+        test_folder, control_folder, [x.name for x in test_folder.glob("**/*")]
+    )
+    assert len(matchs) == files_number
+    assert not mismatchs
+    assert not errors
+
+
 async def test_push_file(
     user_id: int,
     project_id: str,
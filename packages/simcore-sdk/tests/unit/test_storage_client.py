@@ -27,6 +27,7 @@ from simcore_sdk.node_ports_common.storage_client import (
     LinkType,
     delete_file,
     get_download_file_link,
+    get_download_file_links,
     get_file_metadata,
     get_storage_locations,
     get_upload_file_links,
@@ -99,6 +100,34 @@ async def test_get_download_file_link(
     assert link.scheme in expected_scheme
 
 
+@pytest.mark.parametrize(
+    "link_type, expected_scheme",
+    [(LinkType.PRESIGNED, ("http", "https")), (LinkType.S3, ("s3", "s3a"))],
+)
+async def test_get_download_file_links(
+    mock_environment: None,
+    storage_v0_service_mock: AioResponsesMock,
+    session: aiohttp.ClientSession,
+    user_id: UserID,
+    file_id: SimcoreS3FileID,
+    location_id: LocationID,
+    link_type: LinkType,
+    expected_scheme: tuple[str],
+):
+    file_ids = [file_id, f"{file_id}.bak"]
+    links = await get_download_file_links(
+        session=session,
+        file_ids=file_ids,
+        location_id=location_id,
+        user_id=user_id,
+        link_type=link_type,
+    )
+    assert list(links) == file_ids
+    for link in links.values():
+        assert isinstance(link, AnyUrl)
+        assert link.scheme in expected_scheme
+
+
 @pytest.mark.parametrize(
     "link_type, expected_scheme",
     [(LinkType.PRESIGNED, ("http", "https")), (LinkType.S3, ("s3", "s3a"))],
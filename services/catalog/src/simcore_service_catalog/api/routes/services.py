@@ -1,27 +1,26 @@
 # pylint: disable=too-many-arguments
 
-import asyncio
 import logging
 import urllib.parse
 from typing import Any, Optional, cast
 
-from aiocache import cached
 from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import JSONResponse
 from models_library.services import ServiceKey, ServiceType, ServiceVersion
 from models_library.services_db import ServiceAccessRightsAtDB, ServiceMetaDataAtDB
-from pydantic import ValidationError
 from pydantic.types import PositiveInt
 from starlette.requests import Request
+from starlette.responses import Response
 
 from ...db.repositories.groups import GroupsRepository
 from ...db.repositories.services import ServicesRepository
-from ...models.schemas.constants import (
-    DIRECTOR_CACHING_TTL,
-    LIST_SERVICES_CACHING_TTL,
-    RESPONSE_MODEL_POLICY,
-)
+from ...models.schemas.constants import RESPONSE_MODEL_POLICY
 from ...models.schemas.services import ServiceGet, ServiceUpdate
 from ...services.function_services import get_function_service, is_function_service
+from ...services.services_snapshot import (
+    get_services_snapshot,
+    invalidate_services_snapshot,
+)
 from ...utils.requests_decorators import cancellable_request
 from ..dependencies.database import get_repository
 from ..dependencies.director import DirectorApi, get_director_api
@@ -29,58 +28,20 @@ from ..dependencies.director import DirectorApi, get_director_api
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-ServicesSelection = set[tuple[str, str]]
-
-
-def _prepare_service_details(
-    service_in_registry: dict[str, Any],
-    service_in_db: ServiceMetaDataAtDB,
-    service_access_rights_in_db: list[ServiceAccessRightsAtDB],
-    service_owner: Optional[str],
-) -> Optional[ServiceGet]:
-    # compose service from registry and DB
-    composed_service = service_in_registry
-    composed_service.update(
-        service_in_db.dict(exclude_unset=True, exclude={"owner"}),
-        access_rights={rights.gid: rights for rights in service_access_rights_in_db},
-        owner=service_owner if service_owner else None,
-    )
-
-    # validate the service
-    validated_service = None
-    try:
-        validated_service = ServiceGet(**composed_service)
-    except ValidationError as exc:
-        logger.warning(
-            "could not validate service [%s:%s]: %s",
-            composed_service.get("key"),
-            composed_service.get("version"),
-            exc,
-        )
-    return validated_service
-
-
-def _build_cache_key(fct, *_, **kwargs):
-    return f"{fct.__name__}_{kwargs['user_id']}_{kwargs['x_simcore_products_name']}_{kwargs['details']}"
-
-
 # NOTE: this call is pretty expensive and can be called several times
 # (when e2e runs or by the webserver when listing projects) therefore
-# a cache is setup here
+# the detailed services are prepared once per product in a snapshot
+# (see services_snapshot) and only filtered here
 @router.get("", response_model=list[ServiceGet], **RESPONSE_MODEL_POLICY)
 @cancellable_request
-@cached(
-    ttl=LIST_SERVICES_CACHING_TTL,
-    key_builder=_build_cache_key,
-)
 async def list_services(
-    request: Request,  # pylint:disable=unused-argument
+    request: Request,
     user_id: PositiveInt,
     details: Optional[bool] = True,
-    director_client: DirectorApi = Depends(get_director_api),
     groups_repository: GroupsRepository = Depends(get_repository(GroupsRepository)),
     services_repo: ServicesRepository = Depends(get_repository(ServicesRepository)),
     x_simcore_products_name: str = Header(...),
+    if_none_match: Optional[str] = Header(None),
 ):
     # Access layer
     user_groups = await groups_repository.list_user_groups(user_id)
@@ -90,18 +51,8 @@ async def list_services(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You have unsufficient rights to access the services",
         )
+    gids = [group.gid for group in user_groups]
 
-    # now get the executable or writable services
-    services_in_db = {
-        (s.key, s.version): s
-        for s in await services_repo.list_services(
-            gids=[group.gid for group in user_groups],
-            execute_access=True,
-            write_access=True,
-            combine_access_with_and=False,
-            product_name=x_simcore_products_name,
-        )
-    }
     # Non-detailed views from the services_repo database
     if not details:
         # only return a stripped down version
@@ -110,8 +61,8 @@ async def list_services(
         # in terms of time, this takes the most
         services_overview = [
             ServiceGet.construct(
-                key=key,
-                version=version,
+                key=service.key,
+                version=service.version,
                 name="nodetails",
                 description="nodetails",
                 type=ServiceType.COMPUTATIONAL,
@@ -119,57 +70,32 @@ async def list_services(
                 contact="nodetails@nodetails.com",
                 inputs={},
                 outputs={},
-                deprecated=services_in_db[(key, version)].deprecated,
+                deprecated=service.deprecated,
+            )
+            for service in await services_repo.list_services(
+                gids=gids,
+                execute_access=True,
+                write_access=True,
+                combine_access_with_and=False,
+                product_name=x_simcore_products_name,
             )
-            for key, version in services_in_db
         ]
         return services_overview
 
-    # caching this steps brings down the time to generate it at the expense of being sometimes a bit out of date
-    @cached(ttl=DIRECTOR_CACHING_TTL)
-    async def cached_registry_services() -> dict[str, Any]:
-        return cast(dict[str, Any], await director_client.get("/services"))
-
-    (
-        services_in_registry,
-        services_access_rights,
-        services_owner_emails,
-    ) = await asyncio.gather(
-        cached_registry_services(),
-        services_repo.list_services_access_rights(
-            key_versions=services_in_db,
-            product_name=x_simcore_products_name,
-        ),
-        groups_repository.list_user_emails_from_gids(
-            {s.owner for s in services_in_db.values() if s.owner}
-        ),
-    )
+    snapshot = await get_services_snapshot(request.app, x_simcore_products_name)
+    etag = snapshot.create_etag(gids)
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    ):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
 
-    # NOTE: for the details of the services:
-    # 1. we get all the services from the director-v0 (TODO: move the registry to the catalog)
-    # 2. we filter the services using the visible ones from the db
-    # 3. then we compose the final service using as a base the registry service, overriding with the same
-    #    service from the database, adding also the access rights and the owner as email address instead of gid
-    # NOTE: This step takes the bulk of the time to generate the list
-    services_details = await asyncio.gather(
-        *[
-            asyncio.get_event_loop().run_in_executor(
-                None,
-                _prepare_service_details,
-                s,
-                services_in_db[s["key"], s["version"]],
-                services_access_rights[s["key"], s["version"]],
-                services_owner_emails.get(
-                    services_in_db[s["key"], s["version"]].owner or 0
-                ),
-            )
-            for s in (
-                request.app.state.frontend_services_catalog + services_in_registry
-            )
-            if (s.get("key"), s.get("version")) in services_in_db
-        ]
+    # NOTE: the details are already validated and encoded in the snapshot
+    return JSONResponse(
+        content=snapshot.list_services_details(gids), headers={"ETag": etag}
     )
-    return [s for s in services_details if s is not None]
 
 
 @router.get(
@@ -262,6 +188,7 @@ async def get_service(
 )
 async def update_service(
     # pylint: disable=too-many-arguments
+    request: Request,
     user_id: int,
     service_key: ServiceKey,
     service_version: ServiceVersion,
@@ -355,6 +282,9 @@ async def update_service(
         ]
         await services_repo.delete_service_access_rights(deleted_access_rights)
 
+    # the listed services of this product are not valid anymore
+    invalidate_services_snapshot(request.app, x_simcore_products_name)
+
     # now return the service
     return await get_service(
         user_id,
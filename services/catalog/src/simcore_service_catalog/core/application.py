@@ -19,6 +19,7 @@ from ..api.root import router as api_router
 from ..api.routes.health import router as health_router
 from ..meta import API_VERSION, API_VTAG, PROJECT_NAME, SUMMARY
 from ..services.function_services import setup_function_services
+from ..services.services_snapshot import setup_services_snapshots
 from .events import (
     create_start_app_handler,
     create_stop_app_handler,
@@ -53,6 +54,7 @@ def init_app(settings: Optional[AppSettings] = None) -> FastAPI:
     app.state.settings = settings
 
     setup_function_services(app)
+    setup_services_snapshots(app)
 
     # events
     app.add_event_handler("startup", on_startup)
@@ -1,24 +1,32 @@
 """This background task does the following:
 
 1. gets the full list of services from the docker registry through the director
-2. gets the same list from the DB
-3. if services are missing from the DB, they are added with basic access rights
+   and keeps only the ones that are new or changed since the last sync (using a digest of each service)
+2. gets which of these are already in the DB
+3. if services are missing from the DB, they are added (in batches) with basic access rights
     3.a. basic access rights are set as following:
         1. writable access allow the user to change meta data as well as access rights
         2. executable access allow the user to see/execute the service
+4. refreshes the snapshots of the services listed so far (if the registry or the DB changed)
 
 """
 
 import asyncio
+import hashlib
+import json
 import logging
+from collections import defaultdict
 from contextlib import suppress
+from itertools import chain
 from pprint import pformat
+from typing import Any, Final
 
 from fastapi import FastAPI
 from models_library.services import ServiceDockerData
 from models_library.services_db import ServiceAccessRightsAtDB, ServiceMetaDataAtDB
 from packaging.version import Version
 from pydantic import ValidationError
+from servicelib.utils import logged_gather
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from ..api.dependencies.director import get_director_api
@@ -27,6 +35,7 @@ from ..db.repositories.projects import ProjectsRepository
 from ..db.repositories.services import ServicesRepository
 from ..services import access_rights
 from ..services.function_services import iter_service_docker_data
+from ..services.services_snapshot import refresh_services_snapshots
 
 logger = logging.getLogger(__name__)
 
@@ -34,18 +43,34 @@ logger = logging.getLogger(__name__)
 ServiceKey = str
 ServiceVersion = str
 ServiceDockerDataMap = dict[tuple[ServiceKey, ServiceVersion], ServiceDockerData]
+RegistryDigestsMap = dict[tuple[ServiceKey, ServiceVersion], str]
+
+_MAX_CONCURRENT_SERVICES_EVALUATIONS: Final[int] = 10
+
+
+def _compute_digest(service_data: dict[str, Any]) -> str:
+    return hashlib.sha256(
+        json.dumps(service_data, sort_keys=True, default=str).encode()
+    ).hexdigest()
 
 
 async def _list_registry_services(
-    app: FastAPI,
-) -> ServiceDockerDataMap:
+    app: FastAPI, known_digests: RegistryDigestsMap
+) -> tuple[ServiceDockerDataMap, RegistryDigestsMap]:
+    """Lists the services in the registry
 
+    Only the services that are new or changed with respect to known_digests are validated
+    and returned, together with the digests of all the services currently in the registry
+    """
     client = get_director_api(app)
     data = await client.get("/services")
-    services: ServiceDockerDataMap = {
-        (s.key, s.version): s for s in iter_service_docker_data()
-    }
-    for x in data:
+    services: ServiceDockerDataMap = {}
+    digests: RegistryDigestsMap = {}
+    for x in chain((s.dict(by_alias=True) for s in iter_service_docker_data()), data):
+        key_version = (x.get("key"), x.get("version"))
+        digests[key_version] = _compute_digest(x)
+        if known_digests.get(key_version) == digests[key_version]:
+            continue
         try:
             service_data = ServiceDockerData.parse_obj(x)
             services[(service_data.key, service_data.version)] = service_data
@@ -58,17 +83,60 @@ async def _list_registry_services(
                 exc,
             )
 
-    return services
+    return services, digests
 
 
-async def _list_db_services(
-    db_engine: AsyncEngine,
-) -> set[tuple[ServiceKey, ServiceVersion]]:
-    services_repo = ServicesRepository(db_engine=db_engine)
-    return {
-        (service.key, service.version)
-        for service in await services_repo.list_services()
-    }
+def _group_in_creation_waves(
+    service_keys: set[tuple[ServiceKey, ServiceVersion]]
+) -> list[list[tuple[ServiceKey, ServiceVersion]]]:
+    """Groups services such that those in a wave can be created together
+
+    A patch release inherits the access rights of its previous patch release
+    (see AUTO-UPGRADE PATCH policy), therefore releases of a same key and minor version
+    are placed in consecutive waves (sorted by version)
+    """
+    releases: dict[
+        tuple[ServiceKey, int, int], list[tuple[ServiceKey, ServiceVersion]]
+    ] = defaultdict(list)
+    for service_key, service_version in sorted(
+        service_keys, key=lambda t: Version(t[1])
+    ):
+        version = Version(service_version)
+        releases[(service_key, version.major, version.minor)].append(
+            (service_key, service_version)
+        )
+
+    waves: list[list[tuple[ServiceKey, ServiceVersion]]] = []
+    for minor_releases in releases.values():
+        for n, key_version in enumerate(minor_releases):
+            if n == len(waves):
+                waves.append([])
+            waves[n].append(key_version)
+    return waves
+
+
+async def _evaluate_service_access_rights(
+    app: FastAPI, service_metadata: ServiceDockerData, services_repo: ServicesRepository
+) -> tuple[ServiceMetaDataAtDB, list[ServiceAccessRightsAtDB]]:
+    # DEFAULT policies
+    (
+        owner_gid,
+        service_access_rights,
+    ) = await access_rights.evaluate_default_policy(app, service_metadata)
+
+    # AUTO-UPGRADE PATCH policy
+    inherited_access_rights = await access_rights.evaluate_auto_upgrade_policy(
+        service_metadata, services_repo
+    )
+
+    service_access_rights += inherited_access_rights
+    service_access_rights = access_rights.reduce_access_rights(service_access_rights)
+
+    service_metadata_dict = service_metadata.dict()
+    return (
+        ServiceMetaDataAtDB(**service_metadata_dict, owner=owner_gid),
+        service_access_rights,
+    )
 
 
 async def _create_services_in_db(
@@ -76,55 +144,41 @@ async def _create_services_in_db(
     service_keys: set[tuple[ServiceKey, ServiceVersion]],
     services_in_registry: dict[tuple[ServiceKey, ServiceVersion], ServiceDockerData],
 ) -> None:
-    """Adds a new service in the database
+    """Adds new services in the database
 
-    Determines the access rights of each service and adds it to the database"""
+    Determines the access rights of each service and adds them to the database"""
 
     services_repo = ServicesRepository(app.state.engine)
 
-    sorted_services = sorted(service_keys, key=lambda t: Version(t[1]))
-
-    for service_key, service_version in sorted_services:
-        service_metadata: ServiceDockerData = services_in_registry[
-            (service_key, service_version)
-        ]
-        ## Set deprecation date to null (is valid date value for postgres)
-
-        # DEFAULT policies
-        (
-            owner_gid,
-            service_access_rights,
-        ) = await access_rights.evaluate_default_policy(app, service_metadata)
-
-        # AUTO-UPGRADE PATCH policy
-        inherited_access_rights = await access_rights.evaluate_auto_upgrade_policy(
-            service_metadata, services_repo
-        )
-
-        service_access_rights += inherited_access_rights
-        service_access_rights = access_rights.reduce_access_rights(
-            service_access_rights
-        )
-
-        service_metadata_dict = service_metadata.dict()
-        # set the service in the DB
-        await services_repo.create_service(
-            ServiceMetaDataAtDB(**service_metadata_dict, owner=owner_gid),
-            service_access_rights,
+    for wave in _group_in_creation_waves(service_keys):
+        new_services = await logged_gather(
+            *(
+                _evaluate_service_access_rights(
+                    app, services_in_registry[key_version], services_repo
+                )
+                for key_version in wave
+            ),
+            log=logger,
+            max_concurrency=_MAX_CONCURRENT_SERVICES_EVALUATIONS,
         )
+        # set the services in the DB
+        await services_repo.create_services(new_services)
 
 
 async def _ensure_registry_insync_with_db(app: FastAPI) -> None:
     """Ensures that the services listed in the database is in sync with the registry
 
     Notice that a services here refers to a 2-tuple (key, version)
+
+    NOTE: this is incremental, i.e. only the services that are new (or changed) in the
+    registry since the last successful sync are checked against the database
     """
-    services_in_registry: dict[
-        tuple[ServiceKey, ServiceVersion], ServiceDockerData
-    ] = await _list_registry_services(app)
-    services_in_db: set[tuple[ServiceKey, ServiceVersion]] = await _list_db_services(
-        app.state.engine
+    services_in_registry, registry_digests = await _list_registry_services(
+        app, app.state.registry_services_digests
     )
+    services_in_db: set[tuple[ServiceKey, ServiceVersion]] = await ServicesRepository(
+        app.state.engine
+    ).list_existing_services(services_in_registry.keys())
 
     # check that the db has all the services at least once
     missing_services_in_db = set(services_in_registry.keys()) - services_in_db
@@ -137,6 +191,9 @@ async def _ensure_registry_insync_with_db(app: FastAPI) -> None:
         # update db
         await _create_services_in_db(app, missing_services_in_db, services_in_registry)
 
+    # NOTE: only once the db is in sync, so that failures are retried on the next iteration
+    app.state.registry_services_digests = registry_digests
+
 
 async def _ensure_published_templates_accessible(
     db_engine: AsyncEngine, default_product_name: str
@@ -182,6 +239,8 @@ async def _ensure_published_templates_accessible(
 async def sync_registry_task(app: FastAPI) -> None:
     default_product: str = app.state.settings.CATALOG_ACCESS_RIGHTS_DEFAULT_PRODUCT_NAME
     engine: AsyncEngine = app.state.engine
+    # NOTE: the first sync is a full one
+    app.state.registry_services_digests = {}
 
     while app.state.registry_syncer_running:
         try:
@@ -194,6 +253,9 @@ async def sync_registry_task(app: FastAPI) -> None:
             # (templates are published to GUESTs, so their services must be also accessible)
             await _ensure_published_templates_accessible(engine, default_product)
 
+            # prepare the services listings beforehand, so that requests do not have to
+            await refresh_services_snapshots(app)
+
             await asyncio.sleep(app.state.settings.CATALOG_BACKGROUND_TASK_REST_TIME)
 
         except asyncio.CancelledError:
@@ -100,6 +100,26 @@ class ServicesRepository(BaseRepository):
                 services_in_db.append(ServiceMetaDataAtDB(**row))
         return services_in_db
 
+    async def list_existing_services(
+        self, key_versions: Iterable[tuple[str, str]]
+    ) -> set[tuple[str, str]]:
+        """Returns which of key_versions are in the database"""
+        key_versions = list(key_versions)
+        if not key_versions:
+            return set()
+        query = sa.select(
+            [services_meta_data.c.key, services_meta_data.c.version]
+        ).where(
+            tuple_(services_meta_data.c.key, services_meta_data.c.version).in_(
+                key_versions
+            )
+        )
+        async with self.db_engine.connect() as conn:
+            return {
+                (row[services_meta_data.c.key], row[services_meta_data.c.version])
+                async for row in await conn.stream(query)
+            }
+
     async def list_service_releases(
         self,
         key: str,
@@ -225,6 +245,41 @@ class ServicesRepository(BaseRepository):
                 await conn.execute(insert_stmt)
         return created_service
 
+    async def create_services(
+        self,
+        new_services: list[tuple[ServiceMetaDataAtDB, list[ServiceAccessRightsAtDB]]],
+    ) -> None:
+        """Batch version of create_service (all or none are created)"""
+        for new_service, new_service_access_rights in new_services:
+            for access_rights in new_service_access_rights:
+                if (
+                    access_rights.key != new_service.key
+                    or access_rights.version != new_service.version
+                ):
+                    raise ValueError(
+                        f"{access_rights} does not correspond to service {new_service.key}:{new_service.version}"
+                    )
+        if not new_services:
+            return
+        all_access_rights = [
+            access_rights.dict(by_alias=True)
+            for _, new_service_access_rights in new_services
+            for access_rights in new_service_access_rights
+        ]
+        async with self.db_engine.begin() as conn:
+            # NOTE: this ensure proper rollback in case of issue
+            await conn.execute(
+                # pylint: disable=no-value-for-parameter
+                services_meta_data.insert(),
+                [new_service.dict(by_alias=True) for new_service, _ in new_services],
+            )
+            if all_access_rights:
+                await conn.execute(
+                    # pylint: disable=no-value-for-parameter
+                    services_access_rights.insert(),
+                    all_access_rights,
+                )
+
     async def update_service(
         self, patched_service: ServiceMetaDataAtDB
     ) -> ServiceMetaDataAtDB:
@@ -297,6 +352,27 @@ class ServicesRepository(BaseRepository):
                 ].append(ServiceAccessRightsAtDB(**row))
         return service_to_access_rights
 
+    async def get_services_fingerprint(self, product_name: str) -> str:
+        """Returns a value that changes whenever the services (or their access rights)
+        of 'product_name' change in the database
+        """
+        services_stats = sa.select(
+            [sa.func.count(), sa.func.max(services_meta_data.c.modified)]
+        ).subquery()
+        access_rights_stats = (
+            sa.select([sa.func.count(), sa.func.max(services_access_rights.c.modified)])
+            .where(services_access_rights.c.product_name == product_name)
+            .subquery()
+        )
+        async with self.db_engine.connect() as conn:
+            result = await conn.execute(
+                sa.select([services_stats, access_rights_stats]).select_from(
+                    services_stats.join(access_rights_stats, sa.true())
+                )
+            )
+            stats = result.first()
+        return f"{tuple(stats or ())}"
+
     async def upsert_service_access_rights(
         self, new_access_rights: list[ServiceAccessRightsAtDB]
     ) -> None:
@@ -312,11 +388,15 @@ class ServicesRepository(BaseRepository):
                     services_access_rights.c.gid,
                     services_access_rights.c.product_name,
                 ],
-                set_=rights.dict(
-                    by_alias=True,
-                    exclude_unset=True,
-                    exclude={"key", "version", "gid", "product_name"},
-                ),
+                set_={
+                    **rights.dict(
+                        by_alias=True,
+                        exclude_unset=True,
+                        exclude={"key", "version", "gid", "product_name"},
+                    ),
+                    # NOTE: onupdate is not triggered by ON CONFLICT DO UPDATE
+                    "modified": sa.func.now(),
+                },
             )
             try:
                 async with self.db_engine.begin() as conn:
@@ -13,6 +13,5 @@ RESPONSE_MODEL_POLICY: Final[dict[str, bool]] = {
 SECOND: Final[int] = 1
 MINUTE: Final[int] = 60 * SECOND
 DIRECTOR_CACHING_TTL: Final[int] = 5 * MINUTE
-LIST_SERVICES_CACHING_TTL: Final[int] = 30 * SECOND
 
 SIMCORE_SERVICE_SETTINGS_LABELS: Final[str] = "simcore.service.settings"
@@ -0,0 +1,249 @@
+""" Precomputed snapshot of the services of a product
+
+Composing the details of every service (i.e. registry + database + access rights + owner)
+and validating them is what makes listing the services expensive. Instead of doing
+it for every user, this is done once per product and the resulting snapshot is only
+rebuilt when either the registry or the database changes. Checking for these changes
+is cheap: a digest of the (cached) registry and a fingerprint of the database tables.
+
+The detailed services of a given user are then a (cheap) selection of the snapshot
+through the user's groups.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional, cast
+
+from aiocache import cached
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from models_library.services_db import ServiceAccessRightsAtDB, ServiceMetaDataAtDB
+from models_library.users import GroupID
+from pydantic import ValidationError
+
+from ..api.dependencies.director import get_director_api
+from ..db.repositories.groups import GroupsRepository
+from ..db.repositories.services import ServicesRepository
+from ..models.schemas.constants import DIRECTOR_CACHING_TTL, RESPONSE_MODEL_POLICY
+from ..models.schemas.services import ServiceGet
+
+logger = logging.getLogger(__name__)
+
+ServiceKeyVersion = tuple[str, str]
+
+
+def _prepare_service_details(
+    service_in_registry: dict[str, Any],
+    service_in_db: ServiceMetaDataAtDB,
+    service_access_rights_in_db: list[ServiceAccessRightsAtDB],
+    service_owner: Optional[str],
+) -> Optional[ServiceGet]:
+    # compose service from registry and DB
+    composed_service = dict(service_in_registry)
+    composed_service.update(
+        service_in_db.dict(exclude_unset=True, exclude={"owner"}),
+        access_rights={rights.gid: rights for rights in service_access_rights_in_db},
+        owner=service_owner if service_owner else None,
+    )
+
+    # validate the service
+    validated_service = None
+    try:
+        validated_service = ServiceGet(**composed_service)
+    except ValidationError as exc:
+        logger.warning(
+            "could not validate service [%s:%s]: %s",
+            composed_service.get("key"),
+            composed_service.get("version"),
+            exc,
+        )
+    return validated_service
+
+
+def _prepare_services_details(
+    services_in_registry: list[dict[str, Any]],
+    services_in_db: dict[ServiceKeyVersion, ServiceMetaDataAtDB],
+    services_access_rights: dict[ServiceKeyVersion, list[ServiceAccessRightsAtDB]],
+    services_owner_emails: dict[GroupID, Optional[str]],
+) -> dict[ServiceKeyVersion, dict[str, Any]]:
+    services_details = {}
+    for service in services_in_registry:
+        key_version = (service.get("key"), service.get("version"))
+        if key_version not in services_in_db:
+            continue
+        service_in_db = services_in_db[key_version]
+        if validated_service := _prepare_service_details(
+            service,
+            service_in_db,
+            services_access_rights[key_version],
+            services_owner_emails.get(service_in_db.owner or 0),
+        ):
+            # NOTE: encoded as the list_services response would be
+            services_details[key_version] = jsonable_encoder(
+                validated_service,
+                by_alias=RESPONSE_MODEL_POLICY["response_model_by_alias"],
+                exclude_unset=RESPONSE_MODEL_POLICY["response_model_exclude_unset"],
+            )
+    return services_details
+
+
+@dataclass
+class ServicesSnapshot:
+    product_name: str
+    fingerprint: str
+    # validated and encoded details of the services in the order of the registry
+    services_details: dict[ServiceKeyVersion, dict[str, Any]]
+    _gid_to_services: dict[GroupID, set[ServiceKeyVersion]] = field(
+        default_factory=dict
+    )
+
+    @classmethod
+    def create(
+        cls,
+        product_name: str,
+        fingerprint: str,
+        services_access_rights: dict[ServiceKeyVersion, list[ServiceAccessRightsAtDB]],
+        services_details: dict[ServiceKeyVersion, dict[str, Any]],
+    ) -> "ServicesSnapshot":
+        snapshot = cls(product_name, fingerprint, services_details)
+        for key_version, access_rights in services_access_rights.items():
+            for rights in access_rights:
+                if rights.execute_access or rights.write_access:
+                    snapshot._gid_to_services.setdefault(rights.gid, set()).add(
+                        key_version
+                    )
+        return snapshot
+
+    def list_services_details(self, gids: list[GroupID]) -> list[dict[str, Any]]:
+        """details of the services executable or writable by any of gids"""
+        accessible_services = self._list_accessible_services(gids)
+        return [
+            details
+            for key_version, details in self.services_details.items()
+            if key_version in accessible_services
+        ]
+
+    def create_etag(self, gids: list[GroupID]) -> str:
+        """the entity tag of the services details listed for gids"""
+        etag = hashlib.sha256(f"{self.fingerprint}:{sorted(gids)}".encode()).hexdigest()
+        return f'"{etag}"'
+
+    def _list_accessible_services(self, gids: list[GroupID]) -> set[ServiceKeyVersion]:
+        return set().union(*(self._gid_to_services.get(gid, set()) for gid in gids))
+
+
+# caching this steps brings down the time to generate it at the expense of being sometimes a bit out of date
+@cached(ttl=DIRECTOR_CACHING_TTL, key="services_snapshot_registry_services")
+async def _list_registry_services(app: FastAPI) -> tuple[list[dict[str, Any]], str]:
+    """returns the services in the registry and their digest"""
+    services_in_registry = app.state.frontend_services_catalog + cast(
+        list[dict[str, Any]], await get_director_api(app).get("/services")
+    )
+    digest = hashlib.sha256(
+        json.dumps(services_in_registry, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return services_in_registry, digest
+
+
+async def _create_snapshot(
+    app: FastAPI,
+    product_name: str,
+    fingerprint: str,
+    services_in_registry: list[dict[str, Any]],
+) -> ServicesSnapshot:
+    services_repo = ServicesRepository(app.state.engine)
+    groups_repo = GroupsRepository(app.state.engine)
+    services_in_db = {
+        (s.key, s.version): s
+        for s in await services_repo.list_services(
+            execute_access=True,
+            write_access=True,
+            combine_access_with_and=False,
+            product_name=product_name,
+        )
+    }
+    services_access_rights, services_owner_emails = await asyncio.gather(
+        services_repo.list_services_access_rights(
+            key_versions=services_in_db, product_name=product_name
+        ),
+        groups_repo.list_user_emails_from_gids(
+            {s.owner for s in services_in_db.values() if s.owner}
+        ),
+    )
+    # NOTE: this step takes the bulk of the time, it is done in one go in a thread
+    # so that the event loop is not blocked
+    services_details = await asyncio.get_event_loop().run_in_executor(
+        None,
+        _prepare_services_details,
+        services_in_registry,
+        services_in_db,
+        services_access_rights,
+        services_owner_emails,
+    )
+    return ServicesSnapshot.create(
+        product_name,
+        fingerprint,
+        services_access_rights,
+        services_details,
+    )
+
+
+async def get_services_snapshot(app: FastAPI, product_name: str) -> ServicesSnapshot:
+    """Returns the up-to-date snapshot of product_name, (re)builds it if the registry
+    or the database changed"""
+    services_in_registry, registry_digest = await _list_registry_services(app)
+    db_fingerprint = await ServicesRepository(
+        app.state.engine
+    ).get_services_fingerprint(product_name)
+    fingerprint = f"{registry_digest}:{db_fingerprint}"
+    snapshot: Optional[ServicesSnapshot] = app.state.services_snapshots.get(
+        product_name
+    )
+    if snapshot and snapshot.fingerprint == fingerprint:
+        return snapshot
+
+    # NOTE: only building the snapshot is serialized, so that concurrent requests
+    # of the same product do not build it several times
+    lock = app.state.services_snapshots_locks.setdefault(product_name, asyncio.Lock())
+    async with lock:
+        snapshot = app.state.services_snapshots.get(product_name)
+        if snapshot and snapshot.fingerprint == fingerprint:
+            # built in the meantime
+            return snapshot
+
+        start = time.monotonic()
+        snapshot = await _create_snapshot(
+            app, product_name, fingerprint, services_in_registry
+        )
+        app.state.services_snapshots[product_name] = snapshot
+        logger.info(
+            "services snapshot of '%s' rebuilt with %d services in %.2f secs",
+            product_name,
+            len(snapshot.services_details),
+            time.monotonic() - start,
+        )
+        return snapshot
+
+
+async def refresh_services_snapshots(app: FastAPI) -> None:
+    """Refreshes the snapshots of all the products that were requested so far"""
+    for product_name in list(app.state.services_snapshots):
+        await get_services_snapshot(app, product_name)
+
+
+def invalidate_services_snapshot(app: FastAPI, product_name: str) -> None:
+    app.state.services_snapshots.pop(product_name, None)
+
+
+def setup_services_snapshots(app: FastAPI) -> None:
+    """
+    Setup entrypoint for this app module.
+
+    Used in core.application.init_app
+    """
+    app.state.services_snapshots = {}
+    app.state.services_snapshots_locks = {}
@@ -0,0 +1,33 @@
+# pylint: disable=protected-access
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=unused-variable
+
+from simcore_service_catalog.core.background_tasks import _group_in_creation_waves
+
+
+def test_group_in_creation_waves():
+    jupyter = "simcore/services/dynamic/jupyterlab"
+    sleeper = "simcore/services/comp/itis/sleeper"
+    waves = _group_in_creation_waves(
+        {
+            (jupyter, "1.0.10"),
+            (jupyter, "1.0.2"),
+            (jupyter, "1.1.0"),
+            (jupyter, "2.0.0"),
+            (sleeper, "1.0.0"),
+            (sleeper, "1.0.1"),
+            (sleeper, "1.0.2"),
+        }
+    )
+    assert [set(w) for w in waves] == [
+        {
+            (jupyter, "1.0.2"),
+            (jupyter, "1.1.0"),
+            (jupyter, "2.0.0"),
+            (sleeper, "1.0.0"),
+        },
+        {(jupyter, "1.0.10"), (sleeper, "1.0.1")},
+        {(sleeper, "1.0.2")},
+    ]
+    assert _group_in_creation_waves(set()) == []
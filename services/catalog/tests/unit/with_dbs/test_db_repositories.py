@@ -115,6 +115,37 @@ async def test_create_services(
     assert new_service.dict(include=set(fake_service.keys())) == service.dict()
 
 
+async def test_create_services_in_batch(
+    services_repo: ServicesRepository, service_catalog_faker: Callable
+):
+    new_services = []
+    for service_version in ["1.0.0", "1.0.1"]:
+        fake_service, *fake_access_rights = service_catalog_faker(
+            "simcore/services/dynamic/jupyterlab",
+            service_version,
+            team_access="x",
+            everyone_access=None,
+        )
+        new_services.append(
+            (
+                ServiceMetaDataAtDB.parse_obj(fake_service),
+                [ServiceAccessRightsAtDB.parse_obj(a) for a in fake_access_rights],
+            )
+        )
+
+    await services_repo.create_services(new_services)
+
+    key_versions = {(s.key, s.version) for s, _ in new_services}
+    assert await services_repo.list_existing_services(key_versions) == key_versions
+    for service, access_rights in new_services:
+        assert {
+            (r.gid, r.execute_access, r.write_access)
+            for r in await services_repo.get_service_access_rights(
+                service.key, service.version
+            )
+        } == {(r.gid, r.execute_access, r.write_access) for r in access_rights}
+
+
 async def test_read_services(
     services_repo: ServicesRepository,
     user_groups_ids: list[int],
@@ -294,3 +294,78 @@ async def test_list_services_that_are_deprecated(
     assert len(list_of_services) == 1
     received_service = list_of_services[0]
     assert received_service.deprecated == deprecation_date
+
+
+async def test_list_services_etag(
+    mock_catalog_background_task,
+    disable_service_caching,
+    director_mockup: MockRouter,
+    client: TestClient,
+    user_id: int,
+    products_names: list[str],
+    service_catalog_faker: Callable,
+    services_db_tables_injector: Callable,
+):
+    target_product = products_names[-1]
+    await services_db_tables_injector(
+        [
+            service_catalog_faker(
+                "simcore/services/dynamic/jupyterlab",
+                "1.0.0",
+                team_access=None,
+                everyone_access=None,
+                product=target_product,
+            )
+        ]
+    )
+    # the registry already has the version that is added later to the db
+    fake_registry_service_data = ServiceDockerData.Config.schema_extra["examples"][0]
+    director_mockup.get("/services", name="list_services").respond(
+        200,
+        json={
+            "data": [
+                {
+                    **fake_registry_service_data,
+                    **{"key": "simcore/services/dynamic/jupyterlab", "version": v},
+                }
+                for v in ("1.0.0", "1.0.1")
+            ]
+        },
+    )
+
+    url = URL("/v0/services").with_query({"user_id": user_id, "details": "true"})
+    headers = {"x-simcore-products-name": target_product}
+    response = client.get(f"{url}", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 1
+    etag = response.headers["ETag"]
+
+    # unchanged
+    response = client.get(f"{url}", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+
+    # the services without details are listed from the database
+    response = client.get(
+        f"{url.update_query(details='false')}",
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert "ETag" not in response.headers
+
+    # a new service in the db changes the listing
+    await services_db_tables_injector(
+        [
+            service_catalog_faker(
+                "simcore/services/dynamic/jupyterlab",
+                "1.0.1",
+                team_access=None,
+                everyone_access=None,
+                product=target_product,
+            )
+        ]
+    )
+    response = client.get(f"{url}", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 2
+    assert response.headers["ETag"] != etag
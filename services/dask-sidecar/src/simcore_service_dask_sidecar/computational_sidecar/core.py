@@ -27,7 +27,8 @@ from yarl import URL
 
 from ..boot_mode import BootMode
 from ..dask_utils import TaskPublisher, create_dask_worker_logger, publish_event
-from ..file_utils import pull_file_from_remote, push_file_to_remote
+from ..file_utils import TransferMetrics, pull_file_from_remote, push_file_to_remote
+from ..inputs_cache import InputsCache, get_inputs_cache
 from ..settings import Settings
 from .docker_utils import (
     create_container_config,
@@ -62,6 +63,7 @@ class ComputationalSidecar:  # pylint: disable=too-many-instance-attributes
         self,
         task_volumes: TaskSharedVolumes,
         integration_version: version.Version,
+        inputs_cache: Optional[InputsCache],
     ) -> None:
         input_data_file = (
             task_volumes.inputs_folder
@@ -69,6 +71,7 @@ class ComputationalSidecar:  # pylint: disable=too-many-instance-attributes
         )
         local_input_data_file = {}
         download_tasks = []
+        download_metrics = TransferMetrics()
 
         for input_key, input_params in self.input_data.items():
             if isinstance(input_params, FileUrl):
@@ -92,6 +95,8 @@ class ComputationalSidecar:  # pylint: disable=too-many-instance-attributes
                         destination_path,
                         self._publish_sidecar_log,
                         self.s3_settings,
+                        transfer_metrics=download_metrics,
+                        inputs_cache=inputs_cache,
                     )
                 )
             else:
@@ -99,7 +104,11 @@ class ComputationalSidecar:  # pylint: disable=too-many-instance-attributes
         await asyncio.gather(*download_tasks)
         input_data_file.write_text(json.dumps(local_input_data_file))
 
-        await self._publish_sidecar_log("All the input data were downloaded.")
+        await self._publish_sidecar_log(
+            f"All the input data were downloaded [{download_metrics}]."
+        )
+        if inputs_cache:
+            logger.info("worker inputs cache: %s", inputs_cache.metrics)
 
     async def _retrieve_output_data(
         self,
@@ -127,6 +136,7 @@ class ComputationalSidecar:  # pylint: disable=too-many-instance-attributes
             )
 
             upload_tasks = []
+            upload_metrics = TransferMetrics()
             for output_params in output_data.values():
                 if isinstance(output_params, FileUrl):
                     assert (  # nosec
@@ -140,11 +150,14 @@ class ComputationalSidecar:  # pylint: disable=too-many-instance-attributes
                             output_params.url,
                             self._publish_sidecar_log,
                             self.s3_settings,
+                            transfer_metrics=upload_metrics,
                         )
                     )
             await asyncio.gather(*upload_tasks)
 
-            await self._publish_sidecar_log("All the output data were uploaded.")
+            await self._publish_sidecar_log(
+                f"All the output data were uploaded [{upload_metrics}]."
+            )
             logger.info("retrieved outputs data:\n%s", output_data.json(indent=1))
             return output_data
 
@@ -205,7 +218,9 @@ class ComputationalSidecar:  # pylint: disable=too-many-instance-attributes
                 boot_mode=self.boot_mode,
                 task_max_resources=self.task_max_resources,
             )
-            await self._write_input_data(task_volumes, integration_version)
+            await self._write_input_data(
+                task_volumes, integration_version, get_inputs_cache(settings)
+            )
 
             # PROCESSING
             async with managed_container(docker_client, config) as container:
@@ -1,8 +1,10 @@
 import asyncio
 import functools
 import mimetypes
+import os
 import time
 import zipfile
+from dataclasses import dataclass, field
 from io import BytesIO
 from pathlib import Path
 from typing import Any, Awaitable, Callable, Final, Optional, TypedDict, cast
@@ -16,6 +18,7 @@ from settings_library.s3 import S3Settings
 from yarl import URL
 
 from .dask_utils import create_dask_worker_logger
+from .inputs_cache import InputsCache
 
 logger = create_dask_worker_logger(__name__)
 
@@ -26,22 +29,94 @@ S3_FILE_SYSTEM_SCHEMES: Final = ["s3", "s3a"]
 LogPublishingCB = Callable[[str], Awaitable[None]]
 
 
+_PROGRESS_PUBLISHING_MIN_INTERVAL_S: Final[float] = 1.0
+
+
+@dataclass
+class TransferMetrics:
+    """Aggregated throughput of several (possibly concurrent) file transfers,
+    e.g. all the inputs of a task"""
+
+    num_files: int = 0
+    num_bytes: int = 0
+    started_at: Optional[float] = None
+    completed_at: Optional[float] = None
+
+    def start(self) -> None:
+        if self.started_at is None:
+            self.started_at = time.monotonic()
+
+    def add_completed_transfer(self, num_bytes: int) -> None:
+        self.num_files += 1
+        self.num_bytes += num_bytes
+        self.completed_at = time.monotonic()
+
+    @property
+    def elapsed_time_s(self) -> float:
+        if self.started_at is None or self.completed_at is None:
+            return 0.0
+        return self.completed_at - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """average throughput in bytes/s"""
+        if not self.elapsed_time_s:
+            return 0.0
+        return self.num_bytes / self.elapsed_time_s
+
+    def __str__(self) -> str:
+        return (
+            f"{self.num_files} file(s),"
+            f" {ByteSize(self.num_bytes).human_readable()} in {self.elapsed_time_s:.1f}s"
+            f" [{ByteSize(int(self.throughput)).to('MB'):.2f} MBytes/s (avg)]"
+        )
+
+
+@dataclass
+class _TransferProgress:
+    """computes the progress messages of a transfer, at most one every
+    _PROGRESS_PUBLISHING_MIN_INTERVAL_S so that the logs channel is not flooded"""
+
+    text_prefix: str
+    total_size: Optional[int]
+    transferred: int = 0
+    _started_at: float = field(default_factory=time.monotonic)
+    _last_published_at: Optional[float] = None
+
+    def update(self, transferred: int, *, final: bool = False) -> Optional[str]:
+        """returns the message to publish or None if it is too early"""
+        self.transferred = transferred
+        now = time.monotonic()
+        if (
+            not final
+            and self._last_published_at is not None
+            and (now - self._last_published_at) < _PROGRESS_PUBLISHING_MIN_INTERVAL_S
+        ):
+            return None
+        self._last_published_at = now
+        elapsed_time = now - self._started_at
+        return (
+            f"{self.text_prefix}"
+            f" {100.0 * float(transferred or 0)/float(self.total_size or 1):.1f}%"
+            f" ({ByteSize(transferred).human_readable() if transferred else 0} / {ByteSize(self.total_size).human_readable() if self.total_size else 'NaN'})"
+            f" [{ByteSize(transferred).to('MB')/(elapsed_time or 1):.2f} MBytes/s (avg)]"
+        )
+
+
 def _file_progress_cb(
     size,
     value,
+    progress: _TransferProgress,
     log_publishing_cb: LogPublishingCB,
-    text_prefix: str,
     main_loop: asyncio.AbstractEventLoop,
     **kwargs,
 ):
-    asyncio.run_coroutine_threadsafe(
-        log_publishing_cb(
-            f"{text_prefix}"
-            f" {100.0 * float(value or 0)/float(size or 1):.1f}%"
-            f" ({ByteSize(value).human_readable() if value else 0} / {ByteSize(size).human_readable() if size else 'NaN'})"
-        ),
-        main_loop,
-    )
+    if size and not progress.total_size:
+        progress.total_size = size
+    if message := progress.update(
+        value or 0, final=bool(size) and (value or 0) >= size
+    ):
+        asyncio.run_coroutine_threadsafe(log_publishing_cb(message), main_loop)
 
 
 CHUNK_SIZE = 4 * 1024 * 1024
@@ -87,15 +162,16 @@ async def _copy_file(
     text_prefix: str,
     src_storage_cfg: Optional[dict[str, Any]] = None,
     dst_storage_cfg: Optional[dict[str, Any]] = None,
-):
+) -> int:
     src_storage_kwargs = src_storage_cfg or {}
     dst_storage_kwargs = dst_storage_cfg or {}
     with fsspec.open(src_url, mode="rb", **src_storage_kwargs) as src_fp:
         with fsspec.open(dst_url, "wb", **dst_storage_kwargs) as dst_fp:
-            file_size = getattr(src_fp, "size", None)
+            progress = _TransferProgress(
+                text_prefix=text_prefix, total_size=getattr(src_fp, "size", None)
+            )
             data_read = True
             total_data_written = 0
-            t = time.process_time()
             while data_read:
                 (
                     data_read,
@@ -103,14 +179,108 @@ async def _copy_file(
                 ) = await asyncio.get_event_loop().run_in_executor(
                     None, _file_chunk_streamer, src_fp, dst_fp
                 )
-                elapsed_time = time.process_time() - t
                 total_data_written += data_written or 0
-                await log_publishing_cb(
-                    f"{text_prefix}"
-                    f" {100.0 * float(total_data_written or 0)/float(file_size or 1):.1f}%"
-                    f" ({ByteSize(total_data_written).human_readable() if total_data_written else 0} / {ByteSize(file_size).human_readable() if file_size else 'NaN'})"
-                    f" [{ByteSize(total_data_written).to('MB')/elapsed_time:.2f} MBytes/s (avg)]"
-                )
+                if message := progress.update(total_data_written, final=not data_read):
+                    await log_publishing_cb(message)
+    return total_data_written
+
+
+# NOTE: below that size a single stream is as fast and opens less connections
+_PARALLEL_TRANSFER_MIN_SIZE: Final[ByteSize] = parse_obj_as(ByteSize, "64MiB")
+_PARALLEL_TRANSFER_CHUNK_SIZE: Final[ByteSize] = parse_obj_as(ByteSize, "16MiB")
+_PARALLEL_TRANSFER_MAX_CONCURRENCY: Final[int] = 4
+_S3_MULTIPART_UPLOAD_CHUNK_SIZE: Final[ByteSize] = parse_obj_as(ByteSize, "64MiB")
+
+
+def _get_file_info(fs: fsspec.AbstractFileSystem, path: str) -> dict[str, Any]:
+    try:
+        return fs.info(path)
+    except (OSError, ValueError):
+        logger.debug("could not get info of %s, using single stream", path)
+        return {}
+
+
+def _read_range_into_file(
+    fs: fsspec.AbstractFileSystem,
+    path: str,
+    start: int,
+    end: int,
+    dst_fd: int,
+    file_size: int,
+) -> int:
+    data = fs.cat_file(path, start=start, end=end)
+    if len(data) != (end - start) and not (start == 0 and len(data) == file_size):
+        raise OSError(
+            f"reading range {start}-{end} of {path} returned {len(data)} bytes"
+        )
+    # NOTE: if the server ignores ranges (200 instead of 206), the first range
+    # is the whole file
+    return os.pwrite(dst_fd, data, start)
+
+
+async def _parallel_download(
+    fs: fsspec.AbstractFileSystem,
+    path: str,
+    file_size: int,
+    dst_path: Path,
+    *,
+    log_publishing_cb: LogPublishingCB,
+    text_prefix: str,
+) -> int:
+    """downloads ranges of the remote file concurrently, each directly written at its offset
+    in the destination file
+
+    The first range is downloaded alone: if the server does not support ranges it
+    returns the whole file, which is then downloaded only once
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(_PARALLEL_TRANSFER_MAX_CONCURRENCY)
+    progress = _TransferProgress(text_prefix=text_prefix, total_size=file_size)
+    total_data_written = 0
+
+    async def _download_range(start: int) -> None:
+        nonlocal total_data_written
+        async with semaphore:
+            data_written = await loop.run_in_executor(
+                None,
+                _read_range_into_file,
+                fs,
+                path,
+                start,
+                min(start + _PARALLEL_TRANSFER_CHUNK_SIZE, file_size),
+                dst_fd,
+                file_size,
+            )
+        total_data_written += data_written
+        if message := progress.update(
+            total_data_written, final=total_data_written == file_size
+        ):
+            await log_publishing_cb(message)
+
+    dst_fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+    results = []
+    try:
+        os.ftruncate(dst_fd, file_size)
+        await _download_range(0)
+        if total_data_written < file_size:
+            # NOTE: all the ranges are awaited (no cancellation) before the file is closed
+            # since the reads/writes run in threads
+            results = await asyncio.gather(
+                *(
+                    _download_range(start)
+                    for start in range(
+                        _PARALLEL_TRANSFER_CHUNK_SIZE,
+                        file_size,
+                        _PARALLEL_TRANSFER_CHUNK_SIZE,
+                    )
+                ),
+                return_exceptions=True,
+            )
+    finally:
+        os.close(dst_fd)
+    if errors := [r for r in results if isinstance(r, BaseException)]:
+        raise errors[0]
+    return total_data_written
 
 
 _ZIP_MIME_TYPE: Final[str] = "application/zip"
@@ -122,11 +292,15 @@ async def pull_file_from_remote(
     dst_path: Path,
     log_publishing_cb: LogPublishingCB,
     s3_settings: Optional[S3Settings],
+    transfer_metrics: Optional[TransferMetrics] = None,
+    inputs_cache: Optional[InputsCache] = None,
 ) -> None:
     assert src_url.path  # nosec
     await log_publishing_cb(
         f"Downloading '{src_url.path.strip('/')}' into local file '{dst_path.name}'..."
     )
+    if transfer_metrics:
+        transfer_metrics.start()
     if not dst_path.parent.exists():
         raise ValueError(
             f"{dst_path.parent=} does not exist. It must be created by the caller"
@@ -139,13 +313,56 @@ async def pull_file_from_remote(
     storage_kwargs = {}
     if s3_settings and src_url.scheme in S3_FILE_SYSTEM_SCHEMES:
         storage_kwargs = _s3fs_settings_from_s3_settings(s3_settings)
-    await _copy_file(
-        src_url,
-        parse_obj_as(FileUrl, dst_path.as_uri()),
-        src_storage_cfg=cast(dict[str, Any], storage_kwargs),
-        log_publishing_cb=log_publishing_cb,
-        text_prefix=f"Downloading '{src_url.path.strip('/')}':",
-    )
+    text_prefix = f"Downloading '{src_url.path.strip('/')}':"
+
+    file_info: dict[str, Any] = {}
+    if src_url.scheme in HTTP_FILE_SYSTEM_SCHEMES + S3_FILE_SYSTEM_SCHEMES:
+        fs, path = fsspec.core.url_to_fs(f"{src_url}", **storage_kwargs)
+        file_info = await asyncio.get_event_loop().run_in_executor(
+            None, _get_file_info, fs, path
+        )
+    file_size: Optional[int] = file_info.get("size")
+
+    cache_key = None
+    if inputs_cache and file_size and (etag := file_info.get("ETag")):
+        # NOTE: the query of a presigned link changes with every new link
+        cache_key = InputsCache.create_key(
+            f"{URL(src_url).with_query(None)}", etag, file_size
+        )
+    if (
+        inputs_cache
+        and cache_key
+        and await asyncio.get_event_loop().run_in_executor(
+            None, inputs_cache.link_to, cache_key, dst_path
+        )
+    ):
+        await log_publishing_cb(
+            f"'{src_url.path.strip('/')}' found in the worker inputs cache."
+        )
+    else:
+        if file_size and file_size >= _PARALLEL_TRANSFER_MIN_SIZE:
+            num_bytes = await _parallel_download(
+                fs,
+                path,
+                file_size,
+                dst_path,
+                log_publishing_cb=log_publishing_cb,
+                text_prefix=text_prefix,
+            )
+        else:
+            num_bytes = await _copy_file(
+                src_url,
+                parse_obj_as(FileUrl, dst_path.as_uri()),
+                src_storage_cfg=cast(dict[str, Any], storage_kwargs),
+                log_publishing_cb=log_publishing_cb,
+                text_prefix=text_prefix,
+            )
+        if transfer_metrics:
+            transfer_metrics.add_completed_transfer(num_bytes)
+        if inputs_cache and cache_key:
+            await asyncio.get_event_loop().run_in_executor(
+                None, inputs_cache.add, cache_key, dst_path
+            )
 
     await log_publishing_cb(
         f"Download of '{src_url.path.strip('/')}' into local file '{dst_path.name}' complete."
@@ -165,14 +382,15 @@ async def pull_file_from_remote(
 
 async def _push_file_to_http_link(
     file_to_upload: Path, dst_url: AnyUrl, log_publishing_cb: LogPublishingCB
-):
+) -> int:
     # NOTE: special case for http scheme when uploading. this is typically a S3 put presigned link.
     # Therefore, we need to use the http filesystem directly in order to call the put_file function.
     # writing on httpfilesystem is disabled by default.
+    file_size = file_to_upload.stat().st_size
     fs = fsspec.filesystem(
         "http",
         headers={
-            "Content-Length": f"{file_to_upload.stat().st_size}",
+            "Content-Length": f"{file_size}",
         },
         asynchronous=True,
     )
@@ -185,13 +403,17 @@ async def _push_file_to_http_link(
             hooks={
                 "progress": functools.partial(
                     _file_progress_cb,
+                    progress=_TransferProgress(
+                        text_prefix=f"Uploading '{dst_url.path.strip('/')}':",
+                        total_size=file_size,
+                    ),
                     log_publishing_cb=log_publishing_cb,
-                    text_prefix=f"Uploading '{dst_url.path.strip('/')}':",
                     main_loop=asyncio.get_event_loop(),
                 )
             }
         ),
     )
+    return file_size
 
 
 async def _push_file_to_remote(
@@ -199,7 +421,7 @@ async def _push_file_to_remote(
     dst_url: AnyUrl,
     log_publishing_cb: LogPublishingCB,
     s3_settings: Optional[S3Settings],
-):
+) -> int:
     logger.debug("Uploading %s to %s...", file_to_upload, dst_url)
     assert dst_url.path  # nosec
 
@@ -207,12 +429,43 @@ async def _push_file_to_remote(
     if s3_settings:
         storage_kwargs = _s3fs_settings_from_s3_settings(s3_settings)
 
-    await _copy_file(
+    text_prefix = f"Uploading '{dst_url.path.strip('/')}':"
+    file_size = file_to_upload.stat().st_size
+    if (
+        dst_url.scheme in S3_FILE_SYSTEM_SCHEMES
+        and file_size >= _PARALLEL_TRANSFER_MIN_SIZE
+    ):
+        # s3fs uploads the file using a multipart upload
+        fs, path = fsspec.core.url_to_fs(f"{dst_url}", **storage_kwargs)
+        await asyncio.get_event_loop().run_in_executor(
+            None,
+            functools.partial(
+                fs.put_file,
+                f"{file_to_upload}",
+                path,
+                chunksize=_S3_MULTIPART_UPLOAD_CHUNK_SIZE,
+                callback=fsspec.Callback(
+                    hooks={
+                        "progress": functools.partial(
+                            _file_progress_cb,
+                            progress=_TransferProgress(
+                                text_prefix=text_prefix, total_size=file_size
+                            ),
+                            log_publishing_cb=log_publishing_cb,
+                            main_loop=asyncio.get_event_loop(),
+                        )
+                    }
+                ),
+            ),
+        )
+        return file_size
+
+    return await _copy_file(
         parse_obj_as(FileUrl, file_to_upload.as_uri()),
         dst_url,
         dst_storage_cfg=cast(dict[str, Any], storage_kwargs),
         log_publishing_cb=log_publishing_cb,
-        text_prefix=f"Uploading '{dst_url.path.strip('/')}':",
+        text_prefix=text_prefix,
     )
 
 
@@ -224,9 +477,12 @@ async def push_file_to_remote(
     dst_url: AnyUrl,
     log_publishing_cb: LogPublishingCB,
     s3_settings: Optional[S3Settings],
+    transfer_metrics: Optional[TransferMetrics] = None,
 ) -> None:
     if not src_path.exists():
         raise ValueError(f"{src_path=} does not exist")
+    if transfer_metrics:
+        transfer_metrics.start()
     assert dst_url.path  # nosec
     async with aiofiles.tempfile.TemporaryDirectory() as tmp_dir:
         file_to_upload = src_path
@@ -256,11 +512,15 @@ async def push_file_to_remote(
 
         if dst_url.scheme in HTTP_FILE_SYSTEM_SCHEMES:
             logger.debug("destination is a http presigned link")
-            await _push_file_to_http_link(file_to_upload, dst_url, log_publishing_cb)
+            num_bytes = await _push_file_to_http_link(
+                file_to_upload, dst_url, log_publishing_cb
+            )
         else:
-            await _push_file_to_remote(
+            num_bytes = await _push_file_to_remote(
                 file_to_upload, dst_url, log_publishing_cb, s3_settings
             )
+        if transfer_metrics:
+            transfer_metrics.add_completed_transfer(num_bytes)
 
     await log_publishing_cb(
         f"Upload of '{src_path.name}' to '{dst_url.path.strip('/')}' complete"
@@ -0,0 +1,181 @@
+"""Worker-local cache of the tasks input files
+
+Consecutive tasks on a worker (e.g. a parameter sweep) typically use the very same
+input files. These are kept in a size-bounded LRU cache, keyed by the identity of the
+remote object (location, ETag and size), and reflinked (or copied) into the task
+inputs folder instead of being downloaded again. Tasks may modify their inputs in
+place, so the cache never shares its files with them through hard links.
+
+NOTE: tasks run in different threads of the dask-worker, therefore the cache index is
+protected by a lock. Each worker process owns its own cache folder.
+"""
+
+import errno
+import fcntl
+import hashlib
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final, Optional
+
+from pydantic import ByteSize
+
+from .dask_utils import create_dask_worker_logger
+from .settings import Settings
+
+logger = create_dask_worker_logger(__name__)
+
+_INPUTS_CACHE_FOLDER_NAME: Final[str] = ".inputs_cache"
+_FICLONE: Final[int] = 0x40049409  # from linux/fs.h
+
+
+def _link_file(src: Path, dst: Path) -> None:
+    """reflinks (i.e. copy-on-write) src to dst if the filesystem supports it,
+    else copies it
+
+    :raises OSError: if none is possible (e.g. no space left)
+    """
+    try:
+        with src.open("rb") as src_fp, dst.open("wb") as dst_fp:
+            fcntl.ioctl(dst_fp.fileno(), _FICLONE, src_fp.fileno())
+        return
+    except OSError:
+        dst.unlink(missing_ok=True)
+    try:
+        shutil.copy2(src, dst)
+    except OSError:
+        dst.unlink(missing_ok=True)
+        raise
+
+
+def _pid_exists(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except OSError as err:
+        return err.errno == errno.EPERM
+    return True
+
+
+@dataclass
+class InputsCacheMetrics:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    bytes_saved: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.hits} hit(s), {self.misses} miss(es), {self.evictions} eviction(s),"
+            f" {ByteSize(self.bytes_saved).human_readable()} not downloaded"
+        )
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    path: Path
+    size: int
+    mtime_ns: int
+
+
+class InputsCache:
+    def __init__(self, cache_dir: Path, max_size: ByteSize) -> None:
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.metrics = InputsCacheMetrics()
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        # NOTE: there is no index of a previous run, so the cache starts empty
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        self.cache_dir.mkdir(parents=True)
+
+    @staticmethod
+    def create_key(location: str, etag: str, size: int) -> str:
+        return hashlib.sha256(f"{location}:{etag}:{size}".encode()).hexdigest()
+
+    def _evict(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+        entry.path.unlink(missing_ok=True)
+        self.metrics.evictions += 1
+
+    def link_to(self, key: str, dst_path: Path) -> bool:
+        """links the cached file to dst_path, returns False if not in cache"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                try:
+                    file_stat = entry.path.stat()
+                    if (file_stat.st_size, file_stat.st_mtime_ns) != (
+                        entry.size,
+                        entry.mtime_ns,
+                    ):
+                        # e.g. modified in place in the cache folder
+                        raise OSError(f"{entry.path} was modified")
+                    _link_file(entry.path, dst_path)
+                except OSError:
+                    logger.warning(
+                        "cached input %s is not usable, evicting it", entry.path
+                    )
+                    self._evict(key)
+                else:
+                    self._entries.move_to_end(key)
+                    self.metrics.hits += 1
+                    self.metrics.bytes_saved += entry.size
+                    return True
+            self.metrics.misses += 1
+            return False
+
+    def add(self, key: str, src_path: Path) -> None:
+        """adds a file (e.g. just downloaded in a task inputs folder) to the cache"""
+        with self._lock:
+            if key in self._entries or src_path.stat().st_size > self.max_size:
+                return
+            cached_path = self.cache_dir / key
+            try:
+                _link_file(src_path, cached_path)
+                file_stat = cached_path.stat()
+            except OSError:
+                logger.warning(
+                    "%s could not be linked into the inputs cache",
+                    src_path,
+                    exc_info=True,
+                )
+                cached_path.unlink(missing_ok=True)
+                return
+            self._entries[key] = _CacheEntry(
+                cached_path, file_stat.st_size, file_stat.st_mtime_ns
+            )
+            self._size += file_stat.st_size
+            while self._size > self.max_size:
+                self._evict(next(iter(self._entries)))
+
+
+_inputs_cache: Optional[InputsCache] = None
+_inputs_cache_lock = threading.Lock()
+
+
+def get_inputs_cache(settings: Settings) -> Optional[InputsCache]:
+    """returns the inputs cache of this worker process, None if disabled"""
+    global _inputs_cache  # pylint: disable=global-statement
+    if not settings.SIDECAR_INPUTS_CACHE_MAX_SIZE:
+        return None
+    with _inputs_cache_lock:
+        if _inputs_cache is None:
+            base_dir = (
+                settings.SIDECAR_COMP_SERVICES_SHARED_FOLDER / _INPUTS_CACHE_FOLDER_NAME
+            )
+            # remove the caches of worker processes that are gone
+            if base_dir.exists():
+                for cache_dir in base_dir.iterdir():
+                    if cache_dir.name.isdigit() and not _pid_exists(
+                        int(cache_dir.name)
+                    ):
+                        shutil.rmtree(cache_dir, ignore_errors=True)
+            _inputs_cache = InputsCache(
+                base_dir / f"{os.getpid()}", settings.SIDECAR_INPUTS_CACHE_MAX_SIZE
+            )
+        return _inputs_cache
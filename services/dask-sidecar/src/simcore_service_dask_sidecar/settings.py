@@ -2,7 +2,7 @@ from pathlib import Path
 from typing import Any, Optional
 
 from models_library.basic_types import LogLevel
-from pydantic import Field, validator
+from pydantic import ByteSize, Field, parse_obj_as, validator
 from settings_library.base import BaseCustomSettings
 from settings_library.utils_logging import MixinLoggingSettings
 
@@ -22,6 +22,11 @@ class Settings(BaseCustomSettings, MixinLoggingSettings):
 
     SIDECAR_INTERVAL_TO_CHECK_TASK_ABORTED_S: Optional[int] = 5
 
+    SIDECAR_INPUTS_CACHE_MAX_SIZE: ByteSize = Field(
+        parse_obj_as(ByteSize, "5GiB"),
+        description="Maximal size of the worker-local cache of tasks input files (0 disables it)",
+    )
+
     TARGET_MPI_NODE_CPU_COUNT: Optional[int] = Field(
         None,
         description="If a node has this amount of CPUs it will be a candidate an MPI candidate",
@@ -15,15 +15,18 @@ import pytest
 from _pytest.fixtures import FixtureRequest
 from faker import Faker
 from minio import Minio
-from pydantic import AnyUrl, parse_obj_as
+from pydantic import AnyUrl, ByteSize, parse_obj_as
 from pytest_localftpserver.servers import ProcessFTPServer
 from pytest_mock.plugin import MockerFixture
 from settings_library.s3 import S3Settings
+from simcore_service_dask_sidecar import file_utils
 from simcore_service_dask_sidecar.file_utils import (
+    TransferMetrics,
     _s3fs_settings_from_s3_settings,
     pull_file_from_remote,
     push_file_to_remote,
 )
+from simcore_service_dask_sidecar.inputs_cache import InputsCache
 
 
 @pytest.fixture()
@@ -240,6 +243,110 @@ async def test_pull_file_from_remote(
     mocked_log_publishing_cb.assert_called()
 
 
+async def test_pull_file_from_remote_with_parallel_ranges(
+    s3_settings: S3Settings,
+    s3_remote_file_url: AnyUrl,
+    tmp_path: Path,
+    faker: Faker,
+    mocked_log_publishing_cb: mock.AsyncMock,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    # force the ranged download on a small file
+    monkeypatch.setattr(file_utils, "_PARALLEL_TRANSFER_MIN_SIZE", 1)
+    monkeypatch.setattr(file_utils, "_PARALLEL_TRANSFER_CHUNK_SIZE", 1024)
+    storage_kwargs = _s3fs_settings_from_s3_settings(s3_settings)
+    # put some file on the remote
+    BYTES_IN_FILE = faker.binary(length=50 * 1024 + 3)
+    with cast(
+        fsspec.core.OpenFile,
+        fsspec.open(s3_remote_file_url, mode="wb", **storage_kwargs),
+    ) as fp:
+        fp.write(BYTES_IN_FILE)
+
+    dst_path = tmp_path / faker.file_name()
+    transfer_metrics = TransferMetrics()
+    await pull_file_from_remote(
+        src_url=s3_remote_file_url,
+        target_mime_type=None,
+        dst_path=dst_path,
+        log_publishing_cb=mocked_log_publishing_cb,
+        s3_settings=s3_settings,
+        transfer_metrics=transfer_metrics,
+    )
+    assert dst_path.exists()
+    assert dst_path.read_bytes() == BYTES_IN_FILE
+    assert transfer_metrics.num_files == 1
+    assert transfer_metrics.num_bytes == len(BYTES_IN_FILE)
+    # the progress is not published for each of the 51 ranges
+    assert mocked_log_publishing_cb.call_count < 10
+
+
+async def test_parallel_download_when_server_ignores_ranges(
+    tmp_path: Path,
+    faker: Faker,
+    mocked_log_publishing_cb: mock.AsyncMock,
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(file_utils, "_PARALLEL_TRANSFER_CHUNK_SIZE", 1024)
+    BYTES_IN_FILE = faker.binary(length=50 * 1024 + 3)
+    # NOTE: the whole file is returned whatever range is requested (200 instead of 206)
+    fs = mocker.MagicMock(spec=fsspec.AbstractFileSystem)
+    fs.cat_file.return_value = BYTES_IN_FILE
+
+    dst_path = tmp_path / faker.file_name()
+    num_bytes = await file_utils._parallel_download(  # pylint: disable=protected-access
+        fs,
+        faker.file_path(),
+        len(BYTES_IN_FILE),
+        dst_path,
+        log_publishing_cb=mocked_log_publishing_cb,
+        text_prefix="",
+    )
+    assert num_bytes == len(BYTES_IN_FILE)
+    assert dst_path.read_bytes() == BYTES_IN_FILE
+    # the whole file was downloaded only once
+    fs.cat_file.assert_called_once()
+
+
+async def test_pull_file_from_remote_uses_inputs_cache(
+    s3_settings: S3Settings,
+    s3_remote_file_url: AnyUrl,
+    tmp_path: Path,
+    faker: Faker,
+    mocked_log_publishing_cb: mock.AsyncMock,
+):
+    storage_kwargs = _s3fs_settings_from_s3_settings(s3_settings)
+    # put some file on the remote
+    TEXT_IN_FILE = faker.text()
+    with cast(
+        fsspec.core.OpenFile,
+        fsspec.open(s3_remote_file_url, mode="wt", **storage_kwargs),
+    ) as fp:
+        fp.write(TEXT_IN_FILE)
+
+    inputs_cache = InputsCache(tmp_path / "cache", parse_obj_as(ByteSize, "1MiB"))
+    transfer_metrics = TransferMetrics()
+    for task_folder in ["task1", "task2"]:
+        dst_path = tmp_path / task_folder / faker.file_name()
+        dst_path.parent.mkdir()
+        await pull_file_from_remote(
+            src_url=s3_remote_file_url,
+            target_mime_type=None,
+            dst_path=dst_path,
+            log_publishing_cb=mocked_log_publishing_cb,
+            s3_settings=s3_settings,
+            transfer_metrics=transfer_metrics,
+            inputs_cache=inputs_cache,
+        )
+        assert dst_path.exists()
+        assert dst_path.read_text() == TEXT_IN_FILE
+    # the second task got the file from the cache
+    assert transfer_metrics.num_files == 1
+    assert inputs_cache.metrics.misses == 1
+    assert inputs_cache.metrics.hits == 1
+
+
 async def test_pull_file_from_remote_s3_presigned_link(
     s3_settings: S3Settings,
     s3_remote_file_url: AnyUrl,
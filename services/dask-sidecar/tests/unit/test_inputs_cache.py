@@ -0,0 +1,108 @@
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=unused-variable
+
+from pathlib import Path
+
+import pytest
+from faker import Faker
+from pydantic import ByteSize
+from simcore_service_dask_sidecar.inputs_cache import InputsCache
+
+
+@pytest.fixture
+def inputs_cache(tmp_path: Path) -> InputsCache:
+    return InputsCache(tmp_path / "cache", ByteSize(100))
+
+
+@pytest.fixture
+def create_file(tmp_path: Path, faker: Faker):
+    def _creator(size: int) -> Path:
+        file_path = tmp_path / faker.file_name()
+        file_path.write_bytes(faker.binary(length=size))
+        return file_path
+
+    return _creator
+
+
+def test_inputs_cache_hit_and_miss(
+    inputs_cache: InputsCache, create_file, tmp_path: Path
+):
+    src_file = create_file(10)
+    key = InputsCache.create_key("s3://bucket/file", "etag", 10)
+    dst_path = tmp_path / "dst"
+    assert inputs_cache.link_to(key, dst_path) is False
+    assert not dst_path.exists()
+
+    inputs_cache.add(key, src_file)
+    assert inputs_cache.link_to(key, dst_path) is True
+    assert dst_path.read_bytes() == src_file.read_bytes()
+    assert inputs_cache.metrics.hits == 1
+    assert inputs_cache.metrics.misses == 1
+    assert inputs_cache.metrics.bytes_saved == 10
+
+    # a different ETag is a different content
+    assert (
+        inputs_cache.link_to(
+            InputsCache.create_key("s3://bucket/file", "other_etag", 10),
+            tmp_path / "other_dst",
+        )
+        is False
+    )
+
+
+def test_inputs_cache_evicts_least_recently_used(
+    inputs_cache: InputsCache, create_file, tmp_path: Path
+):
+    keys = [InputsCache.create_key(f"s3://bucket/{n}", "etag", 40) for n in range(3)]
+    inputs_cache.add(keys[0], create_file(40))
+    inputs_cache.add(keys[1], create_file(40))
+    # use the first one, so that the second one is the least recently used
+    assert inputs_cache.link_to(keys[0], tmp_path / "dst0") is True
+    inputs_cache.add(keys[2], create_file(40))
+
+    assert inputs_cache.metrics.evictions == 1
+    assert inputs_cache.link_to(keys[1], tmp_path / "dst1") is False
+    assert inputs_cache.link_to(keys[0], tmp_path / "dst2") is True
+    assert inputs_cache.link_to(keys[2], tmp_path / "dst3") is True
+
+    # too large files are not cached
+    too_large_key = InputsCache.create_key("s3://bucket/large", "etag", 101)
+    inputs_cache.add(too_large_key, create_file(101))
+    assert inputs_cache.link_to(too_large_key, tmp_path / "dst4") is False
+    assert inputs_cache.metrics.evictions == 1
+
+
+def test_inputs_cache_evicts_modified_files(
+    inputs_cache: InputsCache, create_file, tmp_path: Path
+):
+    src_file = create_file(10)
+    key = InputsCache.create_key("s3://bucket/file", "etag", 10)
+    inputs_cache.add(key, src_file)
+    # the cached file is modified in place
+    with (inputs_cache.cache_dir / key).open("ab") as fp:
+        fp.write(b"modified")
+
+    assert inputs_cache.link_to(key, tmp_path / "dst") is False
+    assert inputs_cache.metrics.evictions == 1
+
+
+def test_inputs_cache_is_not_modified_by_tasks(
+    inputs_cache: InputsCache, create_file, tmp_path: Path
+):
+    src_file = create_file(10)
+    original_content = src_file.read_bytes()
+    key = InputsCache.create_key("s3://bucket/file", "etag", 10)
+    inputs_cache.add(key, src_file)
+    # the task modifies its input in place
+    with src_file.open("ab") as fp:
+        fp.write(b"modified")
+    dst_path = tmp_path / "dst"
+    assert inputs_cache.link_to(key, dst_path) is True
+    # the next task modifies its input in place as well
+    with dst_path.open("ab") as fp:
+        fp.write(b"modified")
+
+    assert (inputs_cache.cache_dir / key).read_bytes() == original_content
+    assert inputs_cache.link_to(key, tmp_path / "other_dst") is True
+    assert (tmp_path / "other_dst").read_bytes() == original_content
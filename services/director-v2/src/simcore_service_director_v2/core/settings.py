@@ -377,6 +377,15 @@ class DynamicServicesSchedulerSettings(BaseCustomSettings):
         5.0, description="interval at which the scheduler cycle is repeated"
     )
 
+    DIRECTOR_V2_DYNAMIC_SCHEDULER_MAX_INTERVAL_SECONDS: PositiveFloat = Field(
+        60.0,
+        description=(
+            "the observation interval of a running service, which did not change since "
+            "its last observation, is doubled up to this value. Any change of the service "
+            "(also when reported by docker) resets it to the scheduler interval"
+        ),
+    )
+
     DIRECTOR_V2_DYNAMIC_SCHEDULER_PENDING_VOLUME_REMOVAL_INTERVAL_S: PositiveFloat = (
         Field(
             30 * MINS,
@@ -434,6 +443,11 @@ class ComputationalBackendSettings(BaseCustomSettings):
         FileLinkType.PRESIGNED,
         description=f"Default file link type to use with computational backend '{list(FileLinkType)}'",
     )
+    COMPUTATIONAL_BACKEND_SCHEDULER_RECONCILIATION_INTERVAL_S: PositiveFloat = Field(
+        60.0,
+        description="interval at which all scheduled pipelines are reconciled with "
+        "the database, in between pipelines are scheduled when triggered",
+    )
 
     @cached_property
     def default_cluster(self):
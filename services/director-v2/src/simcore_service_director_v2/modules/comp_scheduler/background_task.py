@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 from asyncio import CancelledError
 from contextlib import suppress
 from typing import Any, Callable, Coroutine
@@ -15,13 +16,23 @@ _DEFAULT_TIMEOUT_S: int = 5
 
 async def scheduler_task(app: FastAPI) -> None:
     scheduler = app.state.scheduler
+    # NOTE: in between, pipelines are only scheduled when triggered (new run, task events...)
+    reconciliation_interval_s = (
+        app.state.settings.DIRECTOR_V2_COMPUTATIONAL_BACKEND.COMPUTATIONAL_BACKEND_SCHEDULER_RECONCILIATION_INTERVAL_S
+    )
+    next_reconciliation = 0.0
     while app.state.comp_scheduler_running:
         try:
             logger.debug("Computational scheduler task running...")
-            await scheduler.schedule_all_pipelines()
+            if time.monotonic() >= next_reconciliation:
+                await scheduler.schedule_all_pipelines()
+                next_reconciliation = time.monotonic() + reconciliation_interval_s
+            else:
+                await scheduler.schedule_triggered_pipelines()
             with suppress(asyncio.TimeoutError):
                 await asyncio.wait_for(
-                    scheduler.wake_up_event.wait(), timeout=_DEFAULT_TIMEOUT_S
+                    scheduler.wake_up_event.wait(),
+                    timeout=max(0, next_reconciliation - time.monotonic()),
                 )
         except CancelledError:
             logger.info("Computational scheduler task cancelled")
@@ -15,16 +15,18 @@ import logging
 import traceback
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple, cast
+from typing import Dict, List, Optional, Set, Tuple
 
 import networkx as nx
 from aiopg.sa.engine import Engine
 from models_library.clusters import ClusterID
+from models_library.errors import ErrorDict
 from models_library.projects import ProjectID
 from models_library.projects_nodes_io import NodeID, NodeIDStr
 from models_library.projects_state import RunningState
 from models_library.users import UserID
 from pydantic import PositiveInt
+from simcore_postgres_database.models.comp_tasks import NodeClass
 
 from ...core.errors import (
     ComputationalBackendNotConnectedError,
@@ -38,6 +40,7 @@ from ...models.domains.comp_pipelines import CompPipelineAtDB
 from ...models.domains.comp_runs import CompRunsAtDB
 from ...models.domains.comp_tasks import CompTaskAtDB, Image
 from ...utils.computations import get_pipeline_state_from_task_states
+from ...utils.db import DB_TO_RUNNING_STATE, RUNNING_STATE_TO_DB
 from ...utils.scheduler import COMPLETED_STATES, Iteration, get_repository
 from ..db.repositories.comp_pipelines import CompPipelinesRepository
 from ..db.repositories.comp_runs import CompRunsRepository
@@ -52,6 +55,16 @@ class ScheduledPipelineParams:
     mark_for_cancellation: bool = False
 
 
+@dataclass
+class _CachedPipeline:
+    """in-memory copy of a scheduled pipeline, the scheduler keeps it in sync
+    with every change it writes in the database"""
+
+    dag: nx.DiGraph
+    tasks: Dict[NodeIDStr, CompTaskAtDB]
+    run_result: Optional[RunningState] = None
+
+
 @dataclass
 class BaseCompScheduler(ABC):
     scheduled_pipelines: Dict[
@@ -59,6 +72,12 @@ class BaseCompScheduler(ABC):
     ]
     db_engine: Engine
     wake_up_event: asyncio.Event = field(default_factory=asyncio.Event, init=False)
+    _pipelines_cache: Dict[
+        Tuple[UserID, ProjectID, Iteration], _CachedPipeline
+    ] = field(default_factory=dict, init=False)
+    _pipelines_to_schedule: Set[Tuple[UserID, ProjectID, Iteration]] = field(
+        default_factory=set, init=False
+    )
 
     async def run_new_pipeline(
         self, user_id: UserID, project_id: ProjectID, cluster_id: ClusterID
@@ -87,7 +106,7 @@ class BaseCompScheduler(ABC):
             (user_id, project_id, new_run.iteration)
         ] = ScheduledPipelineParams(cluster_id=cluster_id)
         # ensure the scheduler starts right away
-        self._wake_up_scheduler_now()
+        self._trigger_pipeline_scheduling(user_id, project_id)
 
     async def stop_pipeline(
         self, user_id: UserID, project_id: ProjectID, iteration: Optional[int] = None
@@ -110,10 +129,52 @@ class BaseCompScheduler(ABC):
             (user_id, project_id, iteration)
         ].mark_for_cancellation = True
         # ensure the scheduler starts right away
-        self._wake_up_scheduler_now()
+        self._trigger_pipeline_scheduling(user_id, project_id)
 
     async def schedule_all_pipelines(self) -> None:
+        """schedules all the scheduled pipelines, the cached ones out of sync with
+        the database are reloaded from it.
+        This reconciles the in-memory state with the database and the computational backend
+        and is therefore only run on startup and periodically"""
+        await self._remove_stale_cached_pipelines()
+        self._pipelines_to_schedule.update(self.scheduled_pipelines)
+        await self.schedule_triggered_pipelines()
+
+    async def _remove_stale_cached_pipelines(self) -> None:
+        """removes the cached pipelines whose tasks state or job_id differ from the
+        database (e.g. changed by another process), they are reloaded on next use"""
+        if not self._pipelines_cache:
+            return
+        comp_tasks_repo: CompTasksRepository = get_repository(
+            self.db_engine, CompTasksRepository
+        )  # type: ignore
+        tasks_states = await comp_tasks_repo.get_comp_tasks_states(
+            list({project_id for _, project_id, _ in self._pipelines_cache})
+        )
+        for key, cached_pipeline in list(self._pipelines_cache.items()):
+            project_tasks_states = tasks_states.get(key[1], {})
+            if any(
+                project_tasks_states.get(task.node_id)
+                != (
+                    # NOTE: the states are compared as stored (e.g. RETRY is stored as STARTED)
+                    DB_TO_RUNNING_STATE[RUNNING_STATE_TO_DB[task.state]],
+                    task.job_id,
+                )
+                for task in cached_pipeline.tasks.values()
+            ):
+                logger.debug("%s cached pipeline is stale", f"{key=}")
+                self._pipelines_cache.pop(key)
+
+    async def schedule_triggered_pipelines(self) -> None:
+        """schedules the pipelines that were triggered since the last call
+        (new/stopped runs, tasks state changes, completed tasks)"""
         self.wake_up_event.clear()
+        pipelines_to_schedule = [
+            (key, self.scheduled_pipelines[key])
+            for key in self._pipelines_to_schedule
+            if key in self.scheduled_pipelines
+        ]
+        self._pipelines_to_schedule.clear()
         # if one of the task throws, the other are NOT cancelled which is what we want
         await asyncio.gather(
             *[
@@ -128,7 +189,7 @@ class BaseCompScheduler(ABC):
                     user_id,
                     project_id,
                     iteration,
-                ), pipeline_params in self.scheduled_pipelines.items()
+                ), pipeline_params in pipelines_to_schedule
             ]
         )
 
@@ -161,20 +222,68 @@ class BaseCompScheduler(ABC):
             )
         return pipeline_comp_tasks
 
+    async def _get_cached_pipeline(
+        self, user_id: UserID, project_id: ProjectID, iteration: PositiveInt
+    ) -> _CachedPipeline:
+        if cached_pipeline := self._pipelines_cache.get(
+            (user_id, project_id, iteration)
+        ):
+            return cached_pipeline
+        dag = await self._get_pipeline_dag(project_id)
+        tasks = await self._get_pipeline_tasks(project_id, dag)
+        cached_pipeline = self._pipelines_cache[
+            (user_id, project_id, iteration)
+        ] = _CachedPipeline(dag=dag, tasks=tasks)
+        return cached_pipeline
+
+    def _update_cached_tasks(
+        self, project_id: ProjectID, node_ids: List[NodeID], **changes
+    ) -> None:
+        for (_, p_id, _), cached_pipeline in self._pipelines_cache.items():
+            if p_id != project_id:
+                continue
+            for node_id in node_ids:
+                if task := cached_pipeline.tasks.get(f"{node_id}"):
+                    for name, value in changes.items():
+                        setattr(task, name, value)
+
+    def _remove_pipeline(
+        self, user_id: UserID, project_id: ProjectID, iteration: PositiveInt
+    ) -> None:
+        self.scheduled_pipelines.pop((user_id, project_id, iteration), None)
+        self._pipelines_cache.pop((user_id, project_id, iteration), None)
+
+    async def _set_tasks_state(
+        self,
+        project_id: ProjectID,
+        node_ids: List[NodeID],
+        state: RunningState,
+        errors: Optional[List[ErrorDict]] = None,
+    ) -> None:
+        comp_tasks_repo: CompTasksRepository = get_repository(
+            self.db_engine, CompTasksRepository
+        )  # type: ignore
+        await comp_tasks_repo.set_project_tasks_state(
+            project_id, node_ids, state, errors
+        )
+        self._update_cached_tasks(project_id, node_ids, state=state, errors=errors)
+
     async def _update_run_result_from_tasks(
         self,
         user_id: UserID,
         project_id: ProjectID,
         iteration: PositiveInt,
-        pipeline_tasks: Dict[str, CompTaskAtDB],
+        cached_pipeline: _CachedPipeline,
     ) -> RunningState:
 
         pipeline_state_from_tasks: RunningState = get_pipeline_state_from_task_states(
-            list(pipeline_tasks.values()),
-        )
-        await self._set_run_result(
-            user_id, project_id, iteration, pipeline_state_from_tasks
+            list(cached_pipeline.tasks.values()),
         )
+        if pipeline_state_from_tasks != cached_pipeline.run_result:
+            await self._set_run_result(
+                user_id, project_id, iteration, pipeline_state_from_tasks
+            )
+            cached_pipeline.run_result = pipeline_state_from_tasks
         return pipeline_state_from_tasks
 
     async def _set_run_result(
@@ -196,39 +305,32 @@ class BaseCompScheduler(ABC):
         )
 
     async def _set_states_following_failed_to_aborted(
-        self, project_id: ProjectID, dag: nx.DiGraph
-    ) -> Dict[str, CompTaskAtDB]:
-        tasks: Dict[str, CompTaskAtDB] = await self._get_pipeline_tasks(project_id, dag)
+        self, project_id: ProjectID, dag: nx.DiGraph, tasks: Dict[str, CompTaskAtDB]
+    ) -> None:
         tasks_to_set_aborted: Set[NodeIDStr] = set()
         for task in tasks.values():
             if task.state == RunningState.FAILED:
                 tasks_to_set_aborted.update(nx.bfs_tree(dag, f"{task.node_id}"))
                 tasks_to_set_aborted.remove(f"{task.node_id}")
-        for task in tasks_to_set_aborted:
-            tasks[f"{task}"].state = RunningState.ABORTED
-        if tasks_to_set_aborted:
+        if tasks_to_set_aborted := {
+            node_id
+            for node_id in tasks_to_set_aborted
+            if tasks[node_id].state != RunningState.ABORTED
+        }:
             # update the current states back in DB
-            comp_tasks_repo: CompTasksRepository = cast(
-                CompTasksRepository,
-                get_repository(self.db_engine, CompTasksRepository),
-            )
-            await comp_tasks_repo.set_project_tasks_state(
+            await self._set_tasks_state(
                 project_id,
                 [NodeID(n) for n in tasks_to_set_aborted],
                 RunningState.ABORTED,
             )
-        return tasks
 
     async def _update_states_from_comp_backend(
         self,
         user_id: UserID,
         cluster_id: ClusterID,
         project_id: ProjectID,
-        pipeline_dag: nx.DiGraph,
+        pipeline_tasks: Dict[str, CompTaskAtDB],
     ):
-        pipeline_tasks: Dict[str, CompTaskAtDB] = await self._get_pipeline_tasks(
-            project_id, pipeline_dag
-        )
         tasks_completed: List[CompTaskAtDB] = []
         if tasks_supposedly_processing := [
             task
@@ -307,14 +409,18 @@ class BaseCompScheduler(ABC):
         )
 
         try:
-            dag: nx.DiGraph = await self._get_pipeline_dag(project_id)
+            cached_pipeline = await self._get_cached_pipeline(
+                user_id, project_id, iteration
+            )
+            dag: nx.DiGraph = cached_pipeline.dag
+            comp_tasks = cached_pipeline.tasks
             # 1. Update our list of tasks with data from backend (state, results)
             await self._update_states_from_comp_backend(
-                user_id, cluster_id, project_id, dag
+                user_id, cluster_id, project_id, comp_tasks
             )
             # 2. Any task following a FAILED task shall be ABORTED
-            comp_tasks = await self._set_states_following_failed_to_aborted(
-                project_id, dag
+            await self._set_states_following_failed_to_aborted(
+                project_id, dag, comp_tasks
             )
             # 3. do we want to stop the pipeline now?
             if marked_for_stopping:
@@ -328,12 +434,12 @@ class BaseCompScheduler(ABC):
                 )
             # 4. Update the run result
             pipeline_result = await self._update_run_result_from_tasks(
-                user_id, project_id, iteration, comp_tasks
+                user_id, project_id, iteration, cached_pipeline
             )
             # 5. Are we done scheduling that pipeline?
             if not dag.nodes() or pipeline_result in COMPLETED_STATES:
                 # there is nothing left, the run is completed, we're done here
-                self.scheduled_pipelines.pop((user_id, project_id, iteration), None)
+                self._remove_pipeline(user_id, project_id, iteration)
                 logger.info(
                     "pipeline %s scheduling completed with result %s",
                     f"{project_id=}",
@@ -347,7 +453,7 @@ class BaseCompScheduler(ABC):
             await self._set_run_result(
                 user_id, project_id, iteration, RunningState.ABORTED
             )
-            self.scheduled_pipelines.pop((user_id, project_id, iteration), None)
+            self._remove_pipeline(user_id, project_id, iteration)
         except InvalidPipelineError as exc:
             logger.warning(
                 "pipeline %s appears to be misconfigured, it will be removed from scheduler. Please check pipeline:\n%s",
@@ -357,7 +463,12 @@ class BaseCompScheduler(ABC):
             await self._set_run_result(
                 user_id, project_id, iteration, RunningState.ABORTED
             )
-            self.scheduled_pipelines.pop((user_id, project_id, iteration), None)
+            self._remove_pipeline(user_id, project_id, iteration)
+        except Exception:
+            # the in-memory state might be out of sync, reload it on next try
+            self._pipelines_cache.pop((user_id, project_id, iteration), None)
+            self._pipelines_to_schedule.add((user_id, project_id, iteration))
+            raise
 
     async def _schedule_tasks_to_stop(
         self,
@@ -371,6 +482,16 @@ class BaseCompScheduler(ABC):
             self.db_engine, CompTasksRepository
         )  # type: ignore
         await comp_tasks_repo.mark_project_published_tasks_as_aborted(project_id)
+        self._update_cached_tasks(
+            project_id,
+            [
+                t.node_id
+                for t in comp_tasks.values()
+                if t.state == RunningState.PUBLISHED
+                and t.node_class == NodeClass.COMPUTATIONAL
+            ],
+            state=RunningState.ABORTED,
+        )
         # stop any remaining running task, these are already submitted
         tasks_to_stop = [
             t
@@ -388,7 +509,8 @@ class BaseCompScheduler(ABC):
         comp_tasks: Dict[str, CompTaskAtDB],
         dag: nx.DiGraph,
     ):
-        # filter out the successfully completed tasks
+        # filter out the successfully completed tasks (the cached dag is not modified)
+        dag = dag.copy()
         dag.remove_nodes_from(
             {
                 node_id
@@ -410,10 +532,7 @@ class BaseCompScheduler(ABC):
             return
 
         # Change the tasks state to PENDING
-        comp_tasks_repo: CompTasksRepository = get_repository(
-            self.db_engine, CompTasksRepository
-        )  # type: ignore
-        await comp_tasks_repo.set_project_tasks_state(
+        await self._set_tasks_state(
             project_id, list(tasks_ready_to_start.keys()), RunningState.PENDING
         )
 
@@ -440,7 +559,7 @@ class BaseCompScheduler(ABC):
                     f"{r}",
                 )
 
-                await comp_tasks_repo.set_project_tasks_state(
+                await self._set_tasks_state(
                     project_id,
                     [r.node_id],
                     RunningState.FAILED,
@@ -461,12 +580,10 @@ class BaseCompScheduler(ABC):
                 # we should try re-connecting.
                 # in the meantime we cannot schedule tasks on the scheduler,
                 # let's put these tasks back to PUBLISHED, so they might be re-submitted later
-                await asyncio.gather(
-                    comp_tasks_repo.set_project_tasks_state(
-                        project_id,
-                        list(tasks_ready_to_start.keys()),
-                        RunningState.PUBLISHED,
-                    ),
+                await self._set_tasks_state(
+                    project_id,
+                    list(tasks_ready_to_start.keys()),
+                    RunningState.PUBLISHED,
                 )
             elif isinstance(r, Exception):
                 logger.error(
@@ -478,9 +595,15 @@ class BaseCompScheduler(ABC):
                     f"{r}",
                     "".join(traceback.format_tb(r.__traceback__)),
                 )
-                await comp_tasks_repo.set_project_tasks_state(
-                    project_id, [t], RunningState.FAILED
-                )
+                await self._set_tasks_state(project_id, [t], RunningState.FAILED)
+
+    def _trigger_pipeline_scheduling(
+        self, user_id: UserID, project_id: ProjectID
+    ) -> None:
+        self._pipelines_to_schedule.update(
+            key for key in self.scheduled_pipelines if key[:2] == (user_id, project_id)
+        )
+        self._wake_up_scheduler_now()
 
     def _wake_up_scheduler_now(self) -> None:
         self.wake_up_event.set()
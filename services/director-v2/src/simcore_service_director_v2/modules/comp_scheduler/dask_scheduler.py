@@ -2,6 +2,7 @@ import asyncio
 import logging
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from functools import partial
 from typing import AsyncIterator, Dict, List, Tuple, Union
 
 from dask_task_models_library.container_tasks.errors import TaskCancelledError
@@ -79,6 +80,8 @@ class DaskScheduler(BaseCompScheduler):
         scheduled_tasks: Dict[NodeID, Image],
     ):
         # now transfer the pipeline to the dask scheduler
+        # NOTE: the callback is called from a secondary thread once the task is done
+        loop = asyncio.get_running_loop()
         async with _cluster_dask_client(user_id, cluster_id, self) as client:
             task_job_ids: List[
                 Tuple[NodeID, str]
@@ -87,7 +90,12 @@ class DaskScheduler(BaseCompScheduler):
                 project_id=project_id,
                 cluster_id=cluster_id,
                 tasks=scheduled_tasks,
-                callback=self._wake_up_scheduler_now,
+                callback=partial(
+                    loop.call_soon_threadsafe,
+                    self._trigger_pipeline_scheduling,
+                    user_id,
+                    project_id,
+                ),
             )
             logger.debug(
                 "started following tasks (node_id, job_id)[%s] on cluster %s",
@@ -104,6 +112,8 @@ class DaskScheduler(BaseCompScheduler):
                 for node_id, job_id in task_job_ids
             ]
         )
+        for node_id, job_id in task_job_ids:
+            self._update_cached_tasks(project_id, [node_id], job_id=job_id)
 
     async def _get_tasks_status(
         self, user_id: UserID, cluster_id: ClusterID, tasks: List[CompTaskAtDB]
@@ -201,7 +211,7 @@ class DaskScheduler(BaseCompScheduler):
             )
             await self.rabbitmq_client.publish_message(message)
 
-        await CompTasksRepository(self.db_engine).set_project_tasks_state(
+        await self._set_tasks_state(
             task.project_id, [task.node_id], task_final_state, errors=errors
         )
 
@@ -228,9 +238,8 @@ class DaskScheduler(BaseCompScheduler):
             )
             await self.rabbitmq_client.publish_message(message)
 
-        await CompTasksRepository(self.db_engine).set_project_tasks_state(
-            project_id, [node_id], task_state_event.state
-        )
+        await self._set_tasks_state(project_id, [node_id], task_state_event.state)
+        self._trigger_pipeline_scheduling(user_id, project_id)
 
     async def _task_progress_change_handler(self, event: str) -> None:
         task_progress_event = TaskProgressEvent.parse_raw(event)
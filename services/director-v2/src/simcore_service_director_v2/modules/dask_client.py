@@ -11,7 +11,6 @@ loads(dumps(my_object))
 import asyncio
 import json
 import logging
-import traceback
 from collections import deque
 from dataclasses import dataclass, field
 from http.client import HTTPException
@@ -85,6 +84,13 @@ _DASK_TASK_STATUS_RUNNING_STATE_MAP = {
 DASK_DEFAULT_TIMEOUT_S = 1
 
 
+def _get_exception_type_name(exception_text: Optional[str]) -> Optional[str]:
+    # NOTE: the dask-scheduler keeps the repr of the exception, e.g. "TaskCancelledError()"
+    if exception_text is None:
+        return None
+    return exception_text.split("(", maxsplit=1)[0]
+
+
 ServiceKey = str
 ServiceVersion = str
 LogFileUploadURL = AnyUrl
@@ -346,32 +352,54 @@ class DaskClient:
         )
         check_communication_with_scheduler_is_open(self.backend.client)
         check_scheduler_status(self.backend.client)
-        # try to get the task from the scheduler
-        task_statuses = await self.backend.client.run_on_scheduler(
-            lambda dask_scheduler: dask_scheduler.get_task_status(keys=job_ids)
+
+        def _get_tasks_status_and_errors(
+            dask_scheduler: distributed.Scheduler,
+        ) -> dict[str, tuple[Optional[str], Optional[str], Optional[str]]]:
+            # NOTE: this runs on the dask-scheduler, so the exceptions are not deserialized
+            # here, their text representations are returned instead
+            tasks_status = {}
+            for job_id in job_ids:
+                task_state = dask_scheduler.tasks.get(job_id)
+                if task_state is None:
+                    tasks_status[job_id] = (None, None, None)
+                elif task_state.state == "erred":
+                    failing_task_state = task_state.exception_blame or task_state
+                    tasks_status[job_id] = (
+                        task_state.state,
+                        failing_task_state.exception_text,
+                        failing_task_state.traceback_text,
+                    )
+                else:
+                    tasks_status[job_id] = (task_state.state, None, None)
+            return tasks_status
+
+        # get the tasks status (and errors if any) from the scheduler in one go
+        tasks_status: dict[
+            str, tuple[Optional[str], Optional[str], Optional[str]]
+        ] = await self.backend.client.run_on_scheduler(
+            _get_tasks_status_and_errors
         )  # type: ignore
-        logger.debug("found dask task statuses: %s", f"{task_statuses=}")
+        logger.debug("found dask task statuses: %s", f"{tasks_status=}")
 
         running_states: Deque[RunningState] = deque()
         for job_id in job_ids:
-            dask_status = task_statuses.get(job_id, "lost")
+            dask_status, exception_text, traceback_text = tasks_status.get(
+                job_id, ("lost", None, None)
+            )
             if dask_status == "erred":
                 # find out if this was a cancellation
-                exception = await distributed.Future(job_id).exception(timeout=DASK_DEFAULT_TIMEOUT_S)  # type: ignore
-
-                if isinstance(exception, TaskCancelledError):
+                if (
+                    _get_exception_type_name(exception_text)
+                    == TaskCancelledError.__name__
+                ):
                     running_states.append(RunningState.ABORTED)
                 else:
-                    assert exception  # nosec
                     logger.warning(
                         "Task  %s completed in error:\n%s\nTrace:\n%s",
                         job_id,
-                        exception,
-                        "".join(
-                            traceback.format_exception(
-                                exception.__class__, exception, exception.__traceback__
-                            )
-                        ),
+                        exception_text,
+                        traceback_text,
                     )
                     running_states.append(RunningState.FAILED)
             else:
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Final, Optional
 
 import sqlalchemy as sa
 from models_library.function_services_catalog import iter_service_docker_data
@@ -10,6 +10,7 @@ from models_library.projects_nodes import Node
 from models_library.projects_nodes_io import NodeID
 from models_library.projects_state import RunningState
 from models_library.services import ServiceDockerData, ServiceKeyVersion
+from servicelib.utils import logged_gather
 from sqlalchemy import literal_column
 from sqlalchemy.dialects.postgresql import insert
 
@@ -17,13 +18,15 @@ from ....core.errors import ErrorDict
 from ....models.domains.comp_tasks import CompTaskAtDB, Image, NodeSchema
 from ....models.schemas.services import ServiceExtras
 from ....utils.computations import to_node_class
-from ....utils.db import RUNNING_STATE_TO_DB
+from ....utils.db import DB_TO_RUNNING_STATE, RUNNING_STATE_TO_DB
 from ...director_v0 import DirectorV0Client
 from ..tables import NodeClass, StateType, comp_tasks
 from ._base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+_MAX_CONCURRENT_SERVICE_METADATA_REQUESTS: Final[int] = 10
+
 #
 # This is a catalog of front-end services that are translated as tasks
 #
@@ -38,12 +41,46 @@ _FRONTEND_SERVICES_CATALOG: dict[str, ServiceDockerData] = {
 }
 
 
+async def _get_service_details_and_extras(
+    director_client: DirectorV0Client, service_key_version: ServiceKeyVersion
+) -> tuple[Optional[ServiceDockerData], Optional[ServiceExtras]]:
+    if to_node_class(service_key_version.key) == NodeClass.FRONTEND:
+        return _FRONTEND_SERVICES_CATALOG.get(service_key_version.key, None), None
+    node_details, node_extras = await asyncio.gather(
+        director_client.get_service_details(service_key_version),
+        director_client.get_service_extras(service_key_version),
+    )
+    return node_details, node_extras
+
+
 async def _generate_tasks_list_from_project(
     project: ProjectAtDB,
     director_client: DirectorV0Client,
     published_nodes: list[NodeID],
 ) -> list[CompTaskAtDB]:
 
+    # NOTE: large studies (e.g. sweeps) use the same few services in many nodes,
+    # each unique service is only fetched once
+    unique_services: list[tuple[str, str]] = list(
+        {(node.key, node.version) for node in project.workbench.values()}
+    )
+    services_details_and_extras: dict[
+        tuple[str, str], tuple[Optional[ServiceDockerData], Optional[ServiceExtras]]
+    ] = dict(
+        zip(
+            unique_services,
+            await logged_gather(
+                *(
+                    _get_service_details_and_extras(
+                        director_client, ServiceKeyVersion(key=key, version=version)
+                    )
+                    for key, version in unique_services
+                ),
+                max_concurrency=_MAX_CONCURRENT_SERVICE_METADATA_REQUESTS,
+            ),
+        )
+    )
+
     list_comp_tasks = []
     for internal_id, node_id in enumerate(project.workbench, 1):
         node: Node = project.workbench[node_id]
@@ -53,15 +90,9 @@ async def _generate_tasks_list_from_project(
             version=node.version,
         )
         node_class = to_node_class(service_key_version.key)
-        node_details: Optional[ServiceDockerData] = None
-        node_extras: Optional[ServiceExtras] = None
-        if node_class == NodeClass.FRONTEND:
-            node_details = _FRONTEND_SERVICES_CATALOG.get(service_key_version.key, None)
-        else:
-            node_details, node_extras = await asyncio.gather(
-                director_client.get_service_details(service_key_version),
-                director_client.get_service_extras(service_key_version),
-            )
+        node_details, node_extras = services_details_and_extras[
+            (node.key, node.version)
+        ]
 
         if not node_details:
             continue
@@ -138,6 +169,33 @@ class CompTasksRepository(BaseRepository):
         logger.debug("found the tasks: %s", f"{tasks=}")
         return tasks
 
+    async def get_comp_tasks_states(
+        self, project_ids: list[ProjectID]
+    ) -> dict[ProjectID, dict[NodeID, tuple[RunningState, Optional[str]]]]:
+        """returns the state and job_id of the computational tasks of the projects,
+        i.e. a lightweight alternative to get_comp_tasks to check them"""
+        tasks_states: dict[
+            ProjectID, dict[NodeID, tuple[RunningState, Optional[str]]]
+        ] = {}
+        async with self.db_engine.acquire() as conn:
+            async for row in conn.execute(
+                sa.select(
+                    [
+                        comp_tasks.c.project_id,
+                        comp_tasks.c.node_id,
+                        comp_tasks.c.state,
+                        comp_tasks.c.job_id,
+                    ]
+                ).where(
+                    (comp_tasks.c.project_id.in_([f"{p}" for p in project_ids]))
+                    & (comp_tasks.c.node_class == NodeClass.COMPUTATIONAL)
+                )
+            ):
+                tasks_states.setdefault(ProjectID(row.project_id), {})[
+                    NodeID(row.node_id)
+                ] = (DB_TO_RUNNING_STATE[row.state], row.job_id)
+        return tasks_states
+
     async def check_task_exists(self, project_id: ProjectID, node_id: NodeID) -> bool:
         async with self.db_engine.acquire() as conn:
             nid: Optional[str] = await conn.scalar(
@@ -168,42 +226,71 @@ class CompTasksRepository(BaseRepository):
                 )
             )
             # remove the tasks that were removed from project workbench
-            node_ids_to_delete = [
+            if node_ids_to_delete := [
                 t.node_id
                 for t in await result.fetchall()
                 if t.node_id not in project.workbench
-            ]
-            for node_id in node_ids_to_delete:
+            ]:
                 await conn.execute(
                     sa.delete(comp_tasks).where(
                         (comp_tasks.c.project_id == str(project.uuid))
-                        & (comp_tasks.c.node_id == node_id)
+                        & (comp_tasks.c.node_id.in_(node_ids_to_delete))
                     )
                 )
 
-            # insert or update the remaining tasks
+            if not list_of_comp_tasks_in_project:
+                return []
+
+            # insert or update the remaining tasks in one statement
             # NOTE: comp_tasks DB only trigger a notification to the webserver if an UPDATE on comp_tasks.outputs or comp_tasks.state is done
             # NOTE: an exception to this is when a frontend service changes its output since there is no node_ports, the UPDATE must be done here.
-            inserted_comp_tasks_db: list[CompTaskAtDB] = []
-            for comp_task_db in list_of_comp_tasks_in_project:
-
-                insert_stmt = insert(comp_tasks).values(**comp_task_db.to_db_model())
-
-                exclusion_rule = (
-                    {"state"}
-                    if str(comp_task_db.node_id) not in published_nodes
-                    else set()
+            # NOTE: the state is only updated for published tasks
+            insert_stmt = insert(comp_tasks).values(
+                [
+                    comp_task_db.to_db_model()
+                    for comp_task_db in list_of_comp_tasks_in_project
+                ]
+            )
+            update_values = {
+                column: insert_stmt.excluded[column]
+                for column in list_of_comp_tasks_in_project[0].to_db_model(
+                    exclude={"state", "outputs"}
                 )
-                if to_node_class(comp_task_db.image.name) != NodeClass.FRONTEND:
-                    exclusion_rule.add("outputs")
-                on_update_stmt = insert_stmt.on_conflict_do_update(
-                    index_elements=[comp_tasks.c.project_id, comp_tasks.c.node_id],
-                    set_=comp_task_db.to_db_model(exclude=exclusion_rule),
-                ).returning(literal_column("*"))
-                result = await conn.execute(on_update_stmt)
-                row = await result.fetchone()
-                assert row  # nosec
-                inserted_comp_tasks_db.append(CompTaskAtDB.from_orm(row))
+            }
+            update_values["outputs"] = sa.case(
+                [
+                    (
+                        insert_stmt.excluded.node_class == NodeClass.FRONTEND,
+                        insert_stmt.excluded.outputs,
+                    )
+                ],
+                else_=comp_tasks.c.outputs,
+            )
+            if published_nodes:
+                update_values["state"] = sa.case(
+                    [
+                        (
+                            insert_stmt.excluded.node_id.in_(
+                                [f"{node_id}" for node_id in published_nodes]
+                            ),
+                            insert_stmt.excluded.state,
+                        )
+                    ],
+                    else_=comp_tasks.c.state,
+                )
+            on_update_stmt = insert_stmt.on_conflict_do_update(
+                index_elements=[comp_tasks.c.project_id, comp_tasks.c.node_id],
+                set_=update_values,
+            ).returning(literal_column("*"))
+            result = await conn.execute(on_update_stmt)
+            upserted_tasks: dict[str, CompTaskAtDB] = {
+                row.node_id: CompTaskAtDB.from_orm(row)
+                for row in await result.fetchall()
+            }
+            inserted_comp_tasks_db: list[CompTaskAtDB] = [
+                upserted_tasks[f"{comp_task_db.node_id}"]
+                for comp_task_db in list_of_comp_tasks_in_project
+            ]
             logger.debug(
                 "inserted the following tasks in comp_tasks: %s",
                 f"{inserted_comp_tasks_db=}",
@@ -5,10 +5,11 @@
 import logging
 import urllib.parse
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Final, List, Optional
 
 import httpx
 import yarl
+from aiocache import cached
 from fastapi import FastAPI, HTTPException, Request, Response
 from models_library.projects import ProjectID
 from models_library.projects_nodes import NodeID
@@ -29,6 +30,15 @@ from ..utils.logging_utils import log_decorator
 
 logger = logging.getLogger(__name__)
 
+# NOTE: a service key:version is not expected to change once published
+_SERVICE_METADATA_CACHING_TTL_S: Final[int] = 5 * 60
+
+
+def _build_service_cache_key(fct, *args, **kwargs) -> str:
+    service: ServiceKeyVersion = kwargs.get("service") or args[-1]
+    return f"{fct.__name__}_{service.key}_{service.version}"
+
+
 # Module's setup logic ---------------------------------------------
 
 
@@ -97,6 +107,7 @@ class DirectorV0Client:
         # NOTE: the response is NOT validated!
         return response
 
+    @cached(ttl=_SERVICE_METADATA_CACHING_TTL_S, key_builder=_build_service_cache_key)
     @log_decorator(logger=logger)
     async def get_service_details(
         self, service: ServiceKeyVersion
@@ -108,6 +119,7 @@ class DirectorV0Client:
             return ServiceDockerData.parse_obj(unenvelope_or_raise_error(resp)[0])
         raise HTTPException(status_code=resp.status_code, detail=resp.content)
 
+    @cached(ttl=_SERVICE_METADATA_CACHING_TTL_S, key_builder=_build_service_cache_key)
     @log_decorator(logger=logger)
     async def get_service_extras(self, service: ServiceKeyVersion) -> ServiceExtras:
         resp = await self.request(
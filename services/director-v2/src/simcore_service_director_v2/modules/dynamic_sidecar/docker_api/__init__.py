@@ -4,6 +4,7 @@ from ._core import (
     create_network,
     create_service_and_get_id,
     get_dynamic_sidecar_placement,
+    get_dynamic_sidecar_stacks_services_count,
     get_dynamic_sidecar_state,
     get_dynamic_sidecars_to_observe,
     get_or_create_networks_ids,
@@ -15,6 +16,7 @@ from ._core import (
     list_dynamic_sidecar_services,
     remove_dynamic_sidecar_network,
     remove_dynamic_sidecar_stack,
+    stream_services_events,
     try_to_remove_network,
     update_scheduler_data_label,
 )
@@ -26,6 +28,7 @@ __all__: tuple[str, ...] = (
     "create_network",
     "create_service_and_get_id",
     "get_dynamic_sidecar_placement",
+    "get_dynamic_sidecar_stacks_services_count",
     "get_dynamic_sidecar_state",
     "get_dynamic_sidecars_to_observe",
     "get_or_create_networks_ids",
@@ -39,6 +42,7 @@ __all__: tuple[str, ...] = (
     "remove_dynamic_sidecar_stack",
     "remove_pending_volume_removal_services",
     "remove_volumes_from_node",
+    "stream_services_events",
     "try_to_remove_network",
     "update_scheduler_data_label",
 )
@@ -1,6 +1,7 @@
 import json
 import logging
-from typing import Any, Mapping, Optional, Union
+from collections import Counter
+from typing import Any, AsyncIterator, Mapping, Optional, Union
 
 import aiodocker
 from aiodocker.utils import clean_filters, clean_map
@@ -274,6 +275,43 @@ async def are_sidecar_and_proxy_services_present(
     return True
 
 
+async def get_dynamic_sidecar_stacks_services_count(
+    dynamic_sidecar_settings: DynamicSidecarSettings,
+) -> dict[NodeID, int]:
+    """
+    Number of services in the stack of each dynamic-sidecar.
+    All the stacks are listed in a single call instead of one call per node.
+    """
+    async with docker_client() as client:
+        stacks_services = await client.services.list(
+            filters={
+                "label": [
+                    f"swarm_stack_name={dynamic_sidecar_settings.SWARM_STACK_NAME}",
+                    "uuid",
+                ]
+            }
+        )
+    return Counter(
+        NodeID(service["Spec"]["Labels"]["uuid"]) for service in stacks_services
+    )
+
+
+async def stream_services_events() -> AsyncIterator[dict[str, Any]]:
+    """
+    Yields the events of the docker swarm services (e.g. create, update, remove)
+    until the stream is closed by the docker engine
+    """
+    async with docker_client() as client:
+        subscriber = client.events.subscribe(
+            filters=clean_filters({"type": ["service"], "scope": ["swarm"]})
+        )
+        try:
+            while event := await subscriber.get():
+                yield event
+        finally:
+            await client.events.stop()
+
+
 async def remove_dynamic_sidecar_stack(
     node_uuid: NodeID, dynamic_sidecar_settings: DynamicSidecarSettings
 ) -> None:
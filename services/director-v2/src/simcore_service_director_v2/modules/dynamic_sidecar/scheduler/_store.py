@@ -0,0 +1,85 @@
+"""Persistence of the data of the services observed by the scheduler
+
+The scheduler data changes during the observation cycle (e.g. status, availability).
+Storing every change in the docker service labels needs an inspect and an update of the
+service spec, a load on the docker swarm API which grows with the number of services.
+These changes are stored in redis instead. The labels still hold the data at creation
+and when the service is marked for removal, and are used if redis has no data.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Final
+
+from fastapi import FastAPI
+from pydantic import ValidationError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from settings_library.redis import RedisSettings
+
+from ....models.schemas.dynamic_services import SchedulerData, ServiceName
+
+logger = logging.getLogger(__name__)
+
+_SCHEDULER_DATA_KEY: Final[str] = "dynamic_sidecars_scheduler_data"
+
+
+@dataclass
+class SchedulerDataStore:
+    """
+    Best effort storage: errors are logged and not raised since
+    the scheduler can always fall back to the docker service labels
+    (e.g. save returns False and the caller updates the labels instead)
+    """
+
+    _redis: Redis
+
+    @classmethod
+    def create(cls, app: FastAPI) -> "SchedulerDataStore":
+        redis_settings: RedisSettings = app.state.settings.REDIS
+        return cls(_redis=Redis.from_url(redis_settings.dsn_scheduler_data))
+
+    async def close(self) -> None:
+        await self._redis.close(close_connection_pool=True)
+
+    async def save(self, scheduler_data: SchedulerData) -> bool:
+        """returns False if the data could not be stored"""
+        try:
+            await self._redis.hset(
+                _SCHEDULER_DATA_KEY,
+                scheduler_data.service_name,
+                scheduler_data.as_label_data(),
+            )
+            return True
+        except RedisError as e:
+            logger.warning(
+                "Could not store data of %s: %s", scheduler_data.service_name, f"{e}"
+            )
+            return False
+
+    async def remove(self, service_name: ServiceName) -> None:
+        try:
+            await self._redis.hdel(_SCHEDULER_DATA_KEY, service_name)
+        except RedisError as e:
+            logger.warning("Could not remove data of %s: %s", service_name, f"{e}")
+
+    async def load_all(self) -> dict[ServiceName, SchedulerData]:
+        try:
+            stored_data: dict[bytes, bytes] = await self._redis.hgetall(
+                _SCHEDULER_DATA_KEY
+            )
+        except RedisError as e:
+            logger.warning("Could not load stored scheduler data: %s", f"{e}")
+            return {}
+
+        scheduler_data_by_name: dict[ServiceName, SchedulerData] = {}
+        for service_name, data in stored_data.items():
+            try:
+                scheduler_data_by_name[service_name.decode()] = SchedulerData.parse_raw(
+                    data
+                )
+            except ValidationError:
+                logger.warning(
+                    "Ignoring invalid stored data of %s", service_name.decode()
+                )
+        return scheduler_data_by_name
@@ -25,8 +25,10 @@ async def apply_observation_cycle(
     # TODO: PC-> ANE: custom settings are frozen. in principle, no need to create copies.
     initial_status = deepcopy(scheduler_data.dynamic_sidecar.status)
 
-    if (  # do not refactor, second part of "and condition" is skipped most times
+    if (  # do not refactor, last part of "and condition" is skipped most times
         scheduler_data.dynamic_sidecar.were_containers_created
+        # NOTE: the stacks listed once per cycle spare a docker call per service
+        and not scheduler.has_complete_stack(scheduler_data.node_uuid)
         and not await are_sidecar_and_proxy_services_present(
             node_uuid=scheduler_data.node_uuid,
             dynamic_sidecar_settings=dynamic_services_settings.DYNAMIC_SIDECAR,
@@ -4,24 +4,30 @@ This scheduler takes care of scheduling the dynamic services life cycle.
 
 self._to_observe is a list containing all the dynamic services to schedule (from creation to deletion)
 self._to_observe is protected by an asyncio Lock
-1. a background task runs every X seconds and adds all the current scheduled services in an asyncio.Queue
+1. a background task runs every X seconds and adds the scheduled services which are due in an asyncio.Queue
+  a. a running service which did not change since its last observation is observed
+    less and less often (up to DIRECTOR_V2_DYNAMIC_SCHEDULER_MAX_INTERVAL_SECONDS)
+  b. the stacks of all the due services are listed once per cycle
 2. a second background task processes the entries in the Queue and starts a task per service
   a. if the service is already under "observation" then it will skip this cycle
 3. a third background task dealing with ensuring no `volumes removal services`
     remain in the system in case the director-v2:
     - is restarted before while the service is running
     - an error occurs while removing one such services
+4. a fourth background task listens to the docker services events and
+    immediately adds the concerned services in the Queue
 """
 
 import asyncio
 import contextlib
 import functools
 import logging
+import time
 from asyncio import Lock, Queue, Task, sleep
 from copy import deepcopy
 from dataclasses import dataclass, field
 from math import floor
-from typing import Optional, Union
+from typing import Any, Mapping, Optional, Union
 from uuid import UUID
 
 from fastapi import FastAPI
@@ -45,10 +51,12 @@ from ..api_client import (
     get_dynamic_sidecar_client,
 )
 from ..docker_api import (
+    get_dynamic_sidecar_stacks_services_count,
     get_dynamic_sidecar_state,
     get_dynamic_sidecars_to_observe,
     is_dynamic_sidecar_stack_missing,
     remove_pending_volume_removal_services,
+    stream_services_events,
     update_scheduler_data_label,
 )
 from ..docker_states import ServiceState, extract_containers_minimim_statuses
@@ -57,15 +65,16 @@ from ..errors import (
     DynamicSidecarNotFoundError,
     GenericDockerError,
 )
+from ._store import SchedulerDataStore
 from ._task_utils import apply_observation_cycle
 from ._utils import attempt_pod_removal_and_data_saving
 
 logger = logging.getLogger(__name__)
 
-ServiceName = str
-
 _DISABLED_MARK = object()
 
+_DOCKER_EVENTS_RECONNECT_DELAY_S: float = 5
+
 
 def _trigger_every_30_seconds(observation_counter: int, wait_interval: float) -> bool:
     # divisor to figure out if 30 seconds have passed based on the cycle count
@@ -73,6 +82,18 @@ def _trigger_every_30_seconds(observation_counter: int, wait_interval: float) ->
     return observation_counter % modulo_divisor == 0
 
 
+def _is_running_undisturbed(scheduler_data: SchedulerData) -> bool:
+    """the service is up and nothing is pending on the scheduler side"""
+    dynamic_sidecar = scheduler_data.dynamic_sidecar
+    return (
+        dynamic_sidecar.status.current == DynamicSidecarStatus.OK
+        and dynamic_sidecar.is_available
+        and dynamic_sidecar.were_containers_created
+        and dynamic_sidecar.is_project_network_attached
+        and not dynamic_sidecar.service_removal_state.can_remove
+    )
+
+
 @dataclass
 class DynamicSidecarsScheduler:  # pylint: disable=too-many-instance-attributes
     app: FastAPI
@@ -89,6 +110,11 @@ class DynamicSidecarsScheduler:  # pylint: disable=too-many-instance-attributes
     _trigger_observation_queue_task: Optional[Task] = None
     _trigger_observation_queue: Queue = field(default_factory=Queue)
     _observation_counter: int = 0
+    _observation_intervals: dict[ServiceName, float] = field(default_factory=dict)
+    _next_observations: dict[ServiceName, float] = field(default_factory=dict)
+    _stacks_services_count: dict[NodeID, int] = field(default_factory=dict)
+    _docker_events_task: Optional[Task] = None
+    _store: Optional[SchedulerDataStore] = None
 
     def toggle_observation_cycle(self, node_uuid: NodeID, disable: bool) -> bool:
         """
@@ -154,6 +180,8 @@ class DynamicSidecarsScheduler:  # pylint: disable=too-many-instance-attributes
             current: SchedulerData = self._to_observe[service_name]
             current.dynamic_sidecar.service_removal_state.mark_to_remove(can_save)
             await update_scheduler_data_label(current)
+            await self._store_scheduler_data(current)
+            self._trigger_observation(service_name)
 
         logger.debug("Service '%s' marked for removal from scheduler", service_name)
 
@@ -172,9 +200,20 @@ class DynamicSidecarsScheduler:  # pylint: disable=too-many-instance-attributes
 
             del self._to_observe[service_name]
             del self._inverse_search_mapping[node_uuid]
+            self._observation_intervals.pop(service_name, None)
+            self._next_observations.pop(service_name, None)
+            if self._store:
+                await self._store.remove(service_name)
 
         logger.debug("Removed service '%s' from scheduler", service_name)
 
+    def has_complete_stack(self, node_uuid: NodeID) -> bool:
+        """
+        True if both the dynamic-sidecar and the proxy were listed
+        at the beginning of the current observation cycle
+        """
+        return self._stacks_services_count.get(node_uuid, 0) == 2
+
     def get_scheduler_data(self, node_uuid: NodeID) -> SchedulerData:
         """
 
@@ -342,6 +381,50 @@ class DynamicSidecarsScheduler:  # pylint: disable=too-many-instance-attributes
     def _enqueue_observation_from_service_name(self, service_name: str) -> None:
         self._trigger_observation_queue.put_nowait(service_name)
 
+    def _trigger_observation(self, service_name: str) -> None:
+        """observes the service right away and resets its observation interval"""
+        self._observation_intervals.pop(service_name, None)
+        self._next_observations.pop(service_name, None)
+        self._enqueue_observation_from_service_name(service_name)
+
+    def _schedule_next_observation(
+        self, scheduler_data: SchedulerData, *, has_changed: bool
+    ) -> None:
+        settings: DynamicServicesSchedulerSettings = (
+            self.app.state.settings.DYNAMIC_SERVICES.DYNAMIC_SCHEDULER
+        )
+        service_name = scheduler_data.service_name
+        interval = settings.DIRECTOR_V2_DYNAMIC_SCHEDULER_INTERVAL_SECONDS
+        if not has_changed and _is_running_undisturbed(scheduler_data):
+            interval = min(
+                2 * self._observation_intervals.get(service_name, interval),
+                max(
+                    interval,
+                    settings.DIRECTOR_V2_DYNAMIC_SCHEDULER_MAX_INTERVAL_SECONDS,
+                ),
+            )
+        self._observation_intervals[service_name] = interval
+        self._next_observations[service_name] = time.monotonic() + interval
+
+    async def _store_scheduler_data(self, scheduler_data: SchedulerData) -> bool:
+        """returns False if the data could not be stored"""
+        if not self._store:
+            return False
+        if await self._store.save(scheduler_data):
+            return True
+        # NOTE: outdated stored data would be preferred to the labels at startup
+        await self._store.remove(scheduler_data.service_name)
+        return False
+
+    async def _save_scheduler_data(self, scheduler_data: SchedulerData) -> None:
+        if await self._store_scheduler_data(scheduler_data):
+            return
+        # the data is not lost when it cannot be stored
+        try:
+            await update_scheduler_data_label(scheduler_data)
+        except GenericDockerError as e:
+            logger.warning("Skipped labels update, please check:\n %s", f"{e}")
+
     async def _run_trigger_observation_queue_task(self) -> None:
         """generates events at regular time interval"""
         dynamic_sidecar_settings: DynamicSidecarSettings = (
@@ -431,13 +514,10 @@ class DynamicSidecarsScheduler:  # pylint: disable=too-many-instance-attributes
                     error_code,
                 )
             finally:
-                if scheduler_data_copy != scheduler_data:
-                    try:
-                        await update_scheduler_data_label(scheduler_data)
-                    except GenericDockerError as e:
-                        logger.warning(
-                            "Skipped labels update, please check:\n %s", f"{e}"
-                        )
+                has_changed = scheduler_data_copy != scheduler_data
+                if has_changed:
+                    await self._save_scheduler_data(scheduler_data)
+                self._schedule_next_observation(scheduler_data, has_changed=has_changed)
 
         service_name: str
         while service_name := await self._trigger_observation_queue.get():
@@ -477,14 +557,38 @@ class DynamicSidecarsScheduler:  # pylint: disable=too-many-instance-attributes
             settings.DIRECTOR_V2_DYNAMIC_SCHEDULER_INTERVAL_SECONDS,
         )
 
-        while self._keep_running:
-            logger.debug("Observing dynamic-sidecars %s", list(self._to_observe.keys()))
+        dynamic_sidecar_settings: DynamicSidecarSettings = (
+            self.app.state.settings.DYNAMIC_SERVICES.DYNAMIC_SIDECAR
+        )
 
+        while self._keep_running:
             try:
+                now = time.monotonic()
                 # prevent access to self._to_observe
                 async with self._lock:
-                    for service_name in self._to_observe:
-                        self._enqueue_observation_from_service_name(service_name)
+                    services_to_observe = [
+                        service_name
+                        for service_name in self._to_observe
+                        if self._next_observations.get(service_name, now) <= now
+                    ]
+                logger.debug("Observing dynamic-sidecars %s", services_to_observe)
+
+                if services_to_observe:
+                    # NOTE: one call for all the services instead of one per service
+                    try:
+                        self._stacks_services_count = (
+                            await get_dynamic_sidecar_stacks_services_count(
+                                dynamic_sidecar_settings
+                            )
+                        )
+                    except Exception:  # pylint: disable=broad-except
+                        logger.warning(
+                            "Could not list the dynamic-sidecars stacks", exc_info=True
+                        )
+                        self._stacks_services_count = {}
+
+                for service_name in services_to_observe:
+                    self._enqueue_observation_from_service_name(service_name)
             except asyncio.CancelledError:  # pragma: no cover
                 logger.info("Stopped dynamic scheduler")
                 raise
@@ -496,6 +600,36 @@ class DynamicSidecarsScheduler:  # pylint: disable=too-many-instance-attributes
             await sleep(settings.DIRECTOR_V2_DYNAMIC_SCHEDULER_INTERVAL_SECONDS)
             self._observation_counter += 1
 
+    def _on_docker_service_event(self, event: Mapping[str, Any]) -> None:
+        docker_service_name = event.get("Actor", {}).get("Attributes", {}).get("name")
+        for scheduler_data in self._to_observe.values():
+            if docker_service_name in (
+                scheduler_data.service_name,
+                scheduler_data.proxy_service_name,
+            ):
+                logger.debug(
+                    "docker %s of %s", f"{event.get('Action')=}", docker_service_name
+                )
+                if event.get("Action") == "remove":
+                    # the stack listed at the beginning of the cycle is outdated
+                    self._stacks_services_count.pop(scheduler_data.node_uuid, None)
+                self._trigger_observation(scheduler_data.service_name)
+                return
+
+    async def _run_docker_events_task(self) -> None:
+        """triggers the observation of a service as soon as docker reports a change"""
+        while self._keep_running:
+            try:
+                async for event in stream_services_events():
+                    self._on_docker_service_event(event)
+            except asyncio.CancelledError:
+                logger.info("Stopped listening to docker events")
+                raise
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Error while listening to docker events", exc_info=True)
+
+            await sleep(_DOCKER_EVENTS_RECONNECT_DELAY_S)
+
     async def _discover_running_services(self) -> None:
         """discover all services which were started before and add them to the scheduler"""
         dynamic_sidecar_settings: DynamicSidecarSettings = (
@@ -509,8 +643,20 @@ class DynamicSidecarsScheduler:  # pylint: disable=too-many-instance-attributes
             "The following services need to be observed: %s", services_to_observe
         )
 
+        # NOTE: the labels only contain the data at creation or removal time,
+        # the stored data is more recent
+        stored_scheduler_data: dict[ServiceName, SchedulerData] = (
+            await self._store.load_all() if self._store else {}
+        )
         for scheduler_data in services_to_observe:
-            await self.add_service(scheduler_data)
+            await self.add_service(
+                stored_scheduler_data.pop(scheduler_data.service_name, scheduler_data)
+            )
+
+        # services which were removed while the director-v2 was down
+        if self._store:
+            for service_name in stored_scheduler_data:
+                await self._store.remove(service_name)
 
     async def _cleanup_volume_removal_services(self) -> None:
         settings: DynamicServicesSchedulerSettings = (
@@ -544,6 +690,7 @@ class DynamicSidecarsScheduler:  # pylint: disable=too-many-instance-attributes
         # run as a background task
         logger.info("Starting dynamic-sidecar scheduler")
         self._keep_running = True
+        self._store = SchedulerDataStore.create(self.app)
         self._scheduler_task = asyncio.create_task(
             self._run_scheduler_task(), name="dynamic-scheduler"
         )
@@ -556,6 +703,10 @@ class DynamicSidecarsScheduler:  # pylint: disable=too-many-instance-attributes
             self._cleanup_volume_removal_services(),
             name="dynamic-scheduler-cleanup-volume-removal-services",
         )
+        self._docker_events_task = asyncio.create_task(
+            self._run_docker_events_task(),
+            name="dynamic-scheduler-docker-events",
+        )
         await self._discover_running_services()
 
     async def shutdown(self):
@@ -563,6 +714,15 @@ class DynamicSidecarsScheduler:  # pylint: disable=too-many-instance-attributes
         self._keep_running = False
         self._inverse_search_mapping = {}
         self._to_observe = {}
+        self._observation_intervals = {}
+        self._next_observations = {}
+        self._stacks_services_count = {}
+
+        if self._docker_events_task is not None:
+            self._docker_events_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._docker_events_task
+            self._docker_events_task = None
 
         if self._cleanup_volume_removal_services_task is not None:
             self._cleanup_volume_removal_services_task.cancel()
@@ -606,6 +766,10 @@ class DynamicSidecarsScheduler:  # pylint: disable=too-many-instance-attributes
                 f"{running_tasks=}",
             )
 
+        if self._store is not None:
+            await self._store.close()
+            self._store = None
+
     def is_service_tracked(self, node_uuid: NodeID) -> bool:
         return node_uuid in self._inverse_search_mapping
 
@@ -21,6 +21,7 @@ from models_library.projects_nodes_io import NodeID
 from models_library.users import UserID
 from pydantic import AnyUrl, ByteSize, ValidationError
 from servicelib.json_serialization import json_dumps
+from servicelib.utils import logged_gather
 from simcore_sdk import node_ports_v2
 from simcore_sdk.node_ports_common.exceptions import (
     S3InvalidPathError,
@@ -46,6 +47,8 @@ ServiceVersionStr = str
 
 _PVType = Optional[_NPItemValue]
 
+_MAX_CONCURRENT_PORTS_RESOLUTION: Final[int] = 10
+
 assert len(get_args(_PVType)) == len(  # nosec
     get_args(PortValue)
 ), "Types returned by port.get_value() -> _PVType MUST map one-to-one to PortValue. See compute_input_data"
@@ -190,13 +193,48 @@ async def compute_input_data(
             node_id=node_id,
         )
 
+    input_ports: list[Port] = list((await ports.inputs).values())
+    # NOTE: links to other nodes' ports are followed concurrently and all file links
+    # are then resolved into download links with a single call to storage
+    data_values = await logged_gather(
+        *(port.get_data_value() for port in input_ports),
+        reraise=False,
+        log=logger,
+        max_concurrency=_MAX_CONCURRENT_PORTS_RESOLUTION,
+    )
+    if unexpected_errors := [
+        v
+        for v in data_values
+        if isinstance(v, Exception) and not isinstance(v, ValidationError)
+    ]:
+        raise unexpected_errors[0]
+    file_links: list[links.FileLink] = [
+        v for v in data_values if isinstance(v, links.FileLink)
+    ]
+    download_links = iter(
+        await port_utils.get_download_links_from_storage(
+            user_id, file_links, link_type=file_link_type
+        )
+        if file_links
+        else []
+    )
+
     input_data = {}
 
     ports_errors = []
-    port: Port
-    for port in (await ports.inputs).values():
+    for port, data_value in zip(input_ports, data_values):
+        if isinstance(data_value, ValidationError):
+            ports_errors.extend(_get_port_validation_errors(port.key, data_value))
+            continue
+        value: _PVType = data_value
+        if isinstance(data_value, links.FileLink):
+            value = next(download_links)
+        elif isinstance(data_value, links.DownloadLink):
+            value = data_value.download_link
         try:
-            value: _PVType = await port.get_value(file_link_type=file_link_type)
+            # assigns to validate result (same as in port.get_value)
+            if value != port.value_item:
+                port.value_item = value
 
             # Mapping _PVType -> PortValue
             if isinstance(value, AnyUrl):
@@ -53,6 +53,9 @@ from simcore_service_director_v2.models.schemas.dynamic_services import (
 from simcore_service_director_v2.modules.dynamic_sidecar.docker_service_specs.volume_remover import (
     DockerVersion,
 )
+from simcore_service_director_v2.modules.dynamic_sidecar.scheduler._store import (
+    SchedulerDataStore,
+)
 from yarl import URL
 
 
@@ -425,6 +428,14 @@ def mock_docker_api(mocker: MockerFixture) -> None:
         "simcore_service_director_v2.modules.dynamic_sidecar.scheduler.task.get_dynamic_sidecar_state",
         return_value=(ServiceState.PENDING, ""),
     )
+    mocker.patch(
+        "simcore_service_director_v2.modules.dynamic_sidecar.scheduler.task.get_dynamic_sidecar_stacks_services_count",
+        autospec=True,
+        return_value={},
+    )
+    mocker.patch.object(SchedulerDataStore, "save", autospec=True, return_value=True)
+    mocker.patch.object(SchedulerDataStore, "remove", autospec=True)
+    mocker.patch.object(SchedulerDataStore, "load_all", autospec=True, return_value={})
 
 
 @pytest.fixture
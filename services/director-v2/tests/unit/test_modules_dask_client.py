@@ -55,7 +55,11 @@ from simcore_service_director_v2.core.errors import (
 )
 from simcore_service_director_v2.models.domains.comp_tasks import Image
 from simcore_service_director_v2.models.schemas.services import NodeRequirements
-from simcore_service_director_v2.modules.dask_client import DaskClient, TaskHandlers
+from simcore_service_director_v2.modules.dask_client import (
+    DaskClient,
+    TaskHandlers,
+    _get_exception_type_name,
+)
 from tenacity._asyncio import AsyncRetrying
 from tenacity.retry import retry_if_exception_type
 from tenacity.stop import stop_after_delay
@@ -757,6 +761,72 @@ async def test_failed_task_returns_exceptions(
     assert len(await dask_client.backend.client.list_datasets()) == 0
 
 
+@pytest.mark.parametrize(
+    "exception_text, expected_type_name",
+    [
+        (None, None),
+        ("TaskCancelledError()", "TaskCancelledError"),
+        ("ValueError('some (nested) error')", "ValueError"),
+    ],
+)
+def test_get_exception_type_name(
+    exception_text: Optional[str], expected_type_name: Optional[str]
+):
+    assert _get_exception_type_name(exception_text) == expected_type_name
+
+
+async def test_get_tasks_status_with_errors_in_one_scheduler_call(
+    dask_client: DaskClient,
+    user_id: UserID,
+    project_id: ProjectID,
+    cluster_id: ClusterID,
+    cpu_image: ImageParams,
+    mocked_node_ports: None,
+    mocked_user_completed_cb: mock.AsyncMock,
+    mocked_storage_service_api: respx.MockRouter,
+    mocker: MockerFixture,
+    caplog: pytest.LogCaptureFixture,
+):
+    # NOTE: this must be inlined so that the test works,
+    # the dask-worker must be able to import the function
+    def fake_failing_sidecar_fct(
+        docker_auth: DockerBasicAuth,
+        service_key: str,
+        service_version: str,
+        input_data: TaskInputData,
+        output_data_keys: TaskOutputDataSchema,
+        log_file_url: AnyUrl,
+        command: list[str],
+        s3_settings: Optional[S3Settings],
+    ) -> TaskOutputData:
+        raise ValueError("this error text is read from the dask-scheduler")
+
+    node_id_to_job_ids = await dask_client.send_computation_tasks(
+        user_id=user_id,
+        project_id=project_id,
+        cluster_id=cluster_id,
+        tasks=cpu_image.fake_tasks,
+        callback=mocked_user_completed_cb,
+        remote_fct=fake_failing_sidecar_fct,
+    )
+    assert len(node_id_to_job_ids) == 1
+    _, job_id = node_id_to_job_ids[0]
+    await _assert_wait_for_cb_call(mocked_user_completed_cb)
+    await _assert_wait_for_task_status(job_id, dask_client, RunningState.FAILED)
+
+    # the states and errors of all the tasks are retrieved with a single call
+    spied_run_on_scheduler = mocker.spy(dask_client.backend.client, "run_on_scheduler")
+    unknown_job_id = f"{uuid4()}"
+    assert await dask_client.get_tasks_status([job_id, unknown_job_id]) == [
+        RunningState.FAILED,
+        RunningState.UNKNOWN,
+    ]
+    spied_run_on_scheduler.assert_called_once()
+    assert "this error text is read from the dask-scheduler" in caplog.text
+
+    await dask_client.release_task_result(job_id)
+
+
 # currently in the case of a dask-gateway we do not check for missing resources
 @pytest.mark.parametrize(
     "dask_client", ["create_dask_client_from_scheduler"], indirect=True
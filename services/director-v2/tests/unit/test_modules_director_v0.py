@@ -7,7 +7,7 @@ import re
 import urllib.parse
 from pathlib import Path
 from random import choice
-from typing import Any, NamedTuple
+from typing import Any, AsyncIterator, NamedTuple
 from uuid import uuid4
 
 import pytest
@@ -25,6 +25,13 @@ MOCK_SERVICE_KEY = "simcore/services/dynamic/myservice"
 MOCK_SERVICE_VERSION = "1.3.4"
 
 
+@pytest.fixture(autouse=True)
+async def clear_service_metadata_cache() -> AsyncIterator[None]:
+    await DirectorV0Client.get_service_details.cache.clear()
+    await DirectorV0Client.get_service_extras.cache.clear()
+    yield
+
+
 @pytest.fixture
 def minimal_director_config(project_env_devel_environment, monkeypatch):
     """set a minimal configuration for testing the director connection only"""
@@ -240,6 +247,28 @@ async def test_get_service_extras(
     assert fake_service_extras == service_extras
 
 
+async def test_service_metadata_is_cached(
+    minimal_director_config: None,
+    minimal_app: FastAPI,
+    mocked_director_service_fcts,
+    mock_service_key_version: ServiceKeyVersion,
+    fake_service_details: ServiceDockerData,
+    fake_service_extras: ServiceExtras,
+):
+    director_client: DirectorV0Client = minimal_app.state.director_v0_client
+    for _ in range(3):
+        assert (
+            await director_client.get_service_details(mock_service_key_version)
+            == fake_service_details
+        )
+        assert (
+            await director_client.get_service_extras(mock_service_key_version)
+            == fake_service_extras
+        )
+    assert mocked_director_service_fcts["get_service_version"].call_count == 1
+    assert mocked_director_service_fcts["get_service_extras"].call_count == 1
+
+
 async def test_get_service_labels(
     minimal_director_config: None,
     minimal_app: FastAPI,
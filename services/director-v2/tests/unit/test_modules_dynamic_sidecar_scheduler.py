@@ -33,6 +33,9 @@ from simcore_service_director_v2.modules.dynamic_sidecar.errors import (
 from simcore_service_director_v2.modules.dynamic_sidecar.scheduler import (
     DynamicSidecarsScheduler,
 )
+from simcore_service_director_v2.modules.dynamic_sidecar.scheduler._store import (
+    SchedulerDataStore,
+)
 from simcore_service_director_v2.modules.dynamic_sidecar.scheduler.events import (
     REGISTERED_EVENTS,
     DynamicSchedulerEvent,
@@ -468,3 +471,106 @@ async def test_get_stack_status_ok(
             service_state=ServiceState.RUNNING,
             service_message="",
         )
+
+
+async def test_observation_interval_backs_off_while_running_undisturbed(
+    disabled_scheduler_background_task: None,
+    minimal_app: FastAPI,
+    scheduler: DynamicSidecarsScheduler,
+    scheduler_data: SchedulerData,
+    mocked_dynamic_scheduler_events: None,
+) -> None:
+    settings = minimal_app.state.settings.DYNAMIC_SERVICES.DYNAMIC_SCHEDULER
+    service_name = scheduler_data.service_name
+    await scheduler.add_service(scheduler_data)
+
+    # still starting
+    scheduler._schedule_next_observation(scheduler_data, has_changed=False)
+    assert (
+        scheduler._observation_intervals[service_name]
+        == TEST_SCHEDULER_INTERVAL_SECONDS
+    )
+
+    scheduler_data.dynamic_sidecar.is_available = True
+    scheduler_data.dynamic_sidecar.were_containers_created = True
+    scheduler_data.dynamic_sidecar.is_project_network_attached = True
+    scheduler._schedule_next_observation(scheduler_data, has_changed=False)
+    assert (
+        scheduler._observation_intervals[service_name]
+        == 2 * TEST_SCHEDULER_INTERVAL_SECONDS
+    )
+    for _ in range(20):
+        scheduler._schedule_next_observation(scheduler_data, has_changed=False)
+    assert (
+        scheduler._observation_intervals[service_name]
+        == settings.DIRECTOR_V2_DYNAMIC_SCHEDULER_MAX_INTERVAL_SECONDS
+    )
+
+    # any change resets it
+    scheduler._schedule_next_observation(scheduler_data, has_changed=True)
+    assert (
+        scheduler._observation_intervals[service_name]
+        == TEST_SCHEDULER_INTERVAL_SECONDS
+    )
+
+
+async def test_docker_service_event_triggers_observation(
+    disabled_scheduler_background_task: None,
+    scheduler: DynamicSidecarsScheduler,
+    scheduler_data: SchedulerData,
+    mocked_dynamic_scheduler_events: None,
+) -> None:
+    service_name = scheduler_data.service_name
+    await scheduler.add_service(scheduler_data)
+    assert scheduler._trigger_observation_queue.get_nowait() == service_name
+
+    scheduler._stacks_services_count = {scheduler_data.node_uuid: 2}
+    scheduler._observation_intervals[service_name] = 60
+    scheduler._next_observations[service_name] = 60
+    assert scheduler.has_complete_stack(scheduler_data.node_uuid) is True
+
+    # events of other services are ignored
+    scheduler._on_docker_service_event(
+        {"Action": "remove", "Actor": {"Attributes": {"name": "other_service"}}}
+    )
+    assert scheduler._trigger_observation_queue.empty()
+
+    scheduler._on_docker_service_event(
+        {
+            "Action": "remove",
+            "Actor": {"Attributes": {"name": scheduler_data.proxy_service_name}},
+        }
+    )
+    assert scheduler._trigger_observation_queue.get_nowait() == service_name
+    assert service_name not in scheduler._observation_intervals
+    assert service_name not in scheduler._next_observations
+    assert scheduler.has_complete_stack(scheduler_data.node_uuid) is False
+
+
+@pytest.mark.parametrize("is_stored", [True, False])
+async def test_scheduler_data_labels_are_updated_when_it_cannot_be_stored(
+    disabled_scheduler_background_task: None,
+    minimal_app: FastAPI,
+    scheduler: DynamicSidecarsScheduler,
+    scheduler_data: SchedulerData,
+    mocker: MockerFixture,
+    is_stored: bool,
+) -> None:
+    mocked_update_label = mocker.patch(
+        "simcore_service_director_v2.modules.dynamic_sidecar.scheduler.task.update_scheduler_data_label",
+        autospec=True,
+    )
+    mocked_store = mocker.AsyncMock(spec=SchedulerDataStore)
+    mocked_store.save.return_value = is_stored
+    scheduler._store = mocked_store
+
+    await scheduler._save_scheduler_data(scheduler_data)
+
+    mocked_store.save.assert_awaited_once_with(scheduler_data)
+    if is_stored:
+        mocked_update_label.assert_not_called()
+        mocked_store.remove.assert_not_called()
+    else:
+        # outdated stored data must not shadow the labels
+        mocked_store.remove.assert_awaited_once_with(scheduler_data.service_name)
+        mocked_update_label.assert_awaited_once_with(scheduler_data)
@@ -26,6 +26,7 @@ from _helpers import (
 from _pytest.monkeypatch import MonkeyPatch
 from dask.distributed import SpecCluster
 from dask_task_models_library.container_tasks.errors import TaskCancelledError
+from dask_task_models_library.container_tasks.events import TaskStateEvent
 from dask_task_models_library.container_tasks.io import TaskOutputData
 from fastapi.applications import FastAPI
 from models_library.clusters import DEFAULT_CLUSTER_ID
@@ -53,6 +54,10 @@ from simcore_service_director_v2.modules.comp_scheduler import background_task
 from simcore_service_director_v2.modules.comp_scheduler.base_scheduler import (
     BaseCompScheduler,
 )
+from simcore_service_director_v2.modules.db.repositories.comp_tasks import (
+    CompTasksRepository,
+)
+from simcore_service_director_v2.utils.dask import generate_dask_job_id
 from simcore_service_director_v2.utils.scheduler import COMPLETED_STATES
 from starlette.testclient import TestClient
 
@@ -352,7 +357,7 @@ async def test_proper_pipeline_is_scheduled(
                 project_id=published_project.project.uuid,
                 cluster_id=DEFAULT_CLUSTER_ID,
                 tasks={f"{p.node_id}": p.image},
-                callback=scheduler._wake_up_scheduler_now,
+                callback=mock.ANY,
             )
             for p in published_tasks
         ],
@@ -435,7 +440,7 @@ async def test_proper_pipeline_is_scheduled(
         tasks={
             f"{next_published_task.node_id}": next_published_task.image,
         },
-        callback=scheduler._wake_up_scheduler_now,
+        callback=mock.ANY,
     )
     mocked_dask_client.send_computation_tasks.reset_mock()
 
@@ -509,6 +514,75 @@ async def test_proper_pipeline_is_scheduled(
     assert scheduler.scheduled_pipelines == {}
 
 
+async def test_triggered_scheduling_uses_cached_pipeline(
+    mocked_scheduler_task: None,
+    mocked_dask_client: mock.MagicMock,
+    scheduler: BaseCompScheduler,
+    minimal_app: FastAPI,
+    aiopg_engine: Iterator[aiopg.sa.engine.Engine],  # type: ignore
+    published_project: PublishedProject,
+    mocker: MockerFixture,
+):
+    await scheduler.run_new_pipeline(
+        user_id=published_project.project.prj_owner,
+        project_id=published_project.project.uuid,
+        cluster_id=DEFAULT_CLUSTER_ID,
+    )
+    # the new run is loaded from the database once
+    get_comp_tasks_spy = mocker.spy(CompTasksRepository, "get_comp_tasks")
+    await scheduler.schedule_triggered_pipelines()
+    get_comp_tasks_spy.assert_called_once()
+    get_comp_tasks_spy.reset_mock()
+    await assert_comp_run_state(
+        aiopg_engine,
+        published_project.project.prj_owner,
+        published_project.project.uuid,
+        exp_state=RunningState.PENDING,
+    )
+    # nothing was triggered, nothing is scheduled
+    mocked_dask_client.send_computation_tasks.reset_mock()
+    await scheduler.schedule_triggered_pipelines()
+    mocked_dask_client.send_computation_tasks.assert_not_called()
+    # a task state event triggers the scheduling of its pipeline, the cached pipeline is used
+    started_task = published_project.tasks[1]
+    await scheduler._task_state_change_handler(
+        TaskStateEvent(
+            job_id=generate_dask_job_id(
+                started_task.image.name,
+                started_task.image.tag,
+                published_project.project.prj_owner,
+                published_project.project.uuid,
+                started_task.node_id,
+            ),
+            state=RunningState.STARTED,
+        ).json()
+    )
+    assert scheduler.wake_up_event.is_set()
+    await scheduler.schedule_triggered_pipelines()
+    get_comp_tasks_spy.assert_not_called()
+    await assert_comp_tasks_state(
+        aiopg_engine,
+        published_project.project.uuid,
+        [started_task.node_id],
+        exp_state=RunningState.STARTED,
+    )
+    await assert_comp_run_state(
+        aiopg_engine,
+        published_project.project.prj_owner,
+        published_project.project.uuid,
+        exp_state=RunningState.STARTED,
+    )
+    # the reconciliation does not reload a pipeline in sync with the database
+    await manually_run_comp_scheduler(scheduler)
+    get_comp_tasks_spy.assert_not_called()
+    # but reloads it once it is stale
+    await set_comp_task_state(
+        aiopg_engine, f"{started_task.node_id}", StateType.SUCCESS
+    )
+    await manually_run_comp_scheduler(scheduler)
+    get_comp_tasks_spy.assert_called_once()
+
+
 @pytest.mark.parametrize(
     "backend_error",
     [
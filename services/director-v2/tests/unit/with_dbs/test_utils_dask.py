@@ -307,18 +307,13 @@ async def test_compute_input_data(
     await set_comp_task_inputs(
         aiopg_engine, sleeper_task.node_id, fake_io_schema, fake_inputs
     )
-    # mock the get_value function so we can test it is called correctly
-    def return_fake_input_value(*args, **kwargs):
-        for value, value_type in zip(fake_inputs.values(), fake_io_schema.values()):
-            if value_type["type"] == "data:*/*":
-                yield parse_obj_as(AnyUrl, faker.url())
-            else:
-                yield value
-
-    mocked_node_ports_get_value_fct = mocker.patch(
-        "simcore_sdk.node_ports_v2.port.Port.get_value",
+    # mock the storage calls so we can test the file links are resolved in one batch
+    mocked_get_download_links_fct = mocker.patch(
+        "simcore_service_director_v2.utils.dask.port_utils.get_download_links_from_storage",
         autospec=True,
-        side_effect=return_fake_input_value(),
+        side_effect=lambda user_id, values, link_type: [
+            parse_obj_as(AnyUrl, faker.url()) for _ in values
+        ],
     )
     computed_input_data = await compute_input_data(
         async_client._transport.app,
@@ -327,12 +322,24 @@ async def test_compute_input_data(
         sleeper_task.node_id,
         file_link_type=tasks_file_link_type,
     )
-    mocked_node_ports_get_value_fct.assert_has_calls(
-        [
-            mock.call(mock.ANY, file_link_type=tasks_file_link_type)
-            for n in fake_io_data.keys()
-        ]
-    )
+    expected_file_paths = [
+        value["path"]
+        for value, value_type in zip(fake_inputs.values(), fake_io_schema.values())
+        if value_type["type"] == "data:*/*"
+    ]
+    if expected_file_paths:
+        mocked_get_download_links_fct.assert_called_once_with(
+            user_id, mock.ANY, link_type=tasks_file_link_type
+        )
+        file_links = mocked_get_download_links_fct.call_args.args[1]
+        assert [f.path for f in file_links] == expected_file_paths
+    else:
+        mocked_get_download_links_fct.assert_not_called()
+    for key, value_type in fake_io_schema.items():
+        if value_type["type"] == "data:*/*":
+            assert isinstance(computed_input_data[key], FileUrl)
+        else:
+            assert computed_input_data[key] == fake_io_data[key]
     assert computed_input_data.keys() == fake_io_data.keys()
 
 
@@ -1,31 +1,115 @@
+""" Caching of the docker registry responses
+
+- the cache is bounded in number of entries, the least recently used are evicted first
+- refreshing an entry is a conditional request if the registry provided an ETag
+  (e.g. for manifests, where it is the content digest). Unchanged entries are then
+  not transferred again
+- the cache can be saved/restored so that a restart does not need to fetch everything again
+"""
+import json
+import logging
+import os
+from collections import OrderedDict
 from functools import wraps
-from typing import Coroutine, Dict, Tuple
+from pathlib import Path
+from typing import Coroutine, Dict, Optional, Tuple
 
 from aiohttp import web
+from multidict import CIMultiDict
 from simcore_service_director import config
 
+logger = logging.getLogger(__name__)
+
+# only these headers are used, so only these are kept
+_CACHED_HEADERS = ("Link", "ETag", "Docker-Content-Digest")
+
+
+class RegistryCache(OrderedDict):
+    """LRU cache of (data, headers) registry responses keyed by 'url:method'"""
+
+    def __init__(self, max_entries: int) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+
+    def get_response(self, key: str) -> Optional[Tuple[Dict, CIMultiDict]]:
+        if key not in self:
+            return None
+        self.move_to_end(key)
+        return self[key]
+
+    def set_response(self, key: str, data: Dict, headers) -> Tuple[Dict, CIMultiDict]:
+        self[key] = (
+            data,
+            CIMultiDict(
+                (name, headers[name]) for name in _CACHED_HEADERS if name in headers
+            ),
+        )
+        self.move_to_end(key)
+        while len(self) > self.max_entries:
+            evicted_key, _ = self.popitem(last=False)
+            logger.debug("evicted %s from the registry cache", evicted_key)
+        return self[key]
+
+    def save(self, path: Path) -> None:
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                [
+                    [key, data, list(headers.items())]
+                    for key, (data, headers) in self.items()
+                ]
+            )
+        )
+        # NOTE: atomic, a crash while saving does not corrupt the previous file
+        os.replace(f"{tmp_path}", f"{path}")
+
+    def load(self, path: Path) -> None:
+        if not path.exists():
+            return
+        try:
+            for key, data, headers in json.loads(path.read_text()):
+                self.set_response(key, data, CIMultiDict(headers))
+        except (OSError, ValueError):
+            logger.warning("registry cache in %s could not be restored", path)
+            self.clear()
+
+
+def cache_requests(func: Coroutine, no_cache: bool = False, revalidate: bool = False):
+    """
+    :param no_cache: the cache is neither used nor updated
+    :param revalidate: the cache is not used but updated, if the cached response
+    has an ETag, the registry is asked to send the response only if it changed
+    """
 
-def cache_requests(func: Coroutine, no_cache: bool = False):
     @wraps(func)
     async def wrapped(
         app: web.Application, url: str, method: str, *args, **kwargs
     ) -> Tuple[Dict, Dict]:
         is_cache_enabled = config.DIRECTOR_REGISTRY_CACHING and method == "GET"
+        if not is_cache_enabled or no_cache:
+            return await func(app, url, method, *args, **kwargs)
+
+        cache: RegistryCache = app[config.APP_REGISTRY_CACHE_DATA_KEY]
         cache_key = f"{url}:{method}"
-        if is_cache_enabled and not no_cache:
-            cache_data = app[config.APP_REGISTRY_CACHE_DATA_KEY]
-            if cache_key in cache_data:
-                return cache_data[cache_key]
+        cached_response = cache.get_response(cache_key)
+        if cached_response:
+            if not revalidate:
+                return cached_response
+            if "ETag" in cached_response[1]:
+                kwargs["headers"] = {
+                    **kwargs.get("headers", {}),
+                    "If-None-Match": cached_response[1]["ETag"],
+                }
 
         resp_data, resp_headers = await func(app, url, method, *args, **kwargs)
+        if resp_data is None:
+            # not modified
+            assert cached_response  # nosec
+            return cached_response
 
-        if is_cache_enabled and not no_cache:
-            cache_data = app[config.APP_REGISTRY_CACHE_DATA_KEY]
-            cache_data[cache_key] = (resp_data, resp_headers)
-
-        return (resp_data, resp_headers)
+        return cache.set_response(cache_key, resp_data, resp_headers)
 
     return wrapped
 
 
-__all__ = ["cache_requests"]
+__all__ = ["cache_requests", "RegistryCache"]
@@ -55,6 +55,14 @@ DIRECTOR_REGISTRY_CACHING: bool = strtobool(
 DIRECTOR_REGISTRY_CACHING_TTL: int = int(
     os.environ.get("DIRECTOR_REGISTRY_CACHING_TTL", 15 * 60)
 )
+# NOTE: listing the services needs ~1 entry per service version, keep it above that number
+DIRECTOR_REGISTRY_CACHING_MAX_ENTRIES: int = int(
+    os.environ.get("DIRECTOR_REGISTRY_CACHING_MAX_ENTRIES", 10000)
+)
+# if set, the registry cache is saved there and restored at startup
+DIRECTOR_REGISTRY_CACHING_PERSISTENCE_PATH: str = os.environ.get(
+    "DIRECTOR_REGISTRY_CACHING_PERSISTENCE_PATH", ""
+)
 
 DIRECTOR_SERVICES_CUSTOM_CONSTRAINTS: str = os.environ.get(
     "DIRECTOR_SERVICES_CUSTOM_CONSTRAINTS", ""
@@ -1,42 +1,84 @@
 import asyncio
 import logging
-from typing import AsyncIterator
+from pathlib import Path
+from typing import AsyncIterator, Optional
 
 from aiohttp import web
-from servicelib.utils import logged_gather
 from simcore_service_director import config, exceptions, registry_proxy
+from simcore_service_director.cache_request_decorator import RegistryCache
 from simcore_service_director.config import APP_REGISTRY_CACHE_DATA_KEY
 
 _logger = logging.getLogger(__name__)
 
 TASK_NAME: str = __name__ + "_registry_caching_task"
 
+_MAX_CONCURRENT_REFRESHES: int = 20
+
+
+def _get_persistence_path() -> Optional[Path]:
+    if config.DIRECTOR_REGISTRY_CACHING_PERSISTENCE_PATH:
+        return Path(config.DIRECTOR_REGISTRY_CACHING_PERSISTENCE_PATH)
+    return None
+
+
+async def _save_cache(app: web.Application) -> None:
+    persistence_path = _get_persistence_path()
+    if not persistence_path:
+        return
+    try:
+        await asyncio.get_event_loop().run_in_executor(
+            None, app[APP_REGISTRY_CACHE_DATA_KEY].save, persistence_path
+        )
+    except OSError:
+        _logger.exception("%s: could not save cache", TASK_NAME)
+
+
+async def _refresh_cache(app: web.Application) -> None:
+    cache: RegistryCache = app[APP_REGISTRY_CACHE_DATA_KEY]
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REFRESHES)
+
+    async def _refresh(key: str) -> None:
+        path, method = key.rsplit(":", 1)
+        _logger.debug("refresh %s:%s", method, path)
+        async with semaphore:
+            try:
+                # NOTE: the unchanged entries with an ETag are not transferred again
+                await registry_proxy.registry_request(
+                    app, path, method, revalidate=True
+                )
+            except exceptions.ServiceNotAvailableError:
+                # e.g. the image tag was removed from the registry
+                cache.pop(key, None)
+
+    await asyncio.gather(*[_refresh(key) for key in list(cache.keys())])
+
 
 async def registry_caching_task(app: web.Application) -> None:
     try:
+        if not app[APP_REGISTRY_CACHE_DATA_KEY]:
+            _logger.info("%s: initializing cache...", TASK_NAME)
+            await registry_proxy.list_services(app, registry_proxy.ServiceType.ALL)
+            _logger.info("%s: initialisation completed", TASK_NAME)
+        else:
+            _logger.info(
+                "%s: cache restored with %s entries, revalidating...",
+                TASK_NAME,
+                len(app[APP_REGISTRY_CACHE_DATA_KEY]),
+            )
+            await _refresh_cache(app)
+        await _save_cache(app)
 
-        _logger.info("%s: initializing cache...", TASK_NAME)
-        app[APP_REGISTRY_CACHE_DATA_KEY].clear()
-        await registry_proxy.list_services(app, registry_proxy.ServiceType.ALL)
-        _logger.info("%s: initialisation completed", TASK_NAME)
         while True:
+            _logger.info(
+                "%s: sleeping for %ss...",
+                TASK_NAME,
+                config.DIRECTOR_REGISTRY_CACHING_TTL,
+            )
+            await asyncio.sleep(config.DIRECTOR_REGISTRY_CACHING_TTL)
             _logger.info("%s: waking up, refreshing cache...", TASK_NAME)
             try:
-                keys = []
-                refresh_tasks = []
-                for key in app[APP_REGISTRY_CACHE_DATA_KEY]:
-                    path, method = key.split(":")
-                    _logger.debug("refresh %s:%s", method, path)
-                    refresh_tasks.append(
-                        registry_proxy.registry_request(
-                            app, path, method, no_cache=True
-                        )
-                    )
-                keys = list(app[APP_REGISTRY_CACHE_DATA_KEY].keys())
-                results = await logged_gather(*refresh_tasks)
-
-                for key, result in zip(keys, results):
-                    app[APP_REGISTRY_CACHE_DATA_KEY][key] = result
+                await _refresh_cache(app)
+                await _save_cache(app)
 
             except exceptions.DirectorException:
                 # if the registry is temporarily not available this might happen
@@ -45,14 +87,10 @@ async def registry_caching_task(app: web.Application) -> None:
                 )
                 app[APP_REGISTRY_CACHE_DATA_KEY].clear()
 
-            _logger.info(
-                "cache refreshed %s: sleeping for %ss...",
-                TASK_NAME,
-                config.DIRECTOR_REGISTRY_CACHING_TTL,
-            )
-            await asyncio.sleep(config.DIRECTOR_REGISTRY_CACHING_TTL)
+            _logger.info("%s: cache refreshed", TASK_NAME)
     except asyncio.CancelledError:
         _logger.info("%s: cancelling task...", TASK_NAME)
+        await _save_cache(app)
     except Exception:  # pylint: disable=broad-except
         _logger.exception("%s: Unhandled exception while refreshing cache", TASK_NAME)
     finally:
@@ -61,7 +99,12 @@ async def registry_caching_task(app: web.Application) -> None:
 
 
 async def setup_registry_caching_task(app: web.Application) -> AsyncIterator[None]:
-    app[APP_REGISTRY_CACHE_DATA_KEY] = {}
+    app[APP_REGISTRY_CACHE_DATA_KEY] = RegistryCache(
+        config.DIRECTOR_REGISTRY_CACHING_MAX_ENTRIES
+    )
+    persistence_path = _get_persistence_path()
+    if persistence_path:
+        app[APP_REGISTRY_CACHE_DATA_KEY].load(persistence_path)
     app[TASK_NAME] = asyncio.get_event_loop().create_task(registry_caching_task(app))
 
     yield
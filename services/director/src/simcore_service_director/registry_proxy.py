@@ -6,7 +6,7 @@ import logging
 import re
 from http import HTTPStatus
 from pprint import pformat
-from typing import Any, AsyncIterator, Dict, List, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from aiohttp import BasicAuth, ClientSession, client_exceptions, web
 from aiohttp.client import ClientTimeout
@@ -40,7 +40,7 @@ class ServiceType(enum.Enum):
 
 async def _basic_auth_registry_request(
     app: web.Application, path: str, method: str, **session_kwargs
-) -> Tuple[Dict, Dict]:
+) -> Tuple[Optional[Dict], Dict]:
     if not config.REGISTRY_URL:
         raise exceptions.DirectorException("URL to registry is not defined")
 
@@ -49,7 +49,7 @@ async def _basic_auth_registry_request(
     )
     logger.debug("Requesting registry using %s", url)
     # try the registry with basic authentication first, spare 1 call
-    resp_data: Dict = {}
+    resp_data: Optional[Dict] = {}
     resp_headers: Dict = {}
     auth = (
         BasicAuth(login=config.REGISTRY_USER, password=config.REGISTRY_PW)
@@ -69,6 +69,10 @@ async def _basic_auth_registry_request(
                     url, method, response.headers, session, **session_kwargs
                 )
 
+            elif response.status == HTTPStatus.NOT_MODIFIED:
+                # conditional request (see cache_requests), the cached data is valid
+                resp_data, resp_headers = None, response.headers
+
             elif response.status == HTTPStatus.NOT_FOUND:
                 logger.exception("Path to registry not found: %s", url)
                 raise exceptions.ServiceNotAvailableError(str(path))
@@ -94,7 +98,7 @@ async def _basic_auth_registry_request(
 
 async def _auth_registry_request(
     url: URL, method: str, auth_headers: Dict, session: ClientSession, **kwargs
-) -> Tuple[Dict, Dict]:
+) -> Tuple[Optional[Dict], Dict]:
     if not config.REGISTRY_AUTH or not config.REGISTRY_USER or not config.REGISTRY_PW:
         raise exceptions.RegistryConnectionError(
             "Wrong configuration: Authentication to registry is needed!"
@@ -118,6 +122,8 @@ async def _auth_registry_request(
 
     # bearer type, it needs a token with all communications
     if auth_type == "Bearer":
+        # NOTE: the request headers (e.g. conditional request) are not for the token
+        request_headers = kwargs.pop("headers", {})
         # get the token
         token_url = URL(auth_details["realm"]).with_query(
             service=auth_details["service"], scope=auth_details["scope"]
@@ -130,10 +136,15 @@ async def _auth_registry_request(
                     )
                 )
             bearer_code = (await token_resp.json())["token"]
-            headers = {"Authorization": "Bearer {}".format(bearer_code)}
+            headers = {
+                **request_headers,
+                "Authorization": "Bearer {}".format(bearer_code),
+            }
             async with getattr(session, method.lower())(
                 url, headers=headers, **kwargs
             ) as resp_wtoken:
+                if resp_wtoken.status == HTTPStatus.NOT_MODIFIED:
+                    return (None, resp_wtoken.headers)
                 if resp_wtoken.status == HTTPStatus.NOT_FOUND:
                     logger.exception("path to registry not found: %s", url)
                     raise exceptions.ServiceNotAvailableError(str(url))
@@ -151,6 +162,8 @@ async def _auth_registry_request(
         async with getattr(session, method.lower())(
             url, auth=auth, **kwargs
         ) as resp_wbasic:
+            if resp_wbasic.status == HTTPStatus.NOT_MODIFIED:
+                return (None, resp_wbasic.headers)
             if resp_wbasic.status == HTTPStatus.NOT_FOUND:
                 logger.exception("path to registry not found: %s", url)
                 raise exceptions.ServiceNotAvailableError(str(url))
@@ -173,12 +186,17 @@ async def registry_request(
     path: str,
     method: str = "GET",
     no_cache: bool = False,
+    revalidate: bool = False,
     **session_kwargs,
 ) -> Tuple[Dict, Dict]:
     logger.debug(
-        "Request to registry: path=%s, method=%s. no_cache=%s", path, method, no_cache
+        "Request to registry: path=%s, method=%s. no_cache=%s, revalidate=%s",
+        path,
+        method,
+        no_cache,
+        revalidate,
     )
-    return await cache_requests(_basic_auth_registry_request, no_cache)(
+    return await cache_requests(_basic_auth_registry_request, no_cache, revalidate)(
         app, path, method, **session_kwargs
     )
 
@@ -10,6 +10,7 @@ import pytest
 import simcore_service_director
 from aiohttp import ClientSession
 from simcore_service_director import config, resources
+from simcore_service_director.cache_request_decorator import RegistryCache
 
 # NOTE: that all the changes in these pytest-plugins MUST by py3.6 compatible!
 pytest_plugins = [
@@ -94,7 +95,9 @@ async def aiohttp_mock_app(loop, mocker):
 
     mock_app_storage = {
         config.APP_CLIENT_SESSION_KEY: session,
-        config.APP_REGISTRY_CACHE_DATA_KEY: {},
+        config.APP_REGISTRY_CACHE_DATA_KEY: RegistryCache(
+            config.DIRECTOR_REGISTRY_CACHING_MAX_ENTRIES
+        ),
     }
 
     def _get_item(self, key):
@@ -0,0 +1,83 @@
+# pylint:disable=unused-argument
+# pylint:disable=redefined-outer-name
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+from multidict import CIMultiDict
+from simcore_service_director import config
+from simcore_service_director.cache_request_decorator import (
+    RegistryCache,
+    cache_requests,
+)
+
+
+def test_registry_cache_evicts_least_recently_used():
+    cache = RegistryCache(max_entries=2)
+    cache.set_response("/v2/a:GET", {"a": 1}, {})
+    cache.set_response("/v2/b:GET", {"b": 1}, {})
+    assert cache.get_response("/v2/a:GET")
+    cache.set_response("/v2/c:GET", {"c": 1}, {})
+
+    assert list(cache.keys()) == ["/v2/a:GET", "/v2/c:GET"]
+    assert cache.get_response("/v2/b:GET") is None
+
+
+def test_registry_cache_persistence(tmp_path: Path):
+    cache = RegistryCache(max_entries=10)
+    cache.set_response(
+        "/v2/a/manifests/1.0.0:GET",
+        {"history": []},
+        CIMultiDict({"ETag": '"sha256:1234"', "Content-Length": "12"}),
+    )
+    cache_path = tmp_path / "registry_cache.json"
+    cache.save(cache_path)
+
+    restored_cache = RegistryCache(max_entries=10)
+    restored_cache.load(cache_path)
+    assert restored_cache == cache
+    data, headers = restored_cache.get_response("/v2/a/manifests/1.0.0:GET")
+    # only the used headers are kept
+    assert dict(headers) == {"ETag": '"sha256:1234"'}
+
+    # a corrupted file is ignored
+    cache_path.write_text("not json")
+    restored_cache = RegistryCache(max_entries=10)
+    restored_cache.load(cache_path)
+    assert not restored_cache
+
+
+@pytest.fixture
+def registry_cache(monkeypatch) -> RegistryCache:
+    monkeypatch.setattr(config, "DIRECTOR_REGISTRY_CACHING", True)
+    return RegistryCache(max_entries=10)
+
+
+async def test_cache_requests_revalidates_with_etag(
+    loop, registry_cache: RegistryCache
+):
+    app = {config.APP_REGISTRY_CACHE_DATA_KEY: registry_cache}
+    received_headers: List[Dict] = []
+
+    async def _fake_registry_request(
+        app, url: str, method: str, **kwargs
+    ) -> Tuple[Optional[Dict], Dict]:
+        received_headers.append(kwargs.get("headers", {}))
+        if kwargs.get("headers", {}).get("If-None-Match") == '"sha256:1234"':
+            return None, {}
+        return {"history": []}, {"ETag": '"sha256:1234"'}
+
+    path = "/v2/a/manifests/1.0.0"
+    data, _ = await cache_requests(_fake_registry_request)(app, path, "GET")
+    assert data == {"history": []}
+    # cached
+    await cache_requests(_fake_registry_request)(app, path, "GET")
+    assert len(received_headers) == 1
+
+    # revalidation is a conditional request
+    data, headers = await cache_requests(_fake_registry_request, revalidate=True)(
+        app, path, "GET"
+    )
+    assert received_headers[-1] == {"If-None-Match": '"sha256:1234"'}
+    assert data == {"history": []}
+    assert headers["ETag"] == '"sha256:1234"'
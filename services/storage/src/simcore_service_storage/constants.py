@@ -39,6 +39,8 @@ MAX_LINK_CHUNK_BYTE_SIZE: Final[dict[LinkType, ByteSize]] = {
 }
 
 MAX_CONCURRENT_S3_TASKS: Final[int] = 4
+MAX_CONCURRENT_S3_SMALL_FILES_COPY_TASKS: Final[int] = 20
+MAX_SYNC_DELETE_BATCH_SIZE: Final[int] = 1000
 
 
 # REST API ----------------------------
@@ -50,6 +52,7 @@ MAX_CONCURRENT_REST_CALLS: Final[int] = 10
 # DATABASE ----------------------------
 APP_DB_ENGINE_KEY = f"{__name__}.db_engine"
 MAX_CONCURRENT_DB_TASKS: Final[int] = 2
+FILES_METADATA_PAGE_SIZE: Final[int] = 1000
 
 # DATA STORAGE MANAGER ----------------------------------
 APP_DSM_KEY = f"{__name__}.DSM"
@@ -1,5 +1,5 @@
 import datetime
-from typing import AsyncGenerator, Optional, Union
+from typing import AsyncGenerator, Final, Optional, Union
 
 import sqlalchemy as sa
 from aiopg.sa.connection import SAConnection
@@ -15,6 +15,8 @@ from sqlalchemy.dialects.postgresql import insert as pg_insert
 from .exceptions import FileMetaDataNotFoundError
 from .models import FileMetaData, FileMetaDataAtDB
 
+_VALID_UPLOADS_BATCH_SIZE: Final[int] = 1000
+
 
 async def exists(conn: SAConnection, file_id: SimcoreS3FileID) -> bool:
     return (
@@ -43,6 +45,31 @@ async def upsert(
     return FileMetaDataAtDB.from_orm(row)
 
 
+async def upsert_many(
+    conn: SAConnection, fmds: list[Union[FileMetaData, FileMetaDataAtDB]]
+) -> None:
+    """bulk version of upsert, all the rows are written in a single statement"""
+    if not fmds:
+        return
+    rows = [
+        jsonable_encoder(
+            FileMetaDataAtDB.from_orm(fmd) if isinstance(fmd, FileMetaData) else fmd
+        )
+        for fmd in fmds
+    ]
+    insert_statement = pg_insert(file_meta_data).values(rows)
+    await conn.execute(
+        insert_statement.on_conflict_do_update(
+            index_elements=[file_meta_data.c.file_id],
+            set_={
+                column: insert_statement.excluded[column]
+                for column in rows[0]
+                if column != "file_id"
+            },
+        )
+    )
+
+
 async def insert(conn: SAConnection, fmd: FileMetaData) -> FileMetaDataAtDB:
     fmd_db = FileMetaDataAtDB.from_orm(fmd)
     result = await conn.execute(
@@ -64,15 +91,14 @@ async def get(conn: SAConnection, file_id: SimcoreS3FileID) -> FileMetaDataAtDB:
     raise FileMetaDataNotFoundError(file_id=file_id)
 
 
-async def list_filter_with_partial_file_id(
-    conn: SAConnection,
+def _filter_with_partial_file_id(
     *,
     user_id: UserID,
     project_ids: list[ProjectID],
     file_id_prefix: Optional[str],
     partial_file_id: Optional[str],
-) -> list[FileMetaDataAtDB]:
-    stmt = sa.select([file_meta_data]).where(
+):
+    return (
         (
             (file_meta_data.c.user_id == f"{user_id}")
             | file_meta_data.c.project_id.in_(f"{pid}" for pid in project_ids)
@@ -88,6 +114,56 @@ async def list_filter_with_partial_file_id(
             else True
         )
     )
+
+
+async def list_filter_with_partial_file_id(
+    conn: SAConnection,
+    *,
+    user_id: UserID,
+    project_ids: list[ProjectID],
+    file_id_prefix: Optional[str],
+    partial_file_id: Optional[str],
+) -> list[FileMetaDataAtDB]:
+    stmt = sa.select([file_meta_data]).where(
+        _filter_with_partial_file_id(
+            user_id=user_id,
+            project_ids=project_ids,
+            file_id_prefix=file_id_prefix,
+            partial_file_id=partial_file_id,
+        )
+    )
+    return [FileMetaDataAtDB.from_orm(row) async for row in await conn.execute(stmt)]
+
+
+async def list_page_filter_with_partial_file_id(
+    conn: SAConnection,
+    *,
+    user_id: UserID,
+    project_ids: list[ProjectID],
+    file_id_prefix: Optional[str],
+    partial_file_id: Optional[str],
+    starting_after: Optional[str],
+    limit: int,
+) -> list[FileMetaDataAtDB]:
+    """keyset paginated version of list_filter_with_partial_file_id
+
+    returns at most limit entries ordered by file_id, strictly
+    after starting_after (i.e. the file_id of the last entry of the previous page)
+    """
+    stmt = (
+        sa.select([file_meta_data])
+        .where(
+            _filter_with_partial_file_id(
+                user_id=user_id,
+                project_ids=project_ids,
+                file_id_prefix=file_id_prefix,
+                partial_file_id=partial_file_id,
+            )
+            & ((file_meta_data.c.file_id > starting_after) if starting_after else True)
+        )
+        .order_by(file_meta_data.c.file_id)
+        .limit(limit)
+    )
     return [FileMetaDataAtDB.from_orm(row) async for row in await conn.execute(stmt)]
 
 
@@ -123,17 +199,108 @@ async def total(conn: SAConnection) -> int:
     )
 
 
+def _valid_uploads_filter():
+    return file_meta_data.c.upload_expires_at == None  # lgtm [py/test-equals-none]
+
+
+async def total_valid_uploads(conn: SAConnection) -> int:
+    """returns the number of theoretically valid fmds (e.g. upload_expires_at column is null)"""
+    return (
+        await conn.scalar(
+            sa.select([sa.func.count()])
+            .select_from(file_meta_data)
+            .where(_valid_uploads_filter())
+        )
+        or 0
+    )
+
+
 async def list_valid_uploads(
-    conn: SAConnection,
+    conn: SAConnection, *, batch_size: int = _VALID_UPLOADS_BATCH_SIZE
 ) -> AsyncGenerator[FileMetaDataAtDB, None]:
-    """returns all the theoretically valid fmds (e.g. upload_expires_at column is null)"""
-    async for row in conn.execute(
-        sa.select([file_meta_data]).where(
-            file_meta_data.c.upload_expires_at == None  # lgtm [py/test-equals-none]
+    """returns all the theoretically valid fmds (e.g. upload_expires_at column is null)
+
+    NOTE: the entries are sorted by object_name in binary order (i.e. the same order as S3 lists its keys),
+    and fetched in batches of batch_size rows so that the table is never fully loaded in memory
+    """
+    object_name_in_binary_order = file_meta_data.c.object_name.collate("C")
+    last_entry: Optional[tuple[str, str]] = None
+    while True:
+        result = await conn.execute(
+            sa.select([file_meta_data])
+            .where(
+                _valid_uploads_filter()
+                & (
+                    sa.tuple_(object_name_in_binary_order, file_meta_data.c.file_id)
+                    > sa.tuple_(*last_entry)
+                    if last_entry
+                    else True
+                )
+            )
+            .order_by(object_name_in_binary_order, file_meta_data.c.file_id)
+            .limit(batch_size)
         )
-    ):
-        fmd_at_db = FileMetaDataAtDB.from_orm(row)
-        yield fmd_at_db
+        rows = await result.fetchall()
+        for row in rows:
+            yield FileMetaDataAtDB.from_orm(row)
+        if len(rows) < batch_size:
+            break
+        last_entry = (rows[-1].object_name, rows[-1].file_id)
+
+
+async def list_soft_links_to(
+    conn: SAConnection, object_name: SimcoreS3FileID
+) -> list[FileMetaDataAtDB]:
+    """returns the entries (other than object_name itself) referencing the S3 object object_name"""
+    stmt = sa.select([file_meta_data]).where(
+        (file_meta_data.c.object_name == object_name)
+        & (file_meta_data.c.file_id != object_name)
+    )
+    return [FileMetaDataAtDB.from_orm(row) async for row in await conn.execute(stmt)]
+
+
+async def list_referenced_object_names(
+    conn: SAConnection, object_names: list[SimcoreS3FileID]
+) -> set[SimcoreS3FileID]:
+    """returns which of object_names are still referenced by at least one entry"""
+    if not object_names:
+        return set()
+    stmt = (
+        sa.select([file_meta_data.c.object_name])
+        .distinct()
+        .where(file_meta_data.c.object_name.in_(object_names))
+    )
+    return {row.object_name async for row in await conn.execute(stmt)}
+
+
+async def list_shared_object_names(
+    conn: SAConnection, prefix: str
+) -> set[SimcoreS3FileID]:
+    """returns the S3 objects starting with prefix that are referenced by soft links outside of prefix"""
+    stmt = (
+        sa.select([file_meta_data.c.object_name])
+        .distinct()
+        .where(
+            file_meta_data.c.object_name.startswith(prefix)
+            & ~file_meta_data.c.file_id.startswith(prefix)
+        )
+    )
+    return {row.object_name async for row in await conn.execute(stmt)}
+
+
+async def list_linked_object_names(
+    conn: SAConnection, prefix: str
+) -> set[SimcoreS3FileID]:
+    """returns the S3 objects outside of prefix, referenced by soft links starting with prefix"""
+    stmt = (
+        sa.select([file_meta_data.c.object_name])
+        .distinct()
+        .where(
+            file_meta_data.c.file_id.startswith(prefix)
+            & ~file_meta_data.c.object_name.startswith(prefix)
+        )
+    )
+    return {row.object_name async for row in await conn.execute(stmt)}
 
 
 async def delete(conn: SAConnection, file_ids: list[SimcoreS3FileID]) -> None:
@@ -1,8 +1,9 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Union
 
 import sqlalchemy as sa
 from aiopg.sa.connection import SAConnection
 from models_library.projects import ProjectAtDB, ProjectID
+from models_library.projects_nodes_io import NodeID
 from simcore_postgres_database.storage_models import projects
 
 
@@ -17,6 +18,44 @@ async def list_projects(
         yield ProjectAtDB.from_orm(row)
 
 
+async def list_project_and_node_names(
+    conn: SAConnection, project_uuids: list[ProjectID]
+) -> dict[Union[ProjectID, NodeID], str]:
+    """returns a mapping of project uuid -> project name and node uuid -> node label
+
+    NOTE: only the labels are extracted from the workbench (server-side), the
+    whole workbench column is never transfered
+    """
+    if not project_uuids:
+        return {}
+    workbench_nodes = sa.func.json_each(projects.c.workbench).table_valued(
+        "key", "value"
+    )
+    nodes_labels = (
+        sa.select(
+            [
+                sa.func.json_object_agg(
+                    workbench_nodes.c.key, workbench_nodes.c.value.op("->>")("label")
+                )
+            ]
+        )
+        .select_from(workbench_nodes)
+        .scalar_subquery()
+    )
+    names_mapping: dict[Union[ProjectID, NodeID], str] = {}
+    async for row in conn.execute(
+        sa.select(
+            [projects.c.uuid, projects.c.name, nodes_labels.label("nodes_labels")]
+        ).where(projects.c.uuid.in_(f"{pid}" for pid in project_uuids))
+    ):
+        names_mapping[ProjectID(row.uuid)] = row.name
+        names_mapping |= {
+            NodeID(node_id): label
+            for node_id, label in (row.nodes_labels or {}).items()
+        }
+    return names_mapping
+
+
 async def project_exists(conn: SAConnection, project_uuid: ProjectID) -> bool:
     return (
         await conn.scalar(
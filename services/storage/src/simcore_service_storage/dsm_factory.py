@@ -1,15 +1,18 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Callable
+from typing import Callable, Final
 
 from aiohttp import web
 from models_library.api_schemas_storage import LinkType, UploadedPart
 from models_library.projects_nodes_io import LocationID, LocationName, StorageFileID
 from models_library.users import UserID
 from pydantic import AnyUrl, ByteSize
+from servicelib.utils import logged_gather
 
 from .models import DatasetMetaData, FileMetaData, UploadLinks
 
+_MAX_CONCURRENT_DOWNLOAD_LINKS_CREATION: Final[int] = 10
+
 
 class BaseDataManager(ABC):
     @property
@@ -86,6 +89,23 @@ class BaseDataManager(ABC):
     ) -> AnyUrl:
         """creates a download file link if user has the rights to"""
 
+    async def create_file_download_links(
+        self, user_id: UserID, file_ids: list[StorageFileID], link_type: LinkType
+    ) -> dict[StorageFileID, AnyUrl]:
+        """creates download file links for all file_ids if user has the rights to
+
+        NOTE: this default implementation creates the links one by one, override if the location
+        can do better
+        """
+        links = await logged_gather(
+            *(
+                self.create_file_download_link(user_id, file_id, link_type)
+                for file_id in file_ids
+            ),
+            max_concurrency=_MAX_CONCURRENT_DOWNLOAD_LINKS_CREATION,
+        )
+        return dict(zip(file_ids, links))
+
     @abstractmethod
     async def delete_file(self, user_id: UserID, file_id: StorageFileID) -> None:
         """deletes file if user has the rights to"""
@@ -6,6 +6,7 @@ from typing import cast
 from aiohttp import web
 from aiohttp.web import RouteTableDef
 from models_library.api_schemas_storage import (
+    FileDownloadLinksBody,
     FileMetaDataGet,
     FileUploadCompleteFutureResponse,
     FileUploadCompleteLinks,
@@ -60,10 +61,40 @@ async def get_files_metadata(request: web.Request):
         f"{path_params=}, {query_params=}",
     )
     dsm = get_dsm_provider(request.app).get(path_params.location_id)
-    data: list[FileMetaData] = await dsm.list_files(
-        user_id=query_params.user_id,
-        uuid_filter=query_params.uuid_filter,
-    )
+    if not isinstance(dsm, SimcoreS3DataManager):
+        data: list[FileMetaData] = await dsm.list_files(
+            user_id=query_params.user_id,
+            uuid_filter=query_params.uuid_filter,
+        )
+        return [jsonable_encoder(FileMetaDataGet.from_orm(d)) for d in data]
+
+    if query_params.limit:
+        # keyset pagination: the client follows _links.next until it is null
+        data, next_cursor = await dsm.list_files_page(
+            user_id=query_params.user_id,
+            uuid_filter=query_params.uuid_filter,
+            file_id_prefix=query_params.file_id_prefix or None,
+            starting_after=query_params.starting_after,
+            limit=query_params.limit,
+        )
+        return {
+            "data": [jsonable_encoder(FileMetaDataGet.from_orm(d)) for d in data],
+            "_links": {
+                "next": f"{request.rel_url.update_query(starting_after=next_cursor)}"
+                if next_cursor
+                else None
+            },
+        }
+
+    data = [
+        fmd
+        async for files_page in dsm.iter_files_pages(
+            user_id=query_params.user_id,
+            uuid_filter=query_params.uuid_filter,
+            file_id_prefix=query_params.file_id_prefix or None,
+        )
+        for fmd in files_page
+    ]
     return [jsonable_encoder(FileMetaDataGet.from_orm(d)) for d in data]
 
 
@@ -132,6 +163,22 @@ async def download_file(request: web.Request):
     return {"link": link}
 
 
+@routes.post(f"/{api_vtag}/locations/{{location_id}}/files:download-links", name="download_files")  # type: ignore
+async def download_files(request: web.Request):
+    query_params = parse_request_query_parameters_as(FileDownloadQueryParams, request)
+    path_params = parse_request_path_parameters_as(LocationPathParams, request)
+    body = await parse_request_body_as(FileDownloadLinksBody, request)
+    log.debug(
+        "received call to download_files with %s",
+        f"{path_params=}, {query_params=}, {body=}",
+    )
+    dsm = get_dsm_provider(request.app).get(path_params.location_id)
+    links = await dsm.create_file_download_links(
+        query_params.user_id, body.file_ids, query_params.link_type
+    )
+    return {"links": {file_id: f"{link}" for file_id, link in links.items()}}
+
+
 @routes.put(f"/{api_vtag}/locations/{{location_id}}/files/{{file_id}}", name="upload_file")  # type: ignore
 async def upload_file(request: web.Request):
     """creates upload file links:
@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import cast
+from typing import Any, cast
 
 from aiohttp import web
 from aiohttp.web import RouteTableDef
@@ -11,6 +11,10 @@ from servicelib.aiohttp.application_keys import (
     APP_CONFIG_KEY,
     APP_FIRE_AND_FORGET_TASKS_KEY,
 )
+from servicelib.aiohttp.long_running_tasks.server import (
+    TaskProgress,
+    start_long_running_task,
+)
 from servicelib.aiohttp.requests_validation import (
     parse_request_path_parameters_as,
     parse_request_query_parameters_as,
@@ -94,3 +98,34 @@ async def synchronise_meta_data_table(request: web.Request):
             "dry_run": query_params.dry_run,
         },
     }
+
+
+async def _synchronise_meta_data_table(
+    task_progress: TaskProgress, app: web.Application, dry_run: bool
+) -> dict[str, Any]:
+    dsm = cast(
+        SimcoreS3DataManager,
+        get_dsm_provider(app).get(SimcoreS3DataManager.get_location_id()),
+    )
+    sync_results: list[StorageFileID] = await dsm.synchronise_meta_data_table(
+        dry_run, task_progress=task_progress
+    )
+    return {"removed": sync_results, "dry_run": dry_run}
+
+
+@routes.post(f"/{api_vtag}/locations/{{location_id}}:sync-task", name="synchronise_meta_data_table_task")  # type: ignore
+async def synchronise_meta_data_table_task(request: web.Request):
+    query_params = parse_request_query_parameters_as(SyncMetadataQueryParams, request)
+    path_params = parse_request_path_parameters_as(LocationPathParams, request)
+    log.debug(
+        "received call to synchronise_meta_data_table_task with %s",
+        f"{path_params=}, {query_params=}",
+    )
+    return await start_long_running_task(
+        request,
+        _synchronise_meta_data_table,
+        fire_and_forget=query_params.fire_and_forget,
+        task_context={},
+        app=request.app,
+        dry_run=query_params.dry_run,
+    )
@@ -25,6 +25,7 @@ from simcore_service_storage.simcore_s3_dsm import SimcoreS3DataManager
 from . import sts
 from ._meta import api_vtag
 from .models import (
+    CopyFoldersQueryParams,
     DeleteFolderQueryParams,
     FileMetaData,
     SearchFilesQueryParams,
@@ -54,7 +55,7 @@ async def get_or_create_temporary_s3_access(request: web.Request):
 async def _copy_folders_from_project(
     task_progress: TaskProgress,
     app: web.Application,
-    query_params: StorageQueryParamsBase,
+    query_params: CopyFoldersQueryParams,
     body: FoldersBody,
 ) -> web.Response:
     dsm = cast(
@@ -67,6 +68,7 @@ async def _copy_folders_from_project(
         body.destination,
         body.nodes_map,
         task_progress=task_progress,
+        copy_on_write=query_params.copy_on_write,
     )
 
     raise web.HTTPCreated(
@@ -76,7 +78,7 @@ async def _copy_folders_from_project(
 
 @routes.post(f"/{api_vtag}/simcore-s3/folders", name="copy_folders_from_project")  # type: ignore
 async def copy_folders_from_project(request: web.Request):
-    query_params = parse_request_query_parameters_as(StorageQueryParamsBase, request)
+    query_params = parse_request_query_parameters_as(CopyFoldersQueryParams, request)
     body = await parse_request_body_as(FoldersBody, request)
     log.debug(
         "received call to create_folders_from_project with %s",
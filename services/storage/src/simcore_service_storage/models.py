@@ -25,6 +25,7 @@ from pydantic import (
     BaseModel,
     ByteSize,
     Extra,
+    PositiveInt,
     parse_obj_as,
     validate_arguments,
     validator,
@@ -140,6 +141,10 @@ class StorageQueryParamsBase(BaseModel):
 
 class FilesMetadataQueryParams(StorageQueryParamsBase):
     uuid_filter: str = ""
+    file_id_prefix: str = ""
+    # keyset pagination (only for simcore.s3): when limit is set, a single page is returned
+    limit: Optional[PositiveInt] = None
+    starting_after: Optional[str] = None
 
 
 class SyncMetadataQueryParams(BaseModel):
@@ -170,6 +175,11 @@ class FileUploadQueryParams(StorageQueryParamsBase):
         return v
 
 
+class CopyFoldersQueryParams(StorageQueryParamsBase):
+    # if True, the files are not copied but soft-linked and only copied once overwritten
+    copy_on_write: bool = False
+
+
 class DeleteFolderQueryParams(StorageQueryParamsBase):
     node_id: Optional[NodeID] = None
 
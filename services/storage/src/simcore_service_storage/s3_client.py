@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import json
 import logging
@@ -5,7 +6,7 @@ import urllib.parse
 from contextlib import AsyncExitStack
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional, cast
+from typing import Any, AsyncGenerator, Callable, Optional, cast
 
 import aioboto3
 from aiobotocore.session import ClientCreatorContext
@@ -17,7 +18,10 @@ from models_library.projects_nodes_io import NodeID, SimcoreS3FileID
 from pydantic import AnyUrl, ByteSize, parse_obj_as
 from servicelib.utils import logged_gather
 from settings_library.s3 import S3Settings
-from simcore_service_storage.constants import MULTIPART_UPLOADS_MIN_TOTAL_SIZE
+from simcore_service_storage.constants import (
+    MAX_CONCURRENT_S3_TASKS,
+    MULTIPART_UPLOADS_MIN_TOTAL_SIZE,
+)
 from types_aiobotocore_s3 import S3Client
 
 from .models import ETag, MultiPartUploadLinks, S3BucketName, UploadID
@@ -34,6 +38,18 @@ class S3MetaData:
     size: int
 
 
+@dataclass(frozen=True)
+class S3DeletedFiles:
+    num_files: int
+    total_size: int
+
+    def __add__(self, other: "S3DeletedFiles") -> "S3DeletedFiles":
+        return S3DeletedFiles(
+            num_files=self.num_files + other.num_files,
+            total_size=self.total_size + other.total_size,
+        )
+
+
 @dataclass
 class StorageS3Client:
     session: aioboto3.Session
@@ -98,6 +114,34 @@ class StorageS3Client:
         )
         return parse_obj_as(AnyUrl, generated_link)
 
+    @s3_exception_handler(log)
+    async def create_presigned_download_links(
+        self,
+        bucket: S3BucketName,
+        file_ids: list[SimcoreS3FileID],
+        expiration_secs: int,
+    ) -> dict[SimcoreS3FileID, AnyUrl]:
+        # NOTE: ensure the bucket/objects exist, this will raise if not
+        await self.client.head_bucket(Bucket=bucket)
+        # NOTE: the objects are checked with a bounded number of concurrent head_object
+        await logged_gather(
+            *(self.get_file_metadata(bucket, file_id) for file_id in file_ids),
+            log=log,
+            max_concurrency=MAX_CONCURRENT_S3_TASKS,
+        )
+        # NOTE: presigning is computed locally, no round trip to S3 is needed here
+        return {
+            file_id: parse_obj_as(
+                AnyUrl,
+                await self.client.generate_presigned_url(
+                    "get_object",
+                    Params={"Bucket": bucket, "Key": file_id},
+                    ExpiresIn=expiration_secs,
+                ),
+            )
+            for file_id in file_ids
+        }
+
     @s3_exception_handler(log)
     async def create_single_presigned_upload_link(
         self, bucket: S3BucketName, file_id: SimcoreS3FileID, expiration_secs: int
@@ -214,21 +258,67 @@ class StorageS3Client:
         bucket: S3BucketName,
         project_id: ProjectID,
         node_id: Optional[NodeID] = None,
-    ) -> None:
+        *,
+        files_to_keep: Optional[set[SimcoreS3FileID]] = None,
+    ) -> S3DeletedFiles:
+        """deletes all the files of a project (or of a node if node_id is given),
+        except the ones in files_to_keep
+
+        The listing is paginated and each page (max 1000 keys, which is also the
+        maximum allowed by delete_objects) is deleted as one batch, while the next
+        page is listed. At most MAX_CONCURRENT_S3_TASKS batches run concurrently.
+        """
         # NOTE: the / at the end of the Prefix is VERY important,
         # makes the listing several order of magnitudes faster
-        response = await self.client.list_objects_v2(
+        prefix = f"{project_id}/{node_id}/" if node_id else f"{project_id}/"
+        concurrency_limiter = asyncio.Semaphore(MAX_CONCURRENT_S3_TASKS)
+
+        async def _delete_batch(files: list[S3MetaData]) -> S3DeletedFiles:
+            try:
+                return await self._delete_files(bucket, files)
+            finally:
+                concurrency_limiter.release()
+
+        delete_tasks: list[asyncio.Task] = []
+        try:
+            async for files in self.list_all_files(bucket, prefix=prefix):
+                if files_to_keep:
+                    files = [f for f in files if f.file_id not in files_to_keep]
+                    if not files:
+                        continue
+                await concurrency_limiter.acquire()
+                delete_tasks.append(asyncio.create_task(_delete_batch(files)))
+        finally:
+            # NOTE: even if the listing fails, the started batches are awaited
+            results = await asyncio.gather(*delete_tasks, return_exceptions=True)
+
+        deleted_files = S3DeletedFiles(num_files=0, total_size=0)
+        for result in results:
+            # NOTE: also re-raises the cancellation of a batch (not an Exception)
+            if isinstance(result, BaseException):
+                raise result
+            deleted_files += result
+        log.debug("deleted %s in %s", f"{deleted_files}", f"{prefix=}")
+        return deleted_files
+
+    @s3_exception_handler(log)
+    async def _delete_files(
+        self, bucket: S3BucketName, files: list[S3MetaData]
+    ) -> S3DeletedFiles:
+        files_size = {f.file_id: f.size for f in files}
+        response = await self.client.delete_objects(
             Bucket=bucket,
-            Prefix=f"{project_id}/{node_id}/" if node_id else f"{project_id}/",
+            Delete={"Objects": [{"Key": key} for key in files_size], "Quiet": False},
         )
-
-        if objects_to_delete := [
-            f["Key"] for f in response.get("Contents", []) if "Key" in f
-        ]:
-            await self.client.delete_objects(
-                Bucket=bucket,
-                Delete={"Objects": [{"Key": key} for key in objects_to_delete]},
+        if errors := response.get("Errors"):
+            log.warning(
+                "could not delete %d files in %s: %s", len(errors), bucket, errors
             )
+        deleted_keys = [d["Key"] for d in response.get("Deleted", []) if "Key" in d]
+        return S3DeletedFiles(
+            num_files=len(deleted_keys),
+            total_size=sum(files_size.get(key, 0) for key in deleted_keys),
+        )
 
     @s3_exception_handler(log)
     async def get_file_metadata(
@@ -266,13 +356,119 @@ class StorageS3Client:
             copy_options |= dict(Callback=bytes_transfered_cb)
         await self.client.copy(**copy_options)
 
+    @s3_exception_handler(log)
+    async def copy_small_file(
+        self,
+        bucket: S3BucketName,
+        src_file: SimcoreS3FileID,
+        dst_file: SimcoreS3FileID,
+        file_size: ByteSize,
+        bytes_transfered_cb: Optional[Callable[[int], None]],
+    ) -> None:
+        """copy a file in S3 with a single server-side request (only for files < 5GiB)"""
+        await self.client.copy_object(
+            CopySource={"Bucket": bucket, "Key": src_file},
+            Bucket=bucket,
+            Key=dst_file,
+        )
+        if bytes_transfered_cb:
+            bytes_transfered_cb(file_size)
+
+    @s3_exception_handler(log)
+    async def copy_file_multipart(
+        self,
+        bucket: S3BucketName,
+        src_file: SimcoreS3FileID,
+        dst_file: SimcoreS3FileID,
+        file_size: ByteSize,
+        bytes_transfered_cb: Optional[Callable[[int], None]],
+    ) -> None:
+        """copy a big file in S3 server-side using a multipart upload where
+        the parts are copied in parallel (UploadPartCopy)
+        """
+        num_parts, chunk_size = compute_num_file_chunks(file_size)
+        response = await self.client.create_multipart_upload(
+            Bucket=bucket, Key=dst_file
+        )
+        upload_id = response["UploadId"]
+
+        async def _copy_part(part_index: int) -> dict[str, Any]:
+            first_byte = part_index * chunk_size
+            last_byte = min(first_byte + chunk_size, file_size) - 1
+            response = await self.client.upload_part_copy(
+                Bucket=bucket,
+                Key=dst_file,
+                CopySource={"Bucket": bucket, "Key": src_file},
+                CopySourceRange=f"bytes={first_byte}-{last_byte}",
+                PartNumber=part_index + 1,
+                UploadId=upload_id,
+            )
+            if bytes_transfered_cb:
+                bytes_transfered_cb(last_byte - first_byte + 1)
+            return {
+                "ETag": response["CopyPartResult"]["ETag"],  # type: ignore
+                "PartNumber": part_index + 1,
+            }
+
+        try:
+            copied_parts = await logged_gather(
+                *(_copy_part(i) for i in range(num_parts)),
+                log=log,
+                max_concurrency=self.transfer_max_concurrency,
+            )
+            await self.client.complete_multipart_upload(
+                Bucket=bucket,
+                Key=dst_file,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": copied_parts},
+            )
+        except BaseException:
+            # NOTE: also on cancellation, an unfinished multipart upload is billed
+            await self.client.abort_multipart_upload(
+                Bucket=bucket, Key=dst_file, UploadId=upload_id
+            )
+            raise
+
     @s3_exception_handler(log)
     async def list_files(
         self, bucket: S3BucketName, *, prefix: str
     ) -> list[S3MetaData]:
         # NOTE: adding a / at the end of a folder improves speed by several orders of magnitudes
-        response = await self.client.list_objects_v2(Bucket=bucket, Prefix=prefix)
-        return [
+        files, _ = await self._list_files_page(
+            bucket, prefix=prefix, continuation_token=None
+        )
+        return files
+
+    async def list_all_files(
+        self, bucket: S3BucketName, *, prefix: str = ""
+    ) -> AsyncGenerator[list[S3MetaData], None]:
+        """lists all the files in the bucket starting with prefix, one page
+        (max 1000 entries) at a time. The files are listed in lexicographic order
+        of their UTF-8 encoded keys.
+        """
+        continuation_token: Optional[str] = None
+        while True:
+            files, continuation_token = await self._list_files_page(
+                bucket, prefix=prefix, continuation_token=continuation_token
+            )
+            if files:
+                yield files
+            if not continuation_token:
+                break
+
+    @s3_exception_handler(log)
+    async def _list_files_page(
+        self,
+        bucket: S3BucketName,
+        *,
+        prefix: str,
+        continuation_token: Optional[str],
+    ) -> tuple[list[S3MetaData], Optional[str]]:
+        list_options = dict(Bucket=bucket, Prefix=prefix)
+        if continuation_token:
+            list_options |= dict(ContinuationToken=continuation_token)
+        response = await self.client.list_objects_v2(**list_options)
+        files = [
             S3MetaData(
                 file_id=entry["Key"],  # type: ignore
                 last_modified=entry["LastModified"],  # type: ignore
@@ -282,6 +478,11 @@ class StorageS3Client:
             for entry in response.get("Contents", [])
             if all(k in entry for k in ("Key", "LastModified", "ETag", "Size"))
         ]
+        return files, (
+            response.get("NextContinuationToken")
+            if response.get("IsTruncated")
+            else None
+        )
 
     @s3_exception_handler(log)
     async def upload_file(
@@ -1,6 +1,7 @@
 import functools
 import logging
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from typing import Final, Optional
 
 from botocore import exceptions as botocore_exc
@@ -102,12 +103,25 @@ class S3TransferDataCB:
     total_bytes_to_transfer: ByteSize
     task_progress_message_prefix: str = ""
     _total_bytes_copied: int = 0
+    _start_time: float = field(default_factory=time.monotonic)
 
     def __post_init__(self):
         self.copy_transfer_cb(0)
 
+    @property
+    def throughput(self) -> float:
+        """average transfer rate in bytes/s since creation"""
+        elapsed_time = time.monotonic() - self._start_time
+        return self._total_bytes_copied / elapsed_time if elapsed_time > 0 else 0
+
     def finalize_transfer(self):
         self.copy_transfer_cb(self.total_bytes_to_transfer - self._total_bytes_copied)
+        logger.info(
+            "%s - transferred %s at %s/s",
+            self.task_progress_message_prefix,
+            self.total_bytes_to_transfer.human_readable(),
+            parse_obj_as(ByteSize, int(self.throughput)).human_readable(),
+        )
 
     def copy_transfer_cb(self, copied_bytes: int):
         self._total_bytes_copied += copied_bytes
@@ -116,6 +130,7 @@ class S3TransferDataCB:
                 self.task_progress,
                 f"{self.task_progress_message_prefix} - "
                 f"{parse_obj_as(ByteSize,self._total_bytes_copied).human_readable()}"
-                f"/{self.total_bytes_to_transfer.human_readable()}]",
+                f"/{self.total_bytes_to_transfer.human_readable()}"
+                f" @ {parse_obj_as(ByteSize, int(self.throughput)).human_readable()}/s]",
                 self._total_bytes_copied / self.total_bytes_to_transfer,
             )
@@ -7,7 +7,7 @@ from collections import deque
 from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Optional, Union
+from typing import Any, AsyncGenerator, Awaitable, Callable, Optional
 
 from aiohttp import web
 from aiopg.sa import Engine
@@ -31,9 +31,12 @@ from .constants import (
     APP_CONFIG_KEY,
     APP_DB_ENGINE_KEY,
     DATCORE_ID,
+    FILES_METADATA_PAGE_SIZE,
     MAX_CONCURRENT_DB_TASKS,
+    MAX_CONCURRENT_S3_SMALL_FILES_COPY_TASKS,
     MAX_CONCURRENT_S3_TASKS,
     MAX_LINK_CHUNK_BYTE_SIZE,
+    MAX_SYNC_DELETE_BATCH_SIZE,
     S3_UNDEFINED_OR_EXTERNAL_MULTIPART_ID,
     SIMCORE_S3_ID,
     SIMCORE_S3_STR,
@@ -62,6 +65,7 @@ from .models import (
     UploadLinks,
 )
 from .s3 import get_s3_client
+from .s3_client import S3DeletedFiles, S3MetaData
 from .s3_utils import S3TransferDataCB, update_task_progress
 from .settings import Settings
 from .utils import (
@@ -117,17 +121,63 @@ class SimcoreS3DataManager(BaseDataManager):
         self, user_id: UserID, uuid_filter: str = ""
     ) -> list[FileMetaData]:
         data: deque[FileMetaData] = deque()
-        accesible_projects_ids = []
+        async for files_page in self.iter_files_pages(user_id, uuid_filter=uuid_filter):
+            data.extend(files_page)
+        return list(data)
+
+    async def iter_files_pages(
+        self,
+        user_id: UserID,
+        *,
+        uuid_filter: str = "",
+        file_id_prefix: Optional[str] = None,
+        page_size: int = FILES_METADATA_PAGE_SIZE,
+    ) -> AsyncGenerator[list[FileMetaData], None]:
+        """streams the file meta data a user has access to, one page at a time"""
+        cursor: Optional[SimcoreS3FileID] = None
+        while True:
+            files_page, cursor = await self.list_files_page(
+                user_id,
+                uuid_filter=uuid_filter,
+                file_id_prefix=file_id_prefix,
+                starting_after=cursor,
+                limit=page_size,
+            )
+            if files_page:
+                yield files_page
+            if cursor is None:
+                break
+
+    async def list_files_page(
+        self,
+        user_id: UserID,
+        *,
+        uuid_filter: str = "",
+        file_id_prefix: Optional[str] = None,
+        starting_after: Optional[str] = None,
+        limit: int = FILES_METADATA_PAGE_SIZE,
+    ) -> tuple[list[FileMetaData], Optional[SimcoreS3FileID]]:
+        """returns one page of the file meta data a user has access to
+        (keyset pagination ordered by file_id), and the cursor to pass as
+        starting_after to get the next page (None if there are no more pages)
+
+        NOTE: entries not belonging to a readable project/node are filtered out,
+        therefore a page may contain less than limit entries even if
+        there are more pages to come
+        """
+        data: deque[FileMetaData] = deque()
         async with self.engine.acquire() as conn, conn.begin():
             accesible_projects_ids = await get_readable_project_ids(conn, user_id)
             file_metadatas: list[
                 FileMetaDataAtDB
-            ] = await db_file_meta_data.list_filter_with_partial_file_id(
+            ] = await db_file_meta_data.list_page_filter_with_partial_file_id(
                 conn,
                 user_id=user_id,
                 project_ids=accesible_projects_ids,
-                file_id_prefix=None,
+                file_id_prefix=file_id_prefix,
                 partial_file_id=uuid_filter,
+                starting_after=starting_after,
+                limit=limit,
             )
 
             for fmd in file_metadatas:
@@ -142,21 +192,17 @@ class SimcoreS3DataManager(BaseDataManager):
                     updated_fmd = await self._update_database_from_storage(conn, fmd)
                     data.append(convert_db_to_model(updated_fmd))
 
-            # now parse the project to search for node/project names
-            prj_names_mapping: dict[Union[ProjectID, NodeID], str] = {}
-            async for proj_data in db_projects.list_projects(
-                conn, accesible_projects_ids
-            ):
-                prj_names_mapping |= {proj_data.uuid: proj_data.name} | {
-                    NodeID(node_id): node_data.label
-                    for node_id, node_data in proj_data.workbench.items()
-                }
+            # now search for node/project names, only for the projects in this page
+            prj_names_mapping = await db_projects.list_project_and_node_names(
+                conn,
+                list({d.project_id for d in data} & set(accesible_projects_ids)),
+            )
 
         # FIXME: artifically fills ['project_name', 'node_name', 'file_id', 'raw_file_path', 'display_file_path']
         #        with information from the projects table!
         # also all this stuff with projects should be done in the client code not here
         # NOTE: sorry for all the FIXMEs here, but this will need further refactoring
-        clean_data = deque()
+        clean_data: list[FileMetaData] = []
         for d in data:
             if d.project_id not in prj_names_mapping:
                 continue
@@ -166,8 +212,10 @@ class SimcoreS3DataManager(BaseDataManager):
             if d.node_name and d.project_name:
                 clean_data.append(d)
 
-            data = clean_data
-        return list(data)
+        next_cursor = (
+            file_metadatas[-1].file_id if len(file_metadatas) == limit else None
+        )
+        return clean_data, next_cursor
 
     async def get_file(self, user_id: UserID, file_id: StorageFileID) -> FileMetaData:
         async with self.engine.acquire() as conn, conn.begin():
@@ -193,19 +241,29 @@ class SimcoreS3DataManager(BaseDataManager):
         link_type: LinkType,
         file_size_bytes: ByteSize,
     ) -> UploadLinks:
-        async with self.engine.acquire() as conn, conn.begin() as transaction:
+        async with self.engine.acquire() as conn:
             can: Optional[AccessRights] = await get_file_access_rights(
                 conn, user_id, file_id
             )
             if not can.write:
                 raise FileAccessRightError(access_right="write", file_id=file_id)
 
+        # NOTE: copy-on-write, the soft links to this file must keep the current content.
+        # This is done before the transaction since copying in S3 might take a while
+        await self._materialize_soft_links_to(parse_obj_as(SimcoreS3FileID, file_id))
+
+        async with self.engine.acquire() as conn, conn.begin() as transaction:
             # NOTE: if this gets called successively with the same file_id, and
             # there was a multipart upload in progress beforehand, it MUST be
             # cancelled to prevent unwanted costs in AWS
             await self._clean_pending_upload(
                 conn, parse_obj_as(SimcoreS3FileID, file_id)
             )
+            previous_fmd: Optional[FileMetaDataAtDB] = None
+            with suppress(FileMetaDataNotFoundError):
+                previous_fmd = await db_file_meta_data.get(
+                    conn, parse_obj_as(SimcoreS3FileID, file_id)
+                )
 
             # initiate the file meta data table
             fmd = await self._create_fmd_for_upload(
@@ -219,6 +277,11 @@ class SimcoreS3DataManager(BaseDataManager):
                 )
                 else None,
             )
+            if previous_fmd and previous_fmd.object_name != fmd.object_name:
+                # this was a soft link, it now gets its own content
+                await self._delete_unreferenced_s3_objects(
+                    conn, [previous_fmd.object_name]
+                )
             # NOTE: ensure the database is updated so cleaner does not pickup newly created uploads
             await transaction.commit()
 
@@ -367,6 +430,54 @@ class SimcoreS3DataManager(BaseDataManager):
 
         return f"{link}"
 
+    async def create_file_download_links(
+        self, user_id: UserID, file_ids: list[StorageFileID], link_type: LinkType
+    ) -> dict[StorageFileID, AnyUrl]:
+        async with self.engine.acquire() as conn:
+            for file_id in file_ids:
+                can: Optional[AccessRights] = await get_file_access_rights(
+                    conn, user_id, file_id
+                )
+                if not can.read:
+                    raise FileAccessRightError(access_right="read", file_id=file_id)
+
+            fmds = {
+                fmd.file_id: fmd
+                for fmd in await db_file_meta_data.list_fmds(
+                    conn,
+                    file_ids=[parse_obj_as(SimcoreS3FileID, f) for f in file_ids],
+                )
+            }
+            for file_id in file_ids:
+                if file_id not in fmds:
+                    raise FileMetaDataNotFoundError(file_id=file_id)
+                if not is_file_entry_valid(fmds[file_id]):
+                    # try lazy update
+                    fmds[file_id] = await self._update_database_from_storage(
+                        conn, fmds[file_id]
+                    )
+
+        object_names = {file_id: fmds[file_id].object_name for file_id in file_ids}
+        if link_type == LinkType.PRESIGNED:
+            presigned_links = await get_s3_client(
+                self.app
+            ).create_presigned_download_links(
+                self.simcore_bucket_name,
+                list(set(object_names.values())),
+                self.settings.STORAGE_DEFAULT_PRESIGNED_LINK_EXPIRATION_SECONDS,
+            )
+            return {
+                file_id: presigned_links[object_name]
+                for file_id, object_name in object_names.items()
+            }
+        return {
+            file_id: parse_obj_as(
+                AnyUrl,
+                f"s3://{self.simcore_bucket_name}/{urllib.parse.quote(object_name)}",
+            )
+            for file_id, object_name in object_names.items()
+        }
+
     async def delete_file(self, user_id: UserID, file_id: StorageFileID):
         async with self.engine.acquire() as conn, conn.begin():
             can: Optional[AccessRights] = await get_file_access_rights(
@@ -379,14 +490,13 @@ class SimcoreS3DataManager(BaseDataManager):
                 file: FileMetaDataAtDB = await db_file_meta_data.get(
                     conn, parse_obj_as(SimcoreS3FileID, file_id)
                 )
-                await get_s3_client(self.app).delete_file(
-                    file.bucket_name, file.file_id
-                )
                 await db_file_meta_data.delete(conn, [file.file_id])
+                # NOTE: the S3 object might be shared with soft links (copy-on-write)
+                await self._delete_unreferenced_s3_objects(conn, [file.object_name])
 
     async def delete_project_simcore_s3(
         self, user_id: UserID, project_id: ProjectID, node_id: Optional[NodeID] = None
-    ) -> None:
+    ) -> S3DeletedFiles:
         async with self.engine.acquire() as conn, conn.begin():
             can: Optional[AccessRights] = await get_project_access_rights(
                 conn, user_id, project_id
@@ -396,14 +506,36 @@ class SimcoreS3DataManager(BaseDataManager):
                     access_right="delete", project_id=project_id
                 )
 
+            # NOTE: copy-on-write, objects of this project/node referenced by soft links
+            # of other projects are kept, objects of other projects referenced by soft links
+            # of this project/node are removed if they are not referenced anymore
+            prefix = f"{project_id}/{node_id}/" if node_id else f"{project_id}/"
+            shared_object_names = await db_file_meta_data.list_shared_object_names(
+                conn, prefix
+            )
+            linked_object_names = await db_file_meta_data.list_linked_object_names(
+                conn, prefix
+            )
+
             # we can do it this way, since we are in a transaction, it will rollback in case of error
             if not node_id:
                 await db_file_meta_data.delete_all_from_project(conn, project_id)
             else:
                 await db_file_meta_data.delete_all_from_node(conn, node_id)
-            await get_s3_client(self.app).delete_files_in_project_node(
-                self.simcore_bucket_name, project_id, node_id
+            deleted_files = await get_s3_client(self.app).delete_files_in_project_node(
+                self.simcore_bucket_name,
+                project_id,
+                node_id,
+                files_to_keep=shared_object_names,
             )
+            await self._delete_unreferenced_s3_objects(conn, list(linked_object_names))
+        logger.info(
+            "deleted %d files (%s) of %s",
+            deleted_files.num_files,
+            parse_obj_as(ByteSize, deleted_files.total_size).human_readable(),
+            f"{project_id=}, {node_id=}",
+        )
+        return deleted_files
 
     async def deep_copy_project_simcore_s3(
         self,
@@ -412,7 +544,15 @@ class SimcoreS3DataManager(BaseDataManager):
         dst_project: dict[str, Any],
         node_mapping: dict[NodeID, NodeID],
         task_progress: Optional[TaskProgress] = None,
+        *,
+        copy_on_write: bool = False,
     ) -> None:
+        """copies the data of src_project into dst_project
+
+        if copy_on_write is set, the files referenced in file_meta_data are not
+        copied, instead the destination entries are soft links to the source
+        objects, which get materialized once overwritten
+        """
         src_project_uuid: ProjectID = ProjectID(src_project["uuid"])
         dst_project_uuid: ProjectID = ProjectID(dst_project["uuid"])
         # Step 1: check access rights (read of src and write of dst)
@@ -450,13 +590,13 @@ class SimcoreS3DataManager(BaseDataManager):
                 lambda a, b: a + b, [f.file_size for f in src_project_files], 0
             ),
         )
-        # Step 3.1: copy: files referenced from file_metadata
-        copy_tasks: deque[Awaitable] = deque()
+        # Step 3.1: plan the copy of the files referenced from file_metadata
         s3_transfered_data_cb = S3TransferDataCB(
             task_progress,
             src_project_total_data_size,
             task_progress_message_prefix=f"Copying {len(src_project_files)} files to '{dst_project['name']}'",
         )
+        planned_s3_copies: list[tuple[FileMetaDataAtDB, SimcoreS3FileID]] = []
         for src_fmd in src_project_files:
             if not src_fmd.node_id or (src_fmd.location_id != self.location_id):
                 raise NotImplementedError(
@@ -465,19 +605,92 @@ class SimcoreS3DataManager(BaseDataManager):
                 )
 
             if new_node_id := node_mapping.get(src_fmd.node_id):
-                copy_tasks.append(
-                    self._copy_file_s3_s3(
-                        user_id,
+                planned_s3_copies.append(
+                    (
                         src_fmd,
                         SimcoreS3FileID(
                             f"{dst_project_uuid}/{new_node_id}/{src_fmd.object_name.split('/')[-1]}"
                         ),
+                    )
+                )
+        if copy_on_write:
+            async with self.engine.acquire() as conn, conn.begin():
+                await db_file_meta_data.upsert_many(
+                    conn,
+                    [
+                        self._fmd_for_upload(
+                            user_id,
+                            dst_file_id,
+                            upload_id=None,
+                            upload_expires_at=None,
+                            object_name=src_fmd.object_name,
+                            is_soft_link=True,
+                            file_size=src_fmd.file_size,
+                            last_modified=src_fmd.last_modified,
+                            entity_tag=src_fmd.entity_tag,
+                        )
+                        for src_fmd, dst_file_id in planned_s3_copies
+                    ],
+                )
+            s3_transfered_data_cb.copy_transfer_cb(
+                sum(src_fmd.file_size for src_fmd, _ in planned_s3_copies)
+            )
+            planned_s3_copies = []
+
+        # all the destination entries are created at once
+        async with self.engine.acquire() as conn, conn.begin():
+            await db_file_meta_data.upsert_many(
+                conn,
+                [
+                    self._fmd_for_upload(
+                        user_id,
+                        dst_file_id,
+                        upload_id=S3_UNDEFINED_OR_EXTERNAL_MULTIPART_ID,
+                    )
+                    for _, dst_file_id in planned_s3_copies
+                ],
+            )
+        # small files are copied with a single request each and a high concurrency,
+        # big files are copied one part per request (parts are copied in parallel)
+        s3_client = get_s3_client(self.app)
+        # NOTE: the copies are planned with the sizes in S3, those in the database might
+        # be undefined (-1) or outdated. Source files might be soft-links to other projects
+        src_files_in_s3 = await self._list_s3_files_by_id(
+            {src_fmd.object_name.split("/")[0] for src_fmd, _ in planned_s3_copies}
+        )
+        small_files_copy_tasks: deque[Awaitable] = deque()
+        big_files_copy_tasks: deque[Awaitable] = deque()
+        for src_fmd, dst_file_id in planned_s3_copies:
+            src_s3_metadata = src_files_in_s3.get(src_fmd.object_name)
+            if src_s3_metadata is None:
+                raise S3KeyNotFoundError(
+                    key=src_fmd.object_name, bucket=self.simcore_bucket_name
+                )
+            src_file_size = parse_obj_as(ByteSize, src_s3_metadata.size)
+            if s3_client.is_multipart(src_file_size):
+                big_files_copy_tasks.append(
+                    s3_client.copy_file_multipart(
+                        self.simcore_bucket_name,
+                        src_fmd.object_name,
+                        dst_file_id,
+                        src_file_size,
+                        bytes_transfered_cb=s3_transfered_data_cb.copy_transfer_cb,
+                    )
+                )
+            else:
+                small_files_copy_tasks.append(
+                    s3_client.copy_small_file(
+                        self.simcore_bucket_name,
+                        src_fmd.object_name,
+                        dst_file_id,
+                        src_file_size,
                         bytes_transfered_cb=s3_transfered_data_cb.copy_transfer_cb,
                     )
                 )
         # Step 3.2: copy files referenced from file-picker from DAT-CORE
+        datcore_copy_tasks: deque[Awaitable] = deque()
         for node_id, node in dst_project.get("workbench", {}).items():
-            copy_tasks.extend(
+            datcore_copy_tasks.extend(
                 [
                     self._copy_file_datcore_s3(
                         user_id=user_id,
@@ -491,10 +704,55 @@ class SimcoreS3DataManager(BaseDataManager):
                     if int(output.get("store", self.location_id)) == DATCORE_ID
                 ]
             )
-        await logged_gather(*copy_tasks, max_concurrency=MAX_CONCURRENT_S3_TASKS)
+        await logged_gather(
+            logged_gather(
+                *small_files_copy_tasks,
+                max_concurrency=MAX_CONCURRENT_S3_SMALL_FILES_COPY_TASKS,
+            ),
+            logged_gather(
+                *big_files_copy_tasks, max_concurrency=MAX_CONCURRENT_S3_TASKS
+            ),
+            logged_gather(*datcore_copy_tasks, max_concurrency=MAX_CONCURRENT_S3_TASKS),
+        )
+        # Step 4: update the destination entries with what is now in S3 (one listing instead of one request per file)
+        dst_files_in_s3 = await self._list_s3_files_by_id({f"{dst_project_uuid}"})
+        copied_fmds: list[FileMetaData] = []
+        for src_fmd, dst_file_id in planned_s3_copies:
+            s3_metadata = dst_files_in_s3.get(dst_file_id)
+            if s3_metadata is None:
+                raise S3KeyNotFoundError(
+                    key=dst_file_id, bucket=self.simcore_bucket_name
+                )
+            copied_fmds.append(
+                self._fmd_for_upload(
+                    user_id,
+                    dst_file_id,
+                    upload_id=None,
+                    upload_expires_at=None,
+                    file_size=parse_obj_as(ByteSize, s3_metadata.size),
+                    last_modified=s3_metadata.last_modified,
+                    entity_tag=s3_metadata.e_tag,
+                )
+            )
+        async with self.engine.acquire() as conn, conn.begin():
+            await db_file_meta_data.upsert_many(conn, copied_fmds)
         # ensure the full size is reported
         s3_transfered_data_cb.finalize_transfer()
 
+    async def _list_s3_files_by_id(
+        self, project_ids: set[str]
+    ) -> dict[str, S3MetaData]:
+        """lists the files of the projects in S3 (one listing per project)"""
+        s3_client = get_s3_client(self.app)
+        return {
+            s3_file.file_id: s3_file
+            for project_id in project_ids
+            async for s3_files in s3_client.list_all_files(
+                self.simcore_bucket_name, prefix=f"{project_id}/"
+            )
+            for s3_file in s3_files
+        }
+
     async def search_files_starting_with(
         self, user_id: UserID, prefix: str
     ) -> list[FileMetaData]:
@@ -541,33 +799,128 @@ class SimcoreS3DataManager(BaseDataManager):
         async with self.engine.acquire() as conn:
             return convert_db_to_model(await db_file_meta_data.insert(conn, target))
 
-    async def synchronise_meta_data_table(self, dry_run: bool) -> list[StorageFileID]:
-        file_ids_to_remove = []
+    async def synchronise_meta_data_table(
+        self, dry_run: bool, task_progress: Optional[TaskProgress] = None
+    ) -> list[StorageFileID]:
+        file_ids_to_remove: list[StorageFileID] = []
+        file_ids_pending_removal: list[SimcoreS3FileID] = []
         async with self.engine.acquire() as conn:
-            logger.warning(
-                "Total number of entries to check %d",
-                await db_file_meta_data.total(conn),
+            total_num_entries = await db_file_meta_data.total_valid_uploads(conn)
+            logger.warning("Total number of entries to check %d", total_num_entries)
+            update_task_progress(
+                task_progress, f"Checking {total_num_entries} entries...", 0
+            )
+
+            # NOTE: the S3 bucket is walked once (paginated listing) and merge-joined
+            # against the file_meta_data entries, both are sorted by S3 key in binary order.
+            # This replaces one S3 listing call per entry.
+            s3_keys = _iter_s3_keys(
+                get_s3_client(self.app).list_all_files(self.simcore_bucket_name)
             )
-            # iterate over all entries to check if there is a file in the S3 backend
+            current_s3_key = await _next_s3_key_or_none(s3_keys)
+            num_checked_entries = 0
             async for fmd in db_file_meta_data.list_valid_uploads(conn):
-                # SEE https://www.peterbe.com/plog/fastest-way-to-find-out-if-a-file-exists-in-s3
-                if not await get_s3_client(self.app).list_files(
-                    self.simcore_bucket_name, prefix=fmd.object_name
+                while current_s3_key is not None and current_s3_key < fmd.object_name:
+                    current_s3_key = await _next_s3_key_or_none(s3_keys)
+                # NOTE: an entry exists if any key starts with its object name (e.g. directories).
+                # The first key not smaller than the object name is the smallest one with that prefix
+                if current_s3_key is None or not current_s3_key.startswith(
+                    fmd.object_name
                 ):
                     # this file does not exist in S3
                     file_ids_to_remove.append(fmd.file_id)
+                    if not dry_run:
+                        file_ids_pending_removal.append(fmd.file_id)
+
+                if len(file_ids_pending_removal) >= MAX_SYNC_DELETE_BATCH_SIZE:
+                    await db_file_meta_data.delete(conn, file_ids_pending_removal)
+                    file_ids_pending_removal = []
+
+                num_checked_entries += 1
+                if num_checked_entries % MAX_SYNC_DELETE_BATCH_SIZE == 0:
+                    update_task_progress(
+                        task_progress,
+                        f"Checked {num_checked_entries}/{total_num_entries} entries, "
+                        f"{len(file_ids_to_remove)} without file in S3",
+                        min(num_checked_entries / max(total_num_entries, 1), 1.0),
+                    )
 
-            if not dry_run:
-                await db_file_meta_data.delete(conn, file_ids_to_remove)
+            if file_ids_pending_removal:
+                await db_file_meta_data.delete(conn, file_ids_pending_removal)
 
             logger.info(
                 "%s %d entries ",
                 "Would delete" if dry_run else "Deleted",
                 len(file_ids_to_remove),
             )
+            update_task_progress(
+                task_progress,
+                f"{'Would delete' if dry_run else 'Deleted'} {len(file_ids_to_remove)} entries",
+                1.0,
+            )
 
         return file_ids_to_remove
 
+    async def _materialize_soft_links_to(self, object_name: SimcoreS3FileID) -> None:
+        """copies the S3 object object_name to each of the soft links referencing it,
+        so that they keep the current content (i.e. copy-on-write)
+
+        NOTE: no connection is held while copying in S3
+        """
+        async with self.engine.acquire() as conn:
+            soft_links = [
+                fmd
+                for fmd in await db_file_meta_data.list_soft_links_to(conn, object_name)
+                if is_file_entry_valid(fmd)
+            ]
+        if not soft_links:
+            return
+        s3_client = get_s3_client(self.app)
+
+        async def _materialize(link_fmd: FileMetaDataAtDB) -> FileMetaDataAtDB:
+            copy_fct = (
+                s3_client.copy_file_multipart
+                if s3_client.is_multipart(link_fmd.file_size)
+                else s3_client.copy_small_file
+            )
+            await copy_fct(
+                self.simcore_bucket_name,
+                object_name,
+                link_fmd.file_id,
+                link_fmd.file_size,
+                bytes_transfered_cb=None,
+            )
+            link_fmd.object_name = link_fmd.file_id
+            link_fmd.is_soft_link = False
+            return link_fmd
+
+        materialized_fmds = await logged_gather(
+            *(_materialize(fmd) for fmd in soft_links),
+            log=logger,
+            max_concurrency=MAX_CONCURRENT_S3_SMALL_FILES_COPY_TASKS,
+        )
+        async with self.engine.acquire() as conn, conn.begin():
+            await db_file_meta_data.upsert_many(conn, materialized_fmds)
+        logger.info(
+            "materialized %d soft links to %s", len(materialized_fmds), object_name
+        )
+
+    async def _delete_unreferenced_s3_objects(
+        self, conn: SAConnection, object_names: list[SimcoreS3FileID]
+    ) -> None:
+        """deletes the S3 objects that are not referenced anymore in file_meta_data"""
+        referenced_object_names = await db_file_meta_data.list_referenced_object_names(
+            conn, object_names
+        )
+        await logged_gather(
+            *(
+                get_s3_client(self.app).delete_file(self.simcore_bucket_name, name)
+                for name in set(object_names) - referenced_object_names
+            ),
+            log=logger,
+            max_concurrency=MAX_CONCURRENT_S3_TASKS,
+        )
+
     async def _clean_pending_upload(self, conn: SAConnection, file_id: SimcoreS3FileID):
         with suppress(FileMetaDataNotFoundError):
             fmd = await db_file_meta_data.get(conn, file_id)
@@ -783,59 +1136,55 @@ class SimcoreS3DataManager(BaseDataManager):
 
         return convert_db_to_model(updated_fmd)
 
-    async def _copy_file_s3_s3(
+    def _fmd_for_upload(
         self,
         user_id: UserID,
-        src_fmd: FileMetaDataAtDB,
-        dst_file_id: SimcoreS3FileID,
-        bytes_transfered_cb: Callable[[int], None],
-    ) -> FileMetaData:
-        logger.debug("copying %s to %s", f"{src_fmd=}", f"{dst_file_id=}")
-        # copying will happen using aioboto3, therefore multipart might happen
-        # NOTE: connection must be released to ensure database update
-        async with self.engine.acquire() as conn, conn.begin() as transaction:
-            new_fmd = await self._create_fmd_for_upload(
-                conn,
-                user_id,
-                dst_file_id,
-                upload_id=S3_UNDEFINED_OR_EXTERNAL_MULTIPART_ID,
-            )
-            # NOTE: ensure the database is updated so cleaner does not pickup newly created uploads
-            await transaction.commit()
-
-            await get_s3_client(self.app).copy_file(
-                self.simcore_bucket_name,
-                src_fmd.object_name,
-                new_fmd.object_name,
-                bytes_transfered_cb=bytes_transfered_cb,
-            )
-            updated_fmd = await self._update_database_from_storage(conn, new_fmd)
-        logger.info("copied %s to %s", f"{src_fmd=}", f"{updated_fmd=}")
-        return convert_db_to_model(updated_fmd)
-
-    async def _create_fmd_for_upload(
-        self,
-        conn: SAConnection,
-        user_id: UserID,
         file_id: StorageFileID,
         upload_id: Optional[UploadID],
-    ) -> FileMetaDataAtDB:
+        **file_meta_data_kwargs,
+    ) -> FileMetaData:
         now = datetime.datetime.utcnow()
         upload_expiration_date = now + datetime.timedelta(
             seconds=self.settings.STORAGE_DEFAULT_PRESIGNED_LINK_EXPIRATION_SECONDS
         )
-        fmd = FileMetaData.from_simcore_node(
+        return FileMetaData.from_simcore_node(
             user_id=user_id,
             file_id=parse_obj_as(SimcoreS3FileID, file_id),
             bucket=self.simcore_bucket_name,
             location_id=self.location_id,
             location_name=self.location_name,
-            upload_expires_at=upload_expiration_date,
-            upload_id=upload_id,
+            **(
+                {"upload_expires_at": upload_expiration_date, "upload_id": upload_id}
+                | file_meta_data_kwargs
+            ),
         )
+
+    async def _create_fmd_for_upload(
+        self,
+        conn: SAConnection,
+        user_id: UserID,
+        file_id: StorageFileID,
+        upload_id: Optional[UploadID],
+    ) -> FileMetaDataAtDB:
+        fmd = self._fmd_for_upload(user_id, file_id, upload_id)
         return await db_file_meta_data.upsert(conn, fmd)
 
 
+async def _iter_s3_keys(
+    s3_files_pages: AsyncGenerator[list[S3MetaData], None]
+) -> AsyncGenerator[str, None]:
+    async for s3_files in s3_files_pages:
+        for s3_file in s3_files:
+            yield s3_file.file_id
+
+
+async def _next_s3_key_or_none(s3_keys: AsyncGenerator[str, None]) -> Optional[str]:
+    try:
+        return await s3_keys.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
 def create_simcore_s3_data_manager(app: web.Application) -> SimcoreS3DataManager:
     cfg: Settings = app[APP_CONFIG_KEY]
     assert cfg.STORAGE_S3  # nosec
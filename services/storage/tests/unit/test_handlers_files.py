@@ -857,6 +857,56 @@ async def test_download_file(
     assert filecmp.cmp(uploaded_file, dest_file)
 
 
+async def test_download_files(
+    client: TestClient,
+    upload_file: Callable[[ByteSize, str], Awaitable[tuple[Path, SimcoreS3FileID]]],
+    location_id: int,
+    user_id: UserID,
+    tmp_path: Path,
+    faker: Faker,
+):
+    assert client.app
+    uploaded_files = dict(
+        [
+            await upload_file(parse_obj_as(ByteSize, "1Kib"), faker.file_name())
+            for _ in range(3)
+        ]
+    )
+
+    download_url = (
+        client.app.router["download_files"]
+        .url_for(location_id=f"{location_id}")
+        .with_query(user_id=user_id)
+    )
+    response = await client.post(
+        f"{download_url}", json={"file_ids": list(uploaded_files.values())}
+    )
+    data, error = await assert_status(response, web.HTTPOk)
+    assert not error
+    assert data
+    assert set(data["links"]) == set(uploaded_files.values())
+    # now download the links from S3
+    async with ClientSession() as session:
+        for uploaded_file, uploaded_file_uuid in uploaded_files.items():
+            dest_file = tmp_path / faker.file_name()
+            response = await session.get(data["links"][uploaded_file_uuid])
+            response.raise_for_status()
+            dest_file.write_bytes(await response.read())
+            assert filecmp.cmp(uploaded_file, dest_file)
+
+    # a missing file fails the whole batch
+    response = await client.post(
+        f"{download_url}",
+        json={
+            "file_ids": [
+                *uploaded_files.values(),
+                f"{next(iter(uploaded_files.values()))}_missing",
+            ]
+        },
+    )
+    await assert_status(response, web.HTTPNotFound)
+
+
 @pytest.mark.parametrize(
     "file_size",
     [
@@ -79,6 +79,57 @@ async def test_get_files_metadata(
     assert len(list_fmds) == (NUM_FILES)
 
 
+async def test_get_files_metadata_paginated(
+    upload_file: Callable[[ByteSize, str], Awaitable[tuple[Path, SimcoreS3FileID]]],
+    client: TestClient,
+    user_id: UserID,
+    location_id: int,
+    project_id: ProjectID,
+    faker: Faker,
+):
+    assert client.app
+
+    NUM_FILES = 7
+    file_size = parse_obj_as(ByteSize, "1Mib")
+    uploaded_file_ids = [
+        (await upload_file(file_size, faker.file_name()))[1] for _ in range(NUM_FILES)
+    ]
+
+    PAGE_SIZE = 3
+    url = (
+        client.app.router["get_files_metadata"]
+        .url_for(location_id=f"{location_id}")
+        .with_query(user_id=f"{user_id}", limit=PAGE_SIZE)
+    )
+    listed_file_ids = []
+    num_pages = 0
+    next_url = f"{url}"
+    while next_url:
+        response = await client.get(next_url)
+        assert response.status == web.HTTPOk.status_code
+        payload = await response.json()
+        list_fmds = parse_obj_as(list[FileMetaDataGet], payload["data"])
+        assert len(list_fmds) <= PAGE_SIZE
+        listed_file_ids += [fmd.file_id for fmd in list_fmds]
+        next_url = payload["_links"]["next"]
+        num_pages += 1
+
+    assert len(listed_file_ids) == NUM_FILES
+    assert set(listed_file_ids) == set(uploaded_file_ids)
+    assert num_pages == NUM_FILES // PAGE_SIZE + 1
+
+    # prefix filtering is done server-side
+    selected_file_id = uploaded_file_ids[0]
+    response = await client.get(
+        f"{url.update_query(file_id_prefix=selected_file_id, limit=NUM_FILES)}"
+    )
+    assert response.status == web.HTTPOk.status_code
+    payload = await response.json()
+    list_fmds = parse_obj_as(list[FileMetaDataGet], payload["data"])
+    assert [fmd.file_id for fmd in list_fmds] == [selected_file_id]
+    assert payload["_links"]["next"] is None
+
+
 @pytest.mark.xfail(
     reason="storage get_file_metadata must return a 200 with no payload as long as legacy services are around!!"
 )
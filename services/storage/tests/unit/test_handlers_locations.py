@@ -9,6 +9,7 @@ from aiohttp import web
 from aiohttp.test_utils import TestClient
 from models_library.users import UserID
 from pytest_simcore.helpers.utils_assert import assert_status
+from servicelib.aiohttp.long_running_tasks.client import long_running_task_request
 from tests.helpers.utils import has_datcore_tokens
 
 pytest_simcore_core_services_selection = ["postgres"]
@@ -68,3 +69,24 @@ async def test_synchronise_meta_data_table(
         False if fire_and_forget is None else fire_and_forget
     )
     assert data["removed"] == expected_removed
+
+
+@pytest.mark.parametrize("dry_run", [True, False])
+async def test_synchronise_meta_data_table_task(
+    client: TestClient,
+    location_id: int,
+    user_id: UserID,
+    dry_run: bool,
+):
+    assert client.app
+    url = client.make_url(
+        f"{client.app.router['synchronise_meta_data_table_task'].url_for(location_id=f'{location_id}').with_query(dry_run=f'{dry_run}')}"
+    )
+    async for lr_task in long_running_task_request(client.session, url):
+        print(f"<-- current state is {lr_task.progress=}")
+        if lr_task.done():
+            result = await lr_task.result()
+            assert result == {"removed": [], "dry_run": dry_run}
+            return
+
+    assert False, "Synchronisation task failed!"
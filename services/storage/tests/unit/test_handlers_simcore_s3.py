@@ -30,6 +30,7 @@ from servicelib.aiohttp.long_running_tasks.client import long_running_task_reque
 from servicelib.utils import logged_gather
 from settings_library.s3 import S3Settings
 from simcore_postgres_database.storage_models import file_meta_data, projects
+from simcore_service_storage.models import S3BucketName
 from simcore_service_storage.s3_client import StorageS3Client
 from simcore_service_storage.simcore_s3_dsm import SimcoreS3DataManager
 from tests.helpers.utils_file_meta_data import assert_file_meta_data_in_db
@@ -81,10 +82,12 @@ async def _request_copy_folders(
     source_project: dict[str, Any],
     dst_project: dict[str, Any],
     nodes_map: dict[NodeID, NodeID],
+    *,
+    copy_on_write: bool = False,
 ) -> dict[str, Any]:
     assert client.app
     url = client.make_url(
-        f"{(client.app.router['copy_folders_from_project'].url_for().with_query(user_id=user_id))}"
+        f"{(client.app.router['copy_folders_from_project'].url_for().with_query(user_id=user_id, copy_on_write=f'{copy_on_write}'))}"
     )
     async for lr_task in long_running_task_request(
         client.session,
@@ -330,6 +333,73 @@ async def test_copy_folders_from_valid_project(
             )
 
 
+async def test_copy_folders_copy_on_write(
+    client: TestClient,
+    user_id: UserID,
+    create_project: Callable[[], Awaitable[dict[str, Any]]],
+    create_simcore_file_id: Callable[[ProjectID, NodeID, str], SimcoreS3FileID],
+    aiopg_engine: Engine,
+    storage_s3_client: StorageS3Client,
+    storage_s3_bucket: S3BucketName,
+    random_project_with_files: Callable[
+        ..., Awaitable[tuple[dict[str, Any], dict[NodeID, dict[SimcoreS3FileID, Path]]]]
+    ],
+):
+    assert client.app
+    src_project, src_projects_list = await random_project_with_files(num_nodes=3)
+    dst_project, nodes_map = clone_project_data(src_project)
+    dst_project = await create_project(**dst_project)
+    await _request_copy_folders(
+        client,
+        user_id,
+        src_project,
+        dst_project,
+        nodes_map={NodeID(i): NodeID(j) for i, j in nodes_map.items()},
+        copy_on_write=True,
+    )
+    num_src_files = sum(len(files) for files in src_projects_list.values())
+    # the entries are created but nothing was copied in S3
+    for src_node_id in src_projects_list:
+        dst_node_id = nodes_map.get(NodeIDStr(f"{src_node_id}"))
+        assert dst_node_id
+        for src_file in src_projects_list[src_node_id].values():
+            await assert_file_meta_data_in_db(
+                aiopg_engine,
+                file_id=create_simcore_file_id(
+                    ProjectID(dst_project["uuid"]), NodeID(dst_node_id), src_file.name
+                ),
+                expected_entry_exists=True,
+                expected_file_size=src_file.stat().st_size,
+                expected_upload_id=None,
+                expected_upload_expiration_date=None,
+            )
+    assert not await storage_s3_client.list_files(
+        storage_s3_bucket, prefix=f"{dst_project['uuid']}/"
+    )
+
+    async def _delete_project_data(project_id: str) -> None:
+        url = (
+            client.app.router["delete_folders_of_project"]
+            .url_for(folder_id=project_id)
+            .with_query(user_id=f"{user_id}")
+        )
+        resp = await client.delete(f"{url}")
+        await assert_status(resp, expected_cls=web.HTTPNoContent)
+
+    # deleting the source keeps the shared objects
+    await _delete_project_data(src_project["uuid"])
+    src_objects = await storage_s3_client.list_files(
+        storage_s3_bucket, prefix=f"{src_project['uuid']}/"
+    )
+    assert len(src_objects) == num_src_files
+
+    # deleting the last reference removes them
+    await _delete_project_data(dst_project["uuid"])
+    assert not await storage_s3_client.list_files(
+        storage_s3_bucket, prefix=f"{src_project['uuid']}/"
+    )
+
+
 current_dir = Path(sys.argv[0] if __name__ == "__main__" else __file__).resolve().parent
 
 
@@ -20,7 +20,9 @@ from models_library.projects import ProjectID
 from models_library.projects_nodes import NodeID
 from models_library.projects_nodes_io import SimcoreS3FileID
 from pydantic import ByteSize, parse_obj_as
+from pytest_mock import MockerFixture
 from pytest_simcore.helpers.utils_parametrizations import byte_size_ids
+from servicelib.utils import logged_gather
 from simcore_service_storage.exceptions import (
     S3AccessError,
     S3BucketInvalidError,
@@ -586,15 +588,17 @@ async def test_delete_files_in_project_node(
                 assert s3_metadata.e_tag
 
     # now let's delete some files and check they are correctly deleted
-    await storage_s3_client.delete_files_in_project_node(
+    deleted_files = await storage_s3_client.delete_files_in_project_node(
         storage_s3_bucket, project_1, node_3
     )
+    assert deleted_files.num_files == 3
     await _assert_deleted(deleted_ids=(f"{project_1}/{node_3}",))
 
     # delete some stuff in project 2
-    await storage_s3_client.delete_files_in_project_node(
+    deleted_files = await storage_s3_client.delete_files_in_project_node(
         storage_s3_bucket, project_2, node_3
     )
+    assert deleted_files.num_files == 3
     await _assert_deleted(
         deleted_ids=(
             f"{project_1}/{node_3}",
@@ -603,9 +607,10 @@ async def test_delete_files_in_project_node(
     )
 
     # completely delete project 2
-    await storage_s3_client.delete_files_in_project_node(
+    deleted_files = await storage_s3_client.delete_files_in_project_node(
         storage_s3_bucket, project_2, None
     )
+    assert deleted_files.num_files == 6
     await _assert_deleted(
         deleted_ids=(
             f"{project_1}/{node_3}",
@@ -614,6 +619,38 @@ async def test_delete_files_in_project_node(
     )
 
 
+async def test_delete_files_in_project_node_with_many_files(
+    storage_s3_client: StorageS3Client,
+    storage_s3_bucket: S3BucketName,
+    faker: Faker,
+):
+    # S3 lists and deletes at most 1000 keys per call
+    NUM_FILES = 2345
+    FILE_CONTENT = b"some content"
+    project_id = uuid4()
+    node_id = uuid4()
+    await logged_gather(
+        *(
+            storage_s3_client.client.put_object(
+                Bucket=storage_s3_bucket,
+                Key=f"{project_id}/{node_id}/{i}_{faker.file_name()}",
+                Body=FILE_CONTENT,
+            )
+            for i in range(NUM_FILES)
+        ),
+        max_concurrency=50,
+    )
+
+    deleted_files = await storage_s3_client.delete_files_in_project_node(
+        storage_s3_bucket, project_id, None
+    )
+    assert deleted_files.num_files == NUM_FILES
+    assert deleted_files.total_size == NUM_FILES * len(FILE_CONTENT)
+    assert not await storage_s3_client.list_files(
+        storage_s3_bucket, prefix=f"{project_id}/"
+    )
+
+
 async def test_delete_files_in_project_node_invalid_raises(
     storage_s3_client: StorageS3Client,
     storage_s3_bucket: S3BucketName,
@@ -682,6 +719,37 @@ async def test_create_single_presigned_download_link_invalid_raises(
         )
 
 
+async def test_create_presigned_download_links(
+    storage_s3_client: StorageS3Client,
+    storage_s3_bucket: S3BucketName,
+    upload_file_single_presigned_link: Callable[..., Awaitable[SimcoreS3FileID]],
+    create_simcore_file_id: Callable[[ProjectID, NodeID, str], SimcoreS3FileID],
+    faker: Faker,
+):
+    file_ids = [await upload_file_single_presigned_link() for _ in range(3)]
+
+    presigned_urls = await storage_s3_client.create_presigned_download_links(
+        storage_s3_bucket, file_ids, expiration_secs=DEFAULT_EXPIRATION_SECS
+    )
+    assert set(presigned_urls) == set(file_ids)
+    async with ClientSession() as session:
+        for file_id, presigned_url in presigned_urls.items():
+            response = await session.get(presigned_url)
+            response.raise_for_status()
+            s3_metadata = await storage_s3_client.get_file_metadata(
+                storage_s3_bucket, file_id
+            )
+            assert len(await response.read()) == s3_metadata.size
+
+    wrong_file_id = create_simcore_file_id(uuid4(), uuid4(), faker.file_name())
+    with pytest.raises(S3KeyNotFoundError):
+        await storage_s3_client.create_presigned_download_links(
+            storage_s3_bucket,
+            [*file_ids, wrong_file_id],
+            expiration_secs=DEFAULT_EXPIRATION_SECS,
+        )
+
+
 @pytest.fixture
 async def upload_file_with_aioboto3_managed_transfer(
     storage_s3_client: StorageS3Client,
@@ -789,6 +857,84 @@ async def test_copy_file(
         assert s3_obj["Size"] == src_file.stat().st_size
 
 
+@pytest.mark.parametrize(
+    "file_size, is_multipart",
+    [
+        (parse_obj_as(ByteSize, "10Mib"), False),
+        (parse_obj_as(ByteSize, "220Mib"), True),
+    ],
+    ids=byte_size_ids,
+)
+async def test_copy_small_file_and_multipart(
+    file_size: ByteSize,
+    is_multipart: bool,
+    upload_file_with_aioboto3_managed_transfer: Callable[
+        [ByteSize], Awaitable[tuple[Path, SimcoreS3FileID]]
+    ],
+    storage_s3_client: StorageS3Client,
+    storage_s3_bucket: S3BucketName,
+    create_simcore_file_id: Callable[[ProjectID, NodeID, str], SimcoreS3FileID],
+    faker: Faker,
+):
+    src_file, src_file_uuid = await upload_file_with_aioboto3_managed_transfer(
+        file_size
+    )
+    dst_file_uuid = create_simcore_file_id(uuid4(), uuid4(), faker.file_name())
+    transfered_bytes = []
+    copy_fct = (
+        storage_s3_client.copy_file_multipart
+        if is_multipart
+        else storage_s3_client.copy_small_file
+    )
+    await copy_fct(
+        storage_s3_bucket,
+        src_file_uuid,
+        dst_file_uuid,
+        file_size,
+        bytes_transfered_cb=transfered_bytes.append,
+    )
+    assert sum(transfered_bytes) == file_size
+
+    dst_s3_metadata = await storage_s3_client.get_file_metadata(
+        storage_s3_bucket, dst_file_uuid
+    )
+    assert dst_s3_metadata.size == src_file.stat().st_size
+    if is_multipart:
+        # multipart uploads have an ETag of the form md5-numparts
+        assert "-" in dst_s3_metadata.e_tag
+    # no dangling multipart uploads
+    assert not await storage_s3_client.list_ongoing_multipart_uploads(storage_s3_bucket)
+
+
+async def test_copy_file_multipart_aborts_upload_when_cancelled(
+    mocker: MockerFixture,
+    upload_file_with_aioboto3_managed_transfer: Callable[
+        [ByteSize], Awaitable[tuple[Path, SimcoreS3FileID]]
+    ],
+    storage_s3_client: StorageS3Client,
+    storage_s3_bucket: S3BucketName,
+    create_simcore_file_id: Callable[[ProjectID, NodeID, str], SimcoreS3FileID],
+    faker: Faker,
+):
+    file_size = parse_obj_as(ByteSize, "220Mib")
+    _, src_file_uuid = await upload_file_with_aioboto3_managed_transfer(file_size)
+    dst_file_uuid = create_simcore_file_id(uuid4(), uuid4(), faker.file_name())
+    mocker.patch.object(
+        storage_s3_client.client,
+        "upload_part_copy",
+        side_effect=asyncio.CancelledError,
+    )
+    with pytest.raises(asyncio.CancelledError):
+        await storage_s3_client.copy_file_multipart(
+            storage_s3_bucket,
+            src_file_uuid,
+            dst_file_uuid,
+            file_size,
+            bytes_transfered_cb=None,
+        )
+    assert not await storage_s3_client.list_ongoing_multipart_uploads(storage_s3_bucket)
+
+
 async def test_copy_file_invalid_raises(
     upload_file_with_aioboto3_managed_transfer: Callable[
         [ByteSize], Awaitable[tuple[Path, SimcoreS3FileID]]
@@ -845,6 +991,45 @@ async def test_list_files(
     assert list_files[0].size == file.stat().st_size
 
 
+async def test_list_all_files(
+    storage_s3_client: StorageS3Client,
+    storage_s3_bucket: S3BucketName,
+    faker: Faker,
+):
+    async def _list_all_keys(prefix: str) -> list[str]:
+        return [
+            f.file_id
+            async for files in storage_s3_client.list_all_files(
+                storage_s3_bucket, prefix=prefix
+            )
+            for f in files
+        ]
+
+    assert await _list_all_keys(prefix="") == []
+
+    # S3 lists at most 1000 keys per call
+    NUM_FILES = 1010
+    project_id = faker.uuid4()
+    file_ids = [f"{project_id}/{faker.uuid4()}/{i}.txt" for i in range(NUM_FILES)]
+    await logged_gather(
+        *(
+            storage_s3_client.client.put_object(
+                Bucket=storage_s3_bucket, Key=file_id, Body=b""
+            )
+            for file_id in file_ids
+        ),
+        max_concurrency=50,
+    )
+
+    listed_keys = await _list_all_keys(prefix="")
+    assert len(listed_keys) == NUM_FILES
+    # keys are sorted in binary order
+    assert listed_keys == sorted(file_ids)
+    # test with prefix
+    selected_file_id = choice(file_ids)
+    assert await _list_all_keys(prefix=selected_file_id) == [selected_file_id]
+
+
 async def test_list_files_invalid_bucket_raises(
     storage_s3_client: StorageS3Client,
 ):
@@ -6,17 +6,20 @@ import asyncio
 import json
 import logging
 from contextlib import suppress
+from dataclasses import dataclass, field
 from pprint import pformat
-from typing import Optional
+from typing import Any, Final, Optional
 
 from aiohttp import web
 from aiopg.sa import Engine
 from aiopg.sa.connection import SAConnection
 from models_library.errors import ErrorDict
 from models_library.projects_state import RunningState
+from psycopg2.extensions import Notify
 from pydantic.types import PositiveInt
 from servicelib.aiohttp.application_keys import APP_DB_ENGINE_KEY
 from servicelib.logging_utils import log_decorator
+from servicelib.utils import logged_gather
 from simcore_postgres_database.webserver_models import DB_CHANNEL_NAME, projects
 from sqlalchemy.sql import select
 
@@ -26,6 +29,9 @@ from .projects.projects_nodes_utils import update_node_outputs
 
 log = logging.getLogger(__name__)
 
+_NOTIFICATIONS_BURST_WINDOW_S: Final[float] = 0.1
+_CONNECTION_CHECK_INTERVAL_S: Final[float] = 1
+
 
 @log_decorator(logger=log)
 async def _get_project_owner(conn: SAConnection, project_uuid: str) -> PositiveInt:
@@ -42,106 +48,194 @@ async def _update_project_state(
     app: web.Application,
     user_id: PositiveInt,
     project_uuid: str,
-    node_uuid: str,
-    new_state: RunningState,
-    node_errors: Optional[list[ErrorDict]],
+    nodes_states: dict[str, tuple[RunningState, Optional[list[ErrorDict]]]],
 ) -> None:
-    project = await projects_api.update_project_node_state(
-        app, user_id, project_uuid, node_uuid, new_state
+    project = await projects_api.update_project_nodes_states(
+        app,
+        user_id,
+        project_uuid,
+        {node_uuid: new_state for node_uuid, (new_state, _) in nodes_states.items()},
+    )
+    await projects_api.notify_project_nodes_update(
+        app,
+        project,
+        {
+            node_uuid: node_errors
+            for node_uuid, (_, node_errors) in nodes_states.items()
+        },
     )
-    await projects_api.notify_project_node_update(app, project, node_uuid, node_errors)
     await projects_api.notify_project_state_update(app, project)
 
 
-async def listen(app: web.Application, db_engine: Engine):
-    listen_query = f"LISTEN {DB_CHANNEL_NAME};"
-    _LISTENING_TASK_BASE_SLEEPING_TIME_S = 1
-    async with db_engine.acquire() as conn:
-        await conn.execute(listen_query)
+@dataclass
+class _NodeChanges:
+    task_data: dict[str, Any]
+    task_changes: set[str] = field(default_factory=set)
 
-        while True:
-            # NOTE: instead of using await get() we check first if the connection was closed
-            # since aiopg does not reset the await in such a case (if DB was restarted or so)
-            # see aiopg issue: https://github.com/aio-libs/aiopg/pull/559#issuecomment-826813082
-            if conn.closed:
-                raise ConnectionError("connection with database is closed!")
-            if conn.connection.notifies.empty():
-                await asyncio.sleep(_LISTENING_TASK_BASE_SLEEPING_TIME_S)
-                continue
-            notification = conn.connection.notifies.get_nowait()
-            log.debug(
-                "received update from database: %s", pformat(notification.payload)
-            )
-            # get the data and the info on what changed
-            payload: dict = json.loads(notification.payload)
 
-            # FIXME: all this should move to rabbitMQ instead of this
-            task_data = payload.get("data", {})
-            task_changes = payload.get("changes", [])
+def _parse_notification(
+    notification: Notify,
+) -> Optional[tuple[str, str, _NodeChanges]]:
+    log.debug("received update from database: %s", pformat(notification.payload))
+    # get the data and the info on what changed
+    payload: dict = json.loads(notification.payload)
 
-            if not task_data:
-                log.error("task data invalid: %s", pformat(payload))
-                continue
+    # FIXME: all this should move to rabbitMQ instead of this
+    task_data = payload.get("data", {})
+    task_changes = payload.get("changes", [])
 
-            if not task_changes:
-                log.error("no changes but still triggered: %s", pformat(payload))
-                continue
+    if not task_data:
+        log.error("task data invalid: %s", pformat(payload))
+        return None
 
-            project_uuid = task_data.get("project_id", "undefined")
-            node_uuid = task_data.get("node_id", "undefined")
+    if not task_changes:
+        log.error("no changes but still triggered: %s", pformat(payload))
+        return None
 
-            # FIXME: we do not know who triggered these changes. we assume the user had the rights to do so
-            # therefore we'll use the prj_owner user id. This should be fixed when the new sidecar comes in
-            # and comp_tasks/comp_pipeline get deprecated.
-            try:
-                # find the user(s) linked to that project
-                the_project_owner = await _get_project_owner(conn, project_uuid)
-
-                if any(f in task_changes for f in ["outputs", "run_hash"]):
-                    new_outputs = task_data.get("outputs", {})
-                    new_run_hash = task_data.get("run_hash", None)
-
-                    await update_node_outputs(
-                        app,
-                        the_project_owner,
-                        project_uuid,
-                        node_uuid,
-                        new_outputs,
-                        new_run_hash,
-                        node_errors=task_data.get("errors", None),
-                        ui_changed_keys=None,
-                    )
+    project_uuid = task_data.get("project_id", "undefined")
+    node_uuid = task_data.get("node_id", "undefined")
+    return project_uuid, node_uuid, _NodeChanges(task_data, set(task_changes))
 
-                if "state" in task_changes:
-                    new_state = convert_state_from_db(task_data["state"]).value
-                    await _update_project_state(
-                        app,
-                        the_project_owner,
-                        project_uuid,
-                        node_uuid,
-                        new_state,
-                        node_errors=task_data.get("errors", None),
-                    )
 
-            except projects_exceptions.ProjectNotFoundError as exc:
-                log.warning(
-                    "Project %s was not found and cannot be updated. Maybe was it deleted?",
-                    exc.project_uuid,
+def _group_by_project(
+    notifications: list[Notify],
+) -> dict[str, dict[str, _NodeChanges]]:
+    """a burst of notifications is reduced to the latest data of each node together
+    with all the changed columns"""
+    projects_changes: dict[str, dict[str, _NodeChanges]] = {}
+    for notification in notifications:
+        if parsed := _parse_notification(notification):
+            project_uuid, node_uuid, node_changes = parsed
+            nodes_changes = projects_changes.setdefault(project_uuid, {})
+            if previous_changes := nodes_changes.get(node_uuid):
+                node_changes.task_changes |= previous_changes.task_changes
+            nodes_changes[node_uuid] = node_changes
+    return projects_changes
+
+
+async def _update_node_outputs(
+    app: web.Application,
+    user_id: PositiveInt,
+    project_uuid: str,
+    node_uuid: str,
+    changes: _NodeChanges,
+) -> None:
+    try:
+        await update_node_outputs(
+            app,
+            user_id,
+            project_uuid,
+            node_uuid,
+            changes.task_data.get("outputs", {}),
+            changes.task_data.get("run_hash", None),
+            node_errors=changes.task_data.get("errors", None),
+            ui_changed_keys=None,
+        )
+    except projects_exceptions.NodeNotFoundError as exc:
+        log.warning(
+            "Node %s of project %s not found and cannot be updated. Maybe was it deleted?",
+            exc.node_uuid,
+            exc.project_uuid,
+        )
+
+
+async def _update_project_nodes(
+    app: web.Application,
+    conn: SAConnection,
+    project_uuid: str,
+    nodes_changes: dict[str, _NodeChanges],
+) -> None:
+    # FIXME: we do not know who triggered these changes. we assume the user had the rights to do so
+    # therefore we'll use the prj_owner user id. This should be fixed when the new sidecar comes in
+    # and comp_tasks/comp_pipeline get deprecated.
+    try:
+        # find the user(s) linked to that project
+        the_project_owner = await _get_project_owner(conn, project_uuid)
+
+        # NOTE: outputs of different nodes are patched concurrently (i.e. coalesced in the db layer)
+        # a node that cannot be updated does not prevent the others to be
+        await logged_gather(
+            *(
+                _update_node_outputs(
+                    app, the_project_owner, project_uuid, node_uuid, changes
                 )
-                continue
-            except projects_exceptions.ProjectOwnerNotFoundError as exc:
-                log.warning(
-                    "Project owner of project %s could not be found, is the project valid?",
-                    exc.project_uuid,
+                for node_uuid, changes in nodes_changes.items()
+                if changes.task_changes & {"outputs", "run_hash"}
+            ),
+            reraise=False,
+            log=log,
+        )
+
+        nodes_states = {
+            node_uuid: (
+                convert_state_from_db(changes.task_data["state"]).value,
+                changes.task_data.get("errors", None),
+            )
+            for node_uuid, changes in nodes_changes.items()
+            if "state" in changes.task_changes
+        }
+        while nodes_states:
+            try:
+                await _update_project_state(
+                    app, the_project_owner, project_uuid, nodes_states
                 )
-                continue
+                break
             except projects_exceptions.NodeNotFoundError as exc:
                 log.warning(
                     "Node %s of project %s not found and cannot be updated. Maybe was it deleted?",
                     exc.node_uuid,
                     exc.project_uuid,
                 )
-                continue
+                # the states of the other nodes are still updated
+                if nodes_states.pop(f"{exc.node_uuid}", None) is None:
+                    break
+
+    except projects_exceptions.ProjectNotFoundError as exc:
+        log.warning(
+            "Project %s was not found and cannot be updated. Maybe was it deleted?",
+            exc.project_uuid,
+        )
+    except projects_exceptions.ProjectOwnerNotFoundError as exc:
+        log.warning(
+            "Project owner of project %s could not be found, is the project valid?",
+            exc.project_uuid,
+        )
+
+
+async def _get_notification(conn: SAConnection) -> Notify:
+    while True:
+        # NOTE: the connection is checked regularly since aiopg might not wake up a waiting get()
+        # if the connection was closed (if DB was restarted or so)
+        # see aiopg issue: https://github.com/aio-libs/aiopg/pull/559#issuecomment-826813082
+        if conn.closed:
+            raise ConnectionError("connection with database is closed!")
+        with suppress(asyncio.TimeoutError):
+            return await asyncio.wait_for(
+                conn.connection.notifies.get(), timeout=_CONNECTION_CHECK_INTERVAL_S
+            )
+
+
+async def listen(app: web.Application, db_engine: Engine):
+    listen_query = f"LISTEN {DB_CHANNEL_NAME};"
+    async with db_engine.acquire() as conn:
+        await conn.execute(listen_query)
+        notifies = conn.connection.notifies
+
+        while True:
+            notifications = [await _get_notification(conn)]
+            # let a burst of notifications (e.g. a whole pipeline changing state) accumulate
+            await asyncio.sleep(_NOTIFICATIONS_BURST_WINDOW_S)
+            while not notifies.empty():
+                notifications.append(notifies.get_nowait())
+
+            for project_uuid, nodes_changes in _group_by_project(notifications).items():
+                try:
+                    await _update_project_nodes(app, conn, project_uuid, nodes_changes)
+                except Exception:  # pylint: disable=broad-except
+                    # one project shall not prevent the others to be updated
+                    log.exception(
+                        "Unexpected error while updating project %s", project_uuid
+                    )
 
 
 async def comp_tasks_listening_task(app: web.Application) -> None:
@@ -1,5 +1,6 @@
 import logging
 import time
+from collections import deque
 from operator import attrgetter
 
 from aiohttp import web
@@ -9,11 +10,13 @@ from servicelib.aiohttp.application_setup import ModuleCategory, app_module_setu
 from . import diagnostics_handlers
 from .diagnostics_healthcheck import (
     IncidentsRegistry,
+    SlowCallbacksRecorder,
     assert_healthy_app,
     kINCIDENTS_REGISTRY,
     kPLUGIN_START_TIME,
+    kSLOW_CALLBACKS_RECORDS,
 )
-from .diagnostics_monitoring import setup_monitoring
+from .diagnostics_monitoring import kSLOW_CALLBACKS_DURATION, setup_monitoring
 from .diagnostics_settings import DiagnosticsSettings, get_plugin_settings
 from .rest import HealthCheck
 
@@ -36,13 +39,34 @@ def setup_diagnostics(
     incidents_registry = IncidentsRegistry(order_by=attrgetter("delay_secs"))
     app[kINCIDENTS_REGISTRY] = incidents_registry
 
-    monitor_slow_callbacks.enable(
-        settings.DIAGNOSTICS_SLOW_DURATION_SECS, incidents_registry
-    )
-
     # adds middleware and /metrics
     setup_monitoring(app)
 
+    app[kSLOW_CALLBACKS_RECORDS] = deque(
+        maxlen=settings.DIAGNOSTICS_SLOW_CALLBACKS_MAX_RECORDS
+    )
+    slow_callbacks_recorder = SlowCallbacksRecorder(
+        incidents=incidents_registry,
+        last_records=app[kSLOW_CALLBACKS_RECORDS],
+        durations=app[kSLOW_CALLBACKS_DURATION],
+    )
+
+    if settings.DIAGNOSTICS_SLOW_CALLBACKS_PROFILING:
+        monitor_slow_callbacks.enable(
+            settings.DIAGNOSTICS_SLOW_DURATION_SECS, slow_callbacks_recorder
+        )
+    else:
+        sampler = monitor_slow_callbacks.enable_sampling(
+            settings.DIAGNOSTICS_SLOW_DURATION_SECS,
+            slow_callbacks_recorder,
+            sampling_interval_secs=settings.DIAGNOSTICS_SLOW_CALLBACKS_SAMPLING_INTERVAL,
+        )
+
+        async def _stop_sampler(_app: web.Application):
+            sampler.stop()
+
+        app.on_cleanup.append(_stop_sampler)
+
     # injects healthcheck
     healthcheck: HealthCheck = app[HealthCheck.__name__]
 
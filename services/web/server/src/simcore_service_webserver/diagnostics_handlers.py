@@ -6,6 +6,7 @@ import logging
 from contextlib import suppress
 from typing import Any, Dict
 
+import attr
 from aiohttp import ClientError, ClientSession, web
 from models_library.app_diagnostics import AppStatusCheck
 from servicelib.aiohttp.client_session import get_client_session
@@ -13,6 +14,7 @@ from servicelib.utils import logged_gather
 
 from . import catalog_client, db, director_v2_api, storage_api
 from ._meta import API_VERSION, APP_NAME, api_version_prefix
+from .diagnostics_healthcheck import kSLOW_CALLBACKS_RECORDS
 from .login.decorators import login_required
 from .security_decorators import permission_required
 from .utils import get_task_info, get_tracemalloc_info
@@ -32,7 +34,12 @@ async def get_app_diagnostics(request: web.Request):
     """
     # tasks in loop
     data: Dict[str, Any] = {
-        "loop_tasks": [get_task_info(task) for task in asyncio.all_tasks()]
+        "loop_tasks": [get_task_info(task) for task in asyncio.all_tasks()],
+        # last callbacks that blocked the loop
+        "slow_callbacks": [
+            attr.asdict(incident)
+            for incident in request.app.get(kSLOW_CALLBACKS_RECORDS, [])
+        ],
     }
 
     # allocated memory
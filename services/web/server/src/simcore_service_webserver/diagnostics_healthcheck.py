@@ -2,9 +2,10 @@ import logging
 import statistics
 import time
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Deque, List, Optional
 
 from aiohttp import web
+from prometheus_client import Histogram
 from servicelib.aiohttp.incidents import LimitedOrderedStack, SlowCallback
 
 from .diagnostics_settings import get_plugin_settings
@@ -14,6 +15,7 @@ log = logging.getLogger(__name__)
 
 # APP KEYS ---
 kINCIDENTS_REGISTRY = f"{__name__}.incidents_registry"
+kSLOW_CALLBACKS_RECORDS = f"{__name__}.slow_callbacks_records"
 kLAST_REQUESTS_AVG_LATENCY = f"{__name__}.last_requests_avg_latency"
 kMAX_AVG_RESP_LATENCY = f"{__name__}.max_avg_response_latency"
 kMAX_TASK_DELAY = f"{__name__}.max_task_delay"
@@ -29,6 +31,25 @@ class IncidentsRegistry(LimitedOrderedStack[SlowCallback]):
         return self.max_item.delay_secs if self else 0
 
 
+@dataclass
+class SlowCallbacksRecorder:
+    """
+    Receives the slow callbacks detected by monitor_slow_callbacks and
+    records them in the incidents registry (healthcheck), the last ones
+    (diagnostics) and the metrics
+    """
+
+    incidents: IncidentsRegistry
+    last_records: Deque[SlowCallback]
+    durations: Optional[Histogram] = None
+
+    def append(self, incident: SlowCallback):
+        self.incidents.append(incident)
+        self.last_records.append(incident)
+        if self.durations:
+            self.durations.observe(incident.delay_secs)
+
+
 @dataclass
 class DelayWindowProbe:
     """
@@ -5,6 +5,7 @@ import logging
 import time
 
 from aiohttp import web
+from prometheus_client import Histogram
 from servicelib.aiohttp import monitor_services
 from servicelib.aiohttp.monitoring import get_collector_registry
 from servicelib.aiohttp.monitoring import setup_monitoring as service_lib_setup
@@ -37,6 +38,7 @@ log = logging.getLogger(__name__)
 
 
 kSTART_TIME = f"{__name__}.start_time"
+kSLOW_CALLBACKS_DURATION = f"{__name__}.slow_callbacks_duration"
 
 
 async def enter_middleware_cb(request: web.Request):
@@ -64,6 +66,15 @@ def setup_monitoring(app: web.Application):
         app, get_collector_registry(app), _meta.APP_NAME
     )
 
+    app[kSLOW_CALLBACKS_DURATION] = Histogram(
+        name="slow_callbacks_duration_seconds",
+        documentation="Time the event loop was blocked by slow callbacks",
+        buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, float("inf")),
+        namespace="simcore",
+        subsystem=_meta.APP_NAME,
+        registry=get_collector_registry(app),
+    )
+
     # on-the fly stats
     app[kLATENCY_PROBE] = DelayWindowProbe()
 
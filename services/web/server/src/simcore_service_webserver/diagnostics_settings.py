@@ -1,8 +1,10 @@
 # pylint: disable=no-self-use
 # pylint: disable=no-self-argument
 
+from typing import Optional
+
 from aiohttp.web import Application
-from pydantic import Field, NonNegativeFloat, PositiveFloat, validator
+from pydantic import Field, NonNegativeFloat, PositiveFloat, PositiveInt, validator
 from servicelib.aiohttp.application_keys import APP_SETTINGS_KEY
 from settings_library.base import BaseCustomSettings
 
@@ -29,6 +31,24 @@ class DiagnosticsSettings(BaseCustomSettings):
 
     DIAGNOSTICS_START_SENSING_DELAY: NonNegativeFloat = 60.0
 
+    DIAGNOSTICS_SLOW_CALLBACKS_PROFILING: bool = Field(
+        False,
+        description=(
+            "Profiles every callback of the event loop to report the slow ones. "
+            "Adds a significant overhead, i.e. only for development. "
+            "Otherwise, callbacks are only timed and the slow ones are sampled"
+        ),
+    )
+
+    DIAGNOSTICS_SLOW_CALLBACKS_SAMPLING_INTERVAL: Optional[PositiveFloat] = Field(
+        None,
+        description="Period in seconds to sample the stack of blocking callbacks (defaults to half of DIAGNOSTICS_SLOW_DURATION_SECS)",
+    )
+
+    DIAGNOSTICS_SLOW_CALLBACKS_MAX_RECORDS: PositiveInt = Field(
+        50, description="Number of the last slow callbacks kept for the diagnostics"
+    )
+
     @validator("DIAGNOSTICS_MAX_TASK_DELAY", pre=True)
     @classmethod
     def validate_max_task_delay(cls, v, values):
@@ -1,7 +1,15 @@
+import asyncio
+import fnmatch
+import hashlib
 import logging
+import mimetypes
+import zipfile
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Tuple
+from typing import IO, Final, Iterable, Optional, Tuple
 
+from aiohttp import ClientSession, ClientTimeout
 from passlib import pwd
 from servicelib.archiving_utils import archive_dir, unarchive_dir
 
@@ -11,6 +19,9 @@ from .utils import rename
 
 log = logging.getLogger(__name__)
 
+_STREAMED_CHUNK_SIZE: Final[int] = 1024 * 1024
+_PREFETCHED_CHUNKS: Final[int] = 8
+
 
 def _get_random_chars(length: int) -> str:
     return pwd.genword(entropy=52, charset="hex")[:length]
@@ -85,6 +96,187 @@ async def zip_folder(folder_to_zip: Path, destination_folder: Path) -> Path:
     return osparc_formatted_name
 
 
+class _HashingWriter:
+    """Write-only and non-seekable file object computing the digest of what is written
+
+    Since it cannot seek, zipfile never rewrites what was already written (it
+    uses data descriptors instead), therefore the digest is the one of the archive
+    """
+
+    def __init__(self, fp: IO[bytes], algorithm: Algorithm) -> None:
+        self._fp = fp
+        self._hash = hashlib.new(algorithm.name.lower())
+        self._written_bytes = 0
+
+    def write(self, data) -> int:
+        self._hash.update(data)
+        self._written_bytes += len(data)
+        return self._fp.write(data)
+
+    def tell(self) -> int:
+        return self._written_bytes
+
+    def flush(self) -> None:
+        self._fp.flush()
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+def _get_compression(
+    file_name: str, compression_levels: dict[str, int]
+) -> Tuple[int, Optional[int]]:
+    """returns the zipfile compression and compression level of file_name"""
+    mime_type, encoding = mimetypes.guess_type(file_name)
+    if encoding:
+        # e.g. gzip, nothing to gain by compressing it again
+        return zipfile.ZIP_STORED, None
+
+    mime_type = mime_type or "application/octet-stream"
+    level = next(
+        (
+            level
+            for pattern, level in compression_levels.items()
+            if fnmatch.fnmatch(mime_type, pattern)
+        ),
+        None,
+    )
+    if level == 0:
+        return zipfile.ZIP_STORED, None
+    return zipfile.ZIP_DEFLATED, level
+
+
+async def _download_chunks(
+    download_link: str,
+    session: ClientSession,
+    timeout: ClientTimeout,
+    chunks: asyncio.Queue,
+) -> None:
+    """downloads the file chunk by chunk into chunks, followed by None or the error"""
+    try:
+        async with session.get(download_link, timeout=timeout) as response:
+            response.raise_for_status()
+            async for chunk in response.content.iter_chunked(_STREAMED_CHUNK_SIZE):
+                await chunks.put(chunk)
+        await chunks.put(None)
+    except Exception as e:  # pylint: disable=broad-except
+        await chunks.put(e)
+
+
+async def _write_to_archive(
+    zip_file: zipfile.ZipFile, file_name_in_archive: str, chunks: asyncio.Queue
+) -> None:
+    event_loop = asyncio.get_event_loop()
+    # NOTE: the size is not known in advance
+    archive_entry = await event_loop.run_in_executor(
+        None, partial(zip_file.open, file_name_in_archive, "w", force_zip64=True)
+    )
+    try:
+        while (chunk := await chunks.get()) is not None:
+            if isinstance(chunk, Exception):
+                raise ExporterException(
+                    f"Could not download {file_name_in_archive} into the archive: {chunk}"
+                ) from chunk
+            # the next chunks are downloaded while this one is compressed and written
+            await event_loop.run_in_executor(None, archive_entry.write, chunk)
+    finally:
+        await event_loop.run_in_executor(None, archive_entry.close)
+
+
+async def zip_folder_and_storage_files(
+    folder_to_zip: Path,
+    destination_folder: Path,
+    storage_files: Iterable[Tuple[Path, str]],
+    session: ClientSession,
+    compression_levels: dict[str, int],
+    download_timeout: ClientTimeout,
+    max_concurrent_downloads: int,
+) -> Path:
+    """Zips a folder together with the storage files and returns the path to the new archive
+
+    storage_files: path in folder_to_zip and download link of the files which are
+    downloaded straight into the archive, i.e. they are never saved on disk.
+    The storage files are written one after the other, while the next ones
+    (up to max_concurrent_downloads files) are already being downloaded. At most
+    _PREFETCHED_CHUNKS chunks of each of these files are kept in memory.
+    The checksum of the archive is computed while it is written.
+    """
+
+    archived_file = destination_folder / "archive.zip"
+    if archived_file.is_file():
+        raise ExporterException(
+            f"Cannot archive '{folder_to_zip}' because '{str(archived_file)}' already exists"
+        )
+
+    event_loop = asyncio.get_event_loop()
+    folder_files = await event_loop.run_in_executor(
+        None, lambda: [p for p in folder_to_zip.rglob("*") if p.is_file()]
+    )
+    storage_files = list(storage_files)
+    downloads: list[tuple[asyncio.Task, asyncio.Queue]] = []
+
+    def _start_download(download_link: str) -> None:
+        chunks: asyncio.Queue = asyncio.Queue(maxsize=_PREFETCHED_CHUNKS)
+        downloads.append(
+            (
+                asyncio.create_task(
+                    _download_chunks(download_link, session, download_timeout, chunks)
+                ),
+                chunks,
+            )
+        )
+
+    try:
+        with archived_file.open("wb") as archive_fp:
+            hashing_writer = _HashingWriter(archive_fp, Algorithm.SHA256)
+            zip_file = zipfile.ZipFile(hashing_writer, "w")  # type: ignore
+            try:
+                for file_path in folder_files:
+                    zip_file.compression, zip_file.compresslevel = _get_compression(
+                        file_path.name, compression_levels
+                    )
+                    await event_loop.run_in_executor(
+                        None,
+                        zip_file.write,
+                        file_path,
+                        f"{file_path.relative_to(folder_to_zip)}",
+                    )
+                for _, download_link in storage_files[:max_concurrent_downloads]:
+                    _start_download(download_link)
+                for index, (file_path, _) in enumerate(storage_files):
+                    zip_file.compression, zip_file.compresslevel = _get_compression(
+                        file_path.name, compression_levels
+                    )
+                    await _write_to_archive(
+                        zip_file,
+                        f"{file_path.relative_to(folder_to_zip)}",
+                        downloads[index][1],
+                    )
+                    if (next_index := index + max_concurrent_downloads) < len(
+                        storage_files
+                    ):
+                        _start_download(storage_files[next_index][1])
+            finally:
+                for download, _ in downloads:
+                    download.cancel()
+                await asyncio.gather(
+                    *(download for download, _ in downloads), return_exceptions=True
+                )
+                # writes the central directory
+                await event_loop.run_in_executor(None, zip_file.close)
+    except BaseException:
+        archived_file.unlink(missing_ok=True)
+        raise
+
+    # opsarc_formatted_name= "4_rand_chars#sha256_sum.osparc"
+    osparc_formatted_name = Path(folder_to_zip) / _get_osparc_export_name(
+        sha256_sum=hashing_writer.hexdigest(), algorithm=Algorithm.SHA256
+    )
+    await rename(archived_file, osparc_formatted_name)
+
+    return osparc_formatted_name
+
+
 async def unzip_folder(archive_to_extract: Path, destination_folder: Path) -> Path:
     try:
         await unarchive_dir(
@@ -100,3 +292,55 @@ async def unzip_folder(archive_to_extract: Path, destination_folder: Path) -> Pa
         raise ExporterException(message) from e
 
     return search_for_unzipped_path(destination_folder)
+
+
+@dataclass(frozen=True)
+class ImportArchive:
+    """Uploaded archive from which the storage files are read instead of being extracted"""
+
+    path: Path
+    # where the other files of the archive were extracted
+    extracted_to: Path
+
+    def get_entry_name(self, extracted_path: Path) -> str:
+        """name of the archive entry which would be extracted to extracted_path"""
+        return extracted_path.relative_to(self.extracted_to).as_posix()
+
+
+def _extract_all_but_directory(
+    archive_to_extract: Path, destination_folder: Path, excluded_dir_name: str
+) -> None:
+    with zipfile.ZipFile(archive_to_extract) as zip_file:
+        zip_file.extractall(
+            destination_folder,
+            members=[
+                entry
+                for entry in zip_file.infolist()
+                if excluded_dir_name not in Path(entry.filename).parts[:-1]
+            ],
+        )
+
+
+async def unzip_folder_without_directory(
+    archive_to_extract: Path, destination_folder: Path, excluded_dir_name: str
+) -> Path:
+    """Same as unzip_folder but the entries inside any directory named
+    excluded_dir_name are not extracted (e.g. the storage files, which are uploaded
+    straight from the archive)"""
+    try:
+        await asyncio.get_event_loop().run_in_executor(
+            None,
+            _extract_all_but_directory,
+            archive_to_extract,
+            destination_folder,
+            excluded_dir_name,
+        )
+    except (zipfile.BadZipFile, OSError) as e:
+        message = (
+            f"There was an error while extracting '{archive_to_extract}' directory to "
+            f"'{destination_folder}'"
+        )
+        log.exception(message)
+        raise ExporterException(message) from e
+
+    return search_for_unzipped_path(destination_folder)
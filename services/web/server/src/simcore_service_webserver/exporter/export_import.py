@@ -1,15 +1,27 @@
 import logging
 import urllib.parse
 from pathlib import Path
+from typing import Optional
 
 import aiofiles
-from aiohttp import web
+from aiohttp import ClientTimeout, web
 from aiohttp.web_request import FileField
-
-from .archiving import unzip_folder, validate_osparc_import_name, zip_folder
+from servicelib.aiohttp.client_session import get_client_session
+from servicelib.aiohttp.long_running_tasks.server import TaskProgress
+
+from .archiving import (
+    ImportArchive,
+    unzip_folder_without_directory,
+    validate_osparc_import_name,
+    zip_folder,
+    zip_folder_and_storage_files,
+)
 from .async_hashing import checksum
 from .exceptions import ExporterException
 from .formatters import BaseFormatter, FormatterV2, validate_manifest
+from .formatters.models import LinkAndPath2
+from .settings import get_plugin_settings
+from .utils import makedirs, remove_dir
 
 log = logging.getLogger(__name__)
 
@@ -30,6 +42,10 @@ async def study_export(
     returns: directory if archive is True else a compressed archive is returned
     """
 
+    exporter_settings = get_plugin_settings(app)
+    # when archiving, the storage files can be downloaded straight into the archive
+    stream_storage_files = archive and exporter_settings.EXPORTER_STREAM_STORAGE_FILES
+
     # storage area for the project data
     base_temp_dir = Path(tmp_dir)
     destination = base_temp_dir / project_id
@@ -37,14 +53,35 @@ async def study_export(
 
     # The formatter will always be chosen to be the highest availabel version
     formatter = formatter_class(root_folder=destination)
-    await formatter.format_export_directory(
-        app=app, project_id=project_id, user_id=user_id, product_name=product_name
+    download_links = await formatter.format_export_directory(
+        app=app,
+        project_id=project_id,
+        user_id=user_id,
+        product_name=product_name,
+        download_files=not stream_storage_files,
     )
 
     if archive is False:
         # returns the path to the temporary directory containing the study data
         return destination
 
+    if stream_storage_files:
+        return await zip_folder_and_storage_files(
+            folder_to_zip=base_temp_dir,
+            destination_folder=base_temp_dir,
+            storage_files=[
+                (link.storage_path_to_file, f"{link.download_link}")
+                for link in download_links
+            ],
+            session=get_client_session(app),
+            compression_levels=exporter_settings.EXPORTER_COMPRESSION_LEVELS,
+            download_timeout=ClientTimeout(
+                total=exporter_settings.EXPORTER_DOWNLOADER_MAX_TIMEOUT_SECONDS,
+                sock_read=exporter_settings.EXPORTER_DOWNLOADER_SOCK_READ_TIMEOUT_SECONDS,
+            ),
+            max_concurrent_downloads=exporter_settings.EXPORTER_STREAM_MAX_CONCURRENT_DOWNLOADS,
+        )
+
     # an archive is always produced when compression is active
     archive_path = await zip_folder(
         folder_to_zip=base_temp_dir, destination_folder=base_temp_dir
@@ -60,11 +97,18 @@ async def study_import(
     user_id: int,
     product_name: str,
     chunk_size: int = 2**16,
+    task_progress: Optional[TaskProgress] = None,
 ) -> str:
     """
     Creates a project from a given exported project and returns
     the imported project's uuid.
+
+    Only the project's data is extracted from the archive, the files are
+    uploaded to storage straight from it. If EXPORTER_IMPORT_CHECKPOINTS_DIR is set,
+    importing again an archive which failed while uploading, resumes the import.
     """
+    exporter_settings = get_plugin_settings(app)
+
     # Storing file to disk
     base_temp_dir = Path(temp_dir)
     upload_file_name = base_temp_dir / "uploaded.zip"
@@ -94,15 +138,37 @@ async def study_import(
             f"{digest_from_filename}, upload_digest={upload_digest}"
         )
 
-    unzipped_root_folder = await unzip_folder(
-        archive_to_extract=upload_file_name, destination_folder=base_temp_dir
+    unzipped_root_folder = await unzip_folder_without_directory(
+        archive_to_extract=upload_file_name,
+        destination_folder=base_temp_dir,
+        # pylint: disable=protected-access
+        excluded_dir_name=f"{LinkAndPath2._FILES_DIRECTORY}",
     )
 
+    checkpoint_dir: Optional[Path] = None
+    if exporter_settings.EXPORTER_IMPORT_CHECKPOINTS_DIR:
+        checkpoint_dir = (
+            exporter_settings.EXPORTER_IMPORT_CHECKPOINTS_DIR
+            / f"{user_id}"
+            / f"{algorithm.name}={upload_digest}"
+        )
+        await makedirs(checkpoint_dir, exist_ok=True)
+
     formatter: BaseFormatter = await validate_manifest(unzipped_root_folder)
-    return await formatter.validate_and_import_directory(
-        app=app, user_id=user_id, product_name=product_name
+    imported_project_uuid = await formatter.validate_and_import_directory(
+        app=app,
+        user_id=user_id,
+        product_name=product_name,
+        archive=ImportArchive(path=upload_file_name, extracted_to=base_temp_dir),
+        checkpoint_dir=checkpoint_dir,
+        task_progress=task_progress,
+        max_concurrent_uploads=exporter_settings.EXPORTER_IMPORT_MAX_CONCURRENT_UPLOADS,
     )
 
+    if checkpoint_dir:
+        await remove_dir(f"{checkpoint_dir}")
+    return imported_project_uuid
+
 
 async def study_duplicate(
     app: web.Application, user_id: int, product_name: str, exported_project_path: Path
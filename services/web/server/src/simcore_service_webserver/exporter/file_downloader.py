@@ -35,7 +35,7 @@ class ParallelDownloader:
         results = await self.downloader.run_download(
             timeouts={
                 "total": exporter_settings.EXPORTER_DOWNLOADER_MAX_TIMEOUT_SECONDS,
-                "sock_read": 90,  # default as in parfive code
+                "sock_read": exporter_settings.EXPORTER_DOWNLOADER_SOCK_READ_TIMEOUT_SECONDS,
             }
         )
 
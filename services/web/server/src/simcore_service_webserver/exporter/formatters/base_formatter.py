@@ -2,9 +2,12 @@
 
 from abc import abstractmethod
 from pathlib import Path
+from typing import Deque
 
 from aiohttp import web
 
+from .models import LinkAndPath2
+
 
 class BaseFormatter:
     def __init__(self, version: str, root_folder: Path):
@@ -14,9 +17,12 @@ class BaseFormatter:
     @abstractmethod
     async def format_export_directory(
         self, app: web.Application, project_id: str, user_id: int, **kwargs
-    ) -> None:
+    ) -> Deque[LinkAndPath2]:
         """Creates the output format given the current version
-        and saves all data to the relative path."""
+        and saves all data to the relative path.
+
+        If download_files=False is passed, the files from the storage
+        services are not saved and their download links are returned"""
 
     @abstractmethod
     async def validate_and_import_directory(self, **kwargs) -> str:
@@ -1,16 +1,20 @@
+import asyncio
 import datetime
 import json
 import logging
 import traceback
+import zipfile
 from collections import deque
+from contextlib import ExitStack
 from itertools import chain
 from pathlib import Path
 from typing import Deque, Optional
 from uuid import UUID
 
+import aiofiles.os
 from aiohttp import ClientError, ClientSession, ClientTimeout, web
 from models_library.api_schemas_storage import ETag, LinkType
-from models_library.projects import AccessRights, Project
+from models_library.projects import AccessRights, Project, ProjectID
 from models_library.projects_nodes_io import (
     BaseFileLink,
     LocationID,
@@ -20,14 +24,16 @@ from models_library.projects_nodes_io import (
 )
 from models_library.users import UserID
 from models_library.utils.nodes import compute_node_hash, project_node_io_payload_cb
-from pydantic import AnyUrl, parse_obj_as
+from pydantic import AnyUrl, ValidationError, parse_obj_as
 from servicelib.aiohttp.client_session import get_client_session
+from servicelib.aiohttp.long_running_tasks.server import TaskProgress
 from servicelib.utils import logged_gather
 from simcore_sdk.node_ports_common.exceptions import (
     NodeportsException,
     S3InvalidPathError,
     StorageInvalidCall,
 )
+from simcore_sdk.node_ports_common.file_io_utils import UploadableFileObject
 from simcore_sdk.node_ports_common.filemanager import (
     get_download_link_from_s3,
     upload_file,
@@ -40,13 +46,20 @@ from simcore_sdk.node_ports_common.storage_client import (
 from ...director_v2_api import create_or_update_pipeline
 from ...projects.projects_api import get_project_for_user, submit_delete_project_task
 from ...projects.projects_db import APP_PROJECT_DBAPI, ProjectDBAPI
-from ...projects.projects_exceptions import ProjectsException
+from ...projects.projects_exceptions import ProjectNotFoundError, ProjectsException
 from ...users_api import get_user
 from ...utils import now_str
+from ..archiving import ImportArchive
 from ..exceptions import ExporterException
 from ..file_downloader import ParallelDownloader
 from .base_formatter import BaseFormatter
-from .models import LinkAndPath2, ManifestFile, ProjectFile, ShuffledData
+from .models import (
+    ImportCheckpointFile,
+    LinkAndPath2,
+    ManifestFile,
+    ProjectFile,
+    ShuffledData,
+)
 
 UPLOAD_HTTP_TIMEOUT = 60 * 60  # 1 hour
 
@@ -145,7 +158,12 @@ async def generate_directory_contents(
     project_id: str,
     user_id: int,
     version: str,
-) -> None:
+    download_files: bool = True,
+) -> Deque[LinkAndPath2]:
+    """
+    If download_files is False the files from storage services are not
+    downloaded, their links are returned to be downloaded by the caller
+    """
     try:
         project_data = await get_project_for_user(
             app=app,
@@ -163,8 +181,9 @@ async def generate_directory_contents(
         app=app, dir_path=root_folder, project_id=project_id, user_id=user_id
     )
 
-    # make sure all files from storage services are persisted on disk
-    await download_all_files_from_storage(app=app, download_links=download_links)
+    if download_files:
+        # make sure all files from storage services are persisted on disk
+        await download_all_files_from_storage(app=app, download_links=download_links)
 
     # store manifest on disk
     manifest_params = dict(
@@ -178,20 +197,23 @@ async def generate_directory_contents(
     # store project data on disk
     await ProjectFile.model_to_file(root_dir=root_folder, **project_data)
 
+    return download_links
+
 
 async def upload_file_to_storage(
     link_and_path: LinkAndPath2,
     user_id: int,
     session: ClientSession,
+    file_to_upload: Optional[UploadableFileObject] = None,
 ) -> tuple[LinkAndPath2, ETag]:
-
+    """Uploads the file in storage_path_to_file or, if given, file_to_upload"""
     try:
         _, e_tag = await upload_file(
             user_id=user_id,
             store_id=link_and_path.storage_type,
             store_name=None,
             s3_object=link_and_path.relative_path_to_file,
-            file_to_upload=link_and_path.storage_path_to_file,
+            file_to_upload=file_to_upload or link_and_path.storage_path_to_file,
             client_session=session,
             io_log_redirect_cb=None,
         )
@@ -207,7 +229,11 @@ async def upload_file_to_storage(
 
 
 async def add_new_project(
-    app: web.Application, project: Project, user_id: int, product_name: str
+    app: web.Application,
+    project: Project,
+    user_id: int,
+    product_name: str,
+    hidden: bool = False,
 ):
     # TODO: move this to projects_api
     # TODO: this piece was taking fromt the end of projects.projects_handlers.create_projects
@@ -221,7 +247,11 @@ async def add_new_project(
 
     # update metadata (uuid, timestamps, ownership) and save
     _project_db: dict = await db.add_project(
-        project_in, user_id, force_as_template=False, product_name=product_name
+        project_in,
+        user_id,
+        force_as_template=False,
+        product_name=product_name,
+        hidden=hidden,
     )
     if _project_db["uuid"] != str(project.uuid):
         raise ExporterException("Project uuid dose nto match after validation")
@@ -304,13 +334,25 @@ async def _upload_files_to_storage(
     root_folder: Path,
     manifest_file: ManifestFile,
     shuffled_data: ShuffledData,
+    *,
+    archive: Optional[ImportArchive] = None,
+    checkpoint: Optional[ImportCheckpointFile] = None,
+    task_progress: Optional[TaskProgress] = None,
+    max_concurrency: int = 2,
 ) -> list[tuple[LinkAndPath2, ETag]]:
-    # check all attachments are present
-    client_timeout = ClientTimeout(  # type: ignore
-        total=UPLOAD_HTTP_TIMEOUT, connect=None, sock_connect=5
-    )
-    async with ClientSession(timeout=client_timeout) as session:
-        run_in_parallel = deque()
+    """
+    - If archive is given, the files are read from it instead of from root_folder
+    - The attachments in the checkpoint are not uploaded again, the checkpoint
+    is saved after each uploaded file
+    """
+    links_to_new_e_tags: list[tuple[LinkAndPath2, ETag]] = []
+    with ExitStack() as stack:
+        zip_file: Optional[zipfile.ZipFile] = (
+            stack.enter_context(zipfile.ZipFile(archive.path)) if archive else None
+        )
+
+        # check all attachments are present
+        to_upload: list[tuple[str, LinkAndPath2, Optional[zipfile.ZipInfo]]] = []
         for attachment in manifest_file.attachments:
             attachment_parts = attachment.split("/")
             link_and_path = LinkAndPath2(
@@ -321,39 +363,163 @@ async def _upload_files_to_storage(
                 ),
                 download_link=None,
             )
-            # check file exists
-            if not await link_and_path.is_file():
-                raise ExporterException(
-                    f"Could not find {link_and_path.storage_path_to_file} in import document"
+            archive_entry: Optional[zipfile.ZipInfo] = None
+            if zip_file:
+                assert archive  # nosec
+                try:
+                    archive_entry = zip_file.getinfo(
+                        archive.get_entry_name(link_and_path.storage_path_to_file)
+                    )
+                except KeyError as err:
+                    raise ExporterException(
+                        f"Could not find {link_and_path.storage_path_to_file} in import document"
+                    ) from err
+                await link_and_path.apply_shuffled_data(
+                    shuffled_data=shuffled_data, move_file=False
+                )
+            else:
+                # check file exists
+                if not await link_and_path.is_file():
+                    raise ExporterException(
+                        f"Could not find {link_and_path.storage_path_to_file} in import document"
+                    )
+                # apply shuffle data which will move the file and check again it exits
+                await link_and_path.apply_shuffled_data(shuffled_data=shuffled_data)
+                if not await link_and_path.is_file():
+                    raise ExporterException(
+                        f"Could not find {link_and_path.storage_path_to_file} after shuffling data"
+                    )
+
+            if checkpoint and attachment in checkpoint.uploaded_files:
+                log.debug("skipping %s, uploaded by a previous import", attachment)
+                links_to_new_e_tags.append(
+                    (link_and_path, checkpoint.uploaded_files[attachment])
+                )
+            else:
+                to_upload.append((attachment, link_and_path, archive_entry))
+
+        num_files = len(manifest_file.attachments)
+        num_uploaded_files = len(links_to_new_e_tags)
+        checkpoint_lock = asyncio.Lock()
+
+        async def _upload(
+            attachment: str,
+            link_and_path: LinkAndPath2,
+            archive_entry: Optional[zipfile.ZipInfo],
+        ) -> tuple[LinkAndPath2, ETag]:
+            nonlocal num_uploaded_files
+
+            if archive_entry is None:
+                link_and_e_tag = await upload_file_to_storage(
+                    link_and_path=link_and_path, user_id=user_id, session=session
                 )
-            # apply shuffle data which will move the file and check again it exits
-            await link_and_path.apply_shuffled_data(shuffled_data=shuffled_data)
-            if not await link_and_path.is_file():
-                raise ExporterException(
-                    f"Could not find {link_and_path.storage_path_to_file} after shuffling data"
+            else:
+                assert zip_file  # nosec
+                # NOTE: the entry is decompressed while it is uploaded, there is
+                # at most a chunk per concurrent upload in memory
+                file_object = await asyncio.get_event_loop().run_in_executor(
+                    None, zip_file.open, archive_entry
                 )
+                with file_object:
+                    link_and_e_tag = await upload_file_to_storage(
+                        link_and_path=link_and_path,
+                        user_id=user_id,
+                        session=session,
+                        file_to_upload=UploadableFileObject(
+                            file_object=file_object,
+                            file_name=Path(archive_entry.filename).name,
+                            file_size=archive_entry.file_size,
+                        ),
+                    )
+
+            if checkpoint:
+                async with checkpoint_lock:
+                    checkpoint.uploaded_files[attachment] = link_and_e_tag[1]
+                    await checkpoint.save()
+
+            num_uploaded_files += 1
+            if task_progress:
+                task_progress.update(
+                    message=f"uploaded {link_and_path.relative_path_to_file.name} "
+                    f"({num_uploaded_files}/{num_files} files)",
+                    percent=num_uploaded_files / num_files,
+                )
+            return link_and_e_tag
 
-            run_in_parallel.append(
-                upload_file_to_storage(
-                    link_and_path=link_and_path,
-                    user_id=user_id,
-                    session=session,
+        client_timeout = ClientTimeout(  # type: ignore
+            total=UPLOAD_HTTP_TIMEOUT, connect=None, sock_connect=5
+        )
+        async with ClientSession(timeout=client_timeout) as session:
+            links_to_new_e_tags.extend(
+                await logged_gather(
+                    *(_upload(*args) for args in to_upload),
+                    max_concurrency=max_concurrency,
                 )
             )
-        links_to_new_e_tags = await logged_gather(*run_in_parallel, max_concurrency=2)
 
     return links_to_new_e_tags
 
 
+async def _load_import_checkpoint(
+    app: web.Application, checkpoint_dir: Path, project_file: ProjectFile
+) -> Optional[ImportCheckpointFile]:
+    """returns the checkpoint of a previous import of the same archive if it can be resumed"""
+    # pylint: disable=protected-access
+    if not (checkpoint_dir / ImportCheckpointFile._RELATIVE_STORAGE_PATH).exists():
+        return None
+    try:
+        checkpoint = await ImportCheckpointFile.model_from_file(root_dir=checkpoint_dir)
+    except ValidationError:
+        log.warning("invalid import checkpoint in %s, ignoring it", checkpoint_dir)
+        return None
+
+    imported_project_uuid = checkpoint.shuffled_data.get(f"{project_file.uuid}")
+    if not imported_project_uuid:
+        log.warning("import checkpoint in %s is not for this project", checkpoint_dir)
+        return None
+
+    db: ProjectDBAPI = app[APP_PROJECT_DBAPI]
+    try:
+        await db.get_project_type(ProjectID(imported_project_uuid))
+    except ProjectNotFoundError:
+        log.warning(
+            "project of the import checkpoint in %s was removed, ignoring it",
+            checkpoint_dir,
+        )
+        return None
+    return checkpoint
+
+
+async def _remove_import_checkpoint(checkpoint: ImportCheckpointFile) -> None:
+    await aiofiles.os.remove(checkpoint.storage_path.path)
+
+
 async def import_files_and_validate_project(
     app: web.Application,
     user_id: int,
     product_name: str,
     root_folder: Path,
     manifest_root_folder: Optional[Path],
+    *,
+    archive: Optional[ImportArchive] = None,
+    checkpoint_dir: Optional[Path] = None,
+    task_progress: Optional[TaskProgress] = None,
+    max_concurrent_uploads: int = 2,
 ) -> str:
+    """
+    If checkpoint_dir is given, the import can be resumed: when uploading the files fails,
+    the (hidden) project and the uploaded files are kept and the next import with the
+    same checkpoint_dir only uploads the missing files
+    """
     project_file = await ProjectFile.model_from_file(root_dir=root_folder)
-    shuffled_data: ShuffledData = project_file.get_shuffled_uuids()
+
+    checkpoint: Optional[ImportCheckpointFile] = None
+    if checkpoint_dir:
+        checkpoint = await _load_import_checkpoint(app, checkpoint_dir, project_file)
+    is_resumed = checkpoint is not None
+    shuffled_data: ShuffledData = (
+        checkpoint.shuffled_data if checkpoint else project_file.get_shuffled_uuids()
+    )
 
     # replace shuffled_data in project
     # NOTE: there is no reason to write the shuffled data to file
@@ -396,29 +562,56 @@ async def import_files_and_validate_project(
     )
     project_uuid = str(project.uuid)
 
+    # NOTE: while uploading the files, the errors do not revert the import if it can be resumed
+    can_be_resumed = False
     try:
         await _remove_runtime_states(project)
-        await add_new_project(app, project, user_id, product_name)
+        if is_resumed:
+            log.info("resuming the import of project %s", project_uuid)
+        else:
+            # NOTE: the project is hidden until all its files are uploaded
+            await add_new_project(app, project, user_id, product_name, hidden=True)
+            if checkpoint_dir:
+                checkpoint = await ImportCheckpointFile.model_to_file(
+                    root_dir=checkpoint_dir, shuffled_data=shuffled_data
+                )
 
         # upload files to storage
+        can_be_resumed = checkpoint is not None
         links_to_new_e_tags = await _upload_files_to_storage(
             user_id=user_id,
             root_folder=root_folder,
             manifest_file=manifest_file,
             shuffled_data=shuffled_data,
+            archive=archive,
+            checkpoint=checkpoint,
+            task_progress=task_progress,
+            max_concurrency=max_concurrent_uploads,
         )
+        can_be_resumed = False
+
         # fix etags
         await _fix_file_e_tags(project, links_to_new_e_tags)
         # NOTE: first fix the file eTags, and then the run hashes
         await _fix_node_run_hashes_based_on_old_project(
             project, project_file, shuffled_data
         )
+        db: ProjectDBAPI = app[APP_PROJECT_DBAPI]
+        await db.set_hidden_flag(project.uuid, enabled=False)
     except Exception as e:
         log.warning(
             "The below error occurred during import\n%s", traceback.format_exc()
         )
+        if can_be_resumed:
+            log.warning(
+                "Keeping project %s, importing the same archive again resumes the import",
+                project_uuid,
+            )
+            raise e
+
         log.warning(
-            "Removing project %s, because there was an error while importing it."
+            "Removing project %s, because there was an error while importing it.",
+            project_uuid,
         )
         try:
             await submit_delete_project_task(
@@ -429,8 +622,12 @@ async def import_files_and_validate_project(
             log.exception(
                 "Could not find project %s while trying to revert actions", project_uuid
             )
+        if checkpoint:
+            await _remove_import_checkpoint(checkpoint)
         raise e
 
+    if checkpoint:
+        await _remove_import_checkpoint(checkpoint)
     return project_uuid
 
 
@@ -440,17 +637,18 @@ class FormatterV1(BaseFormatter):
 
     async def format_export_directory(
         self, app: web.Application, project_id: str, user_id: int, **kwargs
-    ) -> None:
+    ) -> Deque[LinkAndPath2]:
         # injected by Formatter_V2
         manifest_root_folder: Optional[Path] = kwargs.get("manifest_root_folder")
 
-        await generate_directory_contents(
+        return await generate_directory_contents(
             app=app,
             root_folder=self.root_folder,
             manifest_root_folder=manifest_root_folder,
             project_id=project_id,
             user_id=user_id,
             version=self.version,
+            download_files=kwargs.get("download_files", True),
         )
 
     async def validate_and_import_directory(self, **kwargs) -> str:
@@ -466,4 +664,8 @@ class FormatterV1(BaseFormatter):
             product_name=product_name,
             root_folder=self.root_folder,
             manifest_root_folder=manifest_root_folder,
+            archive=kwargs.get("archive"),
+            checkpoint_dir=kwargs.get("checkpoint_dir"),
+            task_progress=kwargs.get("task_progress"),
+            max_concurrent_uploads=kwargs.get("max_concurrent_uploads", 2),
         )
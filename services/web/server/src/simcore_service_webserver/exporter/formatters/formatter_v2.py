@@ -2,7 +2,7 @@ import asyncio
 import logging
 from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import Deque, Optional
 
 from aiohttp import web
 from aiopg.sa.engine import SAConnection
@@ -17,6 +17,7 @@ from ...scicrunch.db import ResearchResourceRepository
 from ..exceptions import ExporterException
 from .base_formatter import BaseFormatter
 from .formatter_v1 import FormatterV1
+from .models import LinkAndPath2
 from .sds import write_sds_directory_content
 from .sds.xlsx.templates.code_description import (
     CodeDescriptionModel,
@@ -189,14 +190,14 @@ class FormatterV2(BaseFormatter):
 
     async def format_export_directory(
         self, app: web.Application, project_id: str, user_id: int, **kwargs
-    ) -> None:
+    ) -> Deque[LinkAndPath2]:
         kwargs["manifest_root_folder"] = self.root_folder
 
         self.code_folder.mkdir(parents=True, exist_ok=True)
         formatter_v1 = FormatterV1(root_folder=self.code_folder, version=self.version)
 
         # generate structure for directory
-        await formatter_v1.format_export_directory(
+        download_links = await formatter_v1.format_export_directory(
             app=app, project_id=project_id, user_id=user_id, **kwargs
         )
         # extract data to pass to the rest
@@ -213,6 +214,8 @@ class FormatterV2(BaseFormatter):
 
         # continue filling up everuthing here
 
+        return download_links
+
     async def validate_and_import_directory(self, **kwargs) -> str:
         kwargs["manifest_root_folder"] = self.root_folder
 
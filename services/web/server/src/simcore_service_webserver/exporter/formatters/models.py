@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Callable, Optional, Union
 
 import aiofiles.os
+from models_library.api_schemas_storage import ETag
 from models_library.projects import Project
 from models_library.projects_nodes_io import LocationID, StorageFileID
 from models_library.projects_state import ProjectStatus
@@ -58,8 +59,14 @@ class LinkAndPath2(BaseModel):
         """Checks if the file was saved at the given link"""
         return self.storage_path_to_file.is_file()
 
-    async def apply_shuffled_data(self, shuffled_data: ShuffledData) -> None:
-        """Will replace paths on disk for the file and change the relative_path_to_file"""
+    async def apply_shuffled_data(
+        self, shuffled_data: ShuffledData, move_file: bool = True
+    ) -> None:
+        """Will replace paths on disk for the file and change the relative_path_to_file
+
+        If move_file is False, only relative_path_to_file is changed (e.g. the file is
+        not on disk but still in the imported archive)
+        """
         current_storage_path_to_file = self.storage_path_to_file
         relative_path_to_file_str = str(self.relative_path_to_file)
         for old_uuid, new_uuid in shuffled_data.items():
@@ -70,6 +77,9 @@ class LinkAndPath2(BaseModel):
             StorageFileID, relative_path_to_file_str
         )
 
+        if not move_file:
+            return
+
         # finally move file to new target path
         destination = self.storage_path_to_file
         await makedirs(destination.parent, exist_ok=True)
@@ -160,3 +170,26 @@ class ProjectFile(BaseLoadingModel, Project):
                 locked["status"] = ProjectStatus.CLOSED.value
 
         return v
+
+
+class ImportCheckpointFile(BaseLoadingModel):
+    """Progress of an import, saved after each file uploaded to storage
+
+    Importing again the same archive resumes the import with the same project
+    and only uploads the files which are not in uploaded_files
+    """
+
+    _RELATIVE_STORAGE_PATH: str = "import_checkpoint.json"
+
+    shuffled_data: ShuffledData = Field(
+        ..., description="mapping of the uuids in the archive to the imported ones"
+    )
+    uploaded_files: dict[str, ETag] = Field(
+        default_factory=dict,
+        description="attachments of the manifest already uploaded and their eTags",
+    )
+
+    async def save(self) -> None:
+        await self.storage_path.data_to_file(
+            self.json(exclude={"storage_path"}, by_alias=True)
+        )
@@ -1,9 +1,17 @@
+import asyncio
 import logging
 from tempfile import TemporaryDirectory
+from typing import Final
 
 from aiohttp import web
 from aiohttp.web_request import FileField
 from models_library.projects_state import ProjectStatus
+from servicelib.aiohttp.long_running_tasks.server import (
+    TaskProgress,
+    create_task_name_from_request,
+    get_tasks_manager,
+    start_task,
+)
 
 from .._constants import RQ_PRODUCT_KEY
 from ..login.decorators import RQT_USERID_KEY, login_required
@@ -18,6 +26,7 @@ from .settings import get_plugin_settings
 from .utils import CleanupFileResponse, get_empty_tmp_dir, remove_dir
 
 ONE_GB: int = 1024 * 1024 * 1024
+_IMPORT_TASK_POLL_INTERVAL_S: Final[float] = 1.0
 
 log = logging.getLogger(__name__)
 
@@ -31,9 +40,11 @@ async def export_project(request: web.Request):
     - inside this directory a new directory is generated with the uuid of the
     project `/tmp/SOME_TMP_DIR/uuid/`.
     - All contents from the project are written inside the `/tmp/SOME_TMP_DIR/uuid/`
-    directory (serialized data and storage files).
+    directory (serialized data and, unless EXPORTER_STREAM_STORAGE_FILES, storage files).
     - The `/tmp/SOME_TMP_DIR/uuid/` is zipped producing the archive to be downloaded
-    in this path `/tmp/SOME_TMP_DIR/some_name#SHA256=SOME_HASH.osparc`
+    in this path `/tmp/SOME_TMP_DIR/some_name#SHA256=SOME_HASH.osparc`. With
+    EXPORTER_STREAM_STORAGE_FILES the storage files are downloaded straight into the archive
+    and the hash is computed while the archive is written
     - When the request finishes, for any reason (HTTO_OK, HTTP_ERROR, etc...), the
     `/tmp/SOME_TMP_DIR/` si removed from the disk."""
     user_id = request[RQT_USERID_KEY]
@@ -107,18 +118,38 @@ async def import_project(request: web.Request):
 
     temp_dir: str = await get_empty_tmp_dir()
 
-    imported_project_uuid = await study_import(
+    # NOTE: the import runs as a long running task (with the same context as the
+    # ones of the user) so that its progress is available in the tasks API while
+    # this request waits for the result
+    tasks_manager = get_tasks_manager(request.app)
+    task_context = {RQT_USERID_KEY: user_id, RQ_PRODUCT_KEY: product_name}
+    task_id = start_task(
+        tasks_manager,
+        _import_study_task,
+        task_context=task_context,
+        task_name=create_task_name_from_request(request),
+        fire_and_forget=True,
         app=request.app,
         temp_dir=temp_dir,
         file_field=file_name_field,
         user_id=user_id,
         product_name=product_name,
     )
-    await remove_dir(directory=temp_dir)
+    try:
+        while not tasks_manager.get_task_status(task_id, task_context).done:
+            await asyncio.sleep(_IMPORT_TASK_POLL_INTERVAL_S)
+        imported_project_uuid = tasks_manager.get_task_result(task_id, task_context)
+    finally:
+        await tasks_manager.remove_task(task_id, task_context, reraise_errors=False)
+        await remove_dir(directory=temp_dir)
 
     return dict(uuid=imported_project_uuid)
 
 
+async def _import_study_task(task_progress: TaskProgress, **kwargs) -> str:
+    return await study_import(task_progress=task_progress, **kwargs)
+
+
 @login_required
 @permission_required("project.duplicate")
 async def duplicate_project(request: web.Request):
@@ -1,5 +1,8 @@
+from pathlib import Path
+from typing import Optional
+
 from aiohttp.web import Application
-from pydantic import Field, PositiveInt
+from pydantic import Field, PositiveInt, conint
 from servicelib.aiohttp.application_keys import APP_SETTINGS_KEY
 from settings_library.base import BaseCustomSettings
 
@@ -21,6 +24,80 @@ class ExporterSettings(BaseCustomSettings):
             "WEBSERVER_EXPORTER_DOWNLOADER_MAX_TIMEOUT_SECONDS",
         ],
     )
+    EXPORTER_DOWNLOADER_SOCK_READ_TIMEOUT_SECONDS: PositiveInt = Field(
+        90,  # default as in parfive code
+        description="maximum time without receiving data while downloading a file",
+        env=[
+            "EXPORTER_DOWNLOADER_SOCK_READ_TIMEOUT_SECONDS",
+            "WEBSERVER_EXPORTER_DOWNLOADER_SOCK_READ_TIMEOUT_SECONDS",
+        ],
+    )
+    EXPORTER_STREAM_STORAGE_FILES: bool = Field(
+        True,
+        description=(
+            "the files from storage are downloaded straight into the exported archive "
+            "instead of being saved on disk and archived afterwards"
+        ),
+        env=[
+            "EXPORTER_STREAM_STORAGE_FILES",
+            "WEBSERVER_EXPORTER_STREAM_STORAGE_FILES",
+        ],
+    )
+    EXPORTER_STREAM_MAX_CONCURRENT_DOWNLOADS: PositiveInt = Field(
+        4,
+        description=(
+            "number of storage files downloaded in parallel when streamed into the "
+            "exported archive, i.e. the next files are prefetched while one is written"
+        ),
+        env=[
+            "EXPORTER_STREAM_MAX_CONCURRENT_DOWNLOADS",
+            "WEBSERVER_EXPORTER_STREAM_MAX_CONCURRENT_DOWNLOADS",
+        ],
+    )
+    EXPORTER_COMPRESSION_LEVELS: dict[str, conint(ge=0, le=9)] = Field(
+        {
+            "image/gif": 0,
+            "image/jpeg": 0,
+            "image/png": 0,
+            "image/webp": 0,
+            "video/*": 0,
+            "audio/*": 0,
+            "application/zip": 0,
+            "*": 6,
+        },
+        description=(
+            "compression level of the streamed files in the exported archive by MIME type. "
+            "The first matching pattern is used, 0 stores the file without compression "
+            "(e.g. for already compressed formats)"
+        ),
+        env=[
+            "EXPORTER_COMPRESSION_LEVELS",
+            "WEBSERVER_EXPORTER_COMPRESSION_LEVELS",
+        ],
+    )
+    EXPORTER_IMPORT_MAX_CONCURRENT_UPLOADS: PositiveInt = Field(
+        4,
+        description="maximum number of files uploaded in parallel to storage while importing",
+        env=[
+            "EXPORTER_IMPORT_MAX_CONCURRENT_UPLOADS",
+            "WEBSERVER_EXPORTER_IMPORT_MAX_CONCURRENT_UPLOADS",
+        ],
+    )
+    EXPORTER_IMPORT_CHECKPOINTS_DIR: Optional[Path] = Field(
+        None,
+        description=(
+            "where the progress of the imports is saved. An import which failed while "
+            "uploading the files is resumed when the same archive is imported again "
+            "(by the same user and on the same replica). The progress of an import which "
+            "is never retried stays there, i.e. the folder must be cleaned up by the "
+            "deployment (e.g. a tmpfs or a volume with a retention policy). "
+            "If None (default), a failed import is reverted"
+        ),
+        env=[
+            "EXPORTER_IMPORT_CHECKPOINTS_DIR",
+            "WEBSERVER_EXPORTER_IMPORT_CHECKPOINTS_DIR",
+        ],
+    )
 
 
 def get_plugin_settings(app: Application) -> ExporterSettings:
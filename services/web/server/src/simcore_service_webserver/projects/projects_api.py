@@ -289,23 +289,32 @@ async def update_project_linked_product(
 async def update_project_node_state(
     app: web.Application, user_id: int, project_id: str, node_id: str, new_state: str
 ) -> dict:
+    return await update_project_nodes_states(
+        app, user_id, project_id, nodes_states={node_id: new_state}
+    )
+
+
+async def update_project_nodes_states(
+    app: web.Application, user_id: int, project_id: str, nodes_states: dict[str, str]
+) -> dict:
+    """Updates the current state of several nodes of a project in a single patch"""
     log.debug(
-        "updating node %s current state in project %s for user %s",
-        node_id,
+        "updating nodes current states in project %s for user %s: %s",
         project_id,
         user_id,
+        nodes_states,
     )
-    partial_workbench_data: dict[str, Any] = {
-        node_id: {"state": {"currentStatus": new_state}},
-    }
-    if RunningState(new_state) in [
-        RunningState.PUBLISHED,
-        RunningState.PENDING,
-        RunningState.STARTED,
-    ]:
-        partial_workbench_data[node_id]["progress"] = 0
-    elif RunningState(new_state) in [RunningState.SUCCESS, RunningState.FAILED]:
-        partial_workbench_data[node_id]["progress"] = 100
+    partial_workbench_data: dict[str, Any] = {}
+    for node_id, new_state in nodes_states.items():
+        partial_workbench_data[node_id] = {"state": {"currentStatus": new_state}}
+        if RunningState(new_state) in [
+            RunningState.PUBLISHED,
+            RunningState.PENDING,
+            RunningState.STARTED,
+        ]:
+            partial_workbench_data[node_id]["progress"] = 0
+        elif RunningState(new_state) in [RunningState.SUCCESS, RunningState.FAILED]:
+            partial_workbench_data[node_id]["progress"] = 100
 
     db: ProjectDBAPI = app[APP_PROJECT_DBAPI]
     updated_project, _ = await db.patch_user_project_workbench(
@@ -718,12 +727,12 @@ async def add_project_states_for_user(
         ):
             # get the running state
             running_state = computation_task.state
-            # get the nodes individual states
+            # get the nodes individual states (unless the workbench was not listed)
             for (
                 node_id,
                 node_state,
             ) in computation_task.pipeline_details.node_states.items():
-                prj_node = project["workbench"].get(str(node_id))
+                prj_node = project.get("workbench", {}).get(str(node_id))
                 if prj_node is None:
                     continue
                 node_state_dict = json.loads(
@@ -983,6 +992,15 @@ async def notify_project_node_update(
     node_id: str,
     errors: Optional[list[ErrorDict]],
 ) -> None:
+    await notify_project_nodes_update(app, project, nodes_errors={node_id: errors})
+
+
+async def notify_project_nodes_update(
+    app: web.Application,
+    project: dict,
+    nodes_errors: dict[str, Optional[list[ErrorDict]]],
+) -> None:
+    """Sends the updates of several nodes of a project in one message batch per room"""
     rooms_to_notify = [
         f"{gid}" for gid, rights in project["accessRights"].items() if rights["read"]
     ]
@@ -999,6 +1017,7 @@ async def notify_project_node_update(
                 "errors": errors,
             },
         }
+        for node_id, errors in nodes_errors.items()
     ]
 
     for room in rooms_to_notify:
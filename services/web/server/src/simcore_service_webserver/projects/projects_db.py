@@ -11,6 +11,7 @@ import uuid as uuidlib
 from collections import deque
 from contextlib import AsyncExitStack
 from copy import deepcopy
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any, Mapping, Optional, Union
@@ -31,6 +32,7 @@ from servicelib.json_serialization import json_dumps
 from simcore_postgres_database.models.projects_to_products import projects_to_products
 from simcore_postgres_database.webserver_models import ProjectType, projects
 from sqlalchemy import desc, func, literal_column
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.sql import and_, select
 
@@ -153,6 +155,129 @@ def _convert_to_schema_names(
     return converted_args
 
 
+def _list_projects_columns(
+    *, include_workbench: bool, filter_by_services: bool
+) -> list:
+    # NOTE: correlated subqueries are only evaluated for the rows in the page, i.e. after offset/limit
+    tags_subquery = (
+        sa.select(
+            [
+                sa.func.array_agg(
+                    aggregate_order_by(study_tags.c.tag_id, study_tags.c.tag_id)
+                )
+            ]
+        )
+        .where(study_tags.c.study_id == projects.c.id)
+        .scalar_subquery()
+    )
+    owner_email_subquery = (
+        sa.select([users.c.email])
+        .where(users.c.id == projects.c.prj_owner)
+        .scalar_subquery()
+    )
+    workbench_column = projects.c.workbench
+    if not include_workbench:
+        # NOTE: the workbench is only needed to filter by services the projects without product
+        workbench_column = (
+            sa.case(
+                [(projects_to_products.c.product_name == None, projects.c.workbench)],
+                else_=sa.null(),
+            ).label("workbench")
+            if filter_by_services
+            else None
+        )
+    return [
+        *(
+            workbench_column if c.name == "workbench" else c
+            for c in projects.columns
+            if c.name != "workbench" or workbench_column is not None
+        ),
+        tags_subquery.label("tags"),
+        owner_email_subquery.label("prj_owner_email"),
+    ]
+
+
+def _filter_valid_projects(db_projects: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    valid_projects = []
+    for prj in db_projects:
+        try:
+            ProjectAtDB.parse_obj(
+                prj if prj.get("workbench") is not None else {**prj, "workbench": {}}
+            )
+        except ValidationError as exc:
+            log.warning(
+                "project  %s  failed validation, please check. error: %s",
+                f"{prj['id']=}",
+                exc,
+            )
+            continue
+        valid_projects.append(prj)
+    return valid_projects
+
+
+def _get_owner_email(user_id: Optional[int], email: Optional[str]) -> str:
+    # SEE ProjectDBAPI._get_user_email
+    if not user_id:
+        return "not_a_user@unknown.com"
+    return email or "Unknown"
+
+
+@dataclass
+class _WorkbenchPatch:
+    partial_workbench_data: dict[str, Any]
+    result: asyncio.Future
+
+
+def _patched_workbench(node_patches: dict[str, dict[str, Any]]):
+    """SQL expression merging node_patches ({node_id: {key: new_value}}) into
+    the workbench column so that only the changed node entries are sent
+
+    NOTE: the order of the nodes in the workbench is kept, the keys
+    within a patched node are reordered (merged as jsonb)
+    """
+    node = (
+        sa.func.json_each(projects.c.workbench)
+        .table_valued("key", "value", with_ordinality="ordinality")
+        .alias("node")
+    )
+    node_patch = (
+        sa.func.jsonb_each(sa.literal(node_patches, JSONB))
+        .table_valued("key", "value")
+        .alias("node_patch")
+    )
+    patched_node = (
+        sa.select(
+            [
+                node.c.key,
+                sa.case(
+                    [(node_patch.c.value == None, node.c.value)],
+                    else_=sa.cast(
+                        sa.cast(node.c.value, JSONB).op("||")(node_patch.c.value),
+                        sa.JSON,
+                    ),
+                ).label("value"),
+            ]
+        )
+        .select_from(node.outerjoin(node_patch, node_patch.c.key == node.c.key))
+        # aggregates follow the order of the sorted subquery
+        .order_by(node.c.ordinality)
+        .subquery("patched_node")
+    )
+    return sa.select(
+        [sa.func.json_object_agg(patched_node.c.key, patched_node.c.value)]
+    ).scalar_subquery()
+
+
+def _fail_workbench_patches(patches: list[_WorkbenchPatch], exc: BaseException) -> None:
+    for patch in patches:
+        if patch.result.done():
+            continue
+        if isinstance(exc, asyncio.CancelledError):
+            patch.result.cancel()
+        else:
+            patch.result.set_exception(exc)
+
+
 def _assemble_array_groups(user_groups: list[RowProxy]) -> str:
     return (
         "array[]::text[]"
@@ -166,6 +291,10 @@ class ProjectDBAPI:
         # TODO: shall be a weak pointer since it is also contained by app??
         self._app = app
         self._engine = app.get(APP_DB_ENGINE_KEY)
+        self._pending_workbench_patches: dict[
+            tuple[str, int], list[_WorkbenchPatch]
+        ] = {}
+        self._workbench_patches_tasks: set[asyncio.Task] = set()
 
     def _init_engine(self):
         # Delays creation of engine because it setup_db does it on_startup
@@ -296,15 +425,29 @@ class ProjectDBAPI:
         filter_by_services: Optional[list[dict]] = None,
         only_published: Optional[bool] = False,
         include_hidden: Optional[bool] = False,
+        include_workbench: bool = True,
         offset: Optional[int] = 0,
         limit: Optional[int] = None,
     ) -> tuple[list[dict[str, Any]], list[ProjectType], int]:
+        """
+        NOTE: tags and owner's email are aggregated in the same query. Setting
+        include_workbench=False avoids transferring the (heavy) workbench column
+        unless it is needed to filter_by_services (i.e. only for projects without product)
+        """
 
         async with self.engine.acquire() as conn:
             user_groups: list[RowProxy] = await self.__load_user_groups(conn, user_id)
 
             query = (
-                sa.select([projects, projects_to_products.c.product_name])
+                sa.select(
+                    [
+                        *_list_projects_columns(
+                            include_workbench=include_workbench,
+                            filter_by_services=filter_by_services is not None,
+                        ),
+                        projects_to_products.c.product_name,
+                    ]
+                )
                 .select_from(projects.join(projects_to_products, isouter=True))
                 .where(
                     (
@@ -347,6 +490,7 @@ class ProjectDBAPI:
                 user_id,
                 user_groups,
                 filter_by_services=filter_by_services,
+                include_workbench=include_workbench,
             )
 
             return (
@@ -374,55 +518,45 @@ class ProjectDBAPI:
         user_id: int,
         user_groups: list[RowProxy],
         filter_by_services: Optional[list[dict]] = None,
+        include_workbench: bool = True,
     ) -> tuple[list[dict[str, Any]], list[ProjectType]]:
         api_projects: list[dict] = []  # API model-compatible projects
-        db_projects: list[dict] = []  # DB model-compatible projects
         project_types: list[ProjectType] = []
+
+        readable_projects: list[dict[str, Any]] = []
         async for row in conn.execute(query):
             try:
                 _check_project_permissions(row, user_id, user_groups, "read")
-
-                await asyncio.get_event_loop().run_in_executor(
-                    None, ProjectAtDB.from_orm, row
-                )
-
             except ProjectInvalidRightsError:
                 continue
+            readable_projects.append(dict(row.items()))
 
-            except ValidationError as exc:
-                log.warning(
-                    "project  %s  failed validation, please check. error: %s",
-                    f"{row.id=}",
-                    exc,
-                )
-                continue
-
-            prj: dict[str, Any] = dict(row.items())
-            prj.pop("product_name", None)
+        # NOTE: validates the whole page at once instead of one executor call per row
+        valid_projects = await asyncio.get_event_loop().run_in_executor(
+            None, _filter_valid_projects, readable_projects
+        )
 
+        for prj in valid_projects:
+            product_name = prj.pop("product_name", None)
             if (
                 filter_by_services is not None
-                and row[projects_to_products.c.product_name] is None
+                and product_name is None
                 and not await project_uses_available_services(prj, filter_by_services)
             ):
                 log.warning(
                     "Project %s will not be listed for user %s since it has no access rights"
                     " for one or more of the services that includes.",
-                    f"{row.id=}",
+                    f"{prj['id']=}",
                     f"{user_id=}",
                 )
                 continue
-            db_projects.append(prj)
+            if not include_workbench:
+                prj.pop("workbench", None)
 
-        # NOTE: DO NOT nest _get_tags_by_project in async loop above !!!
-        # FIXME: temporary avoids inner async loops issue https://github.com/aio-libs/aiopg/issues/535
-        for db_prj in db_projects:
-            db_prj["tags"] = await self._get_tags_by_project(
-                conn, project_id=db_prj["id"]
-            )
-            user_email = await self._get_user_email(conn, db_prj["prj_owner"])
-            api_projects.append(_convert_to_schema_names(db_prj, user_email))
-            project_types.append(db_prj["type"])
+            prj["tags"] = prj["tags"] or []
+            user_email = _get_owner_email(prj["prj_owner"], prj.pop("prj_owner_email"))
+            api_projects.append(_convert_to_schema_names(prj, user_email))
+            project_types.append(prj["type"])
 
         return (api_projects, project_types)
 
@@ -555,85 +689,188 @@ class ProjectDBAPI:
     ) -> tuple[dict[str, Any], dict[str, Any]]:
         """patches an EXISTING project from a user
         new_project_data only contains the entries to modify
+
+        NOTE: a patch is written right away, unless another one of the same
+        project (and user) is being written. Patches arriving meanwhile are then
+        written together in a single update afterwards
         """
         log.info("Patching project %s for user %s", project_uuid, user_id)
+        patch = _WorkbenchPatch(
+            partial_workbench_data=partial_workbench_data,
+            result=asyncio.get_event_loop().create_future(),
+        )
+        batch_key = (project_uuid, user_id)
+        if (batch := self._pending_workbench_patches.get(batch_key)) is not None:
+            batch.append(patch)
+        else:
+            self._pending_workbench_patches[batch_key] = [patch]
+            task = asyncio.create_task(
+                self._flush_workbench_patches(user_id, project_uuid),
+                name=f"patch_workbench_{project_uuid=}_{user_id=}",
+            )
+            self._workbench_patches_tasks.add(task)
+            task.add_done_callback(
+                lambda task: self._on_workbench_patches_flushed(task, batch_key)
+            )
+        return await patch.result
+
+    def _on_workbench_patches_flushed(
+        self, task: asyncio.Task, batch_key: tuple[str, int]
+    ) -> None:
+        self._workbench_patches_tasks.discard(task)
+        if task.cancelled():
+            # NOTE: the task might be cancelled before it started
+            _fail_workbench_patches(
+                self._pending_workbench_patches.pop(batch_key, []),
+                asyncio.CancelledError(),
+            )
+
+    async def _flush_workbench_patches(self, user_id: int, project_uuid: str) -> None:
+        batch_key = (project_uuid, user_id)
+        patches: list[_WorkbenchPatch] = []
+        try:
+            while patches := self._pending_workbench_patches[batch_key]:
+                self._pending_workbench_patches[batch_key] = []
+                try:
+                    await self._apply_workbench_patches(user_id, project_uuid, patches)
+                except Exception as exc:  # pylint: disable=broad-except
+                    _fail_workbench_patches(patches, exc)
+        except BaseException as exc:
+            # e.g. cancelled on shutdown, callers shall not wait forever
+            _fail_workbench_patches(
+                patches + self._pending_workbench_patches.get(batch_key, []), exc
+            )
+            raise
+        finally:
+            self._pending_workbench_patches.pop(batch_key, None)
+
+    async def _apply_workbench_patches(
+        self, user_id: int, project_uuid: str, patches: list[_WorkbenchPatch]
+    ) -> None:
+        node_ids = list(
+            {node_id for patch in patches for node_id in patch.partial_workbench_data}
+        )
         async with self.engine.acquire() as conn:
             async with conn.begin() as _transaction:
-                current_project: dict = await self._get_project(
-                    conn,
-                    user_id,
-                    project_uuid,
-                    exclude_foreign=["tags"],
-                    include_templates=False,
-                    for_update=True,
-                )
                 user_groups: list[RowProxy] = await self.__load_user_groups(
                     conn, user_id
                 )
-                _check_project_permissions(
-                    current_project, user_id, user_groups, "write"
+                # only the patched nodes are read from the workbench
+                result = await conn.execute(
+                    sa.select(
+                        [
+                            projects.c.id,
+                            projects.c.uuid,
+                            projects.c.access_rights,
+                            *(
+                                projects.c.workbench[node_id].label(f"node_{index}")
+                                for index, node_id in enumerate(node_ids)
+                            ),
+                        ]
+                    )
+                    .where(
+                        (projects.c.uuid == project_uuid)
+                        & (projects.c.type != ProjectType.TEMPLATE)
+                        & (
+                            (projects.c.prj_owner == user_id)
+                            | sa.text(
+                                f"jsonb_exists_any(projects.access_rights, {_assemble_array_groups(user_groups)})"
+                            )
+                        )
+                    )
+                    .with_for_update()
                 )
+                row = await result.first()
+                if not row:
+                    raise ProjectNotFoundError(project_uuid)
+                _check_project_permissions(row, user_id, user_groups, "read")
+                _check_project_permissions(row, user_id, user_groups, "write")
 
-                def _patch_workbench(
-                    project: dict[str, Any], new_partial_workbench_data: dict[str, Any]
-                ) -> tuple[dict[str, Any], dict[str, Any]]:
-                    """patch the project workbench with the values in new_data and returns the changed project and changed values"""
-                    changed_entries = {}
-                    for node_key, new_node_data in new_partial_workbench_data.items():
-                        current_node_data = project.get("workbench", {}).get(node_key)
-
-                        if current_node_data is None:
-                            log.debug(
-                                "node %s is missing from project, no patch", node_key
+                current_nodes: dict[str, Optional[dict[str, Any]]] = {
+                    node_id: row[f"node_{index}"]
+                    for index, node_id in enumerate(node_ids)
+                }
+                # NOTE: patches are applied in arrival order, each one reports
+                # its changes w.r.t. the previous ones
+                node_patches: dict[str, dict[str, Any]] = {}
+                applied_patches: list[tuple[_WorkbenchPatch, dict[str, Any]]] = []
+                for patch in patches:
+                    if missing_node_id := next(
+                        (
+                            node_id
+                            for node_id in patch.partial_workbench_data
+                            if current_nodes[node_id] is None
+                        ),
+                        None,
+                    ):
+                        log.debug(
+                            "node %s is missing from project, no patch", missing_node_id
+                        )
+                        if not patch.result.done():
+                            patch.result.set_exception(
+                                NodeNotFoundError(project_uuid, missing_node_id)
                             )
-                            raise NodeNotFoundError(project_uuid, node_key)
-                        # find changed keys
-                        changed_entries.update(
+                        continue
+
+                    changed_entries = {}
+                    for node_id, new_node_data in patch.partial_workbench_data.items():
+                        current_node_data = current_nodes[node_id]
+                        assert current_node_data is not None  # nosec
+                        changed_entries[node_id] = find_changed_node_keys(
+                            current_node_data,
+                            new_node_data,
+                            look_for_removed_keys=False,
+                        )
+                        current_node_data.update(new_node_data)
+                        node_patches.setdefault(node_id, {}).update(
                             {
-                                node_key: find_changed_node_keys(
-                                    current_node_data,
-                                    new_node_data,
-                                    look_for_removed_keys=False,
-                                )
+                                key: current_node_data[key]
+                                for key in changed_entries[node_id]
                             }
                         )
-                        # patch
-                        current_node_data.update(new_node_data)
-                    return (project, changed_entries)
-
-                new_project_data, changed_entries = _patch_workbench(
-                    current_project, partial_workbench_data
-                )
+                    applied_patches.append((patch, changed_entries))
 
-                # update timestamps
-                new_project_data["lastChangeDate"] = now_str()
+                if not applied_patches:
+                    return
 
-                log.debug(
-                    "DB updating with new_project_data=%s",
-                    json_dumps(dict(new_project_data)),
-                )
-                result = await conn.execute(
-                    # pylint: disable=no-value-for-parameter
-                    projects.update()
-                    .values(**_convert_to_db_names(new_project_data))
-                    .where(projects.c.id == current_project[projects.c.id.key])
-                    .returning(literal_column("*"))
-                )
+                if any(node_patches.values()):
+                    log.debug(
+                        "DB updating workbench of project %s with %s",
+                        project_uuid,
+                        json_dumps(node_patches),
+                    )
+                    result = await conn.execute(
+                        # pylint: disable=no-value-for-parameter
+                        projects.update()
+                        .values(
+                            workbench=_patched_workbench(node_patches),
+                            last_change_date=now_str(),
+                        )
+                        .where(projects.c.id == row.id)
+                        .returning(literal_column("*"))
+                    )
+                else:
+                    # nothing changed, no need to rewrite the row
+                    result = await conn.execute(
+                        sa.select([projects]).where(projects.c.id == row.id)
+                    )
                 project = await result.fetchone()
                 assert project  # nosec
-                log.debug(
-                    "DB updated returned row project=%s",
-                    json_dumps(dict(project.items())),
-                )
-                user_email = await self._get_user_email(conn, project.prj_owner)
 
+                user_email = await self._get_user_email(conn, project.prj_owner)
                 tags = await self._get_tags_by_project(
                     conn, project_id=project[projects.c.id]
                 )
-                return (
-                    _convert_to_schema_names(project, user_email, tags=tags),
-                    changed_entries,
-                )
+                for patch, changed_entries in applied_patches:
+                    if not patch.result.done():
+                        patch.result.set_result(
+                            (
+                                _convert_to_schema_names(
+                                    project, user_email, tags=tags
+                                ),
+                                changed_entries,
+                            )
+                        )
 
     async def replace_user_project(
         self,
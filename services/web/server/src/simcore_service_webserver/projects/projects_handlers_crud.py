@@ -222,8 +222,14 @@ async def _copy_files_from_source_project(
                 )
             )
         starting_value = task_progress.percent
+        # NOTE: templates are copied-on-write, i.e. their files are shared until overwritten
         async for long_running_task in copy_data_folders_from_project(
-            app, source_project, new_project, nodes_map, user_id
+            app,
+            source_project,
+            new_project,
+            nodes_map,
+            user_id,
+            copy_on_write=not needs_lock_source_project,
         ):
             task_progress.update(
                 message=long_running_task.progress.message,
@@ -360,6 +366,10 @@ class _ProjectListParams(BaseModel):
     show_hidden: bool = Field(
         default=False, description="includes projects marked as hidden in the listing"
     )
+    include_workbench: bool = Field(
+        default=True,
+        description="when false, the (heavy) workbench of the projects is not returned",
+    )
 
     class Config:
         extra = Extra.forbid
@@ -411,6 +421,7 @@ async def list_projects(request: web.Request):
         offset=query_params.offset,
         limit=query_params.limit,
         include_hidden=query_params.show_hidden,
+        include_workbench=query_params.include_workbench,
     )
     await set_all_project_states(projects, project_types)
     page = Page[ProjectDict].parse_obj(
@@ -1,18 +1,22 @@
 """
 This module takes care of sending events to the connected webclient through the socket.io interface
+
+The messages are not sent right away but queued per room (i.e. the room of a user or of a group)
+and sent together after a short delay. Within that delay, the updates of the same node are merged
+into one message, so that e.g. the many progress updates of a running pipeline do not flood the clients.
 """
 
+import asyncio
 import logging
-from collections import deque
-from typing import Any, Dict, List, Sequence, TypedDict
+from itertools import count
+from typing import Any, Dict, Final, Hashable, Optional, Sequence, TypedDict
 
 from aiohttp.web import Application
 from servicelib.aiohttp.application_keys import APP_FIRE_AND_FORGET_TASKS_KEY
 from servicelib.json_serialization import json_dumps
-from servicelib.utils import fire_and_forget_task, logged_gather
+from servicelib.utils import fire_and_forget_task
 
-from ..resource_manager.websocket_manager import managed_resource
-from .server import AsyncServer, get_socket_server
+from .server import APP_CLIENT_SOCKET_ROOMS_MESSAGES_KEY, AsyncServer, get_socket_server
 
 log = logging.getLogger(__name__)
 
@@ -22,57 +26,131 @@ SOCKET_IO_LOG_EVENT: str = "logger"
 SOCKET_IO_HEARTBEAT_EVENT: str = "set_heartbeat_emit_interval"
 SOCKET_IO_EVENT: str = "event"
 
+_MESSAGES_COALESCING_DELAY_S: Final[float] = 0.1
+
 
 class SocketMessageDict(TypedDict):
     event_type: str
     data: Dict[str, Any]
 
 
-async def send_messages(
-    app: Application, user_id: str, messages: Sequence[SocketMessageDict]
+def get_user_room(user_id: str) -> str:
+    """room where all the sockets of a user are"""
+    return f"user:{user_id}"
+
+
+def _get_coalescing_key(message: SocketMessageDict) -> Optional[Hashable]:
+    if message["event_type"] == SOCKET_IO_NODE_UPDATED_EVENT:
+        return (
+            SOCKET_IO_NODE_UPDATED_EVENT,
+            message["data"].get("project_id"),
+            message["data"].get("node_id"),
+        )
+    return None
+
+
+class _RoomMessages:
+    """Messages waiting to be sent to a room, in order of arrival
+
+    The update of a node already in the queue is merged into it and the
+    merged update moves to the end of the queue, i.e. it is never sent
+    ahead of the messages that arrived before it
+    """
+
+    def __init__(self) -> None:
+        self._messages: Dict[Hashable, SocketMessageDict] = {}
+        self._keys = count()
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def put(self, message: SocketMessageDict) -> None:
+        key = _get_coalescing_key(message)
+        if key is None:
+            key = next(self._keys)
+        elif key in self._messages:
+            # NOTE: the entries of the queued update missing in this one are kept
+            # (e.g. progress updates do not carry the node errors)
+            queued_message = self._messages.pop(key)
+            message = {
+                "event_type": message["event_type"],
+                "data": {**queued_message["data"], **message["data"]},
+            }
+        self._messages[key] = message
+
+    def pop_all(self) -> list[SocketMessageDict]:
+        messages = list(self._messages.values())
+        self._messages.clear()
+        return messages
+
+
+async def _emit_room_messages(
+    sio: AsyncServer, room: str, messages: list[SocketMessageDict]
 ) -> None:
+    for message in messages:
+        try:
+            # NOTE: one emission to the room, the payload is serialized once for all its sockets
+            await sio.emit(
+                message["event_type"], json_dumps(message["data"]), room=room
+            )
+        except Exception:  # pylint: disable=broad-except
+            log.warning(
+                "Could not send %s to room %s",
+                message["event_type"],
+                room,
+                exc_info=True,
+            )
+
+
+async def _send_room_messages_periodically(app: Application, room: str) -> None:
+    rooms_messages: Dict[str, _RoomMessages] = app[APP_CLIENT_SOCKET_ROOMS_MESSAGES_KEY]
     sio: AsyncServer = get_socket_server(app)
+    while True:
+        await asyncio.sleep(_MESSAGES_COALESCING_DELAY_S)
+        messages = rooms_messages[room].pop_all()
+        if not messages:
+            # nothing was queued during the last delay
+            del rooms_messages[room]
+            return
+        await _emit_room_messages(sio, room, messages)
 
-    socket_ids: List[str] = []
-    with managed_resource(user_id, None, app) as rt:
-        socket_ids = await rt.find_socket_ids()
 
-    send_tasks = deque()
-    for sid in socket_ids:
-        for message in messages:
-            send_tasks.append(
-                sio.emit(message["event_type"], json_dumps(message["data"]), room=sid)
-            )
-    await logged_gather(*send_tasks, reraise=False, log=log, max_concurrency=10)
+def _queue_room_messages(
+    app: Application, room: str, messages: Sequence[SocketMessageDict]
+) -> None:
+    rooms_messages: Dict[str, _RoomMessages] = app[APP_CLIENT_SOCKET_ROOMS_MESSAGES_KEY]
+    if room not in rooms_messages:
+        rooms_messages[room] = _RoomMessages()
+        fire_and_forget_task(
+            _send_room_messages_periodically(app, room),
+            task_suffix_name=f"send_room_messages_{room=}",
+            fire_and_forget_tasks_collection=app[APP_FIRE_AND_FORGET_TASKS_KEY],
+        )
+    for message in messages:
+        rooms_messages[room].put(message)
+
+
+async def send_messages(
+    app: Application, user_id: str, messages: Sequence[SocketMessageDict]
+) -> None:
+    _queue_room_messages(app, get_user_room(user_id), messages)
 
 
 async def post_messages(
     app: Application, user_id: str, messages: Sequence[SocketMessageDict]
 ) -> None:
-    fire_and_forget_task(
-        send_messages(app, user_id, messages),
-        task_suffix_name=f"post_message_{user_id=}",
-        fire_and_forget_tasks_collection=app[APP_FIRE_AND_FORGET_TASKS_KEY],
-    )
+    # NOTE: same as send_messages, the messages are always sent in the background
+    _queue_room_messages(app, get_user_room(user_id), messages)
 
 
 async def post_group_messages(
     app: Application, room: str, messages: Sequence[SocketMessageDict]
 ) -> None:
-    fire_and_forget_task(
-        send_group_messages(app, room, messages),
-        task_suffix_name=f"post_group_messages_{room=}",
-        fire_and_forget_tasks_collection=app[APP_FIRE_AND_FORGET_TASKS_KEY],
-    )
+    # NOTE: same as send_group_messages, the messages are always sent in the background
+    _queue_room_messages(app, room, messages)
 
 
 async def send_group_messages(
     app: Application, room: str, messages: Sequence[SocketMessageDict]
 ) -> None:
-    sio: AsyncServer = get_socket_server(app)
-    send_tasks = [
-        sio.emit(message["event_type"], json_dumps(message["data"]), room=room)
-        for message in messages
-    ]
-
-    await logged_gather(*send_tasks, reraise=False, log=log, max_concurrency=10)
+    _queue_room_messages(app, room, messages)
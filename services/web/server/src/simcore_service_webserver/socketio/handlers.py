@@ -21,7 +21,12 @@ from socketio.exceptions import ConnectionRefusedError as SocketIOConnectionErro
 from ..groups_api import list_user_groups
 from ..login.decorators import RQT_USERID_KEY, login_required
 from ..resource_manager.websocket_manager import managed_resource
-from .events import SOCKET_IO_HEARTBEAT_EVENT, SocketMessageDict, send_messages
+from .events import (
+    SOCKET_IO_HEARTBEAT_EVENT,
+    SocketMessageDict,
+    get_user_room,
+    send_messages,
+)
 from .handlers_utils import register_socketio_handler
 from .server import get_socket_server
 
@@ -107,6 +112,7 @@ async def set_user_in_rooms(
     groups = [primary_group] + user_groups + ([all_group] if bool(all_group) else [])
     sio = get_socket_server(app)
     # TODO: check if it is necessary to leave_room when socket disconnects
+    sio.enter_room(sid, get_user_room(user_id))
     for group in groups:
         sio.enter_room(sid, f"{group['gid']}")
 
@@ -5,6 +5,7 @@ from socketio import AsyncServer
 
 APP_CLIENT_SOCKET_SERVER_KEY = f"{__name__}.socketio_socketio"
 APP_CLIENT_SOCKET_DECORATED_HANDLERS_KEY = f"{__name__}.socketio_handlers"
+APP_CLIENT_SOCKET_ROOMS_MESSAGES_KEY = f"{__name__}.socketio_rooms_messages"
 
 log = logging.getLogger(__name__)
 
@@ -22,5 +23,7 @@ def setup_socketio_server(app: web.Application):
         sio.attach(app)
 
         app[APP_CLIENT_SOCKET_SERVER_KEY] = sio
+        # messages waiting to be sent to each room, SEE events.py
+        app[APP_CLIENT_SOCKET_ROOMS_MESSAGES_KEY] = {}
 
     return get_socket_server(app)
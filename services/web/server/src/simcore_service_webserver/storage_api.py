@@ -87,13 +87,17 @@ async def copy_data_folders_from_project(
     destination_project: ProjectDict,
     nodes_map: NodesMap,
     user_id: UserID,
+    *,
+    copy_on_write: bool = False,
 ) -> AsyncGenerator[LRTask, None]:
     session, api_endpoint = _get_storage_client(app)
     log.debug("Copying %d nodes", len(nodes_map))
     # /simcore-s3/folders:
     async for lr_task in long_running_task_request(
         session,
-        (api_endpoint / "simcore-s3/folders").with_query(user_id=user_id),
+        (api_endpoint / "simcore-s3/folders").with_query(
+            user_id=user_id, copy_on_write=f"{copy_on_write}".lower()
+        ),
         json=jsonable_encoder(
             {
                 "source": source_project,
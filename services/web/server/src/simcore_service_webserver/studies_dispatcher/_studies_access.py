@@ -196,6 +196,7 @@ async def copy_study_to_account(
             project,
             nodes_map,
             user["id"],
+            copy_on_write=True,
         ):
             log.info(
                 "copying %s into %s for %s: %s",
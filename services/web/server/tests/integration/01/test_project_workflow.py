@@ -108,7 +108,9 @@ async def storage_subsystem_mock(mocker):
     """
     # requests storage to copy data
 
-    async def _mock_copy_data_from_project(app, src_prj, dst_prj, nodes_map, user_id):
+    async def _mock_copy_data_from_project(
+        app, src_prj, dst_prj, nodes_map, user_id, *, copy_on_write=False
+    ):
         print(
             f"MOCK copying data project {src_prj['uuid']} -> {dst_prj['uuid']} "
             f"with {len(nodes_map)} s3 objects by user={user_id}"
@@ -21,6 +21,7 @@ from simcore_service_webserver.diagnostics_healthcheck import (
     HealthCheckFailed,
     assert_healthy_app,
     kLATENCY_PROBE,
+    kSLOW_CALLBACKS_RECORDS,
 )
 from simcore_service_webserver.diagnostics_settings import DiagnosticsSettings
 from simcore_service_webserver.rest import setup_rest
@@ -182,6 +183,12 @@ async def test_unhealthy_app_with_slow_callbacks(client, api_version_prefix):
     resp = await client.get(f"/{api_version_prefix}/health")
     await assert_status(resp, web.HTTPServiceUnavailable)
 
+    # recorded for the diagnostics
+    assert any(
+        incident.delay_secs >= SLOW_HANDLER_DELAY_SECS
+        for incident in client.app[kSLOW_CALLBACKS_RECORDS]
+    )
+
 
 async def test_diagnose_on_unexpected_error(client):
     resp = await client.get("/error")
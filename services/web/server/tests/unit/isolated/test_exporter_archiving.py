@@ -5,15 +5,20 @@ import hashlib
 import os
 import tempfile
 import uuid
+import zipfile
 from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, Iterator, List, Set, Tuple
 
 import pytest
+from aiohttp import ClientSession, ClientTimeout, web
 from simcore_service_webserver.exporter.archiving import (
+    ImportArchive,
     unzip_folder,
+    unzip_folder_without_directory,
     validate_osparc_import_name,
     zip_folder,
+    zip_folder_and_storage_files,
 )
 from simcore_service_webserver.exporter.async_hashing import Algorithm
 from simcore_service_webserver.exporter.exceptions import ExporterException
@@ -271,3 +276,187 @@ async def test_same_dir_structure_after_compress_decompress(
     await assert_same_directory_content(
         dir_with_random_content, unzipped_content.parent
     )
+
+
+async def test_zip_folder_and_storage_files(
+    aiohttp_server, dir_with_random_content: Path
+):
+    storage_file_content = os.urandom(3 * 1024 * 1024 + 1)
+
+    async def _download(request: web.Request) -> web.Response:
+        return web.Response(body=storage_file_content)
+
+    app = web.Application()
+    app.router.add_get("/{file_name}", _download)
+    server = await aiohttp_server(app)
+
+    storage_files = [
+        dir_with_random_content / "storage" / "0" / "image.png",
+        dir_with_random_content / "storage" / "0" / "data.bin",
+    ]
+    async with ClientSession() as session:
+        zip_archive = await zip_folder_and_storage_files(
+            folder_to_zip=dir_with_random_content,
+            destination_folder=dir_with_random_content,
+            storage_files=[
+                (file_path, f"{server.make_url(f'/{file_path.name}')}")
+                for file_path in storage_files
+            ],
+            session=session,
+            compression_levels={"image/png": 0, "*": 6},
+            download_timeout=ClientTimeout(total=10),
+            max_concurrent_downloads=2,
+        )
+
+    # the digest was computed while writing
+    algorithm, digest = validate_osparc_import_name(zip_archive.name)
+    assert algorithm == Algorithm.SHA256
+    assert hashlib.sha256(zip_archive.read_bytes()).hexdigest() == digest
+
+    # the storage files were never saved in the folder
+    assert not any(file_path.exists() for file_path in storage_files)
+
+    with zipfile.ZipFile(zip_archive) as archive:
+        assert archive.testzip() is None
+        assert {Path(name) for name in archive.namelist()} == get_all_files_in_dir(
+            dir_with_random_content
+        ) - {Path(zip_archive.name)} | {
+            file_path.relative_to(dir_with_random_content)
+            for file_path in storage_files
+        }
+        for file_path in storage_files:
+            file_info = archive.getinfo(
+                f"{file_path.relative_to(dir_with_random_content)}"
+            )
+            assert file_info.compress_type == (
+                zipfile.ZIP_STORED
+                if file_path.suffix == ".png"
+                else zipfile.ZIP_DEFLATED
+            )
+            assert archive.read(file_info) == storage_file_content
+
+
+@pytest.mark.parametrize("max_concurrent_downloads", [1, 3])
+async def test_zip_folder_and_storage_files_prefetches_next_files(
+    aiohttp_server, dir_with_random_content: Path, max_concurrent_downloads: int
+):
+    num_downloads = 0
+    max_num_downloads = 0
+
+    async def _download(request: web.Request) -> web.StreamResponse:
+        nonlocal num_downloads, max_num_downloads
+        num_downloads += 1
+        max_num_downloads = max(max_num_downloads, num_downloads)
+        try:
+            response = web.StreamResponse()
+            await response.prepare(request)
+            for _ in range(3):
+                # let the other downloads start
+                await asyncio.sleep(0.01)
+                await response.write(request.match_info["file_name"].encode())
+            await response.write_eof()
+            return response
+        finally:
+            num_downloads -= 1
+
+    app = web.Application()
+    app.router.add_get("/{file_name}", _download)
+    server = await aiohttp_server(app)
+
+    storage_files = [
+        dir_with_random_content / "storage" / f"{n}" / f"file_{n}.bin" for n in range(6)
+    ]
+    async with ClientSession() as session:
+        zip_archive = await zip_folder_and_storage_files(
+            folder_to_zip=dir_with_random_content,
+            destination_folder=dir_with_random_content,
+            storage_files=[
+                (file_path, f"{server.make_url(f'/{file_path.name}')}")
+                for file_path in storage_files
+            ],
+            session=session,
+            compression_levels={"*": 6},
+            download_timeout=ClientTimeout(total=10),
+            max_concurrent_downloads=max_concurrent_downloads,
+        )
+    assert max_num_downloads == max_concurrent_downloads
+
+    with zipfile.ZipFile(zip_archive) as archive:
+        assert archive.testzip() is None
+        # the files are written in the given order
+        assert [
+            Path(name) for name in archive.namelist() if name.startswith("storage")
+        ] == [
+            file_path.relative_to(dir_with_random_content)
+            for file_path in storage_files
+        ]
+        for file_path in storage_files:
+            assert (
+                archive.read(f"{file_path.relative_to(dir_with_random_content)}")
+                == 3 * file_path.name.encode()
+            )
+
+
+async def test_zip_folder_and_storage_files_download_error(
+    aiohttp_server, dir_with_random_content: Path
+):
+    async def _download(request: web.Request) -> web.Response:
+        if request.match_info["file_name"] == "missing.bin":
+            raise web.HTTPNotFound()
+        return web.Response(body=b"some data")
+
+    app = web.Application()
+    app.router.add_get("/{file_name}", _download)
+    server = await aiohttp_server(app)
+
+    storage_files = [
+        dir_with_random_content / "storage" / "0" / file_name
+        for file_name in ("data.bin", "missing.bin", "other_data.bin")
+    ]
+    async with ClientSession() as session:
+        with pytest.raises(ExporterException, match="missing.bin"):
+            await zip_folder_and_storage_files(
+                folder_to_zip=dir_with_random_content,
+                destination_folder=dir_with_random_content,
+                storage_files=[
+                    (file_path, f"{server.make_url(f'/{file_path.name}')}")
+                    for file_path in storage_files
+                ],
+                session=session,
+                compression_levels={"*": 6},
+                download_timeout=ClientTimeout(total=10),
+                max_concurrent_downloads=2,
+            )
+    # no archive is left behind
+    assert not (dir_with_random_content / "archive.zip").exists()
+
+
+async def test_unzip_folder_without_directory(temp_dir: Path, temp_dir2: Path):
+    project_dir = temp_dir / "project_uuid"
+    storage_file = project_dir / "code" / "storage" / "0" / "a_file.txt"
+    storage_file.parent.mkdir(parents=True)
+    storage_file.write_bytes(os.urandom(1024))
+    (project_dir / "code" / "project.json").write_text("{}")
+
+    archive_path = temp_dir / "archive.zip"
+    with zipfile.ZipFile(archive_path, "w") as zip_file:
+        for path in (storage_file, project_dir / "code" / "project.json"):
+            zip_file.write(path, arcname=path.relative_to(temp_dir))
+
+    unzipped_root_folder = await unzip_folder_without_directory(
+        archive_to_extract=archive_path,
+        destination_folder=temp_dir2,
+        excluded_dir_name="storage",
+    )
+
+    assert unzipped_root_folder == temp_dir2 / "project_uuid"
+    assert (unzipped_root_folder / "code" / "project.json").read_text() == "{}"
+    assert not (unzipped_root_folder / "code" / "storage").exists()
+
+    # the storage files are read from the archive instead
+    archive = ImportArchive(path=archive_path, extracted_to=temp_dir2)
+    entry_name = archive.get_entry_name(
+        unzipped_root_folder / storage_file.relative_to(project_dir)
+    )
+    with zipfile.ZipFile(archive_path) as zip_file:
+        assert zip_file.read(entry_name) == storage_file.read_bytes()
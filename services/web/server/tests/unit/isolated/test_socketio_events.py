@@ -0,0 +1,100 @@
+# pylint:disable=redefined-outer-name
+# pylint:disable=unused-argument
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+from servicelib.aiohttp.application_keys import APP_FIRE_AND_FORGET_TASKS_KEY
+from simcore_service_webserver.socketio.events import (
+    SOCKET_IO_LOG_EVENT,
+    SOCKET_IO_NODE_UPDATED_EVENT,
+    get_user_room,
+    send_group_messages,
+    send_messages,
+)
+from simcore_service_webserver.socketio.server import (
+    APP_CLIENT_SOCKET_ROOMS_MESSAGES_KEY,
+    APP_CLIENT_SOCKET_SERVER_KEY,
+)
+
+
+@pytest.fixture
+def mock_sio() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def app(mock_sio: AsyncMock) -> dict:
+    return {
+        APP_CLIENT_SOCKET_SERVER_KEY: mock_sio,
+        APP_CLIENT_SOCKET_ROOMS_MESSAGES_KEY: {},
+        APP_FIRE_AND_FORGET_TASKS_KEY: set(),
+    }
+
+
+def _node_updated(node_id: str, **data) -> dict:
+    return {
+        "event_type": SOCKET_IO_NODE_UPDATED_EVENT,
+        "data": {"project_id": "project_uuid", "node_id": node_id, **data},
+    }
+
+
+async def _wait_for_sent_messages(app: dict) -> None:
+    await asyncio.gather(*app[APP_FIRE_AND_FORGET_TASKS_KEY])
+
+
+async def test_node_updates_are_coalesced(app: dict, mock_sio: AsyncMock):
+    user_id = "42"
+    await send_messages(app, user_id, [_node_updated("node1", data={"progress": 10})])
+    await send_messages(
+        app, user_id, [{"event_type": SOCKET_IO_LOG_EVENT, "data": {"messages": []}}]
+    )
+    await send_messages(app, user_id, [_node_updated("node2", data={"progress": 0})])
+    await send_messages(
+        app,
+        user_id,
+        [
+            _node_updated("node1", data={"progress": 50}, errors=None),
+            _node_updated("node1", data={"progress": 90}),
+        ],
+    )
+    mock_sio.emit.assert_not_called()
+
+    await _wait_for_sent_messages(app)
+
+    emitted = [
+        (call.args[0], json.loads(call.args[1]), call.kwargs["room"])
+        for call in mock_sio.emit.call_args_list
+    ]
+    # the merged update of node1 is sent after the messages queued before it
+    assert emitted == [
+        (SOCKET_IO_LOG_EVENT, {"messages": []}, get_user_room(user_id)),
+        (
+            SOCKET_IO_NODE_UPDATED_EVENT,
+            _node_updated("node2", data={"progress": 0})["data"],
+            get_user_room(user_id),
+        ),
+        (
+            SOCKET_IO_NODE_UPDATED_EVENT,
+            _node_updated("node1", data={"progress": 90}, errors=None)["data"],
+            get_user_room(user_id),
+        ),
+    ]
+    assert not app[APP_CLIENT_SOCKET_ROOMS_MESSAGES_KEY]
+
+
+async def test_messages_are_queued_per_room(app: dict, mock_sio: AsyncMock):
+    message = _node_updated("node1", data={"progress": 10})
+    await send_group_messages(app, "1", [message])
+    await send_group_messages(app, "2", [message])
+    await send_messages(app, "1", [message])
+
+    await _wait_for_sent_messages(app)
+
+    assert sorted(call.kwargs["room"] for call in mock_sio.emit.call_args_list) == [
+        "1",
+        "2",
+        get_user_room("1"),
+    ]
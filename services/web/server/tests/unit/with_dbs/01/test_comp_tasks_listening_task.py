@@ -7,6 +7,7 @@ import json
 import logging
 from typing import Any, AsyncIterator
 from unittest import mock
+from uuid import uuid4
 
 import aiopg.sa
 import pytest
@@ -14,11 +15,12 @@ from aiohttp.test_utils import TestClient
 from aiopg.sa.result import RowProxy
 from pytest_mock.plugin import MockerFixture
 from servicelib.aiohttp.application_keys import APP_DB_ENGINE_KEY
-from simcore_postgres_database.models.comp_pipeline import StateType
+from simcore_postgres_database.models.comp_pipeline import StateType, comp_pipeline
 from simcore_postgres_database.models.comp_tasks import NodeClass, comp_tasks
 from simcore_service_webserver.computation_comp_tasks_listening_task import (
     create_comp_tasks_listening_task,
 )
+from simcore_service_webserver.projects.projects_exceptions import NodeNotFoundError
 from sqlalchemy.sql.elements import literal_column
 from tenacity._asyncio import AsyncRetrying
 from tenacity.before_sleep import before_sleep_log
@@ -132,3 +134,109 @@ async def test_listen_comp_tasks_task(
 
             else:
                 mocked_call.assert_not_called()
+
+
+async def test_listen_comp_tasks_task_batches_notifications_per_project(
+    mock_project_subsystem: dict,
+    comp_task_listening_task: None,
+    client,
+):
+    db_engine: aiopg.sa.Engine = client.app[APP_DB_ENGINE_KEY]
+    project_uuid = f"{uuid4()}"
+    node_uuids = [f"{uuid4()}" for _ in range(3)]
+    async with db_engine.acquire() as conn:
+        await conn.execute(comp_pipeline.insert().values(project_id=project_uuid))
+        for node_uuid in node_uuids:
+            await conn.execute(
+                comp_tasks.insert().values(
+                    project_id=project_uuid,
+                    node_id=node_uuid,
+                    outputs=json.dumps({}),
+                    node_class=NodeClass.COMPUTATIONAL,
+                )
+            )
+
+        # all the tasks change state at once
+        await conn.execute(
+            comp_tasks.update()
+            .values(state=StateType.PENDING)
+            .where(comp_tasks.c.project_id == project_uuid)
+        )
+
+    async for attempt in AsyncRetrying(
+        wait=wait_fixed(1),
+        stop=stop_after_delay(10),
+        retry=retry_if_exception_type(AssertionError),
+        before_sleep=before_sleep_log(logger, logging.INFO),
+        reraise=True,
+    ):
+        with attempt:
+            # the burst is applied as a single project update
+            mock_project_subsystem["_update_project_state"].assert_awaited_once()
+
+    _, _, called_project_uuid, nodes_states = mock_project_subsystem[
+        "_update_project_state"
+    ].call_args.args
+    assert called_project_uuid == project_uuid
+    assert set(nodes_states) == set(node_uuids)
+    mock_project_subsystem["_get_project_owner"].assert_awaited_once()
+    mock_project_subsystem["update_node_outputs"].assert_not_called()
+
+
+async def test_listen_comp_tasks_task_updates_nodes_independently(
+    mock_project_subsystem: dict,
+    comp_task_listening_task: None,
+    client,
+):
+    db_engine: aiopg.sa.Engine = client.app[APP_DB_ENGINE_KEY]
+    project_uuid = f"{uuid4()}"
+    node_uuids = [f"{uuid4()}" for _ in range(3)]
+    deleted_node_uuid = node_uuids[0]
+
+    # the first node was e.g. deleted from the project
+    async def _update_node_outputs(
+        app, user_id, project_uuid, node_uuid, *args, **kwargs
+    ):
+        if node_uuid == deleted_node_uuid:
+            raise NodeNotFoundError(project_uuid, node_uuid)
+
+    async def _update_project_state(app, user_id, project_uuid, nodes_states):
+        if deleted_node_uuid in nodes_states:
+            raise NodeNotFoundError(project_uuid, deleted_node_uuid)
+
+    mock_project_subsystem["update_node_outputs"].side_effect = _update_node_outputs
+    mock_project_subsystem["_update_project_state"].side_effect = _update_project_state
+
+    async with db_engine.acquire() as conn:
+        await conn.execute(comp_pipeline.insert().values(project_id=project_uuid))
+        for node_uuid in node_uuids:
+            await conn.execute(
+                comp_tasks.insert().values(
+                    project_id=project_uuid,
+                    node_id=node_uuid,
+                    outputs=json.dumps({}),
+                    node_class=NodeClass.COMPUTATIONAL,
+                )
+            )
+        await conn.execute(
+            comp_tasks.update()
+            .values(outputs={"out_1": 42}, state=StateType.SUCCESS)
+            .where(comp_tasks.c.project_id == project_uuid)
+        )
+
+    async for attempt in AsyncRetrying(
+        wait=wait_fixed(1),
+        stop=stop_after_delay(10),
+        retry=retry_if_exception_type(AssertionError),
+        before_sleep=before_sleep_log(logger, logging.INFO),
+        reraise=True,
+    ):
+        with attempt:
+            assert mock_project_subsystem["_update_project_state"].await_count == 2
+
+    assert mock_project_subsystem["update_node_outputs"].await_count == len(node_uuids)
+    # the states of the other nodes are still updated
+    _, _, _, nodes_states = mock_project_subsystem[
+        "_update_project_state"
+    ].call_args.args
+    assert set(nodes_states) == set(node_uuids[1:])
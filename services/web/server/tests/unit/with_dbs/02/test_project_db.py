@@ -24,6 +24,7 @@ from psycopg2.errors import UniqueViolation
 from pytest_simcore.helpers.utils_dict import copy_from_dict_ex
 from pytest_simcore.helpers.utils_login import UserInfoDict
 from simcore_postgres_database.models.groups import GroupType
+from simcore_postgres_database.models.projects import projects as projects_table
 from simcore_postgres_database.models.projects_to_products import projects_to_products
 from simcore_service_webserver.db_models import UserRole
 from simcore_service_webserver.projects.project_models import ProjectDict
@@ -31,6 +32,7 @@ from simcore_service_webserver.projects.projects_db import (
     APP_PROJECT_DBAPI,
     DB_EXCLUSIVE_COLUMNS,
     SCHEMA_NON_NULL_KEYS,
+    NodeNotFoundError,
     ProjectAccessRights,
     ProjectDBAPI,
     ProjectInvalidRightsError,
@@ -641,6 +643,94 @@ async def test_patch_user_project_workbench_concurrently(
     )
 
 
+@pytest.mark.parametrize(
+    "user_role",
+    [
+        (UserRole.USER),
+    ],
+)
+async def test_patch_user_project_workbench_with_missing_node(
+    fake_project: dict[str, Any],
+    logged_user: dict[str, Any],
+    db_api: ProjectDBAPI,
+    osparc_product_name: str,
+):
+    new_project = await db_api.add_project(
+        prj=fake_project, user_id=logged_user["id"], product_name=osparc_product_name
+    )
+    existing_node_id = choice(list(new_project["workbench"].keys()))
+    missing_node_id = "5739e377-17f7-4f09-a6ad-62659fb7fdec"
+    assert missing_node_id not in new_project["workbench"]
+
+    # only the patch with the missing node fails
+    results = await asyncio.gather(
+        db_api.patch_user_project_workbench(
+            {existing_node_id: {"progress": 42}},
+            logged_user["id"],
+            new_project["uuid"],
+        ),
+        db_api.patch_user_project_workbench(
+            {missing_node_id: {"progress": 42}},
+            logged_user["id"],
+            new_project["uuid"],
+        ),
+        return_exceptions=True,
+    )
+    patched_project, changed_entries = results[0]
+    assert patched_project["workbench"][existing_node_id]["progress"] == 42
+    assert changed_entries == {existing_node_id: {"progress": 42}}
+    assert isinstance(results[1], NodeNotFoundError)
+    # the order of the nodes is kept
+    assert list(patched_project["workbench"]) == list(new_project["workbench"])
+
+    # patching with the same values does not change the project
+    patched_project_again, changed_entries = await db_api.patch_user_project_workbench(
+        {existing_node_id: {"progress": 42}},
+        logged_user["id"],
+        new_project["uuid"],
+    )
+    assert changed_entries == {existing_node_id: {}}
+    assert patched_project_again == patched_project
+
+
+@pytest.mark.parametrize(
+    "user_role",
+    [
+        (UserRole.USER),
+    ],
+)
+async def test_patch_user_project_workbench_cancelled(
+    fake_project: dict[str, Any],
+    logged_user: dict[str, Any],
+    db_api: ProjectDBAPI,
+    osparc_product_name: str,
+):
+    new_project = await db_api.add_project(
+        prj=fake_project, user_id=logged_user["id"], product_name=osparc_product_name
+    )
+    node_id = choice(list(new_project["workbench"].keys()))
+    patches = [
+        asyncio.create_task(
+            db_api.patch_user_project_workbench(
+                {node_id: {"progress": progress}},
+                logged_user["id"],
+                new_project["uuid"],
+            )
+        )
+        for progress in (10, 20)
+    ]
+    await asyncio.sleep(0)
+    # e.g. on shutdown
+    for task in list(db_api._workbench_patches_tasks):
+        task.cancel()
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*patches, return_exceptions=True), timeout=5
+    )
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
+    assert not db_api._pending_workbench_patches
+
+
 @pytest.fixture()
 async def lots_of_projects_and_nodes(
     logged_user: dict[str, Any],
@@ -729,6 +819,48 @@ async def test_get_node_ids_from_project(
         }
 
 
+@pytest.mark.parametrize(
+    "user_role",
+    [UserRole.USER],
+)
+async def test_load_projects_in_single_query(
+    db_api: ProjectDBAPI,
+    lots_of_projects_and_nodes: dict[ProjectID, list[NodeID]],
+    logged_user: UserInfoDict,
+    osparc_product_name: str,
+):
+    projects, project_types, total = await db_api.load_projects(
+        logged_user["id"], product_name=osparc_product_name
+    )
+    assert total == len(lots_of_projects_and_nodes)
+    assert len(projects) == len(project_types) == total
+    assert {ProjectID(p["uuid"]) for p in projects} == set(lots_of_projects_and_nodes)
+
+    # previous implementation: one query per project for tags and owner's email
+    async with db_api.engine.acquire() as conn:
+        for prj in projects:
+            row = await (
+                await conn.execute(
+                    sa.select([projects_table]).where(
+                        projects_table.c.uuid == prj["uuid"]
+                    )
+                )
+            ).first()
+            # NOTE: the order of the aggregated tags is not defined
+            assert sorted(prj["tags"]) == sorted(
+                await db_api._get_tags_by_project(conn, project_id=row.id)
+            )
+            assert prj["prjOwner"] == await db_api._get_user_email(conn, row.prj_owner)
+
+    light_projects, _, _ = await db_api.load_projects(
+        logged_user["id"], product_name=osparc_product_name, include_workbench=False
+    )
+    assert all("workbench" not in p for p in light_projects)
+    assert [{k: v for k, v in p.items() if k != "workbench"} for p in projects] == (
+        light_projects
+    )
+
+
 @pytest.mark.parametrize(
     "user_role",
     [UserRole.USER],
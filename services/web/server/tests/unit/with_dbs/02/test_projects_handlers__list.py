@@ -202,3 +202,33 @@ async def test_list_projects_with_pagination(
         assert {prj["uuid"] for prj in projects} == {
             prj["uuid"] for prj in created_projects
         }
+
+
+@pytest.mark.parametrize(*standard_user_role())
+async def test_list_projects_without_workbench(
+    client: TestClient,
+    logged_user: dict[str, Any],
+    primary_group: dict[str, str],
+    expected: ExpectedResponse,
+    storage_subsystem_mock,
+    catalog_subsystem_mock: Callable[[Optional[Union[list[dict], dict]]], None],
+    director_v2_service_mock: aioresponses,
+    project_db_cleaner,
+    request_create_project: Callable[..., Awaitable[ProjectDict]],
+):
+    created_projects = [
+        await request_create_project(
+            client, expected.accepted, expected.created, logged_user, primary_group
+        )
+        for _ in range(3)
+    ]
+    catalog_subsystem_mock(created_projects)
+
+    projects, *_ = await _list_projects(client, expected.ok)
+    assert all("workbench" in prj for prj in projects)
+
+    light_projects, *_ = await _list_projects(
+        client, expected.ok, query_parameters={"include_workbench": "false"}
+    )
+    assert all("workbench" not in prj for prj in light_projects)
+    assert [prj["uuid"] for prj in light_projects] == [prj["uuid"] for prj in projects]